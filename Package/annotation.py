@@ -26,10 +26,8 @@ Licence: GNU General Public Licence Version 3.
 
 #-------------------------------------------------------------------------------
 
-import gzip
 import os
 import re
-import subprocess
 import sys
 
 from PyQt5.QtCore import Qt                      # pylint: disable=no-name-in-module
@@ -54,6 +52,10 @@ from PyQt5.QtWidgets import QWidget              # pylint: disable=no-name-in-mo
 
 import dialogs
 import genlib
+import pipelinelib
+import queuelib
+import registrylib
+import resultslib
 
 #-------------------------------------------------------------------------------
 
@@ -84,7 +86,7 @@ class FormRunAnnotationPipeline(QWidget):
         self.title = f'{genlib.get_app_short_name()} - {self.head}'
 
         # get the dictionary of application configuration
-        self.app_config_dict = genlib.get_config_dict(genlib.get_app_config_file())
+        self.app_config_dict = genlib.AppState.get_app_config_dict()
 
         # build the graphic user interface of the window
         self.build_gui()
@@ -849,6 +851,7 @@ class FormRunAnnotationPipeline(QWidget):
             rc = genlib.run_command(command, process, is_script=False)
             if rc == 0:
                 process.write(f'The directory path is {current_run_dir}.\n')
+                registrylib.register_run(result_dir, genlib.get_result_run_subdir(), os.path.basename(current_run_dir))
             else:
                 process.write(f'*** ERROR: RC {rc} in command -> {command}\n')
                 OK = False
@@ -892,7 +895,10 @@ class FormRunAnnotationPipeline(QWidget):
             process.write(f'{genlib.get_separator()}\n')
             starter_name = f'{genlib.get_process_run_annotation_pipeline_code()}-process-starter.sh'
             process.write(f'Building the starter script {starter_name} ...\n')
-            (OK, _) = genlib.build_starter(temp_dir, starter_name, script_name, current_run_dir)
+            memory = queuelib.estimate_annotation_job_memory(fasta_file, fasta_type, alignment_tool, threads)
+            process.write(f'The job reserves {threads} threads and {memory} GB of memory in the job queue.\n')
+            job_dict = {'app_dir': self.app_config_dict['Environment parameters']['app_dir'], 'result_dir': result_dir, 'threads': threads, 'memory': memory}
+            (OK, _) = genlib.build_starter(temp_dir, starter_name, script_name, current_run_dir, job_dict)
             if OK:
                 process.write('The file is built.\n')
             if not OK:
@@ -983,13 +989,23 @@ class FormRunAnnotationPipeline(QWidget):
         blastx_clade_alignment_file = f'{temp_dir}/{genlib.get_blastx_clade_alignment_file_name()}'
         blastn_lncrna_alignment_file = f'{temp_dir}/{genlib.get_blastn_lncrna_alignment_file_name()}'
 
+        # set the FASTA files with the transcripts without hits in the alignment of the peptides
+        # (each step run concurrently builds its own query file)
+        blastx_query_file = f'{temp_dir}/{genlib.get_blastx_query_file_name()}'
+        blastn_query_file = f'{temp_dir}/{genlib.get_blastn_query_file_name()}'
+
         # set the CSV files with the annotations
         complete_functional_annotation_file = f'./{genlib.get_complete_functional_annotation_file_name()}'
         besthit_functional_annotation_file = f'./{genlib.get_besthit_functional_annotation_file_name()}'
 
-        # set the annotation file head
-        # -- head = '1i qseqid;sseqid;pident;length;mismatch;gapopen;qstart;qend;sstart;send;evalue;bitscore;algorithm;ncbi_description;ncbi_species;tair10_ortholog_seq_id;interpro_goterms;panther_goterms;metacyc_pathways;reactome_pathways;eggnog_ortholog_seq_id;eggnog_ortholog_species;eggnog_ogs;cog_category;eggnog_description;eggnog_goterms;ec;kegg_kos;kegg_pathways;kegg_modules;kegg_reactions;kegg_rclasses;brite;kegg_tc;cazy;pfams'
-        head = '1i qseqid;sseqid;pident;length;mismatch;gapopen;qstart;qend;sstart;send;evalue;bitscore;algorithm;ncbi_description;ncbi_species;tair10_ortholog_seq_id;interpro_goterms;panther_goterms;metacyc_pathways;eggnog_ortholog_seq_id;eggnog_ortholog_species;eggnog_ogs;cog_category;eggnog_description;eggnog_goterms;ec;kegg_kos;kegg_pathways;kegg_modules;kegg_reactions;kegg_rclasses;brite;kegg_tc;cazy;pfams'
+        # set the dependency graph of the steps, the groups of step chains, the threads of each step
+        # (the threads number is got as text from the form) and the shards of the alignment steps,
+        # and the Python interpreter of the gymnoTOA environment used to run them
+        step_dict = pipelinelib.get_annotation_step_dict(fasta_type)
+        step_group_list = pipelinelib.get_step_group_list(step_dict)
+        step_thread_dict = pipelinelib.get_step_thread_dict(step_dict, step_group_list, int(threads))
+        step_shard_dict = pipelinelib.get_annotation_step_shard_dict(alignment_tool, step_thread_dict)
+        gymnotoa_python = f'{miniforge3_dir}/envs/{genlib.get_gymnotoa_env_code()}/bin/python3'
 
         # set the script path
         script_path = f'{directory}/{script_name}'
@@ -1058,7 +1074,7 @@ class FormRunAnnotationPipeline(QWidget):
                     file_id.write( '        MODELS_DIR=`echo $CONDA_PREFIX`/models\n')
                     file_id.write( '        /usr/bin/time \\\n')
                     file_id.write( '            codan.py \\\n')
-                    file_id.write(f'                --cpu={threads} \\\n')
+                    file_id.write(f'                --cpu={step_thread_dict["predict_orfs"]} \\\n')
                     file_id.write(f'                --model=$MODELS_DIR/{codan_model} \\\n')
                     file_id.write(f'                --transcripts={fasta_file} \\\n')
                     file_id.write(f'                --output={codan_output_dir}\n')
@@ -1096,10 +1112,11 @@ class FormRunAnnotationPipeline(QWidget):
                     file_id.write(f'        source {miniforge3_bin_dir}/activate {genlib.get_blastplus_environment()}\n')
                     file_id.write(f'        export BLASTDB={acrogymnospermae_blastplus_db_dir}\n')
                     file_id.write( '        /usr/bin/time \\\n')
-                    file_id.write( '            blastp \\\n')
-                    file_id.write(f'                -num_threads {threads} \\\n')
+                    pipelinelib.write_sharded_alignment_call(file_id, gymnotoa_python, app_dir, '$PEPTIDE_FILE', blastp_clade_alignment_file, step_shard_dict['align_peptides_2_alignment_tool_acrogymnospermae_db'], step_thread_dict['align_peptides_2_alignment_tool_acrogymnospermae_db'])
+                    file_id.write( '                blastp \\\n')
+                    file_id.write( '                -num_threads %THREADS% \\\n')
                     file_id.write(f'                -db {acrogymnospermae_blastplus_db_name} \\\n')
-                    file_id.write( '                -query $PEPTIDE_FILE \\\n')
+                    file_id.write( '                -query %QUERY% \\\n')
                     file_id.write(f'                -evalue {evalue} \\\n')
                     file_id.write(f'                -max_target_seqs {max_target_seqs} \\\n')
                     file_id.write(f'                -max_hsps {max_hsps} \\\n')
@@ -1119,17 +1136,18 @@ class FormRunAnnotationPipeline(QWidget):
                                 mo = re.search(pattern, parameter)
                                 parameter_name = mo.group(1).strip()
                                 file_id.write(f'                -{parameter_name} \\\n')
-                    file_id.write(f'                -out {blastp_clade_alignment_file}\n')
+                    file_id.write( '                -out %OUTPUT%\n')
                     file_id.write( '        RC=$?\n')
                     file_id.write( '        if [ $RC -ne 0 ]; then manage_error blastp $RC; fi\n')
                     file_id.write( '        conda deactivate\n')
                 elif alignment_tool == genlib.get_diamond_name():
                     file_id.write(f'        source {miniforge3_bin_dir}/activate {genlib.get_diamond_environment()}\n')
                     file_id.write( '        /usr/bin/time \\\n')
-                    file_id.write( '            diamond blastp \\\n')
-                    file_id.write(f'                --threads {threads} \\\n')
+                    pipelinelib.write_sharded_alignment_call(file_id, gymnotoa_python, app_dir, '$PEPTIDE_FILE', blastp_clade_alignment_file, step_shard_dict['align_peptides_2_alignment_tool_acrogymnospermae_db'], step_thread_dict['align_peptides_2_alignment_tool_acrogymnospermae_db'])
+                    file_id.write( '                diamond blastp \\\n')
+                    file_id.write( '                --threads %THREADS% \\\n')
                     file_id.write(f'                --db {acrogymnospermae_diamond_db_dir}/{acrogymnospermae_diamond_db_name} \\\n')
-                    file_id.write( '                --query $PEPTIDE_FILE \\\n')
+                    file_id.write( '                --query %QUERY% \\\n')
                     file_id.write(f'                --evalue {evalue} \\\n')
                     file_id.write(f'                --max-target-seqs {max_target_seqs} \\\n')
                     file_id.write(f'                --max-hsps {max_hsps} \\\n')
@@ -1148,7 +1166,7 @@ class FormRunAnnotationPipeline(QWidget):
                                 mo = re.search(pattern, parameter)
                                 parameter_name = mo.group(1).strip()
                                 file_id.write(f'                --{parameter_name} \\\n')
-                    file_id.write(f'                --out {blastp_clade_alignment_file}\n')
+                    file_id.write( '                --out %OUTPUT%\n')
                     file_id.write( '        RC=$?\n')
                     file_id.write( '        if [ $RC -ne 0 ]; then manage_error diamond-blastp $RC; fi\n')
                     file_id.write( '        conda deactivate\n')
@@ -1167,14 +1185,16 @@ class FormRunAnnotationPipeline(QWidget):
                 file_id.write( '        echo "This step was previously run."\n')
                 file_id.write( '    else\n')
                 if fasta_type ==  genlib.get_fasta_type_transcripts():
+                    pipelinelib.write_unmatched_sequence_filter(file_id, gymnotoa_python, app_dir, fasta_file, [blastp_clade_alignment_file], blastx_query_file)
                     if alignment_tool == genlib.get_blastplus_name():
                         file_id.write(f'        source {miniforge3_bin_dir}/activate {genlib.get_blastplus_environment()}\n')
                         file_id.write(f'        export BLASTDB={acrogymnospermae_blastplus_db_dir}\n')
                         file_id.write( '        /usr/bin/time \\\n')
-                        file_id.write( '            blastx \\\n')
-                        file_id.write(f'                -num_threads {threads} \\\n')
+                        pipelinelib.write_sharded_alignment_call(file_id, gymnotoa_python, app_dir, blastx_query_file, blastx_clade_alignment_file, step_shard_dict['align_transcriptome_2_alignment_tool_acrogymnospermae_db'], step_thread_dict['align_transcriptome_2_alignment_tool_acrogymnospermae_db'])
+                        file_id.write( '                blastx \\\n')
+                        file_id.write( '                -num_threads %THREADS% \\\n')
                         file_id.write(f'                -db {acrogymnospermae_blastplus_db_name} \\\n')
-                        file_id.write(f'                -query {fasta_file} \\\n')
+                        file_id.write( '                -query %QUERY% \\\n')
                         file_id.write(f'                -evalue {evalue} \\\n')
                         file_id.write(f'                -max_target_seqs {max_target_seqs} \\\n')
                         file_id.write(f'                -max_hsps {max_hsps} \\\n')
@@ -1194,17 +1214,18 @@ class FormRunAnnotationPipeline(QWidget):
                                     mo = re.search(pattern, parameter)
                                     parameter_name = mo.group(1).strip()
                                     file_id.write(f'                -{parameter_name} \\\n')
-                        file_id.write(f'                -out {blastx_clade_alignment_file}\n')
+                        file_id.write( '                -out %OUTPUT%\n')
                         file_id.write( '        RC=$?\n')
                         file_id.write( '        if [ $RC -ne 0 ]; then manage_error blastx $RC; fi\n')
                         file_id.write( '        conda deactivate\n')
                     elif alignment_tool == genlib.get_diamond_name():
                         file_id.write(f'        source {miniforge3_bin_dir}/activate {genlib.get_diamond_environment()}\n')
                         file_id.write( '        /usr/bin/time \\\n')
-                        file_id.write( '            diamond blastx \\\n')
-                        file_id.write(f'                --threads {threads} \\\n')
+                        pipelinelib.write_sharded_alignment_call(file_id, gymnotoa_python, app_dir, blastx_query_file, blastx_clade_alignment_file, step_shard_dict['align_transcriptome_2_alignment_tool_acrogymnospermae_db'], step_thread_dict['align_transcriptome_2_alignment_tool_acrogymnospermae_db'])
+                        file_id.write( '                diamond blastx \\\n')
+                        file_id.write( '                --threads %THREADS% \\\n')
                         file_id.write(f'                --db {acrogymnospermae_diamond_db_dir}/{acrogymnospermae_diamond_db_name} \\\n')
-                        file_id.write(f'                --query {fasta_file} \\\n')
+                        file_id.write( '                --query %QUERY% \\\n')
                         file_id.write(f'                --evalue {evalue} \\\n')
                         file_id.write(f'                --max-target-seqs {max_target_seqs} \\\n')
                         file_id.write(f'                --max-hsps {max_hsps} \\\n')
@@ -1223,7 +1244,7 @@ class FormRunAnnotationPipeline(QWidget):
                                     mo = re.search(pattern, parameter)
                                     parameter_name = mo.group(1).strip()
                                     file_id.write(f'                --{parameter_name} \\\n')
-                        file_id.write(f'                --out {blastx_clade_alignment_file}\n')
+                        file_id.write( '                --out %OUTPUT%\n')
                         file_id.write( '        RC=$?\n')
                         file_id.write( '        if [ $RC -ne 0 ]; then manage_error diamond-blastx $RC; fi\n')
                         file_id.write( '        conda deactivate\n')
@@ -1245,19 +1266,21 @@ class FormRunAnnotationPipeline(QWidget):
                 file_id.write( '        echo "This step was previously run."\n')
                 file_id.write( '    else\n')
                 if fasta_type ==  genlib.get_fasta_type_transcripts():
+                    pipelinelib.write_unmatched_sequence_filter(file_id, gymnotoa_python, app_dir, fasta_file, [blastp_clade_alignment_file], blastn_query_file)
                     file_id.write(f'        source {miniforge3_bin_dir}/activate {genlib.get_blastplus_environment()}\n')
                     file_id.write(f'        export BLASTDB={lncrna_blastplus_db_dir}\n')
                     file_id.write( '        /usr/bin/time \\\n')
-                    file_id.write( '            blastn \\\n')
-                    file_id.write(f'                -num_threads {threads} \\\n')
+                    pipelinelib.write_sharded_alignment_call(file_id, gymnotoa_python, app_dir, blastn_query_file, blastn_lncrna_alignment_file, step_shard_dict['align_transcriptome_2_blastplus_lncrna_db'], step_thread_dict['align_transcriptome_2_blastplus_lncrna_db'])
+                    file_id.write( '                blastn \\\n')
+                    file_id.write( '                -num_threads %THREADS% \\\n')
                     file_id.write(f'                -db {lncrna_blastplus_db_name} \\\n')
-                    file_id.write(f'                -query {fasta_file} \\\n')
+                    file_id.write( '                -query %QUERY% \\\n')
                     file_id.write( '                -evalue 1E-3 \\\n')
                     file_id.write( '                -max_target_seqs 1 \\\n')
                     file_id.write( '                -max_hsps 1 \\\n')
                     file_id.write( '                -qcov_hsp_perc 0.0 \\\n')
                     file_id.write( '                -outfmt "6 qseqid sseqid pident length mismatch gapopen qstart qend sstart send evalue bitscore" \\\n')
-                    file_id.write(f'                -out {blastn_lncrna_alignment_file}\n')
+                    file_id.write( '                -out %OUTPUT%\n')
                     file_id.write( '        RC=$?\n')
                     file_id.write( '        if [ $RC -ne 0 ]; then manage_error blastn $RC; fi\n')
                     file_id.write( '        conda deactivate\n')
@@ -1269,133 +1292,32 @@ class FormRunAnnotationPipeline(QWidget):
                 file_id.write( '    fi\n')
                 file_id.write( '}\n')
                 file_id.write( '#-------------------------------------------------------------------------------\n')
-                file_id.write('function concat_functional_annotations\n')
+                file_id.write('function run_post_alignment\n')
                 file_id.write( '{\n')
                 file_id.write( '    echo "$SEP"\n')
-                file_id.write( '    echo "Concatenating functional annotation to alignment file ..."\n')
+                file_id.write( '    echo "Concatenating functional annotation to alignment file, calculating statistics and building inputs to external applications and incidence indexes ..."\n')
                 file_id.write(f'    cd {current_run_dir}\n')
-                file_id.write( '    STEP_STATUS=$STATUS_DIR/concat-functional-annotations.ok\n')
+                file_id.write( '    STEP_STATUS=$STATUS_DIR/run-post-alignment.ok\n')
                 file_id.write( '    if [ -f $STEP_STATUS ]; then\n')
                 file_id.write( '        echo "This step was previously run."\n')
                 file_id.write( '    else\n')
                 file_id.write(f'        source {miniforge3_bin_dir}/activate {genlib.get_gymnotoa_env_code()}\n')
                 file_id.write( '        /usr/bin/time \\\n')
-                file_id.write(f'            {app_dir}/concat-functional-annotations.py \\\n')
+                file_id.write(f'            {app_dir}/run-post-alignment.py \\\n')
                 file_id.write(f'                --db={app_db_path} \\\n')
                 file_id.write(f'                --blastp-alignments={blastp_clade_alignment_file} \\\n')
                 file_id.write(f'                --blastx-alignments={blastx_clade_alignment_file} \\\n')
                 file_id.write(f'                --blastn-alignments={blastn_lncrna_alignment_file} \\\n')
                 file_id.write(f'                --complete_annotations={complete_functional_annotation_file} \\\n')
                 file_id.write(f'                --besthit_annotations={besthit_functional_annotation_file} \\\n')
-                file_id.write( '                --verbose=N \\\n')
-                file_id.write( '                --trace=N\n')
-                file_id.write( '        RC=$?\n')
-                file_id.write( '        if [ $RC -ne 0 ]; then manage_error concat-functional-annotations.py $RC; fi\n')
-                file_id.write( '        conda deactivate\n')
-                file_id.write( '        echo "Data are loaded."\n')
-                file_id.write( '        touch $STEP_STATUS\n')
-                file_id.write( '    fi\n')
-                file_id.write( '}\n')
-                file_id.write( '#-------------------------------------------------------------------------------\n')
-                file_id.write('function sort_functional_annotations\n')
-                file_id.write( '{\n')
-                file_id.write( '    echo "$SEP"\n')
-                file_id.write( '    echo "Sorting functional annotations files ..."\n')
-                file_id.write(f'    cd {current_run_dir}\n')
-                file_id.write( '    STEP_STATUS=$STATUS_DIR/sort-annotations.ok\n')
-                file_id.write( '    if [ -f $STEP_STATUS ]; then\n')
-                file_id.write( '        echo "This step was previously run."\n')
-                file_id.write( '    else\n')
-                file_id.write( '        /usr/bin/time \\\n')
-                file_id.write( '            sort \\\n')
-                file_id.write(f'                --output={complete_functional_annotation_file} \\\n')
-                file_id.write(f'                {complete_functional_annotation_file}\n')
-                file_id.write( '        RC=$?\n')
-                file_id.write( '        if [ $RC -ne 0 ]; then manage_error sort $RC; fi\n')
-                file_id.write( '        /usr/bin/time \\\n')
-                file_id.write( '            sort \\\n')
-                file_id.write(f'                --output={besthit_functional_annotation_file} \\\n')
-                file_id.write(f'                {besthit_functional_annotation_file}\n')
-                file_id.write( '        RC=$?\n')
-                file_id.write( '        if [ $RC -ne 0 ]; then manage_error sort $RC; fi\n')
-                file_id.write( '        echo "Files are sorted."\n')
-                file_id.write( '        touch $STEP_STATUS\n')
-                file_id.write( '    fi\n')
-                file_id.write( '}\n')
-                file_id.write( '#-------------------------------------------------------------------------------\n')
-                file_id.write('function add_heads\n')
-                file_id.write( '{\n')
-                file_id.write( '    echo "$SEP"\n')
-                file_id.write( '    echo "Adding head to annotations files ..."\n')
-                file_id.write(f'    cd {current_run_dir}\n')
-                file_id.write( '    STEP_STATUS=$STATUS_DIR/add-head.ok\n')
-                file_id.write( '    if [ -f $STEP_STATUS ]; then\n')
-                file_id.write( '        echo "This step was previously run."\n')
-                file_id.write( '    else\n')
-                file_id.write( '        /usr/bin/time \\\n')
-                file_id.write( '            sed \\\n')
-                file_id.write( '                --in-place \\\n')
-                file_id.write(f'                "{head}" \\\n')
-                file_id.write(f'                {complete_functional_annotation_file}\n')
-                file_id.write( '        RC=$?\n')
-                file_id.write( '        if [ $RC -ne 0 ]; then manage_error sed $RC; fi\n')
-                file_id.write( '        /usr/bin/time \\\n')
-                file_id.write( '            sed \\\n')
-                file_id.write( '                --in-place \\\n')
-                file_id.write(f'                "{head}" \\\n')
-                file_id.write(f'                {besthit_functional_annotation_file}\n')
-                file_id.write( '        RC=$?\n')
-                file_id.write( '        if [ $RC -ne 0 ]; then manage_error sed $RC; fi\n')
-                file_id.write( '        echo "Heads are added."\n')
-                file_id.write( '        touch $STEP_STATUS\n')
-                file_id.write( '    fi\n')
-                file_id.write( '}\n')
-                file_id.write( '#-------------------------------------------------------------------------------\n')
-                file_id.write('function calculate_functional_annotation_stats\n')
-                file_id.write( '{\n')
-                file_id.write( '    echo "$SEP"\n')
-                file_id.write( '    echo "Calculating functional annotation statistics ..."\n')
-                file_id.write(f'    cd {current_run_dir}\n')
-                file_id.write( '    STEP_STATUS=$STATUS_DIR/calculate-functional-annotation-stats.ok\n')
-                file_id.write( '    if [ -f $STEP_STATUS ]; then\n')
-                file_id.write( '        echo "This step was previously run."\n')
-                file_id.write( '    else\n')
-                file_id.write(f'        source {miniforge3_bin_dir}/activate {genlib.get_gymnotoa_env_code()}\n')
-                file_id.write( '        /usr/bin/time \\\n')
-                file_id.write(f'            {app_dir}/calculate-functional-annotation-stats.py \\\n')
-                file_id.write(f'                --db={app_db_path} \\\n')
-                file_id.write(f'                --annotations={complete_functional_annotation_file} \\\n')
                 file_id.write(f'                --outdir={current_run_dir} \\\n')
+                file_id.write( '                --parquet=Y \\\n')
                 file_id.write( '                --verbose=N \\\n')
                 file_id.write( '                --trace=N\n')
                 file_id.write( '        RC=$?\n')
-                file_id.write( '        if [ $RC -ne 0 ]; then manage_error calculate-functional-annotation-stats.py $RC; fi\n')
+                file_id.write( '        if [ $RC -ne 0 ]; then manage_error run-post-alignment.py $RC; fi\n')
                 file_id.write( '        conda deactivate\n')
-                file_id.write( '        echo "Statistics are calculated."\n')
-                file_id.write( '        touch $STEP_STATUS\n')
-                file_id.write( '    fi\n')
-                file_id.write( '}\n')
-                file_id.write( '#-------------------------------------------------------------------------------\n')
-                file_id.write('function build_external_inputs\n')
-                file_id.write( '{\n')
-                file_id.write( '    echo "$SEP"\n')
-                file_id.write( '    echo "Building inputs to external applications ..."\n')
-                file_id.write(f'    cd {current_run_dir}\n')
-                file_id.write( '    STEP_STATUS=$STATUS_DIR/build-external-inputs.ok\n')
-                file_id.write( '    if [ -f $STEP_STATUS ]; then\n')
-                file_id.write( '        echo "This step was previously run."\n')
-                file_id.write( '    else\n')
-                file_id.write(f'        source {miniforge3_bin_dir}/activate {genlib.get_gymnotoa_env_code()}\n')
-                file_id.write( '        /usr/bin/time \\\n')
-                file_id.write(f'            {app_dir}/build-external-inputs.py \\\n')
-                file_id.write(f'                --annotations={complete_functional_annotation_file} \\\n')
-                file_id.write(f'                --outdir={current_run_dir} \\\n')
-                file_id.write( '                --verbose=N \\\n')
-                file_id.write( '                --trace=N\n')
-                file_id.write( '        RC=$?\n')
-                file_id.write( '        if [ $RC -ne 0 ]; then manage_error build-external-inputs.py $RC; fi\n')
-                file_id.write( '        conda deactivate\n')
-                file_id.write( '        echo "Inputs are built."\n')
+                file_id.write( '        echo "Annotations, statistics, inputs and indexes are built."\n')
                 file_id.write( '        touch $STEP_STATUS\n')
                 file_id.write( '    fi\n')
                 file_id.write( '}\n')
@@ -1434,17 +1356,10 @@ class FormRunAnnotationPipeline(QWidget):
                 file_id.write( '    FORMATTED_DURATION=`printf "%03d:%02d:%02d\\n" $HH $MM $SS`\n')
                 file_id.write( '}\n')
                 file_id.write( '#-------------------------------------------------------------------------------\n')
+                pipelinelib.write_concurrency_function(file_id)
+                file_id.write( '#-------------------------------------------------------------------------------\n')
                 file_id.write( 'init\n')
-                file_id.write( 'save_params\n')
-                file_id.write( 'predict_orfs\n')
-                file_id.write( 'align_peptides_2_alignment_tool_acrogymnospermae_db\n')
-                file_id.write( 'align_transcriptome_2_alignment_tool_acrogymnospermae_db\n')
-                file_id.write( 'align_transcriptome_2_blastplus_lncrna_db\n')
-                file_id.write( 'concat_functional_annotations\n')
-                file_id.write( 'sort_functional_annotations\n')
-                file_id.write( 'add_heads\n')
-                file_id.write( 'calculate_functional_annotation_stats\n')
-                file_id.write( 'build_external_inputs\n')
+                pipelinelib.write_step_group_calls(file_id, step_group_list)
                 file_id.write( 'end\n')
         except Exception as e:
             error_list.append(f'*** EXCEPTION: "{e}".')
@@ -1485,7 +1400,7 @@ class FormRestartAnnotationPipeline(QWidget):
         self.title = f'{genlib.get_app_short_name()} - {self.head}'
 
         # get the dictionary of application configuration
-        self.app_config_dict = genlib.get_config_dict(genlib.get_app_config_file())
+        self.app_config_dict = genlib.AppState.get_app_config_dict()
 
         # build the graphic user interface of the window
         self.build_gui()
@@ -2085,77 +2000,12 @@ class FormRestartAnnotationPipeline(QWidget):
         # get the result directory
         result_dir = self.app_config_dict['Environment parameters']['result_dir']
 
-        # set the type, name and code of the annotation pipeline datasets
+        # set the type and name of the annotation pipeline datasets
         process_type = genlib.get_result_run_subdir()
         process_name = genlib.get_process_run_annotation_pipeline_name()
-        process_code = genlib.get_process_id(process_name)
 
-        # get the process dictionary
-        process_dict = genlib.get_process_dict()
-
-        # get the log directory
-        log_dir = f'{result_dir}/{process_type}'
-        if sys.platform.startswith('win32'):
-            log_dir = genlib.wsl_path_2_windows_path(log_dir)
-
-        # set the command to get the result datasets of annotation pipeline in the log directory
-        command = ''
-        if sys.platform.startswith('linux') or sys.platform.startswith('darwin'):
-            if process_name == 'all':
-                command = f'ls -d {log_dir}/*  | xargs -n 1 basename'
-            else:
-                command = f'ls -d {log_dir}/{process_code}-*  | xargs -n 1 basename'
-        elif sys.platform.startswith('win32'):
-            log_dir = log_dir.replace('/', '\\')
-            if process_name == 'all':
-                command = f'dir /a:d /b {log_dir}\\*'
-            else:
-                command = f'dir /a:d /b {log_dir}\\{process_code}-*'
-
-        # run the command to get the result datasets of enrichment analysis in the log directory
-        output = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=False)
-
-        # initialize the result dataset dictionary
-        result_dataset_dict = {}
-
-        # build the result dataset dictionary
-        for line in output.stdout.split('\n'):
-            if line != '':
-
-
-                # get data
-                result_dataset_id = line.strip()
-                try:
-                    pattern = r'^(.+)\-(.+)\-(.+)$'
-                    mo = re.search(pattern, result_dataset_id)
-                    process_code = mo.group(1).strip()
-                    process_name = process_dict[process_code]['name']
-                    yymmdd = mo.group(2)
-                    hhmmss = mo.group(3)
-                    date = f'20{yymmdd[:2]}-{yymmdd[2:4]}-{yymmdd[4:]}'
-                    time = f'{hhmmss[:2]}:{hhmmss[2:4]}:{hhmmss[4:]}'
-                except:    # pylint: disable=bare-except
-                    process_name = 'unknown process'
-                    date = '0000-00-00'
-                    time = '00:00:00'
-
-                # determine the status
-                status_ok = os.path.isfile(genlib.get_status_ok(os.path.join(log_dir, result_dataset_id)))
-                status_wrong = os.path.isfile(genlib.get_status_wrong(os.path.join(log_dir, result_dataset_id)))
-                status = ''
-                if status_ok and not status_wrong:
-                    status = 'OK'
-                elif not status_ok and status_wrong:
-                    status = 'wrong'
-                elif not status_ok and not status_wrong:
-                    status = 'not finished'
-                elif status_ok and status_wrong:
-                    status = 'undetermined'
-
-                # insert data in the dictionary when the the status is wrong
-                if status == 'wrong':
-                    key = f'{process_name}-{result_dataset_id}'
-                    result_dataset_dict[key] = {'process': process_name, 'result_dataset_id': result_dataset_id, 'date': date, 'time': time, 'status': status}
+        # get the result datasets ended wrong from the run registry
+        result_dataset_dict = registrylib.get_result_dataset_dict(result_dir, process_type, process_name, status_list=['wrong'])
 
         # initialize "tablewidget"
         self.tablewidget.clearContents()
@@ -2217,6 +2067,10 @@ class FormRestartAnnotationPipeline(QWidget):
         if OK:
             starter_name = f'{genlib.get_process_run_annotation_pipeline_code()}-process-starter.sh'
 
+        # remove the status files of the previous run, because the script removes them when it starts after waiting in the job queue
+        if OK:
+            registrylib.remove_run_status_files(current_run_dir)
+
         # submit the starter
         if OK:
             process.write(f'{genlib.get_separator()}\n')
@@ -2225,6 +2079,7 @@ class FormRestartAnnotationPipeline(QWidget):
             rc = genlib.run_command(command, process, is_script=True)
             if rc == 0:
                 process.write('The script is submitted.\n')
+                registrylib.register_run(result_dir, genlib.get_result_run_subdir(), result_dataset)
             else:
                 process.write(f'*** ERROR: RC {rc} in command -> {command}\n')
                 OK = False
@@ -2267,7 +2122,7 @@ class FormBrowseAnnotationResults(QWidget):
         self.title = f'{genlib.get_app_short_name()} - {self.head}'
 
         # get the dictionary of application configuration
-        self.app_config_dict = genlib.get_config_dict(genlib.get_app_config_file())
+        self.app_config_dict = genlib.AppState.get_app_config_dict()
 
         # get the the code list and text list of annotation result types
         self.annotation_result_type_code_list = genlib.get_annotation_result_type_code_list()
@@ -2900,14 +2755,17 @@ class FormBrowseAnnotationResults(QWidget):
 
             # get functional annotation data
             QApplication.setOverrideCursor(Qt.WaitCursor)
-            (functional_annotation_dict, data_list, data_dict, window_height, window_width, explanatory_text) = self.get_functional_annotation_data(functional_annotation_file_path)
+            (functional_annotation_index, data_list, data_dict, window_height, window_width, explanatory_text) = self.get_functional_annotation_data(functional_annotation_file_path)
             QGuiApplication.restoreOverrideCursor()
 
             # show functional annotation data
             head = f'Functional annotation file {functional_annotation_file_path}'
-            data_table = dialogs.DialogDataTable(self, head, window_height, window_width, data_list, data_dict, functional_annotation_dict, functional_annotation_dict.keys(), explanatory_text, 'browse-functional-annotation')
+            data_table = dialogs.DialogDataTable(self, head, window_height, window_width, data_list, data_dict, functional_annotation_index, range(len(functional_annotation_index)), explanatory_text, 'browse-functional-annotation')
             data_table.exec()
 
+            # close the functional annotation file
+            functional_annotation_index.close()
+
         # close the windows
         # -- if OK:
         # --     self.pushbutton_close_clicked()
@@ -2933,77 +2791,12 @@ class FormBrowseAnnotationResults(QWidget):
         # get the result directory
         result_dir = self.app_config_dict['Environment parameters']['result_dir']
 
-        # set the type, name and code of the annotation pipeline datasets
+        # set the type and name of the annotation pipeline datasets
         process_type = genlib.get_result_run_subdir()
         process_name = genlib.get_process_run_annotation_pipeline_name()
-        process_code = genlib.get_process_id(process_name)
 
-        # get the process dictionary
-        process_dict = genlib.get_process_dict()
-
-        # get the log directory
-        log_dir = f'{result_dir}/{process_type}'
-        if sys.platform.startswith('win32'):
-            log_dir = genlib.wsl_path_2_windows_path(log_dir)
-
-        # set the command to get the result datasets of annotation pipeline in the log directory
-        command = ''
-        if sys.platform.startswith('linux') or sys.platform.startswith('darwin'):
-            if process_name == 'all':
-                command = f'ls -d {log_dir}/*  | xargs -n 1 basename'
-            else:
-                command = f'ls -d {log_dir}/{process_code}-*  | xargs -n 1 basename'
-        elif sys.platform.startswith('win32'):
-            log_dir = log_dir.replace('/', '\\')
-            if process_name == 'all':
-                command = f'dir /a:d /b {log_dir}\\*'
-            else:
-                command = f'dir /a:d /b {log_dir}\\{process_code}-*'
-
-        # run the command to get the result datasets of enrichment analysis in the log directory
-        output = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=False)
-
-        # initialize the result dataset dictionary
-        result_dataset_dict = {}
-
-        # build the result dataset dictionary
-        for line in output.stdout.split('\n'):
-            if line != '':
-
-
-                # get data
-                result_dataset_id = line.strip()
-                try:
-                    pattern = r'^(.+)\-(.+)\-(.+)$'
-                    mo = re.search(pattern, result_dataset_id)
-                    process_code = mo.group(1).strip()
-                    process_name = process_dict[process_code]['name']
-                    yymmdd = mo.group(2)
-                    hhmmss = mo.group(3)
-                    date = f'20{yymmdd[:2]}-{yymmdd[2:4]}-{yymmdd[4:]}'
-                    time = f'{hhmmss[:2]}:{hhmmss[2:4]}:{hhmmss[4:]}'
-                except:    # pylint: disable=bare-except
-                    process_name = 'unknown process'
-                    date = '0000-00-00'
-                    time = '00:00:00'
-
-                # determine the status
-                status_ok = os.path.isfile(genlib.get_status_ok(os.path.join(log_dir, result_dataset_id)))
-                status_wrong = os.path.isfile(genlib.get_status_wrong(os.path.join(log_dir, result_dataset_id)))
-                status = ''
-                if status_ok and not status_wrong:
-                    status = 'OK'
-                elif not status_ok and status_wrong:
-                    status = 'wrong'
-                elif not status_ok and not status_wrong:
-                    status = 'not finished'
-                elif status_ok and status_wrong:
-                    status = 'undetermined'
-
-                # insert data in the dictionary when the the status is OK
-                if status == 'OK':
-                    key = f'{process_name}-{result_dataset_id}'
-                    result_dataset_dict[key] = {'process': process_name, 'result_dataset_id': result_dataset_id, 'date': date, 'time': time, 'status': status}
+        # get the result datasets ended OK from the run registry
+        result_dataset_dict = registrylib.get_result_dataset_dict(result_dir, process_type, process_name, status_list=['OK'])
 
         # initialize "tablewidget"
         self.tablewidget.clearContents()
@@ -3033,84 +2826,12 @@ class FormBrowseAnnotationResults(QWidget):
         Get functional annotation data.
         '''
 
-        # initialize the functional annotation dictionary
-        functional_annotation_dict = {}
-
-        # open the functional annotation file
-        if functional_annotation_file.endswith('.gz'):
-            try:
-                functional_annotation_file_id = gzip.open(functional_annotation_file, mode='rt', encoding='iso-8859-1', newline='\n')
-            except Exception as e:
-                raise genlib.ProgramException(e, 'F002', functional_annotation_file)
+        # get the hits from the results database when it is valid (runs before its introduction do not have it);
+        # otherwise, get the index of the functional annotation file (the records are read and parsed when they are shown)
+        if resultslib.is_results_db_valid(functional_annotation_file):
+            functional_annotation_index = resultslib.ResultsHitRows(functional_annotation_file)
         else:
-            try:
-                functional_annotation_file_id = open(functional_annotation_file, mode='r', encoding='iso-8859-1', newline='\n')
-            except Exception as e:
-                raise genlib.ProgramException(e, 'F001', functional_annotation_file)
-
-        # initialize the annotation counter
-        annotation_counter = 0
-
-        # read the first record of the functional annotation file (header)
-        (record, key, data_dict) = genlib.read_functional_annotation_record(functional_annotation_file, functional_annotation_file_id, annotation_counter)
-
-        # read the secord record of the functional annotation file (first data record)
-        (record, key, data_dict) = genlib.read_functional_annotation_record(functional_annotation_file, functional_annotation_file_id, annotation_counter)
-        genlib.Message.print('trace', f'key: {key} - record: {record}')
-
-        # while there are records
-        while record != '':
-
-            # add 1 to the annotation counter
-            annotation_counter += 1
-
-            # get data
-            qseqid = data_dict['qseqid']
-            sseqid = data_dict['sseqid']
-            pident = data_dict['pident']
-            # -- length = data_dict['length']
-            # -- mismatch = data_dict['mismatch']
-            # -- gapopen = data_dict['gapopen']
-            # -- qstart = data_dict['qstart']
-            # -- qend = data_dict['qend']
-            # -- sstart = data_dict['sstart']
-            # -- send = data_dict['send']
-            evalue = data_dict['evalue']
-            # -- bitscore = data_dict['bitscore']
-            algorithm = data_dict['algorithm']
-            ncbi_description = data_dict['ncbi_description']
-            ncbi_species = data_dict['ncbi_species']
-            tair10_ortholog_seq_id = data_dict['tair10_ortholog_seq_id']
-            interpro_goterms = data_dict['interpro_goterms']
-            panther_goterms = data_dict['panther_goterms']
-            metacyc_pathways = data_dict['metacyc_pathways']
-            # -- reactome_pathways = data_dict['reactome_pathways']
-            eggnog_ortholog_seq_id = data_dict['eggnog_ortholog_seq_id']
-            eggnog_ortholog_species = data_dict['eggnog_ortholog_species']
-            eggnog_ogs = data_dict['eggnog_ogs']
-            cog_category = data_dict['cog_category']
-            eggnog_description = data_dict['eggnog_description']
-            eggnog_goterms = data_dict['eggnog_goterms']
-            ec = data_dict['ec']
-            kegg_kos = data_dict['kegg_kos']
-            kegg_pathways = data_dict['kegg_pathways']
-            kegg_modules = data_dict['kegg_modules']
-            kegg_reactions = data_dict['kegg_reactions']
-            kegg_rclasses = data_dict['kegg_rclasses']
-            brite = data_dict['brite']
-            kegg_tc = data_dict['kegg_tc']
-            cazy = data_dict['cazy']
-            pfams = data_dict['pfams']
-
-            # set the key
-            key = f'{qseqid}-{sseqid}'
-
-            # add data to the dictionary
-            # -- functional_annotation_dict[key] = {'qseqid': qseqid, 'sseqid': sseqid, 'pident': pident, 'length': length, 'mismatch': mismatch, 'gapopen': gapopen, 'qstart': qstart, 'qend': qend, 'sstart': sstart, 'send': send, 'evalue': evalue, 'bitscore': bitscore, 'algorithm': algorithm, 'ncbi_description': ncbi_description, 'ncbi_species': ncbi_species, 'tair10_ortholog_seq_id': tair10_ortholog_seq_id, 'interpro_goterms': interpro_goterms, 'panther_goterms': panther_goterms, 'metacyc_pathways': metacyc_pathways, 'reactome_pathways': reactome_pathways, 'eggnog_ortholog_seq_id': eggnog_ortholog_seq_id, 'eggnog_ortholog_species': eggnog_ortholog_species, 'eggnog_ogs': eggnog_ogs, 'cog_category': cog_category, 'eggnog_description': eggnog_description, 'eggnog_goterms': eggnog_goterms, 'ec': ec, 'kegg_kos': kegg_kos, 'kegg_pathways': kegg_pathways, 'kegg_modules': kegg_modules, 'kegg_reactions': kegg_reactions, 'kegg_rclasses': kegg_rclasses, 'brite': brite, 'kegg_tc': kegg_tc, 'cazy': cazy, 'pfams': pfams}
-            functional_annotation_dict[key] = {'qseqid': qseqid, 'sseqid': sseqid, 'pident': pident, 'evalue': evalue, 'algorithm': algorithm, 'ncbi_description': ncbi_description, 'ncbi_species': ncbi_species, 'tair10_ortholog_seq_id': tair10_ortholog_seq_id, 'interpro_goterms': interpro_goterms, 'panther_goterms': panther_goterms, 'metacyc_pathways': metacyc_pathways, 'eggnog_ortholog_seq_id': eggnog_ortholog_seq_id, 'eggnog_ortholog_species': eggnog_ortholog_species, 'eggnog_ogs': eggnog_ogs, 'cog_category': cog_category, 'eggnog_description': eggnog_description, 'eggnog_goterms': eggnog_goterms, 'ec': ec, 'kegg_kos': kegg_kos, 'kegg_pathways': kegg_pathways, 'kegg_modules': kegg_modules, 'kegg_reactions': kegg_reactions, 'kegg_rclasses': kegg_rclasses, 'brite': brite, 'kegg_tc': kegg_tc, 'cazy': cazy, 'pfams': pfams}
-
-            # read the next record
-            (record, key, data_dict) = genlib.read_functional_annotation_record(functional_annotation_file, functional_annotation_file_id, annotation_counter)
+            functional_annotation_index = genlib.FunctionalAnnotationFileIndex(functional_annotation_file)
 
         # build the data list
         # -- data_list = ['qseqid', 'sseqid', 'pident', 'length', 'mismatch', 'gapopen', 'qstart', 'qend', 'sstart', 'send', 'evalue', 'bitscore', 'algorithm', 'ncbi_description', 'ncbi_species', 'tair10_ortholog_seq_id', 'interpro_goterms', 'panther_goterms', 'metacyc_pathways', 'reactome_pathways', 'eggnog_ortholog_seq_id', 'eggnog_ortholog_species', 'eggnog_ogs', 'cog_category', 'eggnog_description', 'eggnog_goterms', 'ec', 'kegg_kos', 'kegg_pathways', 'kegg_modules', 'kegg_reactions', 'kegg_rclasses', 'brite', 'kegg_tc', 'cazy', 'pfams']
@@ -3163,7 +2884,7 @@ class FormBrowseAnnotationResults(QWidget):
         window_width = 1330
 
         # return data
-        return functional_annotation_dict, data_list, data_dict, window_height, window_width, explanatory_text
+        return functional_annotation_index, data_list, data_dict, window_height, window_width, explanatory_text
 
     #---------------
 
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This program measures the time of the functional annotation statistics on a synthetic complete
+functional annotation file. It compares the statistics engine with interned GO term numbers and
+the previous engine with lists of GO term identifications, and it ends with errors when their
+counters are different.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import columnlib
+import genlib
+import statslib
+
+#-------------------------------------------------------------------------------
+
+# set the data of the synthetic functional annotation file
+SYNTHETIC_SEED = 7
+SYNTHETIC_FILE_NAME = 'benchmark-functional-annotations.csv'
+SYNTHETIC_GOTERM_NUM = 5000
+SYNTHETIC_MAX_HITS = 20
+SYNTHETIC_MAX_GOTERMS = 30
+SYNTHETIC_LNCRNA_RATE = 0.02
+SYNTHETIC_SPECIES_LIST = ['Abies alba', 'Cycas revoluta', 'Ginkgo biloba', 'Picea abies', 'Pinus pinaster', 'Pinus taeda', 'Taxus baccata']
+
+#-------------------------------------------------------------------------------
+
+def main():
+    '''
+    Main line of the program.
+    '''
+
+    # check the operating system
+    genlib.check_os()
+
+    # get and check the arguments
+    parser = build_parser()
+    args = parser.parse_args()
+    check_args(args)
+
+    # benchmark the functional annotation statistics
+    OK = benchmark_functional_annotation_stats(args.rows, args.output_dir)
+
+    # exit with error when the benchmark fails
+    if not OK:
+        sys.exit(1)
+
+#-------------------------------------------------------------------------------
+
+def build_parser():
+    '''
+    Build the parser with the available arguments.
+    '''
+
+    # create the parser and add arguments
+    description = 'Description: This program measures the time of the functional annotation statistics on a synthetic complete\n' \
+                  'functional annotation file. It compares the statistics engine with interned GO term numbers and\n' \
+                  'the previous engine with lists of GO term identifications, and it ends with errors when their\n' \
+                  'counters are different.'
+    text = f'{genlib.get_app_short_name()} v{genlib.get_app_version()} - {os.path.basename(__file__)}\n\n{description}\n'
+    usage = f'\r{text.ljust(len("usage:"))}\nUsage: {os.path.basename(__file__)} arguments'
+    parser = argparse.ArgumentParser(usage=usage)
+    parser._optionals.title = 'Arguments'    #pylint: disable=protected-access
+    parser.add_argument('--rows', dest='rows', help=f'Number of records of the synthetic functional annotation file; default: {genlib.Const.DEFAULT_STATS_BENCHMARK_ROWS}.')
+    parser.add_argument('--outdir', dest='output_dir', help='Path of the directory where the synthetic functional annotation file is written and removed at the end (mandatory).')
+    parser.add_argument('--verbose', dest='verbose', help=f'Additional job status info during the run: {genlib.get_verbose_code_list_text()}; default: {genlib.Const.DEFAULT_VERBOSE}.')
+    parser.add_argument('--trace', dest='trace', help=f'Additional info useful to the developer team: {genlib.get_trace_code_list_text()}; default: {genlib.Const.DEFAULT_TRACE}.')
+
+    # return the paser
+    return parser
+
+#-------------------------------------------------------------------------------
+
+def check_args(args):
+    '''
+    Check the input arguments.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # check "rows"
+    if args.rows is None:
+        args.rows = genlib.Const.DEFAULT_STATS_BENCHMARK_ROWS
+    elif not genlib.check_int(args.rows, minimum=1):
+        genlib.Message.print('error', '*** rows has to be an integer number greater than or equal to 1.')
+        OK = False
+    else:
+        args.rows = int(args.rows)
+
+    # check "output_dir"
+    if args.output_dir is None:
+        genlib.Message.print('error', '*** The output directory is not indicated in the input arguments.')
+        OK = False
+    elif not os.path.isdir(args.output_dir):
+        genlib.Message.print('error', f'*** The directory {args.output_dir} does not exist.')
+        OK = False
+
+    # check "verbose"
+    if args.verbose is None:
+        args.verbose = genlib.Const.DEFAULT_VERBOSE
+    elif not genlib.check_code(args.verbose, genlib.get_verbose_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** verbose has to be {genlib.get_verbose_code_list_text()}.')
+        OK = False
+    if args.verbose.upper() == 'Y':
+        genlib.Message.set_verbose_status(True)
+
+    # check "trace"
+    if args.trace is None:
+        args.trace = genlib.Const.DEFAULT_TRACE
+    elif not genlib.check_code(args.trace, genlib.get_trace_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** trace has to be {genlib.get_trace_code_list_text()}.')
+        OK = False
+    if args.trace.upper() == 'Y':
+        genlib.Message.set_trace_status(True)
+
+    # if there are errors, exit with exception
+    if not OK:
+        raise genlib.ProgramException('', 'P001')
+
+#-------------------------------------------------------------------------------
+
+def write_synthetic_file(synthetic_file, rows):
+    '''
+    Write a synthetic complete functional annotation file with a number of records: each sequence
+    has 1 to SYNTHETIC_MAX_HITS hits (or a potential lncRNA record) and each hit has 0 to
+    SYNTHETIC_MAX_GOTERMS GO terms of SYNTHETIC_GOTERM_NUM distinct ones spread over the InterPro,
+    PANTHER and eggNOG columns. Get the number of sequences.
+    '''
+
+    # initialize the random generator and the GO term identifications
+    generator = random.Random(SYNTHETIC_SEED)
+    goterm_id_list = [f'GO:{i:07d}' for i in range(SYNTHETIC_GOTERM_NUM)]
+
+    # get the column positions
+    column_list = genlib.get_functional_annotation_head().split(';')
+    position_dict = {column: i for i, column in enumerate(column_list)}
+
+    # initialize the counters
+    record_counter = 0
+    seq_counter = 0
+
+    # write the records
+    try:
+        with open(synthetic_file, mode='w', encoding='iso-8859-1', newline='\n') as synthetic_file_id:
+            synthetic_file_id.write(f'{genlib.get_functional_annotation_head()}\n')
+            while record_counter < rows:
+                seq_counter += 1
+                qseqid = f'seq{seq_counter:09d}'
+                if generator.random() < SYNTHETIC_LNCRNA_RATE:
+                    hit_num = 1
+                else:
+                    hit_num = min(generator.randint(1, SYNTHETIC_MAX_HITS), rows - record_counter)
+                for hit_i in range(hit_num):
+                    data_list = ['-'] * len(column_list)
+                    data_list[position_dict['qseqid']] = qseqid
+                    data_list[position_dict['algorithm']] = 'blastp'
+                    if hit_num == 1 and generator.random() < SYNTHETIC_LNCRNA_RATE:
+                        data_list[position_dict['sseqid']] = genlib.get_potential_lncrn()
+                        data_list[position_dict['algorithm']] = 'blastn'
+                    else:
+                        sample_list = generator.sample(goterm_id_list, generator.randint(0, SYNTHETIC_MAX_GOTERMS))
+                        data_list[position_dict['sseqid']] = f'cluster{hit_i}'
+                        data_list[position_dict['pident']] = generator.choice(['80.0', '90.0', '95.5', '100.0'])
+                        data_list[position_dict['evalue']] = generator.choice(['1e-5', '1e-10', '1e-20', '0.0'])
+                        data_list[position_dict['ncbi_species']] = generator.choice(SYNTHETIC_SPECIES_LIST)
+                        data_list[position_dict['interpro_goterms']] = '|'.join(sample_list[:len(sample_list) // 2]) or '-'
+                        data_list[position_dict['panther_goterms']] = '|'.join(sample_list[len(sample_list) // 3:]) or '-'
+                        data_list[position_dict['eggnog_goterms']] = '|'.join(sample_list[::2]) or '-'
+                    synthetic_file_id.write(f'{";".join(data_list)}\n')
+                    record_counter += 1
+    except Exception as e:
+        raise genlib.ProgramException(e, 'F003', synthetic_file) from e
+
+    # return the number of sequences
+    return seq_counter
+
+#-------------------------------------------------------------------------------
+
+def read_records(synthetic_file):
+    '''
+    Read the records of the functional annotation file grouped by sequence without calculating
+    statistics. Get the number of records.
+    '''
+
+    record_counter = 0
+    for _, annotation_record_list in columnlib.read_functional_annotation_groups(synthetic_file, statslib.FunctionalStats.COLUMN_LIST):
+        record_counter += len(annotation_record_list)
+
+    return record_counter
+
+#-------------------------------------------------------------------------------
+
+def accumulate_list_functional_stats(synthetic_file):
+    '''
+    Accumulate the functional annotation statistics with the previous engine, which keeps the GO
+    term identifications of each hit in a sorted list and the GO term identifications of each
+    sequence in a list without duplicates. Get the dictionaries of the species counters, GO term
+    counters and sequence number per GO term number.
+    '''
+
+    # initialize the statistics dictionaries
+    species_stats_dict = {}
+    go_stats_dict = {}
+    seq_num_per_goterm_id_num_stats_dict = {}
+
+    # accumulate the statistics of each sequence
+    for _, annotation_record_list in columnlib.read_functional_annotation_groups(synthetic_file, statslib.FunctionalStats.COLUMN_LIST):
+
+        # initialize the best evalue and pident
+        best_evalue = 1.
+        best_pident = 0.
+
+        # initialize the species and list of GO term identification with the best evalue and pident
+        best_species = ''
+        best_goterm_id_list = []
+
+        # initialize the lists of GO term identifications per sequence
+        goterm_ids_per_seq_list = []
+
+        # accumulate data of each record
+        for annotation_record in annotation_record_list:
+
+            # if the sequence matched is a potential lncRNA, skip the record
+            if annotation_record['sseqid'] == genlib.get_potential_lncrn():
+                continue
+
+            # increase the species counter
+            species_data = species_stats_dict.get(annotation_record['ncbi_species'], {'best': 0, 'complete': 0})
+            species_data['complete'] = species_data['complete'] + 1
+            species_stats_dict[annotation_record['ncbi_species']] = species_data
+
+            # extract the GO term identifications
+            # goterms format: "goterm_id1|goterm_id2|...|gotermo_idn"
+            goterm_id_set = set()
+            for column in ['interpro_goterms', 'panther_goterms', 'eggnog_goterms']:
+                if annotation_record[column] != '' and annotation_record[column] != '-':
+                    goterm_id_set.update(annotation_record[column].split('|'))
+            goterm_id_list = sorted(goterm_id_set)
+
+            # increase the GO term identification counters
+            for goterm_id in goterm_id_list:
+                goterm_data = go_stats_dict.get(goterm_id, {'best': 0, 'complete': 0})
+                goterm_data['complete'] = goterm_data['complete'] + 1
+                go_stats_dict[goterm_id] = goterm_data
+
+            # add GO term identifications to the list of GO term identifications per sequence
+            for goterm_id in goterm_id_list:
+                if goterm_id not in goterm_ids_per_seq_list:
+                    goterm_ids_per_seq_list.append(goterm_id)
+
+            # save the species with best evalue and pident
+            if float(annotation_record['evalue']) < best_evalue or float(annotation_record['evalue']) == best_evalue and float(annotation_record['pident']) > best_pident:
+                best_evalue = float(annotation_record['evalue'])
+                best_pident = float(annotation_record['pident'])
+                best_species = annotation_record['ncbi_species']
+                best_goterm_id_list = goterm_id_list
+
+        # if the first sequence matched is not a potential lncRNA
+        if annotation_record_list != [] and annotation_record_list[0]['sseqid'] != genlib.get_potential_lncrn():
+
+            # increase the species counter (best evalue and pident case)
+            species_data = species_stats_dict.get(best_species, {'best': 0, 'complete': 0})
+            species_data['best'] = species_data['best'] + 1
+            species_stats_dict[best_species] = species_data
+
+            # increase the GO term identification counters (best evalue and pident case)
+            for goterm_id in best_goterm_id_list:
+                goterm_data = go_stats_dict.get(goterm_id, {'best': 0, 'complete': 0})
+                goterm_data['best'] = goterm_data['best'] + 1
+                go_stats_dict[goterm_id] = goterm_data
+
+            # increase the sequence number per Gene Ontology identification number
+            seq_num_per_goterm_id_num_stats_dict[len(goterm_ids_per_seq_list)] = seq_num_per_goterm_id_num_stats_dict.get(len(goterm_ids_per_seq_list), 0) + 1
+
+    # return the statistics dictionaries
+    return species_stats_dict, go_stats_dict, seq_num_per_goterm_id_num_stats_dict
+
+#-------------------------------------------------------------------------------
+
+def benchmark_functional_annotation_stats(rows, output_dir):
+    '''
+    Measure the time of the functional annotation statistics of both engines on a synthetic
+    complete functional annotation file and check that their counters are equal.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # write the synthetic functional annotation file
+    synthetic_file = f'{output_dir}/{SYNTHETIC_FILE_NAME}'
+    genlib.Message.print('info', f'Writing the synthetic functional annotation file {synthetic_file} ...')
+    start_time = time.perf_counter()
+    seq_num = write_synthetic_file(synthetic_file, rows)
+    genlib.Message.print('info', f'{rows} records of {seq_num} sequences are written in {time.perf_counter() - start_time:.1f} s.')
+
+    try:
+
+        # measure the reading of the records
+        genlib.Message.print('info', 'Reading the records without statistics ...')
+        start_time = time.perf_counter()
+        read_records(synthetic_file)
+        read_time = time.perf_counter() - start_time
+        genlib.Message.print('info', f'Reading: {read_time:.1f} s.')
+
+        # measure the previous engine
+        genlib.Message.print('info', 'Calculating the statistics with the engine with lists of GO term identifications ...')
+        start_time = time.perf_counter()
+        (species_stats_dict, go_stats_dict, seq_num_per_goterm_id_num_stats_dict) = accumulate_list_functional_stats(synthetic_file)
+        list_time = time.perf_counter() - start_time
+        genlib.Message.print('info', f'Engine with lists: {list_time:.1f} s (statistics without reading: {list_time - read_time:.1f} s).')
+
+        # measure the current engine
+        genlib.Message.print('info', 'Calculating the statistics with the engine with interned GO term numbers ...')
+        start_time = time.perf_counter()
+        functional_stats = statslib.accumulate_functional_stats(synthetic_file)
+        interned_time = time.perf_counter() - start_time
+        genlib.Message.print('info', f'Engine with interned numbers: {interned_time:.1f} s (statistics without reading: {interned_time - read_time:.1f} s).')
+        genlib.Message.print('info', f'The engine with interned numbers is {list_time / interned_time:.1f} times faster than the engine with lists.')
+
+    finally:
+
+        # remove the synthetic functional annotation file
+        os.remove(synthetic_file)
+
+    # check the counters of both engines
+    for (stats_name, list_stats_dict, interned_stats_dict) in [('species', species_stats_dict, functional_stats.species_stats.data_dict), ('GO term', go_stats_dict, functional_stats.go_stats.data_dict), ('sequence number per GO term number', {key: {'seq_num': value} for key, value in seq_num_per_goterm_id_num_stats_dict.items()}, functional_stats.seq_num_per_goterm_id_num_stats.data_dict)]:
+        if list_stats_dict != interned_stats_dict:
+            genlib.Message.print('error', f'*** The {stats_name} counters of both engines are different.')
+            OK = False
+
+    # show OK message
+    if OK:
+        genlib.Message.print('info', 'The counters of both engines are equal. The functional annotation statistics benchmark is OK.')
+
+    # return the control variable
+    return OK
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This program measures the startup time of the gymnoTOA GUI (import of gymnoTOA.py) and compares
+it with an eager import of the libraries and form modules. It ends with errors when the startup
+loads a heavy library or form module, or when its median time exceeds a maximum time.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+import genlib
+
+#-------------------------------------------------------------------------------
+
+# set the libraries that must not be imported at the GUI startup
+HEAVY_LIBRARY_LIST = ['matplotlib', 'numpy', 'pandas', 'plotnine', 'scipy']
+
+# set the form modules that must be imported lazily at the GUI startup
+FORM_MODULE_LIST = ['annotation', 'bioinfosw', 'configuration', 'database', 'dialogs', 'enrichment', 'logs', 'stats']
+
+# set the code executed to measure the GUI startup (it prints the time and the modules loaded)
+LAZY_STARTUP_CODE = f'''
+import sys, time, types
+start = time.perf_counter()
+import gymnoTOA
+elapsed = time.perf_counter() - start
+loaded_list = [name for name in {HEAVY_LIBRARY_LIST} if name in sys.modules]
+loaded_list += [name for name in {FORM_MODULE_LIST} if name in sys.modules and type(sys.modules[name]) is types.ModuleType]
+print(f'{{elapsed}}\\t{{",".join(loaded_list)}}')
+'''
+
+# set the code executed to measure an eager import of the libraries and form modules
+EAGER_STARTUP_CODE = f'''
+import importlib, time
+start = time.perf_counter()
+import genlib
+import PyQt5.QtWidgets
+for name in {HEAVY_LIBRARY_LIST + FORM_MODULE_LIST}:
+    importlib.import_module(name)
+elapsed = time.perf_counter() - start
+print(f'{{elapsed}}\\t')
+'''
+
+#-------------------------------------------------------------------------------
+
+def main():
+    '''
+    Main line of the program.
+    '''
+
+    # check the operating system
+    genlib.check_os()
+
+    # get and check the arguments
+    parser = build_parser()
+    args = parser.parse_args()
+    check_args(args)
+
+    # benchmark the GUI startup
+    OK = benchmark_gui_startup(args.runs, args.max_time, args.eager.upper() == 'Y')
+
+    # exit with error when the benchmark fails
+    if not OK:
+        sys.exit(1)
+
+#-------------------------------------------------------------------------------
+
+def build_parser():
+    '''
+    Build the parser with the available arguments.
+    '''
+
+    # create the parser and add arguments
+    description = 'Description: This program measures the startup time of the gymnoTOA GUI (import of gymnoTOA.py) and compares\n' \
+                  'it with an eager import of the libraries and form modules. It ends with errors when the startup\n' \
+                  'loads a heavy library or form module, or when its median time exceeds a maximum time.'
+    text = f'{genlib.get_app_short_name()} v{genlib.get_app_version()} - {os.path.basename(__file__)}\n\n{description}\n'
+    usage = f'\r{text.ljust(len("usage:"))}\nUsage: {os.path.basename(__file__)} arguments'
+    parser = argparse.ArgumentParser(usage=usage)
+    parser._optionals.title = 'Arguments'    #pylint: disable=protected-access
+    parser.add_argument('--runs', dest='runs', help=f'Number of measured startups (each one in a new Python process); default: {genlib.Const.DEFAULT_STARTUP_BENCHMARK_RUNS}.')
+    parser.add_argument('--maxtime', dest='max_time', help=f'Maximum median time of the startup in seconds; default: {genlib.Const.DEFAULT_STARTUP_MAX_TIME}.')
+    parser.add_argument('--eager', dest='eager', help=f'Measure also an eager import of the libraries and form modules: {genlib.get_eager_code_list_text()}; default: {genlib.Const.DEFAULT_EAGER}.')
+    parser.add_argument('--verbose', dest='verbose', help=f'Additional job status info during the run: {genlib.get_verbose_code_list_text()}; default: {genlib.Const.DEFAULT_VERBOSE}.')
+    parser.add_argument('--trace', dest='trace', help=f'Additional info useful to the developer team: {genlib.get_trace_code_list_text()}; default: {genlib.Const.DEFAULT_TRACE}.')
+
+    # return the paser
+    return parser
+
+#-------------------------------------------------------------------------------
+
+def check_args(args):
+    '''
+    Check the input arguments.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # check "runs"
+    if args.runs is None:
+        args.runs = genlib.Const.DEFAULT_STARTUP_BENCHMARK_RUNS
+    elif not genlib.check_int(args.runs, minimum=1):
+        genlib.Message.print('error', '*** runs has to be an integer number greater than or equal to 1.')
+        OK = False
+    else:
+        args.runs = int(args.runs)
+
+    # check "max_time"
+    if args.max_time is None:
+        args.max_time = genlib.Const.DEFAULT_STARTUP_MAX_TIME
+    elif not genlib.check_float(args.max_time, minimum=0., mne=1E-12):
+        genlib.Message.print('error', '*** maxtime has to be a float number greater than 0.')
+        OK = False
+    else:
+        args.max_time = float(args.max_time)
+
+    # check "eager"
+    if args.eager is None:
+        args.eager = genlib.Const.DEFAULT_EAGER
+    elif not genlib.check_code(args.eager, genlib.get_eager_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** eager has to be {genlib.get_eager_code_list_text()}.')
+        OK = False
+
+    # check "verbose"
+    if args.verbose is None:
+        args.verbose = genlib.Const.DEFAULT_VERBOSE
+    elif not genlib.check_code(args.verbose, genlib.get_verbose_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** verbose has to be {genlib.get_verbose_code_list_text()}.')
+        OK = False
+    if args.verbose.upper() == 'Y':
+        genlib.Message.set_verbose_status(True)
+
+    # check "trace"
+    if args.trace is None:
+        args.trace = genlib.Const.DEFAULT_TRACE
+    elif not genlib.check_code(args.trace, genlib.get_trace_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** trace has to be {genlib.get_trace_code_list_text()}.')
+        OK = False
+    if args.trace.upper() == 'Y':
+        genlib.Message.set_trace_status(True)
+
+    # if there are errors, exit with exception
+    if not OK:
+        raise genlib.ProgramException('', 'P001')
+
+#-------------------------------------------------------------------------------
+
+def measure_startup(code, runs):
+    '''
+    Run a startup code in new Python processes and get the list of times and the list of
+    modules loaded in each run.
+    '''
+
+    # initialize the lists
+    time_list = []
+    loaded_list = []
+
+    # run the code in the application directory
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    for i in range(runs):
+        output = subprocess.run([sys.executable, '-c', code], cwd=app_dir, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=False)
+        if output.returncode != 0:
+            genlib.Message.print('error', f'*** The startup can not be measured:\n{output.stdout}{output.stderr}')
+            return None, None
+        (elapsed, loaded_text) = output.stdout.strip('\n').split('\n')[-1].split('\t')
+        time_list.append(float(elapsed))
+        loaded_list.append(loaded_text)
+        genlib.Message.print('trace', f'run {i + 1}: {float(elapsed):.3f} s; loaded modules: {loaded_text}')
+
+    # return the lists
+    return time_list, loaded_list
+
+#-------------------------------------------------------------------------------
+
+def benchmark_gui_startup(runs, max_time, eager):
+    '''
+    Measure the startup time of the GUI and check that it does not load heavy libraries and
+    form modules.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # check that the GUI library is installed
+    genlib.check_library('PyQt5', 'PyQt5')
+
+    # measure the GUI startup
+    genlib.Message.print('info', f'Measuring the GUI startup ({runs} runs) ...')
+    (time_list, loaded_list) = measure_startup(LAZY_STARTUP_CODE, runs)
+    if time_list is None:
+        return False
+    startup_time = statistics.median(time_list)
+    genlib.Message.print('info', f'GUI startup: median {startup_time:.3f} s (min {min(time_list):.3f} s, max {max(time_list):.3f} s).')
+
+    # measure the eager import of the libraries and form modules
+    if eager:
+        genlib.Message.print('info', f'Measuring the eager import of the libraries and form modules ({runs} runs) ...')
+        (eager_time_list, _) = measure_startup(EAGER_STARTUP_CODE, runs)
+        if eager_time_list is None:
+            return False
+        eager_time = statistics.median(eager_time_list)
+        genlib.Message.print('info', f'Eager import: median {eager_time:.3f} s (min {min(eager_time_list):.3f} s, max {max(eager_time_list):.3f} s).')
+        genlib.Message.print('info', f'The GUI startup is {eager_time / startup_time:.1f} times faster than the eager import.')
+
+    # check the modules loaded at the GUI startup
+    loaded_module_set = {name for loaded_text in loaded_list for name in loaded_text.split(',') if name != ''}
+    if loaded_module_set:
+        genlib.Message.print('error', f'*** The GUI startup loads these modules: {", ".join(sorted(loaded_module_set))}.')
+        OK = False
+
+    # check the startup time
+    if startup_time > max_time:
+        genlib.Message.print('error', f'*** The median time of the GUI startup ({startup_time:.3f} s) exceeds the maximum time ({max_time} s).')
+        OK = False
+
+    # show OK message
+    if OK:
+        genlib.Message.print('info', 'The GUI startup benchmark is OK.')
+
+    # return the control variable
+    return OK
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
@@ -26,6 +26,7 @@ Licence: GNU General Public Licence Version 3.
 
 #-------------------------------------------------------------------------------
 
+import os
 import sys
 
 from PyQt5.QtCore import Qt                # pylint: disable=no-name-in-module
@@ -43,6 +44,7 @@ from PyQt5.QtWidgets import QWidget        # pylint: disable=no-name-in-module
 
 import genlib
 import dialogs
+import registrylib
 
 #-------------------------------------------------------------------------------
 
@@ -75,7 +77,7 @@ class FormInstallBioinfoSoftware(QWidget):
         self.title = f'{genlib.get_app_short_name()} - {self.head}'
 
         # get the dictionary of application configuration
-        self.app_config_dict = genlib.get_config_dict(genlib.get_app_config_file())
+        self.app_config_dict = genlib.AppState.get_app_config_dict()
 
         # build the graphic user interface of the window
         self.build_gui()
@@ -379,6 +381,7 @@ class FormInstallBioinfoSoftware(QWidget):
             rc = genlib.run_command(command, process, is_script=False)
             if rc == 0:
                 process.write(f'The directory path is {current_run_dir}.\n')
+                registrylib.register_run(result_dir, genlib.get_result_installation_subdir(), os.path.basename(current_run_dir))
             else:
                 process.write(f'*** ERROR: RC {rc} in command -> {command}\n')
                 OK = False
@@ -679,6 +682,7 @@ class FormInstallBioinfoSoftware(QWidget):
             rc = genlib.run_command(command, process, is_script=False)
             if rc == 0:
                 process.write(f'The directory path is {current_run_dir}.\n')
+                registrylib.register_run(result_dir, genlib.get_result_installation_subdir(), os.path.basename(current_run_dir))
             else:
                 process.write(f'*** ERROR: RC {rc} in command -> {command}\n')
                 OK = False
@@ -922,6 +926,7 @@ class FormInstallBioinfoSoftware(QWidget):
             rc = genlib.run_command(command, process, is_script=False)
             if rc == 0:
                 process.write(f'The directory path is {current_run_dir}.\n')
+                registrylib.register_run(result_dir, genlib.get_result_installation_subdir(), os.path.basename(current_run_dir))
             else:
                 process.write(f'*** ERROR: RC {rc} in command -> {command}\n')
                 OK = False
@@ -49,6 +49,7 @@ rem Execute the program build-external-inputs.py
 %PYTHON% %PYTHON_OPTIONS% build-external-inputs.py ^
     --annotations=%OUTPUT_DIR%\nt-plant-annotation.csv.gz ^
     --outdir=%OUTPUT_DIR% ^
+    --compress=N ^
     --verbose=Y ^
     --trace=N
 if %ERRORLEVEL% neq 0 (set RC=%ERRORLEVEL% & set ERROR=2 & goto END)
@@ -42,6 +42,7 @@ cd $APP_DIR
     ./build-external-inputs.py \
         --annotations=$OUTPUT_DIR/nt-plant-annotation.csv.gz \
         --outdir=$OUTPUT_DIR \
+        --compress=N \
         --verbose=Y  \
         --trace=N
 if [ $? -ne 0 ]; then echo 'Script ended with errors.'; exit 1; fi
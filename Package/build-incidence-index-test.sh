@@ -0,0 +1,58 @@
+#!/bin/bash
+
+#-------------------------------------------------------------------------------
+
+# This script performs a test of the program build-incidence-index.py
+# in a Linux environment.
+#
+# This software has been developed by:
+#
+#    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+#    Dpto. Sistemas y Recursos Naturales
+#    ETSI Montes, Forestal y del Medio Natural
+#    Universidad Politecnica de Madrid
+#    https://github.com/ggfhf/
+#
+# Licence: GNU General Public Licence Version 3.
+
+#-------------------------------------------------------------------------------
+
+# Control parameters
+
+if [ -n "$*" ]; then echo 'This script does not have parameters'; exit 1; fi
+
+#-------------------------------------------------------------------------------
+
+# Set environment
+
+APP_DIR=$GYMNOTOA
+DATA_DIR=$APP_DIR/data
+OUTPUT_DIR=$APP_DIR/output
+
+if [ ! -d "$OUTPUT_DIR" ]; then mkdir --parents $OUTPUT_DIR; fi
+
+INITIAL_DIR=$(pwd)
+cd $APP_DIR
+
+#-------------------------------------------------------------------------------
+
+# Execute the program build-incidence-index.py
+
+/usr/bin/time \
+    ./build-incidence-index.py \
+        --annotations=$OUTPUT_DIR/annotations.csv \
+        --verbose=Y  \
+        --trace=N
+if [ $? -ne 0 ]; then echo 'Script ended with errors.'; exit 1; fi
+
+#-------------------------------------------------------------------------------
+
+# End
+
+cd $INITIAL_DIR
+
+echo
+echo '**************************************************'
+exit 0
+
+#-------------------------------------------------------------------------------
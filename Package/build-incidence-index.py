@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This program builds the sequence x term incidence index of an annotation file used in the
+enrichment analysis of sequence subsets.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import argparse
+import os
+import sys
+
+import genlib
+import incidencelib
+import termlib
+
+#-------------------------------------------------------------------------------
+
+def main():
+    '''
+    Main line of the program.
+    '''
+
+    # check the operating system
+    genlib.check_os()
+
+    # get and check the arguments
+    parser = build_parser()
+    args = parser.parse_args()
+    check_args(args)
+
+    # build the incidence index
+    build_incidence_index(args.annotation_file)
+
+#-------------------------------------------------------------------------------
+
+def build_parser():
+    '''
+    Build the parser with the available arguments.
+    '''
+
+    # create the parser and add arguments
+    description = 'Description: This program builds the sequence x term incidence index of an annotation file used in the\n' \
+                  'enrichment analysis of sequence subsets.'
+    text = f'{genlib.get_app_short_name()} v{genlib.get_app_version()} - {os.path.basename(__file__)}\n\n{description}\n'
+    usage = f'\r{text.ljust(len("usage:"))}\nUsage: {os.path.basename(__file__)} arguments'
+    parser = argparse.ArgumentParser(usage=usage)
+    parser._optionals.title = 'Arguments'    #pylint: disable=protected-access
+    parser.add_argument('--annotations', dest='annotation_file', help='Path of annotation file in CSV format (mandatory).')
+    parser.add_argument('--verbose', dest='verbose', help=f'Additional job status info during the run: {genlib.get_verbose_code_list_text()}; default: {genlib.Const.DEFAULT_VERBOSE}.')
+    parser.add_argument('--trace', dest='trace', help=f'Additional info useful to the developer team: {genlib.get_trace_code_list_text()}; default: {genlib.Const.DEFAULT_TRACE}.')
+
+    # return the paser
+    return parser
+
+#-------------------------------------------------------------------------------
+
+def check_args(args):
+    '''
+    Check the input arguments.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # check "annotation_file"
+    if args.annotation_file is None:
+        genlib.Message.print('error', '*** The annotation file is not indicated in the input arguments.')
+        OK = False
+    elif not os.path.isfile(args.annotation_file):
+        genlib.Message.print('error', f'*** The file {args.annotation_file} does not exist.')
+        OK = False
+
+    # check "verbose"
+    if args.verbose is None:
+        args.verbose = genlib.Const.DEFAULT_VERBOSE
+    elif not genlib.check_code(args.verbose, genlib.get_verbose_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** verbose has to be {genlib.get_verbose_code_list_text()}.')
+        OK = False
+    if args.verbose.upper() == 'Y':
+        genlib.Message.set_verbose_status(True)
+
+    # check "trace"
+    if args.trace is None:
+        args.trace = genlib.Const.DEFAULT_TRACE
+    elif not genlib.check_code(args.trace, genlib.get_trace_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** trace has to be {genlib.get_trace_code_list_text()}.')
+        OK = False
+    if args.trace.upper() == 'Y':
+        genlib.Message.set_trace_status(True)
+
+    # if there are errors, exit with exception
+    if not OK:
+        raise genlib.ProgramException('', 'P001')
+
+#-------------------------------------------------------------------------------
+
+def build_incidence_index(annotation_file):
+    '''
+    Build and save the sequence x term incidence index of an annotation file.
+    '''
+
+    # get the incidence index (it is built and saved when it does not exist or it is outdated)
+    incidence_index = incidencelib.get_incidence_index(annotation_file)
+
+    # print summary
+    for code in termlib.get_term_column_dict():
+        genlib.Message.print('info', f'{code}: {len(incidence_index.term_matrix_dict[code].term_id_array)} terms - {incidence_index.universe_seqs_wterms_dict[code]} of {incidence_index.get_seq_count()} sequences with terms.')
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
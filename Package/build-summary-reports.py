@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This program builds the statistics plots and the summary report of the annotation runs of a
+result directory without the graphic user interface. The runs whose summary report was built
+from their current statistics files are skipped.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import argparse
+import concurrent.futures
+import multiprocessing
+import os
+import sys
+
+import genlib
+import plotlib
+import registrylib
+
+#-------------------------------------------------------------------------------
+
+def main():
+    '''
+    Main line of the program.
+    '''
+
+    # check the operating system
+    genlib.check_os()
+
+    # get and check the arguments
+    parser = build_parser()
+    args = parser.parse_args()
+    check_args(args)
+
+    # build the summary reports
+    OK = build_summary_reports(args.result_dir, args.run_ids, args.dpi, args.threads)
+
+    # exit with error when a summary report can not be built
+    if not OK:
+        sys.exit(1)
+
+#-------------------------------------------------------------------------------
+
+def build_parser():
+    '''
+    Build the parser with the available arguments.
+    '''
+
+    # create the parser and add arguments
+    description = 'Description: This program builds the statistics plots and the summary report of the annotation runs of a\n' \
+                  'result directory without the graphic user interface. The runs whose summary report was built\n' \
+                  'from their current statistics files are skipped.'
+    text = f'{genlib.get_app_short_name()} v{genlib.get_app_version()} - {os.path.basename(__file__)}\n\n{description}\n'
+    usage = f'\r{text.ljust(len("usage:"))}\nUsage: {os.path.basename(__file__)} arguments'
+    parser = argparse.ArgumentParser(usage=usage)
+    parser._optionals.title = 'Arguments'    #pylint: disable=protected-access
+    parser.add_argument('--resultdir', dest='result_dir', help='Path of the result directory (mandatory).')
+    parser.add_argument('--runs', dest='run_ids', help='Comma-separated list of run identifications; default: all annotation runs of the result directory ended OK.')
+    parser.add_argument('--dpi', dest='dpi', help=f'Resolution of the plots in dots per inch; default: {genlib.Const.DEFAULT_SUMMARY_REPORT_DPI}.')
+    parser.add_argument('--threads', dest='threads', help='Number of processes used to render the plots and the summary reports; default: number of CPUs.')
+    parser.add_argument('--verbose', dest='verbose', help=f'Additional job status info during the run: {genlib.get_verbose_code_list_text()}; default: {genlib.Const.DEFAULT_VERBOSE}.')
+    parser.add_argument('--trace', dest='trace', help=f'Additional info useful to the developer team: {genlib.get_trace_code_list_text()}; default: {genlib.Const.DEFAULT_TRACE}.')
+
+    # return the paser
+    return parser
+
+#-------------------------------------------------------------------------------
+
+def check_args(args):
+    '''
+    Check the input arguments.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # check "result_dir"
+    if args.result_dir is None:
+        genlib.Message.print('error', '*** The result directory is not indicated in the input arguments.')
+        OK = False
+    elif not os.path.isdir(args.result_dir):
+        genlib.Message.print('error', f'*** The directory {args.result_dir} does not exist.')
+        OK = False
+
+    # check "run_ids"
+    if OK:
+        if args.run_ids is None:
+            result_dataset_dict = registrylib.get_result_dataset_dict(args.result_dir, genlib.get_result_run_subdir(), genlib.get_process_run_annotation_pipeline_name(), status_list=['OK'])
+            args.run_ids = [result_dataset_dict[key]['result_dataset_id'] for key in sorted(result_dataset_dict.keys())]
+        else:
+            args.run_ids = list(dict.fromkeys(genlib.split_literal_to_text_list(args.run_ids)))
+            for run_id in args.run_ids:
+                run_dir = f'{args.result_dir}{os.sep}{genlib.get_result_run_subdir()}{os.sep}{run_id}'
+                if not os.path.isdir(run_dir):
+                    genlib.Message.print('error', f'*** The directory {run_dir} does not exist.')
+                    OK = False
+
+    # check "dpi"
+    if args.dpi is None:
+        args.dpi = genlib.Const.DEFAULT_SUMMARY_REPORT_DPI
+    elif not genlib.check_int(args.dpi, minimum=1):
+        genlib.Message.print('error', '*** dpi has to be an integer number greater than or equal to 1.')
+        OK = False
+    else:
+        args.dpi = int(args.dpi)
+
+    # check "threads"
+    if args.threads is None:
+        args.threads = os.cpu_count() or 1
+    elif not genlib.check_int(args.threads, minimum=1):
+        genlib.Message.print('error', '*** threads has to be an integer number greater than or equal to 1.')
+        OK = False
+    else:
+        args.threads = int(args.threads)
+
+    # check "verbose"
+    if args.verbose is None:
+        args.verbose = genlib.Const.DEFAULT_VERBOSE
+    elif not genlib.check_code(args.verbose, genlib.get_verbose_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** verbose has to be {genlib.get_verbose_code_list_text()}.')
+        OK = False
+    if args.verbose.upper() == 'Y':
+        genlib.Message.set_verbose_status(True)
+
+    # check "trace"
+    if args.trace is None:
+        args.trace = genlib.Const.DEFAULT_TRACE
+    elif not genlib.check_code(args.trace, genlib.get_trace_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** trace has to be {genlib.get_trace_code_list_text()}.')
+        OK = False
+    if args.trace.upper() == 'Y':
+        genlib.Message.set_trace_status(True)
+
+    # if there are errors, exit with exception
+    if not OK:
+        raise genlib.ProgramException('', 'P001')
+
+#-------------------------------------------------------------------------------
+
+def build_summary_reports(result_dir, run_id_list, dpi, threads):
+    '''
+    Build the statistics plots and the summary report of the annotation runs sharing a pool of
+    processes, skipping the runs whose summary report is updated.
+    '''
+
+    # initialize the control variable and the counters
+    OK = True
+    skipped_counter = 0
+    built_counter = 0
+
+    # create the pool of processes (the processes are spawned to have the same behavior in all the OS)
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=threads, mp_context=multiprocessing.get_context('spawn'))
+
+    # submit the plots of the runs whose summary report is not updated
+    renderer_dict = {}
+    for run_id in run_id_list:
+
+        # get the run directory and the plot list
+        run_dir = f'{result_dir}{os.sep}{genlib.get_result_run_subdir()}{os.sep}{run_id}'
+        plot_list = plotlib.get_summary_report_plot_list(run_dir, dpi)
+
+        # skip the runs without statistics files
+        if not all(os.path.isfile(plot['stats_file_path']) for plot in plot_list):
+            genlib.Message.print('info', f'{run_id}: skipped because it does not have all the statistics files.')
+            skipped_counter += 1
+            continue
+
+        # skip the runs whose summary report is updated
+        renderer = plotlib.PlotRenderer(plot_list, plotlib.get_plot_cache_dir(run_dir), report_file_path=plotlib.get_summary_report_file_path(run_dir), executor=executor)
+        if renderer.is_report_updated():
+            genlib.Message.print('verbose', f'{run_id}: skipped because its summary report is updated.\n')
+            skipped_counter += 1
+            continue
+
+        # submit the plots that are not in the cache
+        renderer.start()
+        renderer_dict[run_id] = renderer
+
+    # wait for the renderers (the summary report of a run is submitted when its plots end)
+    genlib.Message.print('info', f'Building {len(renderer_dict)} summary reports with {threads} processes ...')
+    while renderer_dict:
+        for run_id in [run_id for run_id, renderer in renderer_dict.items() if renderer.is_done()]:
+            (run_OK, error_list) = renderer_dict.pop(run_id).get_result()
+            if run_OK:
+                genlib.Message.print('verbose', f'{run_id}: the summary report is built.\n')
+                built_counter += 1
+            else:
+                for error in error_list:
+                    genlib.Message.print('error', f'*** {run_id}: {error}')
+                OK = False
+        pending_future_list = [future for renderer in renderer_dict.values() for future in renderer.get_pending_future_list()]
+        if pending_future_list:
+            concurrent.futures.wait(pending_future_list, return_when=concurrent.futures.FIRST_COMPLETED)
+
+    # release the pool of processes
+    executor.shutdown()
+
+    # show the summary
+    genlib.Message.print('info', f'Summary reports built: {built_counter}; skipped runs: {skipped_counter}.')
+    if not OK:
+        genlib.Message.print('error', '*** Some summary reports can not be built.')
+
+    # return the control variable
+    return OK
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
@@ -57,6 +57,7 @@ rem Execute the program calculate-enrichment-analysis.py
     --mpea=%OUTPUT_DIR%\metacyc-pathway-enrichment-analysis.csv ^
     --koea=%OUTPUT_DIR%\kegg-ko-enrichment-analysis.csv ^
     --kpea=%OUTPUT_DIR%\kegg-pathway-enrichment-analysis.csv ^
+    --parquet=N ^
     --verbose=Y ^
     --trace=N
 if %ERRORLEVEL% neq 0 (set RC=%ERRORLEVEL% & set ERROR=2 & goto END)
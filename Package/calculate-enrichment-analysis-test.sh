@@ -50,6 +50,7 @@ cd $APP_DIR
         --mpea=$OUTPUT_DIR/metacyc-pathway-enrichment-analysis.csv \
         --koea=$OUTPUT_DIR/kegg-ko-enrichment-analysis.csv \
         --kpea=$OUTPUT_DIR/kegg-pathway-enrichment-analysis.csv \
+        --parquet=N \
         --verbose=Y  \
         --trace=N
 if [ $? -ne 0 ]; then echo 'Script ended with errors.'; exit 1; fi
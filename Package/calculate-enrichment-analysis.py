@@ -34,8 +34,11 @@ import sys
 import numpy as np
 import scipy.stats as stats
 
+import columnlib
 import genlib
+import incidencelib
 import sqllib
+import termlib
 
 #-------------------------------------------------------------------------------
 
@@ -55,17 +58,25 @@ def main():
     # connect to the SQLite database
     conn = sqllib.connect_database(args.sqlite_database)
 
+    # get the incidence index of the annotation file (the annotation file is read once for the four analyses)
+    incidence_index = incidencelib.get_incidence_index(args.annotation_file)
+
     # calculate the GO term enrichment analysis
-    calculate_goterm_enrichment_analysis(conn, args.annotation_file, args.species_name, args.fdr_method, args.min_seqnum_annotations, args.min_seqnum_species, args.goea_file)
+    calculate_goterm_enrichment_analysis(conn, args.annotation_file, args.species_name, args.fdr_method, args.min_seqnum_annotations, args.min_seqnum_species, args.goea_file, incidence_index.get_annotation_term_dict(genlib.get_goea_code()))
 
     # calculate the Metacyc pathway enrichment analysis
-    calculate_metacyc_pathway_enrichment_analysis(conn, args.annotation_file, args.species_name, args.fdr_method, args.min_seqnum_annotations, args.min_seqnum_species, args.mpea_file)
+    calculate_metacyc_pathway_enrichment_analysis(conn, args.annotation_file, args.species_name, args.fdr_method, args.min_seqnum_annotations, args.min_seqnum_species, args.mpea_file, incidence_index.get_annotation_term_dict(genlib.get_mpea_code()))
 
     # calculate the KEGG KO enrichment analysis
-    calculate_kegg_ko_enrichment_analysis(conn, args.annotation_file, args.species_name, args.fdr_method, args.min_seqnum_annotations, args.min_seqnum_species, args.koea_file)
+    calculate_kegg_ko_enrichment_analysis(conn, args.annotation_file, args.species_name, args.fdr_method, args.min_seqnum_annotations, args.min_seqnum_species, args.koea_file, incidence_index.get_annotation_term_dict(genlib.get_koea_code()))
 
     # calculate the KEGG pathway enrichment analysis
-    calculate_kegg_pathway_enrichment_analysis(conn, args.annotation_file, args.species_name, args.fdr_method, args.min_seqnum_annotations, args.min_seqnum_species, args.kpea_file)
+    calculate_kegg_pathway_enrichment_analysis(conn, args.annotation_file, args.species_name, args.fdr_method, args.min_seqnum_annotations, args.min_seqnum_species, args.kpea_file, incidence_index.get_annotation_term_dict(genlib.get_kpea_code()))
+
+    # write the Parquet copies of the enrichment analysis files
+    if args.parquet == 'Y':
+        for enrichment_file in [args.goea_file, args.mpea_file, args.koea_file, args.kpea_file]:
+            columnlib.write_csv_file_parquet(enrichment_file)
 
 #-------------------------------------------------------------------------------
 
@@ -91,6 +102,7 @@ def build_parser():
     parser.add_argument('--mpea', dest='mpea_file', help='Path of the Metacyc pathway enrichment analysis file (mandatory).')
     parser.add_argument('--koea', dest='koea_file', help='Path of the KEGG KO enrichment analysis file (mandatory).')
     parser.add_argument('--kpea', dest='kpea_file', help='Path of the KEGG pathway enrichment analysis file (mandatory).')
+    parser.add_argument('--parquet', dest='parquet', help=f'Write also the enrichment analysis files in Parquet format (they are not written when pyarrow is not installed): {genlib.get_parquet_code_list_text()}; default: {genlib.Const.DEFAULT_PARQUET}.')
     parser.add_argument('--verbose', dest='verbose', help=f'Additional job status info during the run: {genlib.get_verbose_code_list_text()}; default: {genlib.Const.DEFAULT_VERBOSE}.')
     parser.add_argument('--trace', dest='trace', help=f'Additional info useful to the developer team: {genlib.get_trace_code_list_text()}; default: {genlib.Const.DEFAULT_TRACE}.')
 
@@ -173,6 +185,18 @@ def check_args(args):
         genlib.Message.print('error', '*** The KEGG pathway enrichment analysis file is not indicated in the input arguments.')
         OK = False
 
+    # check "parquet"
+    if args.parquet is None:
+        args.parquet = genlib.Const.DEFAULT_PARQUET
+    elif not genlib.check_code(args.parquet, genlib.get_parquet_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** parquet has to be {genlib.get_parquet_code_list_text()}.')
+        OK = False
+    else:
+        args.parquet = args.parquet.upper()
+    if args.parquet == 'Y' and not columnlib.is_parquet_available():
+        genlib.Message.print('info', 'WARNING: The Parquet files are not written because the library pyarrow is not installed in this environment.')
+        args.parquet = 'N'
+
     # check "verbose"
     if args.verbose is None:
         args.verbose = genlib.Const.DEFAULT_VERBOSE
@@ -197,13 +221,16 @@ def check_args(args):
 
 #-------------------------------------------------------------------------------
 
-def calculate_goterm_enrichment_analysis(conn, annotation_file, species_name, fdr_method, min_seqnum_annotations, min_seqnum_species, goea_file):
+def calculate_goterm_enrichment_analysis(conn, annotation_file, species_name, fdr_method, min_seqnum_annotations, min_seqnum_species, goea_file, annotation_data=None):
     '''
     calculates the GO term enrichment analysis from a annotation file and the gymnoTOA database.
     '''
 
-    # build the annotation GO term dictionary
-    (annotation_goterm_dict, annotation_seqs_wgoterms) = build_annotation_goterm_dict(annotation_file)
+    # build the annotation GO term dictionary (unless it is passed already built)
+    if annotation_data is None:
+        (annotation_goterm_dict, annotation_seqs_wgoterms) = build_annotation_goterm_dict(annotation_file)
+    else:
+        (annotation_goterm_dict, annotation_seqs_wgoterms) = annotation_data
 
     # get the list of GO term identifications involved in the study
     goterm_id_list = sorted(annotation_goterm_dict.keys())
@@ -336,61 +363,35 @@ def build_annotation_goterm_dict(annotation_file):
     # initialize the counter of annotations sequences with GO terms
     annotation_seqs_wgoterms = 0
 
-    # open the annotation file
-    if annotation_file.endswith('.gz'):
-        try:
-            annotation_file_id = gzip.open(annotation_file, mode='rt', encoding='iso-8859-1')
-        except Exception:
-            raise genlib.ProgramException('F002', annotation_file) from None
-    else:
-        try:
-            annotation_file_id = open(annotation_file, mode='r', encoding='iso-8859-1')
-        except Exception:
-            raise genlib.ProgramException('F001', annotation_file) from None
-
     # initialize the annotation counter
     annotation_counter = 0
 
-    # read the first record of the annotation file (header)
-    (record, key, data_dict) = genlib.read_functional_annotation_record(annotation_file, annotation_file_id, annotation_counter)
-
-    # read the secord record of the annotation file (first data record)
-    (record, key, data_dict) = genlib.read_functional_annotation_record(annotation_file, annotation_file_id, annotation_counter)
-    genlib.Message.print('trace', f'key: {key} - record: {record}')
-
-    # while there are records
-    while record != '':
-
-        # set the old sequence identification
-        old_seq_id = data_dict['qseqid']
+    # read the annotation records grouped by sequence identification (only the columns used are read when the file has a Parquet copy)
+    for _, annotation_record_list in columnlib.read_functional_annotation_groups(annotation_file, ['interpro_goterms', 'panther_goterms', 'eggnog_goterms']):
 
         # initialize the list of GO term identifications corresponding to the sequence
         goterm_id_list = []
 
-        # while there are records and the same sequence identification
-        while record != '' and data_dict['qseqid'] == old_seq_id:
+        # for each record of the sequence
+        for annotation_record in annotation_record_list:
 
             # add 1 to the annotation counter
             annotation_counter += 1
 
             # extract the GO term identifications and add them into the GO term identification list
             # goterms format: "goterm_id1|goterm_id2|...|gotermo_idn"
-            if data_dict['interpro_goterms'] != '' and data_dict['interpro_goterms'] != '-':
-                interpro_goterm_id_list = data_dict['interpro_goterms'].split('|')
+            if annotation_record.interpro_goterms != '' and annotation_record.interpro_goterms != '-':
+                interpro_goterm_id_list = annotation_record.interpro_goterms.split('|')
                 goterm_id_list.extend(interpro_goterm_id_list)
-            if data_dict['panther_goterms'] != '' and  data_dict['panther_goterms'] != '-':
-                panther_goterm_id_list = data_dict['panther_goterms'].split('|')
+            if annotation_record.panther_goterms != '' and  annotation_record.panther_goterms != '-':
+                panther_goterm_id_list = annotation_record.panther_goterms.split('|')
                 goterm_id_list.extend(panther_goterm_id_list)
-            if data_dict['eggnog_goterms'] != '' and  data_dict['eggnog_goterms'] != '-':
-                eggnog_goterm_id_list = data_dict['eggnog_goterms'].split('|')
+            if annotation_record.eggnog_goterms != '' and  annotation_record.eggnog_goterms != '-':
+                eggnog_goterm_id_list = annotation_record.eggnog_goterms.split('|')
                 goterm_id_list.extend(eggnog_goterm_id_list)
 
             genlib.Message.print('verbose', f'\rProcessed annotations: {annotation_counter}')
 
-            # read the next record of the annotation file
-            (record, key, data_dict) = genlib.read_functional_annotation_record(annotation_file, annotation_file_id, annotation_counter)
-            genlib.Message.print('trace', f'key: {key} - record: {record}')
-
         # get the list of GO term identifications without duplicates
         goterm_id_set = set(goterm_id_list)
         goterm_id_list = sorted(goterm_id_set)
@@ -410,9 +411,6 @@ def build_annotation_goterm_dict(annotation_file):
     # print summary
     genlib.Message.print('info', f'{annotation_counter} records read in annotation file.')
 
-    # close annotation file
-    annotation_file_id.close()
-
     # return the annotation GO term dictionary
     return annotation_goterm_dict, annotation_seqs_wgoterms
 
@@ -420,58 +418,14 @@ def build_annotation_goterm_dict(annotation_file):
 
 def build_species_goterm_dict(conn, species_name, goterm_id_list):
     '''
-    Build the species GO term dictionary from the annotations file.
+    Build the species GO term dictionary from the cluster x term matrix of the gymnoTOA database.
     '''
 
-    # initialize the species GO term dictionary
-    species_goterm_dict = {}
-
-    # initialize the counter of species sequences with GO terms
-    species_seqs_wgoterms = 0
-
-    # get the dictionary of the GO terms of each cluster corresponding to the species
-    goterms_per_cluster_dict = sqllib.get_goterms_per_cluster_dict(conn, species_name)
-
-    # initialize the species cluster counter
-    species_cluster_counter = 0
-
-    for _, data_dict in goterms_per_cluster_dict.items():
-
-        # add 1 to  the species cluster counter
-        species_cluster_counter += 1
-
-        # initialize the list of GO term identifications corresponding to the sequence
-        goterm_id_list = []
-
-        # extract the GO term identifications and add them into the GO term identification list
-        # goterms format: "goterm_id1|goterm_id2|...|gotermo_idn"
-        if data_dict['interpro_goterms'] != '' and data_dict['interpro_goterms'] != '-':
-            interpro_goterm_id_list = data_dict['interpro_goterms'].split('|')
-            goterm_id_list.extend(interpro_goterm_id_list)
-        if data_dict['panther_goterms'] != '' and  data_dict['panther_goterms'] != '-':
-            panther_goterm_id_list = data_dict['panther_goterms'].split('|')
-            goterm_id_list.extend(panther_goterm_id_list)
-        if data_dict['eggnog_goterms'] != '' and  data_dict['eggnog_goterms'] != '-':
-            eggnog_goterm_id_list = data_dict['eggnog_goterms'].split('|')
-            goterm_id_list.extend(eggnog_goterm_id_list)
-
-        # get the list of GO term identifications without duplicates
-        goterm_id_set = set(goterm_id_list)
-        goterm_id_list = sorted(goterm_id_set)
-
-        # increase the GO term identifications per sequence in the species GOterm dictionary
-        if goterm_id_list != []:
-            for goterm_id in goterm_id_list:
-                counter = species_goterm_dict.get(goterm_id, 0)
-                species_goterm_dict[goterm_id] = counter + 1
-
-        # increase the counter of speciess sequences with GO terms
-        if goterm_id_list != []:
-            species_seqs_wgoterms += 1
+    # get the cluster x GO term matrix of the gymnoTOA database (it is read from the database only when it does not exist or it is outdated)
+    database_term_index = termlib.get_database_term_index(conn)
 
-        genlib.Message.print('verbose', f'\rProcessed {species_name} clusters: {species_cluster_counter}')
-
-    genlib.Message.print('verbose', '\n')
+    # count the GO terms of the species clusters with sparse matrix operations
+    (species_goterm_dict, species_seqs_wgoterms, species_cluster_counter) = database_term_index.get_species_term_count_dict(conn, genlib.get_goea_code(), species_name, goterm_id_list)
 
     # print summary
     genlib.Message.print('info', f'{species_cluster_counter} clusters read.')
@@ -481,13 +435,16 @@ def build_species_goterm_dict(conn, species_name, goterm_id_list):
 
 #-------------------------------------------------------------------------------
 
-def calculate_metacyc_pathway_enrichment_analysis(conn, annotation_file, species_name, fdr_method, min_seqnum_annotations, min_seqnum_species, mpea_file):
+def calculate_metacyc_pathway_enrichment_analysis(conn, annotation_file, species_name, fdr_method, min_seqnum_annotations, min_seqnum_species, mpea_file, annotation_data=None):
     '''
     calculates the Metacyc pathway enrichment analysis from a annotation file and the gymnoTOA database.
     '''
 
-    # build the annotation Metacyc pathway dictionary
-    (annotation_metacyc_pathway_dict, annotation_seqs_wmetacycpathways) = build_annotation_metacyc_pathway_dict(annotation_file)
+    # build the annotation Metacyc pathway dictionary (unless it is passed already built)
+    if annotation_data is None:
+        (annotation_metacyc_pathway_dict, annotation_seqs_wmetacycpathways) = build_annotation_metacyc_pathway_dict(annotation_file)
+    else:
+        (annotation_metacyc_pathway_dict, annotation_seqs_wmetacycpathways) = annotation_data
 
     # get the list of Metacyc pathway identifications involved in the study
     metacyc_pathway_id_list = sorted(annotation_metacyc_pathway_dict.keys())
@@ -613,54 +570,28 @@ def build_annotation_metacyc_pathway_dict(annotation_file):
     # initialize the counter of annotations sequences with Metacyc pathways
     annotation_seqs_wmetacycpathways = 0
 
-    # open the annotation file
-    if annotation_file.endswith('.gz'):
-        try:
-            annotation_file_id = gzip.open(annotation_file, mode='rt', encoding='iso-8859-1')
-        except Exception:
-            raise genlib.ProgramException('F002', annotation_file) from None
-    else:
-        try:
-            annotation_file_id = open(annotation_file, mode='r', encoding='iso-8859-1')
-        except Exception:
-            raise genlib.ProgramException('F001', annotation_file) from None
-
     # initialize the annotation counter
     annotation_counter = 0
 
-    # read the first record of the annotation file (header)
-    (record, key, data_dict) = genlib.read_functional_annotation_record(annotation_file, annotation_file_id, annotation_counter)
-
-    # read the secord record of the annotation file (first data record)
-    (record, key, data_dict) = genlib.read_functional_annotation_record(annotation_file, annotation_file_id, annotation_counter)
-    genlib.Message.print('trace', f'key: {key} - record: {record}')
-
-    # while there are records
-    while record != '':
-
-        # set the old sequence identification
-        old_seq_id = data_dict['qseqid']
+    # read the annotation records grouped by sequence identification (only the columns used are read when the file has a Parquet copy)
+    for _, annotation_record_list in columnlib.read_functional_annotation_groups(annotation_file, ['metacyc_pathways']):
 
         # initialize the list of Metacyc pathway identifications corresponding to the sequence
         metacyc_pathway_id_list = []
 
-        # while there are records and the same sequence identification
-        while record != '' and data_dict['qseqid'] == old_seq_id:
+        # for each record of the sequence
+        for annotation_record in annotation_record_list:
 
             # add 1 to the annotation counter
             annotation_counter += 1
 
             # extract the Metacyc pathway identifications and add them into the Metacyc pathway identification list
             # Metacyc pathway format: "metacyc_pathway_id1|metacyc_pathway_id2|...|metacyc_pathway_idn"
-            if data_dict['metacyc_pathways'] != '' and data_dict['metacyc_pathways'] != '-':
-                metacyc_pathway_id_list.extend(data_dict['metacyc_pathways'].split('|'))
+            if annotation_record.metacyc_pathways != '' and annotation_record.metacyc_pathways != '-':
+                metacyc_pathway_id_list.extend(annotation_record.metacyc_pathways.split('|'))
 
             genlib.Message.print('verbose', f'\rProcessed annotations: {annotation_counter}')
 
-            # read the next record of the annotation file
-            (record, key, data_dict) = genlib.read_functional_annotation_record(annotation_file, annotation_file_id, annotation_counter)
-            genlib.Message.print('trace', f'key: {key} - record: {record}')
-
         # get the list of Metacyc pathway identifications without duplicates
         metacyc_pathway_id_set = set(metacyc_pathway_id_list)
         metacyc_pathway_id_list = sorted(metacyc_pathway_id_set)
@@ -680,9 +611,6 @@ def build_annotation_metacyc_pathway_dict(annotation_file):
     # print summary
     genlib.Message.print('info', f'{annotation_counter} records read in annotation file.')
 
-    # close annotation file
-    annotation_file_id.close()
-
     # return the annotation Metacyc pathway dictionary
     return annotation_metacyc_pathway_dict, annotation_seqs_wmetacycpathways
 
@@ -690,51 +618,14 @@ def build_annotation_metacyc_pathway_dict(annotation_file):
 
 def build_species_metacyc_pathway_dict(conn, species_name, metacyc_pathway_id_list):
     '''
-    Build the species Metacyc pathway dictionary from the annotations file.
+    Build the species Metacyc pathway dictionary from the cluster x term matrix of the gymnoTOA database.
     '''
 
-    # initialize the species Metacyc pathway dictionary
-    species_metacyc_pathway_dict = {}
-
-    # initialize the counter of species sequences with Metacyc pathways
-    species_seqs_wmetacycpataways = 0
-
-    # get the dictionary of the Metacyc pathways of each cluster corresponding to the species
-    metacyc_pathways_per_cluster_dict = sqllib.get_metacyc_pathways_per_cluster_dict(conn, species_name)
-
-    # initialize the species cluster counter
-    species_cluster_counter = 0
-
-    for _, data_dict in metacyc_pathways_per_cluster_dict.items():
-
-        # add 1 to  the species cluster counter
-        species_cluster_counter += 1
-
-        # initialize the list of Metacyc pathway identifications corresponding to the sequence
-        metacyc_pathway_id_list = []
-
-        # extract the Metacyc pathway identifications and add them into the Metacy pathway identification list
-        # Metacyc pathway format: "metacyc_pathway_id1|metacyc_pathway_id2|...|metacyc_pathway_idn"
-        if data_dict['metacyc_pathways'] != '' and data_dict['metacyc_pathways'] != '-':
-            metacyc_pathway_id_list.extend(data_dict['metacyc_pathways'].split('|'))
-
-        # get the list of Metacyc pathway identifications without duplicates
-        metacyc_pathway_id_set = set(metacyc_pathway_id_list)
-        metacyc_pathway_id_list = sorted(metacyc_pathway_id_set)
-
-        # increase the Metacyc pathway identifications per sequence in the species Metacyc pathway dictionary
-        if metacyc_pathway_id_list != []:
-            for metacyc_pathway_id in metacyc_pathway_id_list:
-                counter = species_metacyc_pathway_dict.get(metacyc_pathway_id, 0)
-                species_metacyc_pathway_dict[metacyc_pathway_id] = counter + 1
-
-        # increase the counter of speciess sequences with GO terms
-        if metacyc_pathway_id_list != []:
-            species_seqs_wmetacycpataways += 1
-
-        genlib.Message.print('verbose', f'\rProcessed {species_name} clusters: {species_cluster_counter}')
+    # get the cluster x Metacyc pathway matrix of the gymnoTOA database (it is read from the database only when it does not exist or it is outdated)
+    database_term_index = termlib.get_database_term_index(conn)
 
-    genlib.Message.print('verbose', '\n')
+    # count the Metacyc pathways of the species clusters with sparse matrix operations
+    (species_metacyc_pathway_dict, species_seqs_wmetacycpataways, species_cluster_counter) = database_term_index.get_species_term_count_dict(conn, genlib.get_mpea_code(), species_name, metacyc_pathway_id_list)
 
     # print summary
     genlib.Message.print('info', f'{species_cluster_counter} clusters read.')
@@ -744,13 +635,16 @@ def build_species_metacyc_pathway_dict(conn, species_name, metacyc_pathway_id_li
 
 #-------------------------------------------------------------------------------
 
-def calculate_kegg_ko_enrichment_analysis(conn, annotation_file, species_name, fdr_method, min_seqnum_annotations, min_seqnum_species, koea_file):
+def calculate_kegg_ko_enrichment_analysis(conn, annotation_file, species_name, fdr_method, min_seqnum_annotations, min_seqnum_species, koea_file, annotation_data=None):
     '''
     calculates the KO enrichment analysis from a annotation file and the gymnoTOA database.
     '''
 
-    # build the annotation KEGG KO dictionary
-    (annotation_kegg_ko_dict, annotation_seqs_wkeggkos) = build_annotation_kegg_ko_dict(annotation_file)
+    # build the annotation KEGG KO dictionary (unless it is passed already built)
+    if annotation_data is None:
+        (annotation_kegg_ko_dict, annotation_seqs_wkeggkos) = build_annotation_kegg_ko_dict(annotation_file)
+    else:
+        (annotation_kegg_ko_dict, annotation_seqs_wkeggkos) = annotation_data
 
     # get the list of KEGG KO identifications involved in the study
     kegg_ko_id_list = sorted(annotation_kegg_ko_dict.keys())
@@ -876,54 +770,28 @@ def build_annotation_kegg_ko_dict(annotation_file):
     # initialize the counter of annotations sequences with KEGG KOs
     annotation_seqs_wkeggkos = 0
 
-    # open the annotation file
-    if annotation_file.endswith('.gz'):
-        try:
-            annotation_file_id = gzip.open(annotation_file, mode='rt', encoding='iso-8859-1')
-        except Exception:
-            raise genlib.ProgramException('F002', annotation_file) from None
-    else:
-        try:
-            annotation_file_id = open(annotation_file, mode='r', encoding='iso-8859-1')
-        except Exception:
-            raise genlib.ProgramException('F001', annotation_file) from None
-
     # initialize the annotation counter
     annotation_counter = 0
 
-    # read the first record of the annotation file (header)
-    (record, key, data_dict) = genlib.read_functional_annotation_record(annotation_file, annotation_file_id, annotation_counter)
-
-    # read the secord record of the annotation file (first data record)
-    (record, key, data_dict) = genlib.read_functional_annotation_record(annotation_file, annotation_file_id, annotation_counter)
-    genlib.Message.print('trace', f'key: {key} - record: {record}')
-
-    # while there are records
-    while record != '':
-
-        # set the old sequence identification
-        old_seq_id = data_dict['qseqid']
+    # read the annotation records grouped by sequence identification (only the columns used are read when the file has a Parquet copy)
+    for _, annotation_record_list in columnlib.read_functional_annotation_groups(annotation_file, ['kegg_kos']):
 
         # initialize the list of KEGG KO identifications corresponding to the sequence
         kegg_ko_id_list = []
 
-        # while there are records and the same sequence identification
-        while record != '' and data_dict['qseqid'] == old_seq_id:
+        # for each record of the sequence
+        for annotation_record in annotation_record_list:
 
             # add 1 to the annotation counter
             annotation_counter += 1
 
             # extract the KEGG KO identifications and add them into the KEGG KO identification list
             # KO format: "kegg_ko_id1|kegg_ko_id2|...|kegg_ko_idn"
-            if data_dict['kegg_kos'] != '' and data_dict['kegg_kos'] != '-':
-                kegg_ko_id_list.extend(data_dict['kegg_kos'].split('|'))
+            if annotation_record.kegg_kos != '' and annotation_record.kegg_kos != '-':
+                kegg_ko_id_list.extend(annotation_record.kegg_kos.split('|'))
 
             genlib.Message.print('verbose', f'\rProcessed annotations: {annotation_counter}')
 
-            # read the next record of the annotation file
-            (record, key, data_dict) = genlib.read_functional_annotation_record(annotation_file, annotation_file_id, annotation_counter)
-            genlib.Message.print('trace', f'key: {key} - record: {record}')
-
         # get the list of KEE KO identifications without duplicates
         kegg_ko_id_set = set(kegg_ko_id_list)
         kegg_ko_id_list = sorted(kegg_ko_id_set)
@@ -943,9 +811,6 @@ def build_annotation_kegg_ko_dict(annotation_file):
     # print summary
     genlib.Message.print('info', f'{annotation_counter} records read in annotation file.')
 
-    # close annotation file
-    annotation_file_id.close()
-
     # return the KEGG KO dictionary
     return annotation_kegg_ko_dict, annotation_seqs_wkeggkos
 
@@ -953,51 +818,14 @@ def build_annotation_kegg_ko_dict(annotation_file):
 
 def build_species_kegg_ko_dict(conn, species_name, kegg_ko_id_list):
     '''
-    Build the species KEGG KO dictionary from the annotations file.
+    Build the species KEGG KO dictionary from the cluster x term matrix of the gymnoTOA database.
     '''
 
-    # initialize the species KEGG KO dictionary
-    species_kegg_ko_dict = {}
-
-    # initialize the counter of species sequences with KEGG KOs
-    species_seqs_wkeggkos = 0
-
-    # get the dictionary of the KEGG KOs of each cluster corresponding to the species
-    kegg_kos_per_cluster_dict = sqllib.get_kegg_kos_per_cluster_dict(conn, species_name)
-
-    # initialize the species cluster counter
-    species_cluster_counter = 0
-
-    for _, data_dict in kegg_kos_per_cluster_dict.items():
-
-        # add 1 to  the species cluster counter
-        species_cluster_counter += 1
-
-        # initialize the list of KEGG KO identifications corresponding to the sequence
-        kegg_ko_id_list = []
-
-        # extract the KEGG KO identifications and add them into the KEGG KO identification list
-        # KEGG KO format: "kegg_ko_id1|kegg_ko_id2|...|kegg_ko_idn"
-        if data_dict['kegg_kos'] != '' and data_dict['kegg_kos'] != '-':
-            kegg_ko_id_list.extend(data_dict['kegg_kos'].split('|'))
-
-        # get the list of KEGG KO identifications without duplicates
-        kegg_ko_id_set = set(kegg_ko_id_list)
-        kegg_ko_id_list = sorted(kegg_ko_id_set)
-
-        # increase the KEGG KO identifications per sequence in the species KEGG KO dictionary
-        if kegg_ko_id_list != []:
-            for kegg_ko_id in kegg_ko_id_list:
-                counter = species_kegg_ko_dict.get(kegg_ko_id, 0)
-                species_kegg_ko_dict[kegg_ko_id] = counter + 1
-
-        # increase the counter of speciess sequences with GO terms
-        if kegg_ko_id_list != []:
-            species_seqs_wkeggkos += 1
-
-        genlib.Message.print('verbose', f'\rProcessed {species_name} clusters: {species_cluster_counter}')
+    # get the cluster x KEGG KO matrix of the gymnoTOA database (it is read from the database only when it does not exist or it is outdated)
+    database_term_index = termlib.get_database_term_index(conn)
 
-    genlib.Message.print('verbose', '\n')
+    # count the KEGG KOs of the species clusters with sparse matrix operations
+    (species_kegg_ko_dict, species_seqs_wkeggkos, species_cluster_counter) = database_term_index.get_species_term_count_dict(conn, genlib.get_koea_code(), species_name, kegg_ko_id_list)
 
     # print summary
     genlib.Message.print('info', f'{species_cluster_counter} clusters read.')
@@ -1007,13 +835,16 @@ def build_species_kegg_ko_dict(conn, species_name, kegg_ko_id_list):
 
 #-------------------------------------------------------------------------------
 
-def calculate_kegg_pathway_enrichment_analysis(conn, annotation_file, species_name, fdr_method, min_seqnum_annotations, min_seqnum_species, kpea_file):
+def calculate_kegg_pathway_enrichment_analysis(conn, annotation_file, species_name, fdr_method, min_seqnum_annotations, min_seqnum_species, kpea_file, annotation_data=None):
     '''
     calculates the KEGG pathway enrichment analysis from a annotation file and the gymnoTOA database.
     '''
 
-    # build the annotation KEGG pathway dictionary
-    (annotation_kegg_pathway_dict, annotation_seqs_wkeggpathways) = build_annotation_kegg_pathway_dict(annotation_file)
+    # build the annotation KEGG pathway dictionary (unless it is passed already built)
+    if annotation_data is None:
+        (annotation_kegg_pathway_dict, annotation_seqs_wkeggpathways) = build_annotation_kegg_pathway_dict(annotation_file)
+    else:
+        (annotation_kegg_pathway_dict, annotation_seqs_wkeggpathways) = annotation_data
 
     # get the list of KEGG pathway identifications involved in the study
     kegg_pathway_id_list = sorted(annotation_kegg_pathway_dict.keys())
@@ -1139,54 +970,28 @@ def build_annotation_kegg_pathway_dict(annotation_file):
     # initialize the counter of annotations sequences with KEGG pathways
     annotation_seqs_wkeggpathways = 0
 
-    # open the annotation file
-    if annotation_file.endswith('.gz'):
-        try:
-            annotation_file_id = gzip.open(annotation_file, mode='rt', encoding='iso-8859-1')
-        except Exception:
-            raise genlib.ProgramException('F002', annotation_file) from None
-    else:
-        try:
-            annotation_file_id = open(annotation_file, mode='r', encoding='iso-8859-1')
-        except Exception:
-            raise genlib.ProgramException('F001', annotation_file) from None
-
     # initialize the annotation counter
     annotation_counter = 0
 
-    # read the first record of the annotation file (header)
-    (record, key, data_dict) = genlib.read_functional_annotation_record(annotation_file, annotation_file_id, annotation_counter)
-
-    # read the secord record of the annotation file (first data record)
-    (record, key, data_dict) = genlib.read_functional_annotation_record(annotation_file, annotation_file_id, annotation_counter)
-    genlib.Message.print('trace', f'key: {key} - record: {record}')
-
-    # while there are records
-    while record != '':
-
-        # set the old sequence identification
-        old_seq_id = data_dict['qseqid']
+    # read the annotation records grouped by sequence identification (only the columns used are read when the file has a Parquet copy)
+    for _, annotation_record_list in columnlib.read_functional_annotation_groups(annotation_file, ['kegg_pathways']):
 
         # initialize the list of KEGG pathway identifications corresponding to the sequence
         kegg_pathway_id_list = []
 
-        # while there are records and the same sequence identification
-        while record != '' and data_dict['qseqid'] == old_seq_id:
+        # for each record of the sequence
+        for annotation_record in annotation_record_list:
 
             # add 1 to the annotation counter
             annotation_counter += 1
 
             # extract the KEGG pathway identifications and add them into the KEGG pathway identification list
             # KEGG pathway format: "kegg_pathway_id1|kegg_pathway_id2|...|kegg_pathway_idn"
-            if data_dict['kegg_pathways'] != '' and data_dict['kegg_pathways'] != '-':
-                kegg_pathway_id_list.extend(data_dict['kegg_pathways'].split('|'))
+            if annotation_record.kegg_pathways != '' and annotation_record.kegg_pathways != '-':
+                kegg_pathway_id_list.extend(annotation_record.kegg_pathways.split('|'))
 
             genlib.Message.print('verbose', f'\rProcessed annotations: {annotation_counter}')
 
-            # read the next record of the annotation file
-            (record, key, data_dict) = genlib.read_functional_annotation_record(annotation_file, annotation_file_id, annotation_counter)
-            genlib.Message.print('trace', f'key: {key} - record: {record}')
-
         # get the list of KEGG pathway identifications without duplicates
         kegg_pathway_id_set = set(kegg_pathway_id_list)
         kegg_pathway_id_list = sorted(kegg_pathway_id_set)
@@ -1206,9 +1011,6 @@ def build_annotation_kegg_pathway_dict(annotation_file):
     # print summary
     genlib.Message.print('info', f'{annotation_counter} records read in annotation file.')
 
-    # close annotation file
-    annotation_file_id.close()
-
     # return the annotation KEGG pathway dictionary
     return annotation_kegg_pathway_dict, annotation_seqs_wkeggpathways
 
@@ -1216,51 +1018,14 @@ def build_annotation_kegg_pathway_dict(annotation_file):
 
 def build_species_kegg_pathway_dict(conn, species_name, kegg_pathway_id_list):
     '''
-    Build the species KEGG pathway dictionary from the annotations file.
+    Build the species KEGG pathway dictionary from the cluster x term matrix of the gymnoTOA database.
     '''
 
-    # initialize the species KEGG pathway dictionary
-    species_kegg_pathway_dict = {}
-
-    # initialize the counter of species sequences with KEGG pathways
-    species_seqs_wkeggpataways = 0
-
-    # get the dictionary of the KEGG pathways of each cluster corresponding to the species
-    kegg_pathways_per_cluster_dict = sqllib.get_kegg_pathways_per_cluster_dict(conn, species_name)
-
-    # initialize the species cluster counter
-    species_cluster_counter = 0
-
-    for _, data_dict in kegg_pathways_per_cluster_dict.items():
+    # get the cluster x KEGG pathway matrix of the gymnoTOA database (it is read from the database only when it does not exist or it is outdated)
+    database_term_index = termlib.get_database_term_index(conn)
 
-        # add 1 to  the species cluster counter
-        species_cluster_counter += 1
-
-        # initialize the list of KEGG pathway identifications corresponding to the sequence
-        kegg_pathway_id_list = []
-
-        # extract the KEGG pathway identifications and add them into the KEGG pathway identification list
-        # KEGG pathway format: "kegg_pathway_id1|kegg_pathway_id2|...|kegg_pathway_idn"
-        if data_dict['kegg_pathways'] != '' and data_dict['kegg_pathways'] != '-':
-            kegg_pathway_id_list.extend(data_dict['kegg_pathways'].split('|'))
-
-        # get the list of KEGG pathway identifications without duplicates
-        kegg_pathway_id_set = set(kegg_pathway_id_list)
-        kegg_pathway_id_list = sorted(kegg_pathway_id_set)
-
-        # increase the KEGG pathway identifications per sequence in the species KEGG pathway dictionary
-        if kegg_pathway_id_list != []:
-            for kegg_pathway_id in kegg_pathway_id_list:
-                counter = species_kegg_pathway_dict.get(kegg_pathway_id, 0)
-                species_kegg_pathway_dict[kegg_pathway_id] = counter + 1
-
-        # increase the counter of speciess sequences with GO terms
-        if kegg_pathway_id_list != []:
-            species_seqs_wkeggpataways += 1
-
-        genlib.Message.print('verbose', f'\rProcessed {species_name} clusters: {species_cluster_counter}')
-
-    genlib.Message.print('verbose', '\n')
+    # count the KEGG pathways of the species clusters with sparse matrix operations
+    (species_kegg_pathway_dict, species_seqs_wkeggpataways, species_cluster_counter) = database_term_index.get_species_term_count_dict(conn, genlib.get_kpea_code(), species_name, kegg_pathway_id_list)
 
     # print summary
     genlib.Message.print('info', f'{species_cluster_counter} clusters read.')
@@ -0,0 +1,66 @@
+#!/bin/bash
+
+#-------------------------------------------------------------------------------
+
+# This script performs a test of the program calculate-subset-enrichment.py
+# in a Linux environment.
+#
+# This software has been developed by:
+#
+#    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+#    Dpto. Sistemas y Recursos Naturales
+#    ETSI Montes, Forestal y del Medio Natural
+#    Universidad Politecnica de Madrid
+#    https://github.com/ggfhf/
+#
+# Licence: GNU General Public Licence Version 3.
+
+#-------------------------------------------------------------------------------
+
+# Control parameters
+
+if [ -n "$*" ]; then echo 'This script does not have parameters'; exit 1; fi
+
+#-------------------------------------------------------------------------------
+
+# Set environment
+
+APP_DIR=$GYMNOTOA
+DATA_DIR=$APP_DIR/data
+OUTPUT_DIR=$APP_DIR/output
+
+if [ ! -d "$OUTPUT_DIR" ]; then mkdir --parents $OUTPUT_DIR; fi
+
+INITIAL_DIR=$(pwd)
+cd $APP_DIR
+
+#-------------------------------------------------------------------------------
+
+# Execute the program calculate-subset-enrichment.py
+
+/usr/bin/time \
+    ./calculate-subset-enrichment.py \
+        --db=$DATA_DIR/gymnoTOA.db \
+        --annotations=$OUTPUT_DIR/annotations.csv \
+        --seqids=$DATA_DIR/subset-seqids.txt \
+        --method=by \
+        --msqsubset=2 \
+        --goea=$OUTPUT_DIR/subset-goterm-enrichment-analysis.csv \
+        --mpea=$OUTPUT_DIR/subset-metacyc-pathway-enrichment-analysis.csv \
+        --koea=$OUTPUT_DIR/subset-kegg-ko-enrichment-analysis.csv \
+        --kpea=$OUTPUT_DIR/subset-kegg-pathway-enrichment-analysis.csv \
+        --verbose=Y  \
+        --trace=N
+if [ $? -ne 0 ]; then echo 'Script ended with errors.'; exit 1; fi
+
+#-------------------------------------------------------------------------------
+
+# End
+
+cd $INITIAL_DIR
+
+echo
+echo '**************************************************'
+exit 0
+
+#-------------------------------------------------------------------------------
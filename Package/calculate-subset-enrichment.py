@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This program calculates the enrichment analysis of GO terms, Metacyc pathways, KEGG KOs and KEGG pathways
+of a sequence subset against all sequences of an annotation file.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import argparse
+import os
+import sys
+
+import genlib
+import incidencelib
+import sqllib
+
+#-------------------------------------------------------------------------------
+
+def main():
+    '''
+    Main line of the program.
+    '''
+
+    # check the operating system
+    genlib.check_os()
+
+    # get and check the arguments
+    parser = build_parser()
+    args = parser.parse_args()
+    check_args(args)
+
+    # connect to the SQLite database
+    conn = sqllib.connect_database(args.sqlite_database)
+
+    # calculate the subset enrichment analysis
+    calculate_subset_enrichment_analysis(conn, args.annotation_file, args.seq_id_file, args.fdr_method, args.min_seqnum_subset, args.goea_file, args.mpea_file, args.koea_file, args.kpea_file)
+
+#-------------------------------------------------------------------------------
+
+def build_parser():
+    '''
+    Build the parser with the available arguments.
+    '''
+
+    # create the parser and add arguments
+    description = 'Description: This program calculates the enrichment analysis of GO terms, Metacyc pathways, KEGG KOs\n' \
+                  'and KEGG pathways of a sequence subset against all sequences of an annotation file.'
+    text = f'{genlib.get_app_short_name()} v{genlib.get_app_version()} - {os.path.basename(__file__)}\n\n{description}\n'
+    usage = f'\r{text.ljust(len("usage:"))}\nUsage: {os.path.basename(__file__)} arguments'
+    parser = argparse.ArgumentParser(usage=usage)
+    parser._optionals.title = 'Arguments'    #pylint: disable=protected-access
+    parser.add_argument('--db', dest='sqlite_database', help='Path of the SQLite database (mandatory).')
+    parser.add_argument('--annotations', dest='annotation_file', help='Path of annotation file in CSV format (mandatory).')
+    parser.add_argument('--seqids', dest='seq_id_file', help='Path of the file with the sequence identifications of the subset, one per line (mandatory).')
+    parser.add_argument('--method', dest='fdr_method', help=f'Method used in FDR calcutation: {genlib.get_fdr_method_code_list_text()}; default: {genlib.Const.DEFAULT_FDR_METHOD}.')
+    parser.add_argument('--msqsubset', dest='min_seqnum_subset', help=f'Minimum sequence number in subset; default: {genlib.Const.DEFAULT_MIN_SEQNUM_SUBSET}.')
+    parser.add_argument('--goea', dest='goea_file', help='Path of the GO term enrichment analysis file (mandatory).')
+    parser.add_argument('--mpea', dest='mpea_file', help='Path of the Metacyc pathway enrichment analysis file (mandatory).')
+    parser.add_argument('--koea', dest='koea_file', help='Path of the KEGG KO enrichment analysis file (mandatory).')
+    parser.add_argument('--kpea', dest='kpea_file', help='Path of the KEGG pathway enrichment analysis file (mandatory).')
+    parser.add_argument('--verbose', dest='verbose', help=f'Additional job status info during the run: {genlib.get_verbose_code_list_text()}; default: {genlib.Const.DEFAULT_VERBOSE}.')
+    parser.add_argument('--trace', dest='trace', help=f'Additional info useful to the developer team: {genlib.get_trace_code_list_text()}; default: {genlib.Const.DEFAULT_TRACE}.')
+
+    # return the paser
+    return parser
+
+#-------------------------------------------------------------------------------
+
+def check_args(args):
+    '''
+    Check the input arguments.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # check "sqlite_database"
+    if args.sqlite_database is None:
+        genlib.Message.print('error', '*** The SQLite database is not indicated in the input arguments.')
+        OK = False
+
+    # check "annotation_file"
+    if args.annotation_file is None:
+        genlib.Message.print('error', '*** The annotation file is not indicated in the input arguments.')
+        OK = False
+    elif not os.path.isfile(args.annotation_file):
+        genlib.Message.print('error', f'*** The file {args.annotation_file} does not exist.')
+        OK = False
+
+    # check "seq_id_file"
+    if args.seq_id_file is None:
+        genlib.Message.print('error', '*** The sequence identification file is not indicated in the input arguments.')
+        OK = False
+    elif not os.path.isfile(args.seq_id_file):
+        genlib.Message.print('error', f'*** The file {args.seq_id_file} does not exist.')
+        OK = False
+
+    # check "fdr_method"
+    if args.fdr_method is None:
+        args.fdr_method = genlib.Const.DEFAULT_FDR_METHOD
+    elif not genlib.check_code(args.fdr_method, genlib.get_fdr_method_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** FDR method has to be {genlib.get_fdr_method_code_list_text()}.')
+        OK = False
+    else:
+        args.fdr_method = args.fdr_method.lower()
+
+    # check "min_seqnum_subset"
+    if args.min_seqnum_subset is None:
+        args.min_seqnum_subset = genlib.Const.DEFAULT_MIN_SEQNUM_SUBSET
+    elif not genlib.check_int(args.min_seqnum_subset, minimum=1):
+        genlib.Message.print('error', 'The minimum sequence number in subset has to be an integer number greater than or equal to 1.')
+        OK = False
+    else:
+        args.min_seqnum_subset = int(args.min_seqnum_subset)
+
+    # check "goea_file"
+    if args.goea_file is None:
+        genlib.Message.print('error', '*** The GO term enrichment analysis file is not indicated in the input arguments.')
+        OK = False
+
+    # check "mpea_file"
+    if args.mpea_file is None:
+        genlib.Message.print('error', '*** The Metacyc pathway enrichment analysis file is not indicated in the input arguments.')
+        OK = False
+
+    # check "koea_file"
+    if args.koea_file is None:
+        genlib.Message.print('error', '*** The KEGG KO enrichment analysis file is not indicated in the input arguments.')
+        OK = False
+
+    # check "kpea_file"
+    if args.kpea_file is None:
+        genlib.Message.print('error', '*** The KEGG pathway enrichment analysis file is not indicated in the input arguments.')
+        OK = False
+
+    # check "verbose"
+    if args.verbose is None:
+        args.verbose = genlib.Const.DEFAULT_VERBOSE
+    elif not genlib.check_code(args.verbose, genlib.get_verbose_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** verbose has to be {genlib.get_verbose_code_list_text()}.')
+        OK = False
+    if args.verbose.upper() == 'Y':
+        genlib.Message.set_verbose_status(True)
+
+    # check "trace"
+    if args.trace is None:
+        args.trace = genlib.Const.DEFAULT_TRACE
+    elif not genlib.check_code(args.trace, genlib.get_trace_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** trace has to be {genlib.get_trace_code_list_text()}.')
+        OK = False
+    if args.trace.upper() == 'Y':
+        genlib.Message.set_trace_status(True)
+
+    # if there are errors, exit with exception
+    if not OK:
+        raise genlib.ProgramException('', 'P001')
+
+#-------------------------------------------------------------------------------
+
+def calculate_subset_enrichment_analysis(conn, annotation_file, seq_id_file, fdr_method, min_seqnum_subset, goea_file, mpea_file, koea_file, kpea_file):
+    '''
+    Calculate the enrichment analysis of a sequence subset against all sequences of an annotation file.
+    '''
+
+    # get the incidence index of the annotation file (it is built and saved when it does not exist or it is outdated)
+    incidence_index = incidencelib.get_incidence_index(annotation_file)
+
+    # get the sequence identifications of the subset
+    seq_id_list = incidencelib.read_seq_id_file(seq_id_file)
+    genlib.Message.print('info', f'{len(seq_id_list)} sequence identifications read in subset file.')
+
+    # set the enrichment analysis file of each code
+    enrichment_file_dict = {genlib.get_goea_code(): goea_file, genlib.get_mpea_code(): mpea_file, genlib.get_koea_code(): koea_file, genlib.get_kpea_code(): kpea_file}
+
+    # calculate the enrichment analysis of each code and write its file
+    for code, enrichment_file in enrichment_file_dict.items():
+
+        # calculate the enrichment analysis
+        (result_list, subset_seqs_found, subset_seqs_wterms, universe_seqs_wterms) = incidence_index.calculate_subset_enrichment(code, seq_id_list, fdr_method)
+        genlib.Message.print('verbose', f'{code}: {subset_seqs_found} subset sequences found in annotations; {subset_seqs_wterms} of them with terms.\n')
+
+        # get the Gene Ontology dictionary of the GO terms
+        go_ontology_dict = {}
+        if code == genlib.get_goea_code() and result_list != []:
+            go_ontology_dict = sqllib.get_go_ontology_dict(conn, [result['term_id'] for result in result_list])
+
+        # write the enrichment analysis file
+        incidencelib.write_subset_enrichment_file(code, result_list, subset_seqs_wterms, universe_seqs_wterms, go_ontology_dict, min_seqnum_subset, enrichment_file)
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This source contains functions related to the columnar (Parquet) copies of the functional
+annotation and enrichment analysis files used in gymnoTOA (Gymnosperms Taxonomy-oriented
+Annotation). The Parquet copies are optional: when they do not exist, they are outdated or the
+pyarrow library is not installed, the CSV files are read.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import csv
+import gzip
+import json
+import os
+import sys
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pc = None
+    pacsv = None
+    pq = None
+
+import genlib
+import resultslib
+import sqllib
+
+#-------------------------------------------------------------------------------
+
+# set the record number of each row group of the Parquet files
+ROW_GROUP_SIZE = 100000
+
+# set the record number of each batch read from the Parquet files
+BATCH_SIZE = 10000
+
+#-------------------------------------------------------------------------------
+
+def is_parquet_available():
+    '''
+    Check if the pyarrow library is installed, so Parquet files can be written and read.
+    '''
+
+    return pq is not None
+
+#-------------------------------------------------------------------------------
+
+def get_parquet_file(file):
+    '''
+    Get the path of the Parquet copy of a CSV file.
+    '''
+
+    # remove the extension of the compression and the file extension
+    base = file[:-3] if file.endswith('.gz') else file
+    base = os.path.splitext(base)[0]
+
+    # return the Parquet file path
+    return f'{base}.parquet'
+
+#-------------------------------------------------------------------------------
+
+def get_functional_annotation_column_list():
+    '''
+    Get the column list of the functional annotation files.
+    '''
+
+    return genlib.get_functional_annotation_head().split(';')
+
+#-------------------------------------------------------------------------------
+
+def get_dictionary_column_list():
+    '''
+    Get the list of the functional annotation columns with a few different values, which are
+    saved dictionary-encoded.
+    '''
+
+    return ['sseqid', 'algorithm'] + sqllib.get_results_cluster_column_list()
+
+#-------------------------------------------------------------------------------
+
+def is_parquet_file_valid(file):
+    '''
+    Check if the Parquet copy of a CSV file exists and it has been written from the current
+    CSV file (when the CSV file has been removed, the Parquet copy is valid).
+    '''
+
+    # check the pyarrow library and the Parquet file
+    parquet_file = get_parquet_file(file)
+    if not is_parquet_available() or not os.path.isfile(parquet_file):
+        return False
+
+    # check the source signature saved in the Parquet file metadata
+    if os.path.isfile(file):
+        try:
+            metadata = pq.read_schema(parquet_file).metadata or {}
+        except Exception:
+            return False
+        source_signature = metadata.get(b'source_signature')
+        if source_signature is None or tuple(json.loads(source_signature)) != genlib.get_file_signature(file):
+            return False
+
+    # the Parquet file is valid
+    return True
+
+#-------------------------------------------------------------------------------
+
+def write_parquet_table(file, table, dictionary_column_list):
+    '''
+    Write the Parquet copy of a CSV file from its table. The source signature of the CSV file is
+    saved in the file metadata.
+    '''
+
+    # get the Parquet file path and a temporal file path
+    parquet_file = get_parquet_file(file)
+    temporal_parquet_file = f'{parquet_file}.tmp'
+
+    # add the source signature to the schema metadata
+    table = table.replace_schema_metadata({'source_signature': json.dumps(genlib.get_file_signature(file))})
+
+    # write the table (column-compressed with zstd) in the temporal file and rename it
+    try:
+        pq.write_table(table, temporal_parquet_file, row_group_size=ROW_GROUP_SIZE, compression='zstd', use_dictionary=dictionary_column_list)
+        os.replace(temporal_parquet_file, parquet_file)
+    except Exception as e:
+        raise genlib.ProgramException(e, 'F003', parquet_file)
+
+    # return the Parquet file path
+    return parquet_file
+
+#-------------------------------------------------------------------------------
+
+def read_csv_table(csv_file, quote_char):
+    '''
+    Read a CSV file with head as a table. The values are kept as text like when the CSV file is
+    read without its Parquet copy.
+    '''
+
+    # open the CSV file
+    if csv_file.endswith('.gz'):
+        try:
+            csv_file_id = gzip.open(csv_file, mode='rt', encoding='iso-8859-1')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F002', csv_file)
+    else:
+        try:
+            csv_file_id = open(csv_file, mode='r', encoding='iso-8859-1')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F001', csv_file)
+
+    # read the head of the CSV file
+    head_list = next(csv.reader([csv_file_id.readline()], delimiter=';', quotechar='"'))
+
+    # close the CSV file
+    csv_file_id.close()
+
+    # read the CSV file (the gzip compression is detected from the file extension)
+    try:
+        table = pacsv.read_csv(csv_file, read_options=pacsv.ReadOptions(encoding='iso-8859-1'), parse_options=pacsv.ParseOptions(delimiter=';', quote_char=quote_char), convert_options=pacsv.ConvertOptions(column_types={column: pa.string() for column in head_list}, strings_can_be_null=False))
+    except Exception as e:
+        raise genlib.ProgramException(e, 'F005', csv_file)
+
+    # return the table
+    return table
+
+#-------------------------------------------------------------------------------
+
+def write_functional_annotation_parquet(functional_annotation_file):
+    '''
+    Write the Parquet copy of a functional annotation file. The annotation columns with a few
+    different values are dictionary-encoded.
+    '''
+
+    # read the functional annotation file (its fields are not quoted)
+    table = read_csv_table(functional_annotation_file, False)
+
+    # check the columns
+    if table.column_names != get_functional_annotation_column_list():
+        raise genlib.ProgramException('', 'F005', functional_annotation_file)
+
+    # remove the leading and trailing whitespaces of the values like when the records are parsed
+    table = pa.table({column: pc.utf8_trim_whitespace(table.column(column)) for column in table.column_names})
+
+    # write the Parquet file
+    parquet_file = write_parquet_table(functional_annotation_file, table, get_dictionary_column_list())
+    genlib.Message.print('info', f'The file {os.path.basename(parquet_file)} is created.')
+
+#-------------------------------------------------------------------------------
+
+def write_csv_file_parquet(csv_file):
+    '''
+    Write the Parquet copy of a CSV file with head (for example, an enrichment analysis file).
+    All columns are dictionary-encoded.
+    '''
+
+    # read the CSV file
+    table = read_csv_table(csv_file, '"')
+
+    # write the Parquet file
+    parquet_file = write_parquet_table(csv_file, table, table.column_names)
+    genlib.Message.print('info', f'The file {os.path.basename(parquet_file)} is created.')
+
+#-------------------------------------------------------------------------------
+
+def read_functional_annotation_groups(functional_annotation_file, column_list):
+    '''
+    Get the functional annotation records grouped by sequence identification. Each item yielded
+    is (sequence identification, functional annotation record list). The results database of the
+    run is queried when it is valid, or the Parquet copy is scanned when it is valid, reading only
+    the columns of column list (the other columns are empty); otherwise, the CSV file is read.
+    '''
+
+    # query the results database when it is valid
+    if resultslib.is_results_db_valid(functional_annotation_file):
+        yield from genlib.group_functional_annotation_batches(resultslib.read_results_functional_annotation_batches(functional_annotation_file, column_list))
+
+    # read the Parquet copy when it is valid
+    elif is_parquet_file_valid(functional_annotation_file):
+        yield from genlib.group_functional_annotation_batches(read_parquet_functional_annotation_batches(get_parquet_file(functional_annotation_file), column_list))
+
+    # otherwise, read the CSV file
+    else:
+        yield from read_csv_functional_annotation_groups(functional_annotation_file)
+
+#-------------------------------------------------------------------------------
+
+def read_parquet_functional_annotation_batches(parquet_file, column_list):
+    '''
+    Read the Parquet copy of a functional annotation file in batches with only the columns of
+    column list (and the sequence identification) and get lists of functional annotation records.
+    '''
+
+    # set the columns to read
+    read_column_list = ['qseqid'] + [column for column in column_list if column != 'qseqid']
+
+    # open the Parquet file
+    try:
+        parquet_file_id = pq.ParquetFile(parquet_file)
+    except Exception as e:
+        raise genlib.ProgramException(e, 'F001', parquet_file)
+
+    # build the functional annotation records of each batch (the columns not read are empty
+    # and the values of the columns repeated in many records are interned)
+    make_record = genlib.FunctionalAnnotationRecord._make    # pylint: disable=protected-access
+    for batch in parquet_file_id.iter_batches(batch_size=BATCH_SIZE, columns=read_column_list):
+        value_list_dict = {column: batch.column(column).to_pylist() for column in read_column_list}
+        for column in genlib.FunctionalAnnotationRecord.INTERNED_COLUMN_LIST:
+            if column in value_list_dict:
+                value_list_dict[column] = list(map(sys.intern, value_list_dict[column]))
+        empty_value_list = [''] * batch.num_rows
+        yield [make_record(data_list) for data_list in zip(*[value_list_dict.get(column, empty_value_list) for column in genlib.FunctionalAnnotationRecord._fields])]    # pylint: disable=no-member
+
+    # close the Parquet file
+    parquet_file_id.close()
+
+#-------------------------------------------------------------------------------
+
+def read_csv_functional_annotation_groups(functional_annotation_file):
+    '''
+    Get the records of a functional annotation file (CSV) grouped by sequence identification.
+    '''
+
+    # open the functional annotation file in binary mode
+    if functional_annotation_file.endswith('.gz'):
+        try:
+            functional_annotation_file_id = gzip.open(functional_annotation_file, mode='rb')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F002', functional_annotation_file)
+    else:
+        try:
+            functional_annotation_file_id = open(functional_annotation_file, mode='rb')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F001', functional_annotation_file)
+
+    # skip the first record of the functional annotation file (header)
+    functional_annotation_file_id.readline()
+
+    # group the records
+    yield from genlib.read_functional_annotation_file_groups(functional_annotation_file, functional_annotation_file_id)
+
+    # close functional annotation file
+    functional_annotation_file_id.close()
+
+#-------------------------------------------------------------------------------
+
+def read_csv_file_columns(csv_file, column_list=None):
+    '''
+    Read the columns of column list (all columns when it is None) of a CSV file with head
+    (for example, an enrichment analysis file) as a dictionary (column name -> text value list).
+    The Parquet copy is scanned when it is valid; otherwise, the CSV file is read.
+    '''
+
+    # read the Parquet copy when it is valid
+    if is_parquet_file_valid(csv_file):
+        parquet_file = get_parquet_file(csv_file)
+        try:
+            table = pq.read_table(parquet_file, columns=column_list)
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F001', parquet_file)
+        return table.to_pydict()
+
+    # otherwise, read the CSV file
+    try:
+        with (gzip.open(csv_file, mode='rt', encoding='iso-8859-1', newline='') if csv_file.endswith('.gz') else open(csv_file, mode='r', encoding='iso-8859-1', newline='')) as csv_file_id:
+            reader = csv.reader(csv_file_id, delimiter=';', quotechar='"')
+            head_list = next(reader)
+            column_list = head_list if column_list is None else column_list
+            index_list = [head_list.index(column) for column in column_list]
+            column_dict = {column: [] for column in column_list}
+            for data_list in reader:
+                for column, index in zip(column_list, index_list):
+                    column_dict[column].append(data_list[index])
+    except ValueError as e:
+        raise genlib.ProgramException(e, 'F005', csv_file)
+    except Exception as e:
+        raise genlib.ProgramException(e, 'F001', csv_file)
+
+    # return the column dictionary
+    return column_dict
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    print(f'This source contains functions related to the columnar copies of the annotation files used in {genlib.get_app_long_name()}.')
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
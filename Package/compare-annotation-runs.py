@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This program compares several annotation runs: terms gained or lost between runs, Jaccard
+similarity of the term sets and shared best-hit clusters.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import argparse
+import os
+import sys
+
+import comparisonlib
+import genlib
+import termlib
+
+#-------------------------------------------------------------------------------
+
+def main():
+    '''
+    Main line of the program.
+    '''
+
+    # check the operating system
+    genlib.check_os()
+
+    # get and check the arguments
+    parser = build_parser()
+    args = parser.parse_args()
+    check_args(args)
+
+    # compare the annotation runs
+    compare_annotation_runs(args.run_dir, args.run_ids, args.annotation_result_type, args.output_dir)
+
+#-------------------------------------------------------------------------------
+
+def build_parser():
+    '''
+    Build the parser with the available arguments.
+    '''
+
+    # create the parser and add arguments
+    description = 'Description: This program compares several annotation runs: terms gained or lost between runs, Jaccard\n' \
+                  'similarity of the term sets and shared best-hit clusters.'
+    text = f'{genlib.get_app_short_name()} v{genlib.get_app_version()} - {os.path.basename(__file__)}\n\n{description}\n'
+    usage = f'\r{text.ljust(len("usage:"))}\nUsage: {os.path.basename(__file__)} arguments'
+    parser = argparse.ArgumentParser(usage=usage)
+    parser._optionals.title = 'Arguments'    #pylint: disable=protected-access
+    parser.add_argument('--rundir', dest='run_dir', help=f'Path of the result directory of the runs ("{genlib.get_result_run_subdir()}" subdirectory of the result directory) (mandatory).')
+    parser.add_argument('--runs', dest='run_ids', help='Comma-separated list of run identifications to compare; default: all annotation runs of the result directory.')
+    parser.add_argument('--type', dest='annotation_result_type', help=f'Annotation result type: {genlib.get_annotation_result_type_code_list_text()}; default: {genlib.Const.DEFAULT_ANNOTATION_RESULT_TYPE}.')
+    parser.add_argument('--outdir', dest='output_dir', help='Path of the directory to save comparison files (mandatory).')
+    parser.add_argument('--verbose', dest='verbose', help=f'Additional job status info during the run: {genlib.get_verbose_code_list_text()}; default: {genlib.Const.DEFAULT_VERBOSE}.')
+    parser.add_argument('--trace', dest='trace', help=f'Additional info useful to the developer team: {genlib.get_trace_code_list_text()}; default: {genlib.Const.DEFAULT_TRACE}.')
+
+    # return the paser
+    return parser
+
+#-------------------------------------------------------------------------------
+
+def check_args(args):
+    '''
+    Check the input arguments.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # check "run_dir"
+    if args.run_dir is None:
+        genlib.Message.print('error', '*** The result directory of the runs is not indicated in the input arguments.')
+        OK = False
+    elif not os.path.isdir(args.run_dir):
+        genlib.Message.print('error', f'*** The directory {args.run_dir} does not exist.')
+        OK = False
+
+    # check "annotation_result_type"
+    if args.annotation_result_type is None:
+        args.annotation_result_type = genlib.Const.DEFAULT_ANNOTATION_RESULT_TYPE
+    elif not genlib.check_code(args.annotation_result_type, genlib.get_annotation_result_type_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** type has to be {genlib.get_annotation_result_type_code_list_text()}.')
+        OK = False
+    else:
+        args.annotation_result_type = args.annotation_result_type.lower()
+
+    # check "run_ids"
+    if OK:
+        if args.run_ids is None:
+            args.run_ids = comparisonlib.get_annotation_run_id_list(args.run_dir)
+        else:
+            args.run_ids = list(dict.fromkeys(genlib.split_literal_to_text_list(args.run_ids)))
+        if len(args.run_ids) < 2:
+            genlib.Message.print('error', '*** At least two annotation runs are necessary to compare.')
+            OK = False
+        for run_id in args.run_ids:
+            for annotation_result_type in [args.annotation_result_type, 'best']:
+                functional_annotation_file = comparisonlib.get_functional_annotation_file(args.run_dir, run_id, annotation_result_type)
+                if not os.path.isfile(functional_annotation_file):
+                    genlib.Message.print('error', f'*** The file {functional_annotation_file} does not exist.')
+                    OK = False
+
+    # check "output_dir"
+    if args.output_dir is None:
+        genlib.Message.print('error', '*** The directory to save comparison files is not indicated in the input arguments.')
+        OK = False
+
+    # check "verbose"
+    if args.verbose is None:
+        args.verbose = genlib.Const.DEFAULT_VERBOSE
+    elif not genlib.check_code(args.verbose, genlib.get_verbose_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** verbose has to be {genlib.get_verbose_code_list_text()}.')
+        OK = False
+    if args.verbose.upper() == 'Y':
+        genlib.Message.set_verbose_status(True)
+
+    # check "trace"
+    if args.trace is None:
+        args.trace = genlib.Const.DEFAULT_TRACE
+    elif not genlib.check_code(args.trace, genlib.get_trace_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** trace has to be {genlib.get_trace_code_list_text()}.')
+        OK = False
+    if args.trace.upper() == 'Y':
+        genlib.Message.set_trace_status(True)
+
+    # if there are errors, exit with exception
+    if not OK:
+        raise genlib.ProgramException('', 'P001')
+
+#-------------------------------------------------------------------------------
+
+def compare_annotation_runs(run_dir, run_id_list, annotation_result_type, output_dir):
+    '''
+    Compare the terms and best-hit clusters of several annotation runs.
+    '''
+
+    # create the output directory
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+
+    # load the terms and best-hit clusters of the runs
+    functional_annotation_file_list = [comparisonlib.get_functional_annotation_file(run_dir, run_id, annotation_result_type) for run_id in run_id_list]
+    besthit_functional_annotation_file_list = [comparisonlib.get_functional_annotation_file(run_dir, run_id, 'best') for run_id in run_id_list]
+    run_comparison = comparisonlib.RunComparison(run_id_list, functional_annotation_file_list, besthit_functional_annotation_file_list)
+
+    # print summary
+    genlib.Message.print('info', f'{len(run_id_list)} annotation runs loaded.')
+
+    # write the summary file
+    run_comparison.write_summary_file(f'{output_dir}/{genlib.get_run_comparison_summary_file_name()}')
+
+    # write the overlap and term files of each enrichment analysis
+    for code in termlib.get_term_column_dict():
+        run_comparison.write_overlap_file(code, f'{output_dir}/{genlib.get_run_comparison_overlap_file_name(code)}')
+        run_comparison.write_term_file(code, f'{output_dir}/{genlib.get_run_comparison_term_file_name(code)}')
+
+    # write the overlap file of the best-hit clusters
+    run_comparison.write_overlap_file('clusters', f'{output_dir}/{genlib.get_run_comparison_overlap_file_name("clusters")}')
+
+    # show OK message
+    genlib.Message.print('info', f'The comparison files are save in {output_dir}.')
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
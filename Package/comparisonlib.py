@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This source contains functions and classes related to the comparison of annotation runs used in
+gymnoTOA (Gymnosperms Taxonomy-oriented Annotation). The terms and best-hit clusters of each run
+are encoded as bitsets over a dictionary shared by all runs, so the pairwise overlaps are
+calculated with vectorized operations.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import gzip
+import os
+import sys
+
+import numpy as np
+import scipy.sparse as sparse
+
+import columnlib
+import genlib
+import incidencelib
+import termlib
+
+#-------------------------------------------------------------------------------
+
+# set the bit count of each byte value
+POPCOUNT_ARRAY = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+#-------------------------------------------------------------------------------
+
+def get_term_name_dict():
+    '''
+    Get the dictionary of the term names of each enrichment analysis used in the headers (singular, plural).
+    '''
+
+    # build the term name dictionary
+    term_name_dict = {}
+    term_name_dict[genlib.get_goea_code()] = ('GOterm', 'GOterms')
+    term_name_dict[genlib.get_mpea_code()] = ('Metacyc pathway', 'Metacyc pathways')
+    term_name_dict[genlib.get_koea_code()] = ('KEGG KO', 'KEGG KOs')
+    term_name_dict[genlib.get_kpea_code()] = ('KEGG pathway', 'KEGG pathways')
+
+    # return the term name dictionary
+    return term_name_dict
+
+#-------------------------------------------------------------------------------
+
+def get_annotation_run_id_list(run_dir):
+    '''
+    Get the identifications of the annotation runs of a run result directory with functional
+    annotation files.
+    '''
+
+    # initialize the run identification list
+    run_id_list = []
+
+    # add the annotation pipeline runs with the functional annotation files
+    for entry in sorted(os.scandir(run_dir), key=lambda x: x.name):
+        if entry.is_dir() and entry.name.startswith(genlib.get_process_run_annotation_pipeline_code()) and os.path.isfile(f'{entry.path}/{genlib.get_besthit_functional_annotation_file_name()}'):
+            run_id_list.append(entry.name)
+
+    # return the run identification list
+    return run_id_list
+
+#-------------------------------------------------------------------------------
+
+def get_functional_annotation_file(run_dir, run_id, annotation_result_type):
+    '''
+    Get the path of the functional annotation file of a run corresponding to an annotation result type.
+    '''
+
+    # set the file name
+    if annotation_result_type == 'best':
+        file_name = genlib.get_besthit_functional_annotation_file_name()
+    else:
+        file_name = genlib.get_complete_functional_annotation_file_name()
+
+    # return the functional annotation file path
+    return f'{run_dir}/{run_id}/{file_name}'
+
+#-------------------------------------------------------------------------------
+
+def read_besthit_cluster_ids(besthit_functional_annotation_file):
+    '''
+    Read the best-hit cluster identification of each sequence of a functional annotation file
+    with the best hit per sequence (the potential lncRNA sequences do not have cluster). Return
+    the sequence identification and cluster identification arrays sorted by sequence
+    identification.
+    '''
+
+    # initialize the sequence and cluster identification lists
+    seq_id_list = []
+    cluster_id_list = []
+
+    # get the cluster identification of the sequences with hit in a cluster (only the cluster column is read when the file has a Parquet copy)
+    for seq_id, annotation_record_list in columnlib.read_functional_annotation_groups(besthit_functional_annotation_file, ['sseqid']):
+        cluster_id = annotation_record_list[0].sseqid
+        if cluster_id not in ['', '-', genlib.get_potential_lncrn()]:
+            seq_id_list.append(seq_id)
+            cluster_id_list.append(cluster_id)
+
+    # sort the arrays by sequence identification
+    seq_id_array = np.array(seq_id_list, dtype=str)
+    cluster_id_array = np.array(cluster_id_list, dtype=str)
+    order_array = np.argsort(seq_id_array, kind='stable')
+
+    # return the sequence and cluster identification arrays
+    return seq_id_array[order_array], cluster_id_array[order_array]
+
+#-------------------------------------------------------------------------------
+
+def open_output_file(output_file):
+    '''
+    Open an output file of the comparison (compressed with gzip when its name ends with ".gz").
+    '''
+
+    # open the output file
+    if output_file.endswith('.gz'):
+        try:
+            output_file_id = gzip.open(output_file, mode='wt', encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F004', output_file)
+    else:
+        try:
+            output_file_id = open(output_file, mode='w', encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F003', output_file)
+
+    # return the output file identification
+    return output_file_id
+
+#-------------------------------------------------------------------------------
+
+class RunBitsets():
+    '''
+    This class keeps the item sets (terms or clusters) of several runs as the rows of a bitset
+    matrix, whose bits are the items of a sorted dictionary shared by all runs.
+    '''
+
+    #---------------
+
+    def __init__(self, item_id_array_list):
+        '''
+        Create a class instance.
+        '''
+
+        # build the shared item dictionary (sorted item identifications)
+        if item_id_array_list:
+            self.item_id_array = np.unique(np.concatenate([np.asarray(item_id_array, dtype=str) for item_id_array in item_id_array_list]))
+        else:
+            self.item_id_array = np.array([], dtype=str)
+
+        # build the bitset of each run
+        self.bitset_matrix = np.zeros((len(item_id_array_list), (len(self.item_id_array) + 7) // 8), dtype=np.uint8)
+        for i, item_id_array in enumerate(item_id_array_list):
+            presence_array = np.zeros(len(self.item_id_array), dtype=bool)
+            presence_array[self.get_item_num_array(item_id_array)] = True
+            self.bitset_matrix[i] = np.packbits(presence_array)
+
+        # count the items of each run
+        self.item_count_array = POPCOUNT_ARRAY[self.bitset_matrix].sum(axis=1)
+
+    #---------------
+
+    def get_item_num_array(self, item_id_array):
+        '''
+        Get the item numbers in the shared dictionary of an array of item identifications of a run.
+        '''
+
+        return np.searchsorted(self.item_id_array, np.asarray(item_id_array, dtype=str))
+
+    #---------------
+
+    def get_presence_matrix(self):
+        '''
+        Get the run x item boolean matrix unpacking the bitsets.
+        '''
+
+        return np.unpackbits(self.bitset_matrix, axis=1, count=len(self.item_id_array)).astype(bool)
+
+    #---------------
+
+    def get_intersection_matrix(self):
+        '''
+        Get the run x run matrix of the count of shared items (bit count of the AND of each pair of bitsets).
+        '''
+
+        # initialize the intersection matrix
+        run_count = len(self.bitset_matrix)
+        intersection_matrix = np.zeros((run_count, run_count), dtype=np.int64)
+
+        # calculate the intersections of each run with all runs
+        for i in range(run_count):
+            intersection_matrix[i] = POPCOUNT_ARRAY[np.bitwise_and(self.bitset_matrix[i], self.bitset_matrix)].sum(axis=1)
+
+        # return the intersection matrix
+        return intersection_matrix
+
+    #---------------
+
+    def get_jaccard_matrix(self, intersection_matrix=None):
+        '''
+        Get the run x run matrix of the Jaccard similarity of the item sets (NaN when both sets are empty).
+        '''
+
+        # get the intersection and union matrices
+        if intersection_matrix is None:
+            intersection_matrix = self.get_intersection_matrix()
+        union_matrix = self.item_count_array[:, None] + self.item_count_array[None, :] - intersection_matrix
+
+        # calculate the Jaccard similarity
+        with np.errstate(divide='ignore', invalid='ignore'):
+            jaccard_matrix = np.where(union_matrix > 0, intersection_matrix / union_matrix, np.nan)
+
+        # return the Jaccard matrix
+        return jaccard_matrix
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class RunComparison():
+    '''
+    This class compares the terms of each enrichment analysis and the best-hit clusters of
+    several annotation runs. The per-run term sets are bitsets over a shared term dictionary and
+    the per-sequence term sets are the rows of sparse matrices with the same columns.
+    '''
+
+    #---------------
+
+    def __init__(self, run_id_list, functional_annotation_file_list, besthit_functional_annotation_file_list):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.run_id_list = run_id_list
+
+        # get the incidence index of each run (it is built and saved when it does not exist or it is outdated)
+        self.incidence_index_list = []
+        for run_id, functional_annotation_file in zip(run_id_list, functional_annotation_file_list):
+            self.incidence_index_list.append(incidencelib.get_incidence_index(functional_annotation_file))
+            genlib.Message.print('verbose', f'The incidence index of {run_id} is loaded.\n')
+
+        # get the best-hit cluster of the sequences of each run
+        self.besthit_list = []
+        for run_id, besthit_functional_annotation_file in zip(run_id_list, besthit_functional_annotation_file_list):
+            self.besthit_list.append(read_besthit_cluster_ids(besthit_functional_annotation_file))
+            genlib.Message.print('verbose', f'The best-hit clusters of {run_id} are read.\n')
+
+        # build the term bitsets of each enrichment analysis and the cluster bitsets
+        self.term_bitsets_dict = {}
+        for code in termlib.get_term_column_dict():
+            self.term_bitsets_dict[code] = RunBitsets([incidence_index.term_matrix_dict[code].term_id_array[incidence_index.universe_count_array_dict[code] > 0] for incidence_index in self.incidence_index_list])
+        self.cluster_bitsets = RunBitsets([cluster_id_array for _, cluster_id_array in self.besthit_list])
+
+    #---------------
+
+    def get_shared_term_matrix(self, code, i):
+        '''
+        Get the sequence x term sparse matrix of a run with the columns of the shared term dictionary.
+        '''
+
+        # get the term matrix of the run and the shared term numbers of its terms
+        term_matrix = self.incidence_index_list[i].term_matrix_dict[code]
+        term_bitsets = self.term_bitsets_dict[code]
+        shared_term_num_array = np.zeros(len(term_matrix.term_id_array), dtype=np.int64)
+        used_term_mask = self.incidence_index_list[i].universe_count_array_dict[code] > 0
+        shared_term_num_array[used_term_mask] = term_bitsets.get_item_num_array(term_matrix.term_id_array[used_term_mask])
+
+        # return the sparse matrix with the shared term numbers
+        return sparse.csr_matrix((np.ones(len(term_matrix.indices_array), dtype=np.int8), shared_term_num_array[term_matrix.indices_array], term_matrix.indptr_array), shape=(term_matrix.get_row_count(), len(term_bitsets.item_id_array)))
+
+    #---------------
+
+    def get_shared_seq_row_arrays(self, i, j):
+        '''
+        Get the row arrays of the sequences shared by two runs in their incidence indexes.
+        '''
+
+        (_, row_array_i, row_array_j) = np.intersect1d(self.incidence_index_list[i].seq_id_array, self.incidence_index_list[j].seq_id_array, assume_unique=True, return_indices=True)
+
+        return row_array_i, row_array_j
+
+    #---------------
+
+    def write_summary_file(self, summary_file):
+        '''
+        Write the file with the summary of each run.
+        '''
+
+        # open the summary file
+        summary_file_id = open_output_file(summary_file)
+
+        # write the header
+        term_name_dict = get_term_name_dict()
+        header_list = ['"Run"', '"Sequences#"']
+        for code in self.term_bitsets_dict:
+            header_list.append(f'"Sequences# with {term_name_dict[code][1]}"')
+            header_list.append(f'"{term_name_dict[code][1]}#"')
+        header_list.append('"Sequences# with best hit"')
+        header_list.append('"Best-hit clusters#"')
+        summary_file_id.write(f'{";".join(header_list)}\n')
+
+        # write data records
+        for i, run_id in enumerate(self.run_id_list):
+            incidence_index = self.incidence_index_list[i]
+            value_list = [f'"{run_id}"', str(incidence_index.get_seq_count())]
+            for code, term_bitsets in self.term_bitsets_dict.items():
+                value_list.append(str(incidence_index.universe_seqs_wterms_dict[code]))
+                value_list.append(str(term_bitsets.item_count_array[i]))
+            value_list.append(str(len(self.besthit_list[i][0])))
+            value_list.append(str(self.cluster_bitsets.item_count_array[i]))
+            summary_file_id.write(f'{";".join(value_list)}\n')
+
+        # close the summary file
+        summary_file_id.close()
+
+        genlib.Message.print('info', f'The file {summary_file} is created.')
+
+    #---------------
+
+    def write_overlap_file(self, item, overlap_file):
+        '''
+        Write the file with the pairwise overlaps of the terms of an enrichment analysis or the
+        best-hit clusters (item "clusters"), and the count of shared sequences with different
+        terms or best-hit cluster.
+        '''
+
+        # get the bitsets and the names of the items
+        if item == 'clusters':
+            run_bitsets = self.cluster_bitsets
+            (plural_name, shared_name, difference_name) = ('Best-hit clusters', 'best-hit clusters', 'best-hit cluster')
+        else:
+            run_bitsets = self.term_bitsets_dict[item]
+            plural_name = get_term_name_dict()[item][1]
+            (shared_name, difference_name) = (plural_name, plural_name)
+            shared_term_matrix_list = [self.get_shared_term_matrix(item, i) for i in range(len(self.run_id_list))]
+
+        # calculate the pairwise intersections and the Jaccard similarities
+        intersection_matrix = run_bitsets.get_intersection_matrix()
+        jaccard_matrix = run_bitsets.get_jaccard_matrix(intersection_matrix)
+        item_count_array = run_bitsets.item_count_array
+
+        # open the overlap file
+        overlap_file_id = open_output_file(overlap_file)
+
+        # write the header
+        overlap_file_id.write(f'"Run 1";"Run 2";"{plural_name}# in run 1";"{plural_name}# in run 2";"Shared {shared_name}#";"{plural_name}# only in run 1 (lost)";"{plural_name}# only in run 2 (gained)";"Jaccard similarity";"Shared sequences#";"Shared sequences# with different {difference_name}"\n')
+
+        # write data records
+        for i, run_id_1 in enumerate(self.run_id_list):
+            for j in range(i + 1, len(self.run_id_list)):
+                run_id_2 = self.run_id_list[j]
+
+                # compare the shared sequences
+                if item == 'clusters':
+                    (seq_id_array_1, cluster_id_array_1) = self.besthit_list[i]
+                    (seq_id_array_2, cluster_id_array_2) = self.besthit_list[j]
+                    (shared_seq_id_array, index_array_1, index_array_2) = np.intersect1d(seq_id_array_1, seq_id_array_2, assume_unique=True, return_indices=True)
+                    shared_seq_count = len(shared_seq_id_array)
+                    changed_seq_count = int(np.count_nonzero(cluster_id_array_1[index_array_1] != cluster_id_array_2[index_array_2]))
+                else:
+                    (row_array_1, row_array_2) = self.get_shared_seq_row_arrays(i, j)
+                    shared_seq_count = len(row_array_1)
+                    difference_matrix = shared_term_matrix_list[i][row_array_1] != shared_term_matrix_list[j][row_array_2]
+                    changed_seq_count = int(np.count_nonzero(np.diff(difference_matrix.indptr)))
+
+                # write the record of the pair of runs
+                jaccard = genlib.get_na() if np.isnan(jaccard_matrix[i, j]) else jaccard_matrix[i, j]
+                overlap_file_id.write(f'"{run_id_1}";"{run_id_2}";{item_count_array[i]};{item_count_array[j]};{intersection_matrix[i, j]};{item_count_array[i] - intersection_matrix[i, j]};{item_count_array[j] - intersection_matrix[i, j]};{jaccard};{shared_seq_count};{changed_seq_count}\n')
+
+        # close the overlap file
+        overlap_file_id.close()
+
+        genlib.Message.print('info', f'The file {overlap_file} is created.')
+
+    #---------------
+
+    def write_term_file(self, code, term_file):
+        '''
+        Write the file with the sequence count of each term of an enrichment analysis in each run
+        (the terms gained or lost between runs have 0 sequences in some runs).
+        '''
+
+        # build the run x term matrix of sequence counts with the shared term dictionary
+        term_bitsets = self.term_bitsets_dict[code]
+        count_matrix = np.zeros((len(self.run_id_list), len(term_bitsets.item_id_array)), dtype=np.int64)
+        for i, incidence_index in enumerate(self.incidence_index_list):
+            universe_count_array = incidence_index.universe_count_array_dict[code]
+            used_term_mask = universe_count_array > 0
+            count_matrix[i, term_bitsets.get_item_num_array(incidence_index.term_matrix_dict[code].term_id_array[used_term_mask])] = universe_count_array[used_term_mask]
+
+        # count the runs with each term
+        run_count_array = term_bitsets.get_presence_matrix().sum(axis=0)
+
+        # open the term file
+        term_file_id = open_output_file(term_file)
+
+        # write the header
+        term_name = get_term_name_dict()[code][0]
+        header_list = [f'"{term_name}"', f'"Runs# with this {term_name}"'] + [f'"Sequences# in {run_id}"' for run_id in self.run_id_list]
+        term_file_id.write(f'{";".join(header_list)}\n')
+
+        # write data records
+        count_list_list = count_matrix.T.tolist()
+        run_count_list = run_count_array.tolist()
+        for term_num, term_id in enumerate(term_bitsets.item_id_array.tolist()):
+            term_file_id.write(f'"{term_id}";{run_count_list[term_num]};{";".join(map(str, count_list_list[term_num]))}\n')
+
+        # close the term file
+        term_file_id.close()
+
+        genlib.Message.print('info', f'The file {term_file} is created.')
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    print(f'This source contains functions and classes related to the comparison of annotation runs used in {genlib.get_app_long_name()}.')
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
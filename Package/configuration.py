@@ -366,6 +366,10 @@ class FormRecreateConfigFile(QWidget):
 
             # create the application config file
             (OK, error_list) = self.create_app_config_file(app_dir, self.lineedit_database_dir.text(), self.lineedit_result_dir.text())
+
+            # refresh the environment state of the application
+            genlib.AppState.refresh()
+
             if OK:
                 text = f'The file\n\n{genlib.get_app_config_file()}\n\nis recreated.'
                 QMessageBox.information(self, self.title, text, buttons=QMessageBox.Ok)
@@ -48,6 +48,7 @@ from PyQt5.QtWidgets import QWidget        # pylint: disable=no-name-in-module
 
 import dialogs
 import genlib
+import registrylib
 
 #-------------------------------------------------------------------------------
 
@@ -78,7 +79,7 @@ class FormDownloadGymnoTOAdb(QWidget):
         self.title = f'{genlib.get_app_short_name()} - {self.head}'
 
         # get the dictionary of application configuration
-        self.app_config_dict = genlib.get_config_dict(genlib.get_app_config_file())
+        self.app_config_dict = genlib.AppState.get_app_config_dict()
 
         # build the graphic user interface of the window
         self.build_gui()
@@ -257,6 +258,7 @@ class FormDownloadGymnoTOAdb(QWidget):
             rc = genlib.run_command(command, process, is_script=False)
             if rc == 0:
                 process.write(f'The directory path is {current_run_dir}.\n')
+                registrylib.register_run(result_dir, genlib.get_result_database_subdir(), os.path.basename(current_run_dir))
             else:
                 process.write(f'*** ERROR: RC {rc} in command -> {command}\n')
                 OK = False
@@ -551,7 +553,7 @@ class FormViewGymnoTOAdbStats(QWidget):
         self.title = f'{genlib.get_app_short_name()} - {self.head}'
 
         # get the dictionary of application configuration
-        self.app_config_dict = genlib.get_config_dict(genlib.get_app_config_file())
+        self.app_config_dict = genlib.AppState.get_app_config_dict()
 
         # build the graphic user interface of the window
         self.build_gui()
@@ -28,8 +28,14 @@ Licence: GNU General Public Licence Version 3.
 
 import os
 import sys
+import threading
 
+from PyQt5.QtCore import QAbstractTableModel     # pylint: disable=no-name-in-module
+from PyQt5.QtCore import QFileSystemWatcher      # pylint: disable=no-name-in-module
+from PyQt5.QtCore import QModelIndex             # pylint: disable=no-name-in-module
 from PyQt5.QtCore import Qt                      # pylint: disable=no-name-in-module
+from PyQt5.QtCore import QThread                 # pylint: disable=no-name-in-module
+from PyQt5.QtCore import QTimer                  # pylint: disable=no-name-in-module
 from PyQt5.QtGui import QCursor                  # pylint: disable=no-name-in-module
 from PyQt5.QtGui import QFont                    # pylint: disable=no-name-in-module
 from PyQt5.QtGui import QGuiApplication          # pylint: disable=no-name-in-module
@@ -38,15 +44,17 @@ from PyQt5.QtGui import QPixmap                  # pylint: disable=no-name-in-mo
 from PyQt5.QtGui import QTextCursor              # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QAbstractItemView    # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QApplication         # pylint: disable=no-name-in-module
+from PyQt5.QtWidgets import QCheckBox            # pylint: disable=no-name-in-module
+from PyQt5.QtWidgets import QComboBox            # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QDialog              # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QGridLayout          # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QGroupBox            # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QHeaderView          # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QLabel               # pylint: disable=no-name-in-module
+from PyQt5.QtWidgets import QLineEdit            # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QMessageBox          # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QPushButton          # pylint: disable=no-name-in-module
-from PyQt5.QtWidgets import QTableWidget         # pylint: disable=no-name-in-module
-from PyQt5.QtWidgets import QTableWidgetItem     # pylint: disable=no-name-in-module
+from PyQt5.QtWidgets import QTableView           # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QTextEdit            # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QVBoxLayout          # pylint: disable=no-name-in-module
 
@@ -67,6 +75,9 @@ class DialogProcess(QDialog):
     WINDOW_HEIGHT = 700
     WINDOW_WIDTH = 800
 
+    # set the refresh interval (in milliseconds) of the log text
+    LOG_REFRESH_INTERVAL = 200
+
     #---------------
 
     def __init__(self, parent, head, calling_function, *args):
@@ -80,6 +91,13 @@ class DialogProcess(QDialog):
         self.calling_function = calling_function
         self.title = f'{genlib.get_app_short_name()} - {self.head}'
 
+        # initialize the pending log text, the subprocess being run and the cancellation status
+        # (they are shared with the thread where the calling function runs)
+        self.pending_text_list = []
+        self.pending_text_lock = threading.Lock()
+        self.current_subprocess = None
+        self.cancelled = False
+
         # call the init method of the parent class
         super().__init__()
 
@@ -89,9 +107,19 @@ class DialogProcess(QDialog):
         # load initial data in inputs
         self.initialize_inputs()
 
+        # create the log file
         self.create_log_file()
-        self.calling_function(self, *args)
-        self.enable_pushbutton_close()
+
+        # create the timer that moves the pending log text to "textedit" and the log file
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.LOG_REFRESH_INTERVAL)
+        self.timer.timeout.connect(self.flush_pending_text)
+        self.timer.start()
+
+        # run the calling function in a thread in order to keep the window responsive
+        self.process_thread = ProcessThread(self, self.calling_function, *args)
+        self.process_thread.finished.connect(self.process_thread_finished)
+        self.process_thread.start()
 
         # show the window
         self.setWindowModality(Qt.ApplicationModal)
@@ -138,6 +166,12 @@ class DialogProcess(QDialog):
         groupbox_data.setStyleSheet('QGroupBox#groupbox_data {border: 0px;}')
         groupbox_data.setLayout(gridlayout_data)
 
+        # create and configure "pushbutton_cancel"
+        self.pushbutton_cancel = QPushButton('Cancel')
+        self.pushbutton_cancel.setToolTip('Cancel the process.')
+        self.pushbutton_cancel.setCursor(QCursor(Qt.PointingHandCursor))
+        self.pushbutton_cancel.clicked.connect(self.pushbutton_cancel_clicked)
+
         # create and configure "pushbutton_close"
         self.pushbutton_close = QPushButton('Close')
         self.pushbutton_close.setToolTip('Close the window.')
@@ -148,7 +182,9 @@ class DialogProcess(QDialog):
         gridlayout_buttons = QGridLayout()
         gridlayout_buttons.setColumnStretch(0, 10)
         gridlayout_buttons.setColumnStretch(1, 1)
-        gridlayout_buttons.addWidget(self.pushbutton_close, 0, 1, alignment=Qt.AlignCenter)
+        gridlayout_buttons.setColumnStretch(2, 1)
+        gridlayout_buttons.addWidget(self.pushbutton_cancel, 0, 1, alignment=Qt.AlignCenter)
+        gridlayout_buttons.addWidget(self.pushbutton_close, 0, 2, alignment=Qt.AlignCenter)
 
         # create and configure "groupbox_buttons"
         groupbox_buttons = QGroupBox()
@@ -187,6 +223,63 @@ class DialogProcess(QDialog):
 
     #---------------
 
+    def closeEvent(self, event):
+        '''
+        The window is going to be closed.
+        '''
+
+        # the window can not be closed while the calling function is running
+        if self.process_thread.isRunning():
+            event.ignore()
+        else:
+            event.accept()
+
+    #---------------
+
+    def pushbutton_cancel_clicked(self):
+        '''
+        Cancel the process: the subprocess being run is terminated and the following commands are not run.
+        '''
+
+        # confirm the cancellation
+        text = 'Are you sure to cancel the process?'
+        botton = QMessageBox.question(self, self.title, text, buttons=QMessageBox.Yes|QMessageBox.No, defaultButton=QMessageBox.No)
+        if botton == QMessageBox.No:
+            return
+
+        # disable "pushbutton_cancel"
+        self.pushbutton_cancel.setEnabled(False)
+
+        # set the cancellation status and terminate the subprocess being run
+        self.cancelled = True
+        current_subprocess = self.current_subprocess
+        if current_subprocess is not None and current_subprocess.poll() is None:
+            current_subprocess.terminate()
+        self.write('*** The process is cancelled by the user.\n')
+
+    #---------------
+
+    def process_thread_finished(self):
+        '''
+        The calling function has finished.
+        '''
+
+        # stop the timer and move the remaining log text
+        self.timer.stop()
+        self.flush_pending_text()
+
+        # refresh the environment state of the application
+        # (the process can install, remove or download the directories whose existence is cached)
+        genlib.AppState.refresh()
+
+        # disable "pushbutton_cancel"
+        self.pushbutton_cancel.setEnabled(False)
+
+        # enable "pushbutton_close"
+        self.enable_pushbutton_close()
+
+    #---------------
+
     def pushbutton_close_clicked(self):
         '''
         Close the log file and window.
@@ -235,17 +328,71 @@ class DialogProcess(QDialog):
 
     def write(self, text=''):
         '''
-        Add a message text in "textedit" and in the log file.
+        Add a message text to the pending log text (it can be called from any thread).
         '''
 
-        # insert text in the current cursor position of "textedit" and process pending events
-        self.textedit.insertPlainText(text)
-        QApplication.processEvents()
+        # append the text to the pending log text
+        with self.pending_text_lock:
+            self.pending_text_list.append(text)
+
+    #---------------
+
+    def flush_pending_text(self):
+        '''
+        Add the pending log text in "textedit" and in the log file.
+        '''
 
-        # write the text in the log file and force the write file to disc
-        self.log_file_path_id.write(text)
-        self.log_file_path_id.flush()
-        os.fsync(self.log_file_path_id.fileno())
+        # get the pending log text
+        with self.pending_text_lock:
+            text = ''.join(self.pending_text_list)
+            self.pending_text_list = []
+
+        # if there is pending log text
+        if text != '':
+
+            # insert text at the end of "textedit"
+            self.textedit.moveCursor(QTextCursor.End)
+            self.textedit.insertPlainText(text)
+            self.textedit.moveCursor(QTextCursor.End)
+
+            # write the text in the log file and force the write file to disc
+            self.log_file_path_id.write(text)
+            self.log_file_path_id.flush()
+            os.fsync(self.log_file_path_id.fileno())
+
+#-------------------------------------------------------------------------------
+
+class ProcessThread(QThread):
+    '''
+    The class of the thread where the calling function of a "DialogProcess" is run.
+    '''
+
+    #---------------
+
+    def __init__(self, process, calling_function, *args):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.process = process
+        self.calling_function = calling_function
+        self.args = args
+
+        # call the init method of the parent class
+        super().__init__()
+
+    #---------------
+
+    def run(self):
+        '''
+        Run the calling function.
+        '''
+
+        try:
+            self.calling_function(self.process, *self.args)
+        except Exception as e:
+            self.process.write(f'*** EXCEPTION: "{e}".\n')
 
 #-------------------------------------------------------------------------------
 
@@ -260,9 +407,15 @@ class DialogFileBrowser(QDialog):
     WINDOW_HEIGHT = 700
     WINDOW_WIDTH = 800
 
+    # set the polling interval (in milliseconds) of the file when its content is followed
+    FOLLOW_INTERVAL = 1000
+
+    # set the maximum number of lines kept in "textedit" (the oldest lines are removed)
+    MAX_LINE_COUNT = 50000
+
     #---------------
 
-    def __init__(self, parent, head, file_path):
+    def __init__(self, parent, head, file_path, follow=False):
         '''
         Create a class instance.
         '''
@@ -271,14 +424,26 @@ class DialogFileBrowser(QDialog):
         self.parent = parent
         self.head = head
         self.file_path = file_path
+        self.follow = follow
         self.title = f'{genlib.get_app_short_name()} - {self.head}'
 
+        # create the reader of the file content
+        self.file_tail_reader = genlib.FileTailReader(self.file_path)
+
         # call the init method of the parent class
         super().__init__()
 
         # build the graphic user interface of the window
         self.build_gui()
 
+        # create the watcher of the file and the timer that polls it when its content is followed
+        # (the watcher is not always notified, e. g. with files of WSL from Windows)
+        self.file_system_watcher = QFileSystemWatcher(self)
+        self.file_system_watcher.fileChanged.connect(self.file_changed)
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.FOLLOW_INTERVAL)
+        self.timer.timeout.connect(self.append_new_file_content)
+
         # load initial data in inputs
         self.initialize_inputs()
 
@@ -317,6 +482,7 @@ class DialogFileBrowser(QDialog):
         self.textedit = QTextEdit()
         self.textedit.setFont(QFont('Consolas', 10))
         self.textedit.setReadOnly(True)
+        self.textedit.document().setMaximumBlockCount(self.MAX_LINE_COUNT)
 
         # create and configure "gridlayout_data"
         gridlayout_data = QGridLayout()
@@ -328,6 +494,12 @@ class DialogFileBrowser(QDialog):
         groupbox_data.setStyleSheet('QGroupBox#groupbox_data {border: 0px;}')
         groupbox_data.setLayout(gridlayout_data)
 
+        # create and configure "checkbox_follow"
+        self.checkbox_follow = QCheckBox('Follow new content')
+        self.checkbox_follow.setToolTip('Append the new content of the file as it is written.')
+        self.checkbox_follow.setCursor(QCursor(Qt.PointingHandCursor))
+        self.checkbox_follow.stateChanged.connect(self.checkbox_follow_stateChanged)
+
         # create and configure "pushbutton_refresh"
         self.pushbutton_refresh = QPushButton('Refresh')
         self.pushbutton_refresh.setToolTip('Reload the file content.')
@@ -345,6 +517,7 @@ class DialogFileBrowser(QDialog):
         gridlayout_buttons.setColumnStretch(0, 15)
         gridlayout_buttons.setColumnStretch(1, 1)
         gridlayout_buttons.setColumnStretch(2, 1)
+        gridlayout_buttons.addWidget(self.checkbox_follow, 0, 0, alignment=Qt.AlignLeft)
         gridlayout_buttons.addWidget(self.pushbutton_refresh, 0, 1, alignment=Qt.AlignCenter)
         gridlayout_buttons.addWidget(self.pushbutton_close, 0, 2, alignment=Qt.AlignCenter)
 
@@ -380,6 +553,41 @@ class DialogFileBrowser(QDialog):
         # load the file context
         self.load_file_content()
 
+        # set the follow mode
+        self.checkbox_follow.setChecked(self.follow)
+
+    #---------------
+
+    def checkbox_follow_stateChanged(self):
+        '''
+        Start or stop following the file content when "checkbox_follow" state has changed.
+        '''
+
+        if self.checkbox_follow.isChecked():
+            if self.file_path not in self.file_system_watcher.files():
+                self.file_system_watcher.addPath(self.file_path)
+            self.timer.start()
+            self.append_new_file_content()
+            self.textedit.moveCursor(QTextCursor.End)
+        else:
+            if self.file_system_watcher.files():
+                self.file_system_watcher.removePaths(self.file_system_watcher.files())
+            self.timer.stop()
+
+    #---------------
+
+    def file_changed(self):
+        '''
+        Append the new file content when the file has changed.
+        '''
+
+        # watch the file again when it has been replaced
+        if self.file_path not in self.file_system_watcher.files() and os.path.isfile(self.file_path):
+            self.file_system_watcher.addPath(self.file_path)
+
+        # append the new file content
+        self.append_new_file_content()
+
     #---------------
 
     def pushbutton_refresh_clicked(self):
@@ -397,6 +605,7 @@ class DialogFileBrowser(QDialog):
         Close the window.
         '''
 
+        self.timer.stop()
         self.close()
 
     #---------------
@@ -416,35 +625,76 @@ class DialogFileBrowser(QDialog):
 
     def load_file_content(self):
         '''
-        Load the file content in the "textedit".
+        Load the file content in the "textedit" (only the last part of large files).
         '''
 
-        # clear the content of "textedit"
+        # clear the content of "textedit" and read the file from its last part
         self.textedit.clear()
+        self.file_tail_reader.reset()
 
-        # open the file and insert its content in "textedit"
+        # insert the file content in "textedit"
         try:
-            with open(self.file_path, mode='r', encoding='utf-8') as file_id:
-                self.textedit.insertPlainText(file_id.read())
+            self.insert_text(self.file_tail_reader.read_new_text()[0])
         except Exception:
             title = f'{genlib.get_app_short_name()} - {self.head}'
             text = f'The file\n\n{self.file_path}\n\ncan not be opened.'
             QMessageBox.critical(self, title, text, buttons=QMessageBox.Ok)
 
-        # move the cursor to start
-        # -- text_cursor = QTextCursor(self.textedit.document())
-        # -- text_cursor.movePosition(QTextCursor.Start)
-        text_cursor = QTextCursor(self.textedit.document().findBlockByLineNumber(0))
-        self.textedit.setTextCursor(text_cursor)
+        # move the cursor to the end when the content is followed; otherwise, to start
+        if self.checkbox_follow.isChecked():
+            self.textedit.moveCursor(QTextCursor.End)
+        else:
+            # -- text_cursor = QTextCursor(self.textedit.document())
+            # -- text_cursor.movePosition(QTextCursor.Start)
+            text_cursor = QTextCursor(self.textedit.document().findBlockByLineNumber(0))
+            self.textedit.setTextCursor(text_cursor)
 
         # process pending events
         # -- QApplication.processEvents()
 
+    #---------------
+
+    def append_new_file_content(self):
+        '''
+        Append the content written in the file since the previous read to "textedit".
+        '''
+
+        # read the new file content (the file may not exist yet or be being replaced)
+        try:
+            (text, is_reset) = self.file_tail_reader.read_new_text()
+        except OSError:
+            return
+
+        # clear "textedit" when the file has been truncated or replaced
+        if is_reset:
+            self.textedit.clear()
+
+        # append the new content and move the cursor to the end
+        if text != '':
+            self.insert_text(text)
+            self.textedit.moveCursor(QTextCursor.End)
+
+    #---------------
+
+    def insert_text(self, text):
+        '''
+        Insert a text at the end of "textedit" (the oldest lines are removed when the maximum
+        number of lines is exceeded).
+        '''
+
+        text_cursor = QTextCursor(self.textedit.document())
+        text_cursor.movePosition(QTextCursor.End)
+        text_cursor.insertText(text)
+
+    #---------------
+
 #-------------------------------------------------------------------------------
 
 class DialogDataTable(QDialog):
     '''
-    The class of the dialog "DialogDataTable".
+    The class of the dialog "DialogDataTable". When the items object can sort and filter its keys
+    (for example, a "enrichmentlib.EnrichmentAnalysisTable"), the rows can be sorted clicking on the
+    column headers and filtered by a range of values of a column.
     '''
 
     #---------------
@@ -468,11 +718,19 @@ class DialogDataTable(QDialog):
         self.params = params
         self.title = f'{genlib.get_app_short_name()} - {self.head}'
 
+        # check if the items can be sorted and filtered
+        self.is_sortable = hasattr(self.item_dict, 'sort_key_list')
+        self.is_filterable = hasattr(self.item_dict, 'filter_key_list')
+
+        # initialize the sort column and order
+        self.sort_column = None
+        self.sort_reverse = False
+
         # call the init method of the parent class
         super().__init__()
 
         # get the dictionary of application configuration
-        self.app_config_dict = genlib.get_config_dict(genlib.get_app_config_file())
+        self.app_config_dict = genlib.AppState.get_app_config_dict()
 
         # connect to the SQLite database
         app_db_path = self.app_config_dict[f'{genlib.get_app_short_name()} database']['app_db_path']
@@ -517,22 +775,22 @@ class DialogDataTable(QDialog):
         rectangle.moveCenter(central_point)
         self.move(rectangle.topLeft())
 
-        # create and configure "tablewidget"
-        self.tablewidget = QTableWidget()
-        self.tablewidget.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.tablewidget.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
-        self.column_name_list = []
-        for col in self.data_list:
-            self.column_name_list.append(self.data_dict[col]['text'])
-        self.tablewidget.setColumnCount(len(self.column_name_list))
-        self.tablewidget.setHorizontalHeaderLabels(self.column_name_list)
-        for i in range(len(self.data_list)):    # pylint: disable=consider-using-enumerate
-            col = self.data_list[i]
-            self.tablewidget.setColumnWidth(i, self.data_dict[col]['width'])
-        self.tablewidget.verticalHeader().setVisible(True)
-        self.tablewidget.currentCellChanged.connect(self.tablewidget_currentCellChanged)
-        self.tablewidget.cellClicked.connect(self.tablewidget_cellClicked)
-        self.tablewidget.cellDoubleClicked.connect(self.tablewidget_cellDoubleClicked)
+        # create and configure "tableview"
+        # (the rows have a fixed height in order to the view does not have to measure every row)
+        self.tableview = QTableView()
+        self.tableview.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tableview.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.tableview.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.tableview.verticalHeader().setVisible(True)
+        self.tableview.clicked.connect(self.tableview_clicked)
+        self.tableview.doubleClicked.connect(self.tableview_doubleClicked)
+
+        # sort the rows clicking on the column headers when the items can be sorted
+        if self.is_sortable:
+            self.tableview.horizontalHeader().setSectionsClickable(True)
+            self.tableview.horizontalHeader().setSortIndicatorShown(True)
+            self.tableview.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+            self.tableview.horizontalHeader().sectionClicked.connect(self.tableview_header_clicked)
 
         # create and configure "label_explanatory_text"
         label_explanatory_text = QLabel()
@@ -540,8 +798,10 @@ class DialogDataTable(QDialog):
 
         # create and configure "gridlayout_data"
         gridlayout_data = QGridLayout()
-        gridlayout_data.addWidget(self.tablewidget, 0, 0)
-        gridlayout_data.addWidget(label_explanatory_text, 1, 0)
+        if self.is_filterable:
+            gridlayout_data.addLayout(self.build_gridlayout_filter(), 0, 0)
+        gridlayout_data.addWidget(self.tableview, 1, 0)
+        gridlayout_data.addWidget(label_explanatory_text, 2, 0)
 
         # create and configure "groupbox_data"
         groupbox_data = QGroupBox()
@@ -585,13 +845,66 @@ class DialogDataTable(QDialog):
 
     #---------------
 
+    def build_gridlayout_filter(self):
+        '''
+        Build the layout with the inputs to filter the rows by a range of values of a column.
+        '''
+
+        # set the columns that can be filtered
+        self.filter_column_list = [column for column in self.item_dict.get_filter_column_list() if column in self.data_list]
+
+        # create and configure "label_filter"
+        label_filter = QLabel()
+        label_filter.setText('Filter')
+
+        # create and configure "combobox_filter_column"
+        self.combobox_filter_column = QComboBox()
+        self.combobox_filter_column.addItems([self.data_dict[column]['text'] for column in self.filter_column_list])
+        self.combobox_filter_column.setToolTip('Column whose values are filtered.')
+
+        # create and configure "lineedit_filter_minimum"
+        self.lineedit_filter_minimum = QLineEdit()
+        self.lineedit_filter_minimum.setPlaceholderText('minimum')
+        self.lineedit_filter_minimum.setToolTip('Minimum value (blank: it is not checked).')
+        self.lineedit_filter_minimum.returnPressed.connect(self.pushbutton_filter_clicked)
+
+        # create and configure "lineedit_filter_maximum"
+        self.lineedit_filter_maximum = QLineEdit()
+        self.lineedit_filter_maximum.setPlaceholderText('maximum')
+        self.lineedit_filter_maximum.setToolTip('Maximum value (blank: it is not checked).')
+        self.lineedit_filter_maximum.returnPressed.connect(self.pushbutton_filter_clicked)
+
+        # create and configure "pushbutton_filter"
+        self.pushbutton_filter = QPushButton('Apply')
+        self.pushbutton_filter.setToolTip('Show the rows whose value is between the minimum and the maximum.')
+        self.pushbutton_filter.setCursor(QCursor(Qt.PointingHandCursor))
+        self.pushbutton_filter.clicked.connect(self.pushbutton_filter_clicked)
+
+        # create and configure "label_row_count"
+        self.label_row_count = QLabel()
+
+        # create and configure "gridlayout_filter"
+        gridlayout_filter = QGridLayout()
+        gridlayout_filter.setColumnStretch(5, 1)
+        gridlayout_filter.addWidget(label_filter, 0, 0)
+        gridlayout_filter.addWidget(self.combobox_filter_column, 0, 1)
+        gridlayout_filter.addWidget(self.lineedit_filter_minimum, 0, 2)
+        gridlayout_filter.addWidget(self.lineedit_filter_maximum, 0, 3)
+        gridlayout_filter.addWidget(self.pushbutton_filter, 0, 4)
+        gridlayout_filter.addWidget(self.label_row_count, 0, 5, alignment=Qt.AlignRight)
+
+        # return the layout
+        return gridlayout_filter
+
+    #---------------
+
     def initialize_inputs(self):
         '''
         Load initial data in inputs.
         '''
 
-        # load data in "tablewidget"
-        self.load_tablewidget()
+        # load data in "tableview"
+        self.load_tableview()
 
     #---------------
 
@@ -608,9 +921,9 @@ class DialogDataTable(QDialog):
 
     #---------------
 
-    def tablewidget_currentCellChanged(self, _, __):
+    def tableview_currentChanged(self, _, __):
         '''
-        Perform necessary actions after changing the current "tablewidget" cell.
+        Perform necessary actions after changing the current "tableview" cell.
         '''
 
         # check the content of inputs
@@ -618,9 +931,9 @@ class DialogDataTable(QDialog):
 
     #---------------
 
-    def tablewidget_cellClicked(self, _, __):
+    def tableview_clicked(self, _):
         '''
-        Perform necessary actions after clicking on a "tablewidget" cell.
+        Perform necessary actions after clicking on a "tableview" cell.
         '''
 
         # check the content of inputs
@@ -628,17 +941,17 @@ class DialogDataTable(QDialog):
 
     #---------------
 
-    def tablewidget_cellDoubleClicked(self, row, col):
+    def tableview_doubleClicked(self, index):
         '''
-        Perform necessary actions after double clicking on "tablewidget" cell.
+        Perform necessary actions after double clicking on "tableview" cell.
         '''
 
         # when the dialog is showing functional annotation data
         if self.action == 'browse-functional-annotation':
-            if col == 1:
+            if index.column() == 1:
 
                 # get the cluster identification
-                cluster_id = self.tablewidget.item(row, col).text()
+                cluster_id = self.tableview.model().data(index)
 
                 # get MMseqs2 relationships dictionary
                 relationships_dict = sqllib.get_mmseqs2_protein_clusters_dict(self.conn, cluster_id)
@@ -673,6 +986,66 @@ class DialogDataTable(QDialog):
 
     #---------------
 
+    def tableview_header_clicked(self, section):
+        '''
+        Sort the rows by the column of the header clicked (a second click reverses the order).
+        '''
+
+        # set the sort column and order
+        column = self.data_list[section]
+        self.sort_reverse = column == self.sort_column and not self.sort_reverse
+        self.sort_column = column
+
+        # sort the rows shown
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        model = self.tableview.model()
+        model.set_key_list(self.item_dict.sort_key_list(model.key_list, self.sort_column, self.sort_reverse))
+        self.tableview.horizontalHeader().setSortIndicator(section, Qt.DescendingOrder if self.sort_reverse else Qt.AscendingOrder)
+        QApplication.restoreOverrideCursor()
+
+    #---------------
+
+    def pushbutton_filter_clicked(self):
+        '''
+        Show the rows whose value of the column selected is in the range of the limits.
+        '''
+
+        # get the column
+        column = self.filter_column_list[self.combobox_filter_column.currentIndex()]
+
+        # check the limits
+        limit_list = []
+        for (lineedit, limit_name) in [(self.lineedit_filter_minimum, 'minimum'), (self.lineedit_filter_maximum, 'maximum')]:
+            literal = lineedit.text().strip()
+            if literal == '':
+                limit_list.append(None)
+            elif genlib.check_float(literal):
+                limit_list.append(float(literal))
+            else:
+                text = f'The {limit_name} has to be a float number.'
+                QMessageBox.critical(self, self.title, text, buttons=QMessageBox.Ok)
+                return
+
+        # get the rows in the range keeping the current order
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        key_list = self.item_dict.filter_key_list(column, limit_list[0], limit_list[1])
+        if self.is_sortable and self.sort_column is not None:
+            key_list = self.item_dict.sort_key_list(key_list, self.sort_column, self.sort_reverse)
+        self.tableview.model().set_key_list(key_list)
+        self.show_row_count()
+        QApplication.restoreOverrideCursor()
+
+    #---------------
+
+    def show_row_count(self):
+        '''
+        Show the number of rows shown and the total number of rows.
+        '''
+
+        self.label_row_count.setText(f'{self.tableview.model().rowCount()} of {len(self.item_dict)} rows')
+
+    #---------------
+
     def pushbutton_close_clicked(self):
         '''
         Close the window.
@@ -695,51 +1068,126 @@ class DialogDataTable(QDialog):
 
     #---------------
 
-    def load_tablewidget(self):
+    def load_tableview(self):
         '''
-        Load data in "tablewidget".
+        Load data in "tableview".
         '''
 
-        # clear the content of "tablewidget"
-        self.tablewidget.clearContents()
+        # set the model of "tableview" (the rows are got from the items dictionary when they are shown)
+        self.tableview.setModel(DataTableModel(self.data_list, self.data_dict, self.item_dict, self.key_list))
+        self.tableview.selectionModel().currentChanged.connect(self.tableview_currentChanged)
+
+        # set the column widths
+        for i, col in enumerate(self.data_list):
+            self.tableview.setColumnWidth(i, self.data_dict[col]['width'])
 
-        # set the rows number of "tablewidget"
-        self.tablewidget.setRowCount(len(self.item_dict))
+        # show the number of rows when they can be filtered
+        if self.is_filterable:
+            self.show_row_count()
 
         # check if there are data
         if not self.data_dict:
             text = 'There are no result logs.'
             QMessageBox.critical(self, self.title, text, buttons=QMessageBox.Ok)
 
-        # if there are data
-        else:
+#-------------------------------------------------------------------------------
 
-            # initialize the row counter
-            row = 0
+class DataTableModel(QAbstractTableModel):
+    '''
+    The class of the model of the table shown in "DialogDataTable". The items dictionary can be
+    a dictionary or any object that returns the data dictionary of an item by its key (for example,
+    a "genlib.FunctionalAnnotationFileIndex" with the row numbers as keys), so only the data of the
+    rows shown are got.
+    '''
+
+    #---------------
 
-            # for each key in the items dictionary
-            # -- for key in sorted(self.item_dict.keys()):
-            for key in self.item_dict.keys():
+    def __init__(self, data_list, data_dict, item_dict, key_list):
+        '''
+        Create a class instance.
+        '''
 
-                # load data of the key
-                for col, data in enumerate(self.data_list):
+        # call the init method of the parent class
+        super().__init__()
 
-                    # set the item of the row and column
-                    item = QTableWidgetItem(self.item_dict[key][data])
-                    if self.data_dict[data]['alignment'] == 'left':
-                        item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                    elif self.data_dict[data]['alignment'] == 'right':
-                        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    elif self.data_dict[data]['alignment'] == 'center':
-                        item.setTextAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
-                    else:
-                        item.setTextAlignment(Qt.AlignVCenter)
+        # save parameters in instance variables
+        self.data_list = data_list
+        self.data_dict = data_dict
+        self.item_dict = item_dict
+        self.key_list = key_list if isinstance(key_list, range) else list(key_list)
+
+        # set the alignment of each column
+        self.alignment_list = []
+        for data in self.data_list:
+            if self.data_dict[data]['alignment'] == 'left':
+                self.alignment_list.append(int(Qt.AlignLeft | Qt.AlignVCenter))
+            elif self.data_dict[data]['alignment'] == 'right':
+                self.alignment_list.append(int(Qt.AlignRight | Qt.AlignVCenter))
+            elif self.data_dict[data]['alignment'] == 'center':
+                self.alignment_list.append(int(Qt.AlignHCenter | Qt.AlignVCenter))
+            else:
+                self.alignment_list.append(int(Qt.AlignVCenter))
+
+    #---------------
+
+    def rowCount(self, parent=QModelIndex()):
+        '''
+        Get the number of rows.
+        '''
+
+        return 0 if parent.isValid() else len(self.key_list)
+
+    #---------------
+
+    def columnCount(self, parent=QModelIndex()):
+        '''
+        Get the number of columns.
+        '''
 
-                    # insert the item in the row and column
-                    self.tablewidget.setItem(row, col, item)
+        return 0 if parent.isValid() else len(self.data_list)
 
-                # add 1 to the row counter
-                row += 1
+    #---------------
+
+    def data(self, index, role=Qt.DisplayRole):
+        '''
+        Get the data of a cell.
+        '''
+
+        # get the text of the cell
+        if role == Qt.DisplayRole and index.isValid():
+            return self.item_dict[self.key_list[index.row()]][self.data_list[index.column()]]
+
+        # get the alignment of the cell
+        if role == Qt.TextAlignmentRole and index.isValid():
+            return self.alignment_list[index.column()]
+
+        return None
+
+    #---------------
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        '''
+        Get the data of a header.
+        '''
+
+        # get the column name
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.data_dict[self.data_list[section]]['text']
+
+        return super().headerData(section, orientation, role)
+
+    #---------------
+
+    def set_key_list(self, key_list):
+        '''
+        Change the keys of the rows shown (for example, after sorting or filtering them).
+        '''
+
+        self.beginResetModel()
+        self.key_list = key_list if isinstance(key_list, range) else list(key_list)
+        self.endResetModel()
+
+    #---------------
 
 #-------------------------------------------------------------------------------
 
@@ -26,10 +26,7 @@ Licence: GNU General Public Licence Version 3.
 
 #-------------------------------------------------------------------------------
 
-import gzip
 import os
-import re
-import subprocess
 import sys
 
 from PyQt5.QtCore import Qt                      # pylint: disable=no-name-in-module
@@ -39,6 +36,7 @@ from PyQt5.QtGui import QGuiApplication          # pylint: disable=no-name-in-mo
 from PyQt5.QtWidgets import QAbstractItemView    # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QApplication         # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QComboBox            # pylint: disable=no-name-in-module
+from PyQt5.QtWidgets import QFileDialog          # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QGridLayout          # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QGroupBox            # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QHeaderView          # pylint: disable=no-name-in-module
@@ -52,7 +50,10 @@ from PyQt5.QtWidgets import QVBoxLayout          # pylint: disable=no-name-in-mo
 from PyQt5.QtWidgets import QWidget              # pylint: disable=no-name-in-module
 
 import dialogs
+import enrichmentlib
 import genlib
+import incidencelib
+import registrylib
 import sqllib
 
 #-------------------------------------------------------------------------------
@@ -84,7 +85,7 @@ class FormRunEnrichmentAnalysis(QWidget):
         self.title = f'{genlib.get_app_short_name()} - {self.head}'
 
         # get the dictionary of application configuration
-        self.app_config_dict = genlib.get_config_dict(genlib.get_app_config_file())
+        self.app_config_dict = genlib.AppState.get_app_config_dict()
 
         # connect to the SQLite database
         app_db_path = self.app_config_dict[f'{genlib.get_app_short_name()} database']['app_db_path']
@@ -616,76 +617,12 @@ class FormRunEnrichmentAnalysis(QWidget):
         # initialize "lineedit_fasta_file"
         self.lineedit_fasta_file.setText('')
 
-        # set the type, name and code of the annotation pipeline datasets
+        # set the type and name of the annotation pipeline datasets
         process_type = genlib.get_result_run_subdir()
         process_name = genlib.get_process_run_annotation_pipeline_name()
-        process_code = genlib.get_process_id(process_name)
 
-        # get the process dictionary
-        process_dict = genlib.get_process_dict()
-
-        # get the log directory
-        log_dir = f'{result_dir}/{process_type}'
-        if sys.platform.startswith('win32'):
-            log_dir = genlib.wsl_path_2_windows_path(log_dir)
-
-        # set the command to get the result datasets of annotation pipeline in the log directory
-        command = ''
-        if sys.platform.startswith('linux') or sys.platform.startswith('darwin'):
-            if process_name == 'all':
-                command = f'ls -d {log_dir}/*  | xargs -n 1 basename'
-            else:
-                command = f'ls -d {log_dir}/{process_code}-*  | xargs -n 1 basename'
-        elif sys.platform.startswith('win32'):
-            log_dir = log_dir.replace('/', '\\')
-            if process_name == 'all':
-                command = f'dir /a:d /b {log_dir}\\*'
-            else:
-                command = f'dir /a:d /b {log_dir}\\{process_code}-*'
-
-        # run the command to get the result datasets of enrichment analysis in the log directory
-        output = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=False)
-
-        # initialize the result dataset dictionary
-        result_dataset_dict = {}
-
-        # build the result dataset dictionary
-        for line in output.stdout.split('\n'):
-            if line != '':
-
-                # get data
-                result_dataset_id = line.strip()
-                try:
-                    pattern = r'^(.+)\-(.+)\-(.+)$'
-                    mo = re.search(pattern, result_dataset_id)
-                    process_code = mo.group(1).strip()
-                    process_name = process_dict[process_code]['name']
-                    yymmdd = mo.group(2)
-                    hhmmss = mo.group(3)
-                    date = f'20{yymmdd[:2]}-{yymmdd[2:4]}-{yymmdd[4:]}'
-                    time = f'{hhmmss[:2]}:{hhmmss[2:4]}:{hhmmss[4:]}'
-                except:    # pylint: disable=bare-except
-                    process_name = 'unknown process'
-                    date = '0000-00-00'
-                    time = '00:00:00'
-
-                # determine the status
-                status_ok = os.path.isfile(genlib.get_status_ok(os.path.join(log_dir, result_dataset_id)))
-                status_wrong = os.path.isfile(genlib.get_status_wrong(os.path.join(log_dir, result_dataset_id)))
-                status = ''
-                if status_ok and not status_wrong:
-                    status = 'OK'
-                elif not status_ok and status_wrong:
-                    status = 'wrong'
-                elif not status_ok and not status_wrong:
-                    status = 'not finished'
-                elif status_ok and status_wrong:
-                    status = 'undetermined'
-
-                # insert data in the dictionary when the the status is OK
-                if status == 'OK':
-                    key = f'{process_name}-{result_dataset_id}'
-                    result_dataset_dict[key] = {'process': process_name, 'result_dataset_id': result_dataset_id, 'date': date, 'time': time, 'status': status}
+        # get the result datasets ended OK from the run registry
+        result_dataset_dict = registrylib.get_result_dataset_dict(result_dir, process_type, process_name, status_list=['OK'])
 
         # initialize "tablewidget"
         self.tablewidget.clearContents()
@@ -758,6 +695,7 @@ class FormRunEnrichmentAnalysis(QWidget):
             rc = genlib.run_command(command, process, is_script=False)
             if rc == 0:
                 process.write(f'The directory path is {current_run_dir}.\n')
+                registrylib.register_run(result_dir, genlib.get_result_run_subdir(), os.path.basename(current_run_dir))
             else:
                 process.write(f'*** ERROR: RC {rc} in command -> {command}\n')
                 OK = False
@@ -801,7 +739,8 @@ class FormRunEnrichmentAnalysis(QWidget):
             process.write(f'{genlib.get_separator()}\n')
             starter_name = f'{genlib.get_process_run_enrichment_analysis_code()}-process-starter.sh'
             process.write(f'Building the starter script {starter_name} ...\n')
-            (OK, _) = genlib.build_starter(temp_dir, starter_name, script_name, current_run_dir)
+            job_dict = {'app_dir': self.app_config_dict['Environment parameters']['app_dir'], 'result_dir': result_dir, 'threads': 1, 'memory': genlib.Const.ENRICHMENT_JOB_MEMORY}
+            (OK, _) = genlib.build_starter(temp_dir, starter_name, script_name, current_run_dir, job_dict)
             if OK:
                 process.write('The file is built.\n')
             if not OK:
@@ -986,6 +925,7 @@ class FormRunEnrichmentAnalysis(QWidget):
                 file_id.write(f'                --mpea={besthit_mpea_file} \\\n')
                 file_id.write(f'                --koea={besthit_koea_file} \\\n')
                 file_id.write(f'                --kpea={besthit_kpea_file} \\\n')
+                file_id.write( '                --parquet=Y \\\n')
                 file_id.write( '                --verbose=N \\\n')
                 file_id.write( '                --trace=N\n')
                 file_id.write( '        RC=$?\n')
@@ -1018,6 +958,7 @@ class FormRunEnrichmentAnalysis(QWidget):
                 file_id.write(f'                --mpea={complete_mpea_file} \\\n')
                 file_id.write(f'                --koea={complete_koea_file} \\\n')
                 file_id.write(f'                --kpea={complete_kpea_file} \\\n')
+                file_id.write( '                --parquet=Y \\\n')
                 file_id.write( '                --verbose=N \\\n')
                 file_id.write( '                --trace=N\n')
                 file_id.write( '        RC=$?\n')
@@ -1107,7 +1048,7 @@ class FormRestartEnrichmentAnalysis(QWidget):
         self.title = f'{genlib.get_app_short_name()} - {self.head}'
 
         # get the dictionary of application configuration
-        self.app_config_dict = genlib.get_config_dict(genlib.get_app_config_file())
+        self.app_config_dict = genlib.AppState.get_app_config_dict()
 
         # get the the code list and text list of FDR method
         self.fdr_method_code_list = genlib.get_fdr_method_code_list()
@@ -1592,76 +1533,12 @@ class FormRestartEnrichmentAnalysis(QWidget):
         # get the result directory
         result_dir = self.app_config_dict['Environment parameters']['result_dir']
 
-        # set the type, name and code of the enrichment analysis datasets
+        # set the type and name of the enrichment analysis datasets
         process_type = genlib.get_result_run_subdir()
         process_name = genlib.get_process_run_enrichment_analysis_name()
-        process_code = genlib.get_process_id(process_name)
-
-        # get the process dictionary
-        process_dict = genlib.get_process_dict()
-
-        # get the log directory
-        log_dir = f'{result_dir}/{process_type}'
-        if sys.platform.startswith('win32'):
-            log_dir = genlib.wsl_path_2_windows_path(log_dir)
 
-        # set the command to get the result datasets of enrichment analysis in the log directory
-        command = ''
-        if sys.platform.startswith('linux') or sys.platform.startswith('darwin'):
-            if process_name == 'all':
-                command = f'ls -d {log_dir}/*  | xargs -n 1 basename'
-            else:
-                command = f'ls -d {log_dir}/{process_code}-*  | xargs -n 1 basename'
-        elif sys.platform.startswith('win32'):
-            log_dir = log_dir.replace('/', '\\')
-            if process_name == 'all':
-                command = f'dir /a:d /b {log_dir}\\*'
-            else:
-                command = f'dir /a:d /b {log_dir}\\{process_code}-*'
-
-        # run the command to get the result datasets of enrichment analysis in the log directory
-        output = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=False)
-
-        # initialize the result dataset dictionary
-        result_dataset_dict = {}
-
-        # build the result dataset dictionary
-        for line in output.stdout.split('\n'):
-            if line != '':
-
-                # get data
-                result_dataset_id = line.strip()
-                try:
-                    pattern = r'^(.+)\-(.+)\-(.+)$'
-                    mo = re.search(pattern, result_dataset_id)
-                    process_code = mo.group(1).strip()
-                    process_name = process_dict[process_code]['name']
-                    yymmdd = mo.group(2)
-                    hhmmss = mo.group(3)
-                    date = f'20{yymmdd[:2]}-{yymmdd[2:4]}-{yymmdd[4:]}'
-                    time = f'{hhmmss[:2]}:{hhmmss[2:4]}:{hhmmss[4:]}'
-                except:    # pylint: disable=bare-except
-                    process_name = 'unknown process'
-                    date = '0000-00-00'
-                    time = '00:00:00'
-
-                # determine the status
-                status_ok = os.path.isfile(genlib.get_status_ok(os.path.join(log_dir, result_dataset_id)))
-                status_wrong = os.path.isfile(genlib.get_status_wrong(os.path.join(log_dir, result_dataset_id)))
-                status = ''
-                if status_ok and not status_wrong:
-                    status = 'OK'
-                elif not status_ok and status_wrong:
-                    status = 'wrong'
-                elif not status_ok and not status_wrong:
-                    status = 'not finished'
-                elif status_ok and status_wrong:
-                    status = 'undetermined'
-
-                # insert data in the dictionary when the the status is wrong
-                if status == 'wrong':
-                    key = f'{process_name}-{result_dataset_id}'
-                    result_dataset_dict[key] = {'process': process_name, 'result_dataset_id': result_dataset_id, 'date': date, 'time': time, 'status': status}
+        # get the result datasets ended wrong from the run registry
+        result_dataset_dict = registrylib.get_result_dataset_dict(result_dir, process_type, process_name, status_list=['wrong'])
 
         # initialize "tablewidget"
         self.tablewidget.clearContents()
@@ -1723,6 +1600,10 @@ class FormRestartEnrichmentAnalysis(QWidget):
         if OK:
             starter_name = f'{genlib.get_process_run_enrichment_analysis_code()}-process-starter.sh'
 
+        # remove the status files of the previous run, because the script removes them when it starts after waiting in the job queue
+        if OK:
+            registrylib.remove_run_status_files(current_run_dir)
+
         # submit the starter
         if OK:
             process.write(f'{genlib.get_separator()}\n')
@@ -1731,6 +1612,7 @@ class FormRestartEnrichmentAnalysis(QWidget):
             rc = genlib.run_command(command, process, is_script=True)
             if rc == 0:
                 process.write('The script is submitted.\n')
+                registrylib.register_run(result_dir, genlib.get_result_run_subdir(), result_dataset_id)
             else:
                 process.write(f'*** ERROR: RC {rc} in command -> {command}\n')
                 OK = False
@@ -1746,21 +1628,20 @@ class FormRestartEnrichmentAnalysis(QWidget):
 
 #-------------------------------------------------------------------------------
 
-class FormBrowseEnrichmentAnalysis(QWidget):
+class FormRunSubsetEnrichmentAnalysis(QWidget):
     '''
-    Class used to browse results of an enrichment analysis.
+    Class used to run an enrichment analysis of a sequence subset against the sequences of an annotation pipeline.
     '''
 
     #---------------
 
-    def __init__(self, parent, code):
+    def __init__(self, parent):
         '''
         Create a class instance.
         '''
 
         # save parameters in instance variables
         self.parent = parent
-        self.code = code
 
         # call the init method of the parent class
         super().__init__()
@@ -1770,23 +1651,26 @@ class FormBrowseEnrichmentAnalysis(QWidget):
         self.window_width = self.parent.WINDOW_WIDTH - 50
 
         # set the head and title
-        if self.code == genlib.get_goea_code():
-            self.head = f'Browse results of a {genlib.get_goea_name()}'
-        elif self.code == genlib.get_mpea_code():
-            self.head = f'Browse results of a {genlib.get_mpea_name()}'
-        elif self.code == genlib.get_koea_code():
-            self.head = f'Browse results of a {genlib.get_koea_name()}'
-        elif self.code == genlib.get_kpea_code():
-            self.head = f'Browse results of a {genlib.get_kpea_name()}'
+        self.head = 'Run an enrichment analysis of a sequence subset'
         self.title = f'{genlib.get_app_short_name()} - {self.head}'
 
         # get the dictionary of application configuration
-        self.app_config_dict = genlib.get_config_dict(genlib.get_app_config_file())
+        self.app_config_dict = genlib.AppState.get_app_config_dict()
+
+        # connect to the SQLite database
+        app_db_path = self.app_config_dict[f'{genlib.get_app_short_name()} database']['app_db_path']
+        if sys.platform.startswith('win32'):
+            app_db_path = genlib.wsl_path_2_windows_path(app_db_path)
+        self.conn = sqllib.connect_database(app_db_path)
 
         # get the the code list and text list of annotation result types
         self.annotation_result_type_code_list = genlib.get_annotation_result_type_code_list()
         self.annotation_result_type_text_list = genlib.get_annotation_result_type_text_list()
 
+        # get the the code list and text list of enrichment analysis types
+        self.enrichment_type_code_list = [genlib.get_goea_code(), genlib.get_mpea_code(), genlib.get_koea_code(), genlib.get_kpea_code()]
+        self.enrichment_type_text_list = [genlib.get_goea_name(), genlib.get_mpea_name(), genlib.get_koea_name(), genlib.get_kpea_name()]
+
         # get the the code list and text list of FDR method
         self.fdr_method_code_list = genlib.get_fdr_method_code_list()
         self.fdr_method_text_list = genlib.get_fdr_method_text_list()
@@ -1855,57 +1739,50 @@ class FormBrowseEnrichmentAnalysis(QWidget):
         self.tablewidget.cellClicked.connect(self.tablewidget_cellClicked)
         self.tablewidget.cellDoubleClicked.connect(self.tablewidget_cellDoubleClicked)
 
-        # create and configure "label_fasta_file"
-        label_fasta_file = QLabel()
-        label_fasta_file.setText('FASTA file')
-        label_fasta_file.setFixedWidth(fontmetrics.width('9'*10))
+        # create and configure "label_seq_id_file"
+        label_seq_id_file = QLabel()
+        label_seq_id_file.setText('Subset file')
+        label_seq_id_file.setFixedWidth(fontmetrics.width('9'*10))
 
-        # create and configure "lineedit_fasta_file"
-        self.lineedit_fasta_file = QLineEdit()
-        self.lineedit_fasta_file.editingFinished.connect(self.check_inputs)
-        self.lineedit_fasta_file.setDisabled(True)
+        # create and configure "lineedit_seq_id_file"
+        self.lineedit_seq_id_file = QLineEdit()
+        self.lineedit_seq_id_file.editingFinished.connect(self.check_inputs)
 
-        # create and configure "label_species_name"
-        label_species_name = QLabel()
-        label_species_name.setText('Species')
-        label_species_name.setFixedWidth(fontmetrics.width('9'*10))
+        # create and configure "pushbutton_search_seq_id_file"
+        pushbutton_search_seq_id_file = QPushButton('Search ...')
+        pushbutton_search_seq_id_file.setToolTip('Search and select the file with the sequence identifications of the subset.')
+        pushbutton_search_seq_id_file.setCursor(QCursor(Qt.PointingHandCursor))
+        pushbutton_search_seq_id_file.clicked.connect(self.pushbutton_search_seq_id_file_clicked)
 
-        # create and configure "lineedit_species_name"
-        self.lineedit_species_name = QLineEdit()
-        self.lineedit_species_name.editingFinished.connect(self.check_inputs)
-        self.lineedit_species_name.setFixedWidth(fontmetrics.width('9'*20))
-        self.lineedit_species_name.setDisabled(True)
+        # create and configure "label_enrichment_type"
+        label_enrichment_type = QLabel()
+        label_enrichment_type.setText('Analysis')
+        label_enrichment_type.setFixedWidth(fontmetrics.width('9'*10))
 
-        # create and configure "fdr_method"
+        # create and configure "combobox_enrichment_type"
+        self.combobox_enrichment_type = QComboBox()
+        self.combobox_enrichment_type.currentIndexChanged.connect(self.combobox_enrichment_type_currentIndexChanged)
+        self.combobox_enrichment_type.setFixedWidth(fontmetrics.width('9'*30))
+
+        # create and configure "label_fdr_method"
         label_fdr_method = QLabel()
         label_fdr_method.setText('FDR method')
         label_fdr_method.setFixedWidth(fontmetrics.width('9'*10))
 
-        # create and configure "lineedit_fdr_method"
-        self.lineedit_fdr_method = QLineEdit()
-        self.lineedit_fdr_method.editingFinished.connect(self.check_inputs)
-        self.lineedit_fdr_method.setFixedWidth(fontmetrics.width('9'*20))
-        self.lineedit_fdr_method.setDisabled(True)
-
-        # create and configure "label_min_seqnum_annotations"
-        label_min_seqnum_annotations = QLabel()
-        label_min_seqnum_annotations.setText('Min seq# in annotations')
-        label_min_seqnum_annotations.setFixedWidth(fontmetrics.width('9'*20))
-
-        # create and configure "lineedit_min_seqnum_annotations"
-        self.lineedit_min_seqnum_annotations = QLineEdit()
-        self.lineedit_min_seqnum_annotations.setFixedWidth(fontmetrics.width('9'*8))
-        self.lineedit_min_seqnum_annotations.setDisabled(True)
+        # create and configure "combobox_fdr_method"
+        self.combobox_fdr_method = QComboBox()
+        self.combobox_fdr_method.currentIndexChanged.connect(self.combobox_fdr_method_currentIndexChanged)
+        self.combobox_fdr_method.setFixedWidth(fontmetrics.width('9'*20))
 
-        # create and configure "label_min_seqnum_species"
-        label_min_seqnum_species = QLabel()
-        label_min_seqnum_species.setText('Min seq# in species')
-        label_min_seqnum_species.setFixedWidth(fontmetrics.width('9'*17))
+        # create and configure "label_min_seqnum_subset"
+        label_min_seqnum_subset = QLabel()
+        label_min_seqnum_subset.setText('Min seq# in subset')
+        label_min_seqnum_subset.setFixedWidth(fontmetrics.width('9'*17))
 
-        # create and configure "lineedit_min_seqnum_species"
-        self.lineedit_min_seqnum_species  = QLineEdit()
-        self.lineedit_min_seqnum_species.setFixedWidth(fontmetrics.width('9'*8))
-        self.lineedit_min_seqnum_species.setDisabled(True)
+        # create and configure "lineedit_min_seqnum_subset"
+        self.lineedit_min_seqnum_subset = QLineEdit()
+        self.lineedit_min_seqnum_subset.setFixedWidth(fontmetrics.width('9'*8))
+        self.lineedit_min_seqnum_subset.editingFinished.connect(self.check_inputs)
 
         # create and configure "label_empty"
         label_empty = QLabel()
@@ -1915,19 +1792,17 @@ class FormBrowseEnrichmentAnalysis(QWidget):
         gridlayout_data = QGridLayout()
         gridlayout_data.addWidget(label_annotation_result_type, 0, 0, 1, 1)
         gridlayout_data.addWidget(self.combobox_annotation_result_type, 0, 1, 1, 1, alignment=Qt.AlignLeft)
-        gridlayout_data.addWidget(self.tablewidget, 1, 0, 1, 16)
-        gridlayout_data.addWidget(label_fasta_file, 2, 0, 1, 1)
-        gridlayout_data.addWidget(self.lineedit_fasta_file, 2, 1, 1, 15)
-        gridlayout_data.addWidget(label_species_name, 3, 0, 1, 1)
-        gridlayout_data.addWidget(self.lineedit_species_name, 3, 1, 1, 1, alignment=Qt.AlignLeft)
+        gridlayout_data.addWidget(self.tablewidget, 1, 0, 1, 6)
+        gridlayout_data.addWidget(label_seq_id_file, 2, 0, 1, 1)
+        gridlayout_data.addWidget(self.lineedit_seq_id_file, 2, 1, 1, 4)
+        gridlayout_data.addWidget(pushbutton_search_seq_id_file, 2, 5, 1, 1)
+        gridlayout_data.addWidget(label_enrichment_type, 3, 0, 1, 1)
+        gridlayout_data.addWidget(self.combobox_enrichment_type, 3, 1, 1, 1, alignment=Qt.AlignLeft)
         gridlayout_data.addWidget(label_empty, 3, 2, 1, 1)
         gridlayout_data.addWidget(label_fdr_method, 3, 3, 1, 1)
-        gridlayout_data.addWidget(self.lineedit_fdr_method, 3, 4, 1, 1, alignment=Qt.AlignLeft)
-        gridlayout_data.addWidget(label_min_seqnum_annotations, 4, 0, 1, 1)
-        gridlayout_data.addWidget(self.lineedit_min_seqnum_annotations, 4, 1, 1, 1, alignment=Qt.AlignLeft)
-        gridlayout_data.addWidget(label_empty, 4, 2, 1, 1)
-        gridlayout_data.addWidget(label_min_seqnum_species, 4, 3, 1, 1)
-        gridlayout_data.addWidget(self.lineedit_min_seqnum_species, 4, 4, 1, 1, alignment=Qt.AlignLeft)
+        gridlayout_data.addWidget(self.combobox_fdr_method, 3, 4, 1, 1, alignment=Qt.AlignLeft)
+        gridlayout_data.addWidget(label_min_seqnum_subset, 4, 0, 1, 1)
+        gridlayout_data.addWidget(self.lineedit_min_seqnum_subset, 4, 1, 1, 1, alignment=Qt.AlignLeft)
 
         # create and configure "groupbox_data"
         groupbox_data = QGroupBox()
@@ -1943,7 +1818,7 @@ class FormBrowseEnrichmentAnalysis(QWidget):
 
         # create and configure "pushbutton_execute"
         self.pushbutton_execute = QPushButton('Execute')
-        self.pushbutton_execute.setToolTip('Browse the log file corresponding to the process selected.')
+        self.pushbutton_execute.setToolTip('Calculate the enrichment analysis of the subset and browse its result.')
         self.pushbutton_execute.setCursor(QCursor(Qt.PointingHandCursor))
         self.pushbutton_execute.clicked.connect(self.pushbutton_execute_clicked)
 
@@ -1994,26 +1869,23 @@ class FormBrowseEnrichmentAnalysis(QWidget):
         Load initial data in inputs.
         '''
 
-        # populate data in "combobox_annotation_results"
+        # populate data in "combobox_annotation_result_type"
         self.combobox_annotation_result_type_populate()
 
         # load data in "tablewidget"
         self.load_tablewidget()
 
-        # set initial value in "lineedit_fasta_file"
-        self.lineedit_fasta_file.setText('')
-
-        # initialize "lineedit_species_name"
-        self.lineedit_species_name.setText('')
+        # initialize "lineedit_seq_id_file"
+        self.lineedit_seq_id_file.setText('')
 
-        # initialize "lineedit_fdr_method"
-        self.lineedit_fdr_method.setText('')
+        # populate data in "combobox_enrichment_type"
+        self.combobox_enrichment_type_populate()
 
-        # initialize "lineedit_min_seqnum_annotations"
-        self.lineedit_min_seqnum_annotations.setText('')
+        # populate data in "combobox_fdr_method"
+        self.combobox_fdr_method_populate()
 
-        # initialize "lineedit_min_seqnum_species"
-        self.lineedit_min_seqnum_species.setText('')
+        # set initial value in "lineedit_min_seqnum_subset"
+        self.lineedit_min_seqnum_subset.setText(str(genlib.Const.DEFAULT_MIN_SEQNUM_SUBSET))
 
     #---------------
 
@@ -2031,24 +1903,12 @@ class FormBrowseEnrichmentAnalysis(QWidget):
             row_list.append(idx.row())
         row_list = list(set(row_list))
 
-        # check "lineedit_fasta_file" when the editing finished
-        if not self.lineedit_fasta_file_editing_finished():
-            OK = False
-
-        # check "lineedit_species_name" when the editing finished
-        if not self.lineedit_species_name_editing_finished():
-            OK = False
-
-        # check "lineedit_fdr_method" when the editing finished
-        if not self.lineedit_fdr_method_editing_finished():
-            OK = False
-
-        # check "lineedit_min_seqnum_annotations" when the editing finished
-        if not self.lineedit_min_seqnum_annotations_editing_finished():
+        # check "lineedit_seq_id_file" when the editing finished
+        if not self.lineedit_seq_id_file_editing_finished():
             OK = False
 
-        # check "lineedit_min_seqnum_species" when the editing finished
-        if not self.lineedit_min_seqnum_species_editing_finished():
+        # check "lineedit_min_seqnum_subset" when the editing finished
+        if not self.lineedit_min_seqnum_subset_editing_finished():
             OK = False
 
         # check all inputs are OK
@@ -2058,7 +1918,7 @@ class FormBrowseEnrichmentAnalysis(QWidget):
             self.parent.statusBar().showMessage('There are one or more inputs without data or with wrong value.')
 
         # enable "pushbutton_execute"
-        if OK and self.combobox_annotation_result_type.currentText() != '' and len(row_list) == 1 and self.lineedit_fasta_file.text() != '' and self.lineedit_species_name.text() != '' and self.lineedit_fdr_method.text() != '' and self.lineedit_min_seqnum_annotations.text() != '' and self.lineedit_min_seqnum_species.text() != '':
+        if OK and self.combobox_annotation_result_type.currentText() != '' and len(row_list) == 1 and self.lineedit_seq_id_file.text() != '' and self.combobox_enrichment_type.currentText() != '' and self.combobox_fdr_method.currentText() != '' and self.lineedit_min_seqnum_subset.text() != '':
             self.pushbutton_execute.setEnabled(True)
         else:
             self.pushbutton_execute.setEnabled(False)
@@ -2075,10 +1935,11 @@ class FormBrowseEnrichmentAnalysis(QWidget):
         '''
 
         # load the annotation result type list in "combobox_annotation_result_type"
+        self.combobox_annotation_result_type.clear()
         self.combobox_annotation_result_type.addItems(self.annotation_result_type_text_list)
 
         # select the annotation result type
-        self.combobox_annotation_result_type.setCurrentIndex(1)
+        self.combobox_annotation_result_type.setCurrentIndex(0)
 
         # simulate the annotation result type has changed
         self.combobox_annotation_result_type_currentIndexChanged()
@@ -2095,53 +1956,11 @@ class FormBrowseEnrichmentAnalysis(QWidget):
 
     #---------------
 
-    def tablewidget_currentCellChanged(self, row, _):
+    def tablewidget_currentCellChanged(self, _, __):
         '''
         Perform necessary actions after changing the current "tablewidget" cell.
         '''
 
-        # check if there is a row selected
-        if row >= 0:
-
-            # get the result directory
-            result_dir = self.app_config_dict['Environment parameters']['result_dir']
-
-            # get the result dataset corresponding to the row clicked
-            result_dataset_id = self.tablewidget.item(row, 1).text()
-
-            # get the parameters file corresponding to the result dataset
-            params_file = f'{result_dir}{os.sep}{genlib.get_result_run_subdir()}{os.sep}{result_dataset_id}{os.sep}{genlib.get_params_file_name()}'
-            if sys.platform.startswith('win32'):
-                params_file = genlib.wsl_path_2_windows_path(params_file)
-
-            # get the dictionary of parameters
-            params_dict = genlib.get_config_dict(params_file)
-
-            # set the FASTA file path in "lineedit_fasta_file"
-            fasta_file = params_dict['Annotation parameters']['fasta_file']
-            if sys.platform.startswith('win32'):
-                fasta_file = genlib.wsl_path_2_windows_path(fasta_file)
-            self.lineedit_fasta_file.setText(fasta_file)
-
-            # set the species in "lineedit_species_name"
-            species_name = params_dict['Enrichment parameters']['species_name']
-            if species_name == genlib.get_all_species_code():
-                species_name = genlib.get_all_species_name()
-            self.lineedit_species_name.setText(species_name)
-
-            # set the FDR method in "lineedit_fdr_method"
-            fdr_method_code = params_dict['Enrichment parameters']['fdr_method']
-            fdr_method_text = self.fdr_method_text_list[self.fdr_method_code_list.index(fdr_method_code)]
-            self.lineedit_fdr_method.setText(fdr_method_text)
-
-            # set the min seq# in annotations
-            min_seqnum_annotations = params_dict['Enrichment parameters']['min_seqnum_annotations']
-            self.lineedit_min_seqnum_annotations.setText(min_seqnum_annotations)
-
-            # set the min seq# in species
-            min_seqnum_species = params_dict['Enrichment parameters']['min_seqnum_species']
-            self.lineedit_min_seqnum_species.setText(min_seqnum_species)
-
         # check the content of inputs
         self.check_inputs()
 
@@ -2171,66 +1990,123 @@ class FormBrowseEnrichmentAnalysis(QWidget):
 
     #---------------
 
-    def lineedit_fasta_file_editing_finished(self):
+    def lineedit_seq_id_file_editing_finished(self):
         '''
-        Perform necessary actions after finishing editing "lineedit_fasta_file"
+        Perform necessary actions after finishing editing "lineedit_seq_id_file"
         '''
 
         # initialize the control variable
         OK = True
 
+        # chek if "lineedit_seq_id_file" is empty
+        if self.lineedit_seq_id_file.text() == '':
+            OK = False
+            self.lineedit_seq_id_file.setStyleSheet('background-color: white')
+
+        # chek if "lineedit_seq_id_file" is an existing file
+        elif not os.path.isfile(self.lineedit_seq_id_file.text()):
+            OK = False
+            self.lineedit_seq_id_file.setStyleSheet('background-color: red')
+
+        else:
+            self.lineedit_seq_id_file.setStyleSheet('background-color: white')
+
         # return the control variable
         return OK
 
     #---------------
 
-    def lineedit_species_name_editing_finished(self):
+    def pushbutton_search_seq_id_file_clicked(self):
         '''
-        Perform necessary actions after finishing editing "lineedit_species_name"
+        Search and select the file with the sequence identifications of the subset.
         '''
 
-        # initialize the control variable
-        OK = True
+        # search the sequence identification file
+        (seq_id_file, _) = QFileDialog.getOpenFileName(self, f'{self.head} - Selection of the subset file', os.path.expanduser('~'), "Text files (*.txt *.TXT *.csv *.CSV *.tsv *.TSV);;all (*.*)")
 
-        # return the control variable
-        return OK
+        # set "lineedit_seq_id_file" with the sequence identification file selected
+        if seq_id_file != '':
+            self.lineedit_seq_id_file.setText(seq_id_file)
+
+        # check the content of inputs
+        self.check_inputs()
 
     #---------------
 
-    def lineedit_fdr_method_editing_finished(self):
+    def combobox_enrichment_type_populate(self):
         '''
-        Perform necessary actions after finishing editing "lineedit_fdr_method"
+        Populate data in "combobox_enrichment_type".
         '''
 
-        # initialize the control variable
-        OK = True
+        # load the enrichment analysis type list in "combobox_enrichment_type"
+        self.combobox_enrichment_type.clear()
+        self.combobox_enrichment_type.addItems(self.enrichment_type_text_list)
 
-        # return the control variable
-        return OK
+        # simulate the enrichment analysis type has changed
+        self.combobox_enrichment_type_currentIndexChanged()
 
     #---------------
 
-    def lineedit_min_seqnum_annotations_editing_finished(self):
+    def combobox_enrichment_type_currentIndexChanged(self):
         '''
-        Perform necessary actions after finishing editing "lineedit_min_seqnum_annotations"
+        Process the event when an item of "combobox_enrichment_type" has been selected.
         '''
 
-        # initialize the control variable
-        OK = True
+        # check the content of inputs
+        self.check_inputs()
 
-        # return the control variable
-        return OK
+    #---------------
+
+    def combobox_fdr_method_populate(self):
+        '''
+        Populate data in "combobox_fdr_method".
+        '''
+
+        # load the method text list in "combobox_fdr_method"
+        self.combobox_fdr_method.clear()
+        self.combobox_fdr_method.addItems(self.fdr_method_text_list)
+
+        # select the method Benjamini-Yekutieli
+        self.combobox_fdr_method.setCurrentIndex(1)
+
+        # simulate the method has changed
+        self.combobox_fdr_method_currentIndexChanged()
 
     #---------------
 
-    def lineedit_min_seqnum_species_editing_finished(self):
+    def combobox_fdr_method_currentIndexChanged(self):
         '''
-        Perform necessary actions after finishing editing "lineedit_min_seqnum_species"
+        Process the event when an item of "combobox_fdr_method" has been selected.
+        '''
+
+        # check the content of inputs
+        self.check_inputs()
+
+    #---------------
+
+    def lineedit_min_seqnum_subset_editing_finished(self):
+        '''
+        Perform necessary actions after finishing editing "lineedit_min_seqnum_subset"
         '''
 
         # initialize the control variable
         OK = True
 
+        # chek if "lineedit_min_seqnum_subset" is empty
+        if self.lineedit_min_seqnum_subset.text() == '':
+            OK = False
+            self.lineedit_min_seqnum_subset.setStyleSheet('background-color: white')
+
+        # chek if "lineedit_min_seqnum_subset" is an integer number greater than 1
+        elif self.lineedit_min_seqnum_subset.text() != '' and not genlib.check_int(self.lineedit_min_seqnum_subset.text(), minimum=1):
+            OK = False
+            self.lineedit_min_seqnum_subset.setStyleSheet('background-color: red')
+            text = 'The value of min seq# in subset has to be an integer number greater than 1.'
+            QMessageBox.critical(self, self.title, text, buttons=QMessageBox.Ok)
+
+        else:
+            self.lineedit_min_seqnum_subset.setStyleSheet('background-color: white')
+
         # return the control variable
         return OK
 
@@ -2238,11 +2114,11 @@ class FormBrowseEnrichmentAnalysis(QWidget):
 
     def pushbutton_refresh_clicked(self):
         '''
-        Refresh "tablewidget" and initialize other inputs.
+        Refresh "tablewidget".
         '''
 
-        # check the content of inputs
-        self.initialize_inputs()
+        # reload data in "tablewidget"
+        self.load_tablewidget()
 
         # check the content of inputs
         self.check_inputs()
@@ -2270,13 +2146,6 @@ class FormBrowseEnrichmentAnalysis(QWidget):
             QMessageBox.critical(self, title, text, buttons=QMessageBox.Ok)
             OK = False
 
-        # confirm the process is executed
-        if OK:
-            text = 'The result of the enrichment analysis is going to be browsed.\n\nAre you sure to continue?'
-            botton = QMessageBox.question(self, self.title, text, buttons=QMessageBox.Yes|QMessageBox.No, defaultButton=QMessageBox.No)
-            if botton == QMessageBox.No:
-                OK = False
-
         # execute the process
         if OK:
 
@@ -2286,23 +2155,713 @@ class FormBrowseEnrichmentAnalysis(QWidget):
             # get the result directory
             result_dir = self.app_config_dict['Environment parameters']['result_dir']
 
-            # get the identification of the enrichment analysis dataset
+            # get the identification of the annotation pipeline dataset
             result_dataset_id = self.tablewidget.item(row_list[0], 1).text()
 
             # get the annotation result type
             annotation_result_type = self.annotation_result_type_code_list[self.annotation_result_type_text_list.index(self.combobox_annotation_result_type.currentText())]
 
-            # get the file path of the enrichment analysis
-            if self.code == genlib.get_goea_code():
-                if annotation_result_type == 'best':
-                    enrichment_analysis_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{genlib.get_besthit_goea_file_name()}'
-                elif annotation_result_type == 'complete':
-                    enrichment_analysis_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{genlib.get_complete_goea_file_name()}'
-            elif self.code == genlib.get_mpea_code():
-                if annotation_result_type == 'best':
-                    enrichment_analysis_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{genlib.get_besthit_mpea_file_name()}'
-                elif annotation_result_type == 'complete':
-                    enrichment_analysis_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{genlib.get_complete_mpea_file_name()}'
+            # get the file path of the functional annotation
+            if annotation_result_type == 'best':
+                functional_annotation_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{genlib.get_besthit_functional_annotation_file_name()}'
+            elif annotation_result_type == 'complete':
+                functional_annotation_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{genlib.get_complete_functional_annotation_file_name()}'
+            if sys.platform.startswith('win32'):
+                functional_annotation_file_path = genlib.wsl_path_2_windows_path(functional_annotation_file_path)
+
+            # get the enrichment analysis type
+            enrichment_type = self.enrichment_type_code_list[self.enrichment_type_text_list.index(self.combobox_enrichment_type.currentText())]
+
+            # get the FDR method
+            fdr_method = self.fdr_method_code_list[self.fdr_method_text_list.index(self.combobox_fdr_method.currentText())]
+
+            # get the min seq# in subset
+            min_seqnum_subset = int(self.lineedit_min_seqnum_subset.text())
+
+            # calculate the subset enrichment analysis data
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            (enrichment_analysis_dict, data_list, data_dict, window_height, window_width, explanatory_text) = self.get_subset_enrichment_analysis_data(self.conn, functional_annotation_file_path, self.lineedit_seq_id_file.text(), enrichment_type, fdr_method, min_seqnum_subset)
+            QGuiApplication.restoreOverrideCursor()
+
+            # show the subset enrichment analysis data
+            head = f'{self.combobox_enrichment_type.currentText()} of {os.path.basename(self.lineedit_seq_id_file.text())} in {result_dataset_id}'
+            data_table = dialogs.DialogDataTable(self, head, window_height, window_width, data_list, data_dict, enrichment_analysis_dict, enrichment_analysis_dict.keys(), explanatory_text, 'browse-enrichment-analysis')
+            data_table.exec()
+
+    #---------------
+
+    def pushbutton_close_clicked(self):
+        '''
+        Close the window.
+        '''
+
+        self.parent.current_subwindow = None
+        self.close()
+        self.parent.set_background_image()
+
+    #---------------
+
+    def load_tablewidget(self):
+        '''
+        Load data in "tablewidget".
+        '''
+
+        # get the result directory
+        result_dir = self.app_config_dict['Environment parameters']['result_dir']
+
+        # set the type and name of the annotation pipeline datasets
+        process_type = genlib.get_result_run_subdir()
+        process_name = genlib.get_process_run_annotation_pipeline_name()
+
+        # get the result datasets ended OK from the run registry
+        result_dataset_dict = registrylib.get_result_dataset_dict(result_dir, process_type, process_name, status_list=['OK'])
+
+        # initialize "tablewidget"
+        self.tablewidget.clearContents()
+
+        # set the rows number of "tablewidget"
+        self.tablewidget.setRowCount(len(result_dataset_dict))
+
+        # load data in "tablewidget" for the OK result datasets of annotation pipeline
+        if not result_dataset_dict:
+            text = 'There is no run ended OK.'
+            QMessageBox.warning(self, self.title, text, buttons=QMessageBox.Ok)
+        else:
+            row = 0
+            for key in sorted(result_dataset_dict.keys()):
+                self.tablewidget.setItem(row, 0, QTableWidgetItem(result_dataset_dict[key]['process']))
+                self.tablewidget.setItem(row, 1, QTableWidgetItem(result_dataset_dict[key]['result_dataset_id']))
+                self.tablewidget.setItem(row, 2, QTableWidgetItem(result_dataset_dict[key]['date']))
+                self.tablewidget.setItem(row, 3, QTableWidgetItem(result_dataset_dict[key]['time']))
+                self.tablewidget.setItem(row, 4, QTableWidgetItem(result_dataset_dict[key]['status']))
+                row += 1
+
+    #---------------
+
+    @staticmethod
+    def get_subset_enrichment_analysis_data(conn, functional_annotation_file_path, seq_id_file, enrichment_type, fdr_method, min_seqnum_subset):
+        '''
+        Get the enrichment analysis data of a sequence subset against the sequences of an annotation file.
+        '''
+
+        # get the incidence index of the annotation file (it is cached while the annotation file does not change)
+        incidence_index = incidencelib.get_incidence_index(functional_annotation_file_path)
+
+        # get the sequence identifications of the subset
+        seq_id_list = incidencelib.read_seq_id_file(seq_id_file)
+
+        # calculate the enrichment analysis
+        (result_list, subset_seqs_found, subset_seqs_wterms, universe_seqs_wterms) = incidence_index.calculate_subset_enrichment(enrichment_type, seq_id_list, fdr_method)
+
+        # get the Gene Ontology dictionary of the GO terms
+        go_ontology_dict = {}
+        if enrichment_type == genlib.get_goea_code() and result_list != []:
+            go_ontology_dict = sqllib.get_go_ontology_dict(conn, [result['term_id'] for result in result_list])
+
+        # build the enrichment analysis dictionary
+        enrichment_analysis_dict = {}
+        for result in result_list:
+            if result['subset_seqs_count'] >= min_seqnum_subset:
+                term_id = result['term_id']
+                enrichment_analysis_dict[term_id] = {'term_id': term_id, 'description': go_ontology_dict.get(term_id, {}).get('goterm_name', genlib.get_na()), 'namespace': go_ontology_dict.get(term_id, {}).get('namespace', genlib.get_na()), 'subset_seqs_count': str(result['subset_seqs_count']), 'subset_seqs_wterms': str(subset_seqs_wterms), 'universe_seqs_count': str(result['universe_seqs_count']), 'universe_seqs_wterms': str(universe_seqs_wterms), 'enrichment': str(result['enrichment']), 'pvalue': str(result['pvalue']), 'fdr': str(result['fdr'])}
+
+        # build the data list
+        if enrichment_type == genlib.get_goea_code():
+            data_list = ['term_id', 'description', 'namespace', 'subset_seqs_count', 'subset_seqs_wterms', 'universe_seqs_count', 'universe_seqs_wterms', 'enrichment', 'pvalue', 'fdr']
+        else:
+            data_list = ['term_id', 'subset_seqs_count', 'subset_seqs_wterms', 'universe_seqs_count', 'universe_seqs_wterms', 'enrichment', 'pvalue', 'fdr']
+
+        # build the data dictionary
+        data_dict = {}
+        if enrichment_type == genlib.get_goea_code():
+            data_dict['term_id'] = {'text': 'GOterm', 'width': 100, 'alignment': 'left'}
+            data_dict['description'] = {'text': 'Description', 'width': 200, 'alignment': 'left'}
+            data_dict['namespace'] = {'text': 'Namespace', 'width': 140, 'alignment': 'left'}
+        elif enrichment_type == genlib.get_mpea_code():
+            data_dict['term_id'] = {'text': 'Metacyc pathway', 'width': 300, 'alignment': 'left'}
+        elif enrichment_type == genlib.get_koea_code():
+            data_dict['term_id'] = {'text': 'KEGG KO', 'width': 300, 'alignment': 'left'}
+        elif enrichment_type == genlib.get_kpea_code():
+            data_dict['term_id'] = {'text': 'KEGG pathway', 'width': 300, 'alignment': 'left'}
+        data_dict['subset_seqs_count'] = {'text': '(1)', 'width': 50, 'alignment': 'right'}
+        data_dict['subset_seqs_wterms'] = {'text': '(2)', 'width': 60, 'alignment': 'right'}
+        data_dict['universe_seqs_count'] = {'text': '(3)', 'width': 50, 'alignment': 'right'}
+        data_dict['universe_seqs_wterms'] = {'text': '(4)', 'width': 60, 'alignment': 'right'}
+        data_dict['enrichment'] = {'text': 'Enrichment', 'width': 160, 'alignment': 'right'}
+        data_dict['pvalue'] = {'text': 'p-value', 'width': 190, 'alignment': 'right'}
+        data_dict['fdr'] = {'text': 'FDR', 'width': 190, 'alignment': 'right'}
+
+        # set the explanatory text
+        explanatory_text = f'{subset_seqs_found} of {len(seq_id_list)} subset sequences found in annotations - (1) Sequences# with this term in subset - (2) Sequences# with terms in subset - (3) Sequences# with this term in annotations - (4) Sequences# with terms in annotations'
+
+        # set the window height and width
+        window_height = 800
+        window_width = 1330
+
+        # return data
+        return enrichment_analysis_dict, data_list, data_dict, window_height, window_width, explanatory_text
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class FormBrowseEnrichmentAnalysis(QWidget):
+    '''
+    Class used to browse results of an enrichment analysis.
+    '''
+
+    #---------------
+
+    def __init__(self, parent, code):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.parent = parent
+        self.code = code
+
+        # call the init method of the parent class
+        super().__init__()
+
+        # set the dimensions window
+        self.window_height = self.parent.WINDOW_HEIGHT - 100
+        self.window_width = self.parent.WINDOW_WIDTH - 50
+
+        # set the head and title
+        if self.code == genlib.get_goea_code():
+            self.head = f'Browse results of a {genlib.get_goea_name()}'
+        elif self.code == genlib.get_mpea_code():
+            self.head = f'Browse results of a {genlib.get_mpea_name()}'
+        elif self.code == genlib.get_koea_code():
+            self.head = f'Browse results of a {genlib.get_koea_name()}'
+        elif self.code == genlib.get_kpea_code():
+            self.head = f'Browse results of a {genlib.get_kpea_name()}'
+        self.title = f'{genlib.get_app_short_name()} - {self.head}'
+
+        # get the dictionary of application configuration
+        self.app_config_dict = genlib.AppState.get_app_config_dict()
+
+        # get the the code list and text list of annotation result types
+        self.annotation_result_type_code_list = genlib.get_annotation_result_type_code_list()
+        self.annotation_result_type_text_list = genlib.get_annotation_result_type_text_list()
+
+        # get the the code list and text list of FDR method
+        self.fdr_method_code_list = genlib.get_fdr_method_code_list()
+        self.fdr_method_text_list = genlib.get_fdr_method_text_list()
+
+        # build the graphic user interface of the window
+        self.build_gui()
+
+        # load initial data in inputs
+        self.initialize_inputs()
+
+        # check the content of inputs
+        self.check_inputs()
+
+        # show the window
+        self.show()
+
+    #---------------
+
+    def build_gui(self):
+        '''
+        Build the graphic user interface of the window.
+        '''
+
+        # set the width and height of the window
+        self.setFixedSize(self.window_width, self.window_height)
+
+        # move the window at center
+        rectangle = self.frameGeometry()
+        central_point = QGuiApplication.primaryScreen().availableGeometry().center()
+        rectangle.moveCenter(central_point)
+        self.move(rectangle.topLeft())
+
+        # get font metrics information
+        fontmetrics = QFontMetrics(QApplication.font())
+
+        # create and configure "label_head"
+        label_head = QLabel(self.head, alignment=Qt.AlignCenter)
+        label_head.setStyleSheet('font: bold 14px; color: black; background-color: lightGray; max-height: 30px')
+
+        # create and configure "label_annotation_result_type"
+        label_annotation_result_type = QLabel()
+        label_annotation_result_type.setText('Result type')
+        label_annotation_result_type.setFixedWidth(fontmetrics.width('9'*10))
+
+        # create and configure "combobox_annotation_result_type"
+        self.combobox_annotation_result_type = QComboBox()
+        self.combobox_annotation_result_type.currentIndexChanged.connect(self.combobox_annotation_result_type_currentIndexChanged)
+        self.combobox_annotation_result_type.setFixedWidth(fontmetrics.width('9'*20))
+
+        # create and configure "tablewidget"
+        self.tablewidget = QTableWidget()
+        self.tablewidget.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tablewidget.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.column_name_list = ['Process', 'Result dataset', 'Date', 'Time', 'Status']
+        self.tablewidget.setColumnCount(len(self.column_name_list))
+        self.tablewidget.setHorizontalHeaderLabels(self.column_name_list)
+        self.tablewidget.setColumnWidth(0, 230)
+        self.tablewidget.setColumnWidth(1, 280)
+        self.tablewidget.setColumnWidth(2, 85)
+        self.tablewidget.setColumnWidth(3, 70)
+        self.tablewidget.setColumnWidth(4, 90)
+        self.tablewidget.verticalHeader().setVisible(True)
+        self.tablewidget.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.tablewidget.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.tablewidget.currentCellChanged.connect(self.tablewidget_currentCellChanged)
+        self.tablewidget.cellClicked.connect(self.tablewidget_cellClicked)
+        self.tablewidget.cellDoubleClicked.connect(self.tablewidget_cellDoubleClicked)
+
+        # create and configure "label_fasta_file"
+        label_fasta_file = QLabel()
+        label_fasta_file.setText('FASTA file')
+        label_fasta_file.setFixedWidth(fontmetrics.width('9'*10))
+
+        # create and configure "lineedit_fasta_file"
+        self.lineedit_fasta_file = QLineEdit()
+        self.lineedit_fasta_file.editingFinished.connect(self.check_inputs)
+        self.lineedit_fasta_file.setDisabled(True)
+
+        # create and configure "label_species_name"
+        label_species_name = QLabel()
+        label_species_name.setText('Species')
+        label_species_name.setFixedWidth(fontmetrics.width('9'*10))
+
+        # create and configure "lineedit_species_name"
+        self.lineedit_species_name = QLineEdit()
+        self.lineedit_species_name.editingFinished.connect(self.check_inputs)
+        self.lineedit_species_name.setFixedWidth(fontmetrics.width('9'*20))
+        self.lineedit_species_name.setDisabled(True)
+
+        # create and configure "fdr_method"
+        label_fdr_method = QLabel()
+        label_fdr_method.setText('FDR method')
+        label_fdr_method.setFixedWidth(fontmetrics.width('9'*10))
+
+        # create and configure "lineedit_fdr_method"
+        self.lineedit_fdr_method = QLineEdit()
+        self.lineedit_fdr_method.editingFinished.connect(self.check_inputs)
+        self.lineedit_fdr_method.setFixedWidth(fontmetrics.width('9'*20))
+        self.lineedit_fdr_method.setDisabled(True)
+
+        # create and configure "label_min_seqnum_annotations"
+        label_min_seqnum_annotations = QLabel()
+        label_min_seqnum_annotations.setText('Min seq# in annotations')
+        label_min_seqnum_annotations.setFixedWidth(fontmetrics.width('9'*20))
+
+        # create and configure "lineedit_min_seqnum_annotations"
+        self.lineedit_min_seqnum_annotations = QLineEdit()
+        self.lineedit_min_seqnum_annotations.setFixedWidth(fontmetrics.width('9'*8))
+        self.lineedit_min_seqnum_annotations.setDisabled(True)
+
+        # create and configure "label_min_seqnum_species"
+        label_min_seqnum_species = QLabel()
+        label_min_seqnum_species.setText('Min seq# in species')
+        label_min_seqnum_species.setFixedWidth(fontmetrics.width('9'*17))
+
+        # create and configure "lineedit_min_seqnum_species"
+        self.lineedit_min_seqnum_species  = QLineEdit()
+        self.lineedit_min_seqnum_species.setFixedWidth(fontmetrics.width('9'*8))
+        self.lineedit_min_seqnum_species.setDisabled(True)
+
+        # create and configure "label_empty"
+        label_empty = QLabel()
+        label_empty.setFixedWidth(fontmetrics.width('9'*3))
+
+        # create and configure "gridlayout_data"
+        gridlayout_data = QGridLayout()
+        gridlayout_data.addWidget(label_annotation_result_type, 0, 0, 1, 1)
+        gridlayout_data.addWidget(self.combobox_annotation_result_type, 0, 1, 1, 1, alignment=Qt.AlignLeft)
+        gridlayout_data.addWidget(self.tablewidget, 1, 0, 1, 16)
+        gridlayout_data.addWidget(label_fasta_file, 2, 0, 1, 1)
+        gridlayout_data.addWidget(self.lineedit_fasta_file, 2, 1, 1, 15)
+        gridlayout_data.addWidget(label_species_name, 3, 0, 1, 1)
+        gridlayout_data.addWidget(self.lineedit_species_name, 3, 1, 1, 1, alignment=Qt.AlignLeft)
+        gridlayout_data.addWidget(label_empty, 3, 2, 1, 1)
+        gridlayout_data.addWidget(label_fdr_method, 3, 3, 1, 1)
+        gridlayout_data.addWidget(self.lineedit_fdr_method, 3, 4, 1, 1, alignment=Qt.AlignLeft)
+        gridlayout_data.addWidget(label_min_seqnum_annotations, 4, 0, 1, 1)
+        gridlayout_data.addWidget(self.lineedit_min_seqnum_annotations, 4, 1, 1, 1, alignment=Qt.AlignLeft)
+        gridlayout_data.addWidget(label_empty, 4, 2, 1, 1)
+        gridlayout_data.addWidget(label_min_seqnum_species, 4, 3, 1, 1)
+        gridlayout_data.addWidget(self.lineedit_min_seqnum_species, 4, 4, 1, 1, alignment=Qt.AlignLeft)
+
+        # create and configure "groupbox_data"
+        groupbox_data = QGroupBox()
+        groupbox_data.setObjectName('groupbox_data')
+        groupbox_data.setStyleSheet('QGroupBox#groupbox_data {border: 0px;}')
+        groupbox_data.setLayout(gridlayout_data)
+
+        # create and configure "pushbutton_refresh"
+        self.pushbutton_refresh = QPushButton('Refresh')
+        self.pushbutton_refresh.setToolTip('Update the process list.')
+        self.pushbutton_refresh.setCursor(QCursor(Qt.PointingHandCursor))
+        self.pushbutton_refresh.clicked.connect(self.pushbutton_refresh_clicked)
+
+        # create and configure "pushbutton_execute"
+        self.pushbutton_execute = QPushButton('Execute')
+        self.pushbutton_execute.setToolTip('Browse the log file corresponding to the process selected.')
+        self.pushbutton_execute.setCursor(QCursor(Qt.PointingHandCursor))
+        self.pushbutton_execute.clicked.connect(self.pushbutton_execute_clicked)
+
+        # create and configure "pushbutton_close"
+        pushbutton_close = QPushButton('Close')
+        pushbutton_close.setToolTip('Close the window.')
+        pushbutton_close.setCursor(QCursor(Qt.PointingHandCursor))
+        pushbutton_close.clicked.connect(self.pushbutton_close_clicked)
+
+        # create and configure "gridlayout_buttons"
+        gridlayout_buttons = QGridLayout()
+        gridlayout_buttons.setColumnStretch(0, 15)
+        gridlayout_buttons.setColumnStretch(1, 1)
+        gridlayout_buttons.setColumnStretch(2, 1)
+        gridlayout_buttons.setColumnStretch(3, 1)
+        gridlayout_buttons.addWidget(self.pushbutton_refresh, 0, 1, alignment=Qt.AlignCenter)
+        gridlayout_buttons.addWidget(self.pushbutton_execute, 0, 2, alignment=Qt.AlignCenter)
+        gridlayout_buttons.addWidget(pushbutton_close, 0, 3, alignment=Qt.AlignCenter)
+
+        # create and configure "groupbox_buttons"
+        groupbox_buttons = QGroupBox()
+        groupbox_buttons.setObjectName('groupbox_buttons')
+        groupbox_buttons.setStyleSheet('QGroupBox#groupbox_buttons {border: 0px;}')
+        groupbox_buttons.setLayout(gridlayout_buttons)
+
+        # create and configure "gridlayout_central"
+        gridlayout_central = QGridLayout()
+        gridlayout_central.setRowStretch(0, 1)
+        gridlayout_central.setRowStretch(1, 10)
+        gridlayout_central.setRowStretch(2, 1)
+        gridlayout_central.setColumnStretch(0, 1)
+        gridlayout_central.addWidget(label_head, 0, 0)
+        gridlayout_central.addWidget(groupbox_data, 1, 0)
+        gridlayout_central.addWidget(groupbox_buttons, 2, 0)
+
+        # create and configure "groupbox_central"
+        groupbox_central = QGroupBox()
+        groupbox_central.setLayout(gridlayout_central)
+
+        # create and configure "vboxlayout"
+        vboxlayout = QVBoxLayout(self)
+        vboxlayout.addWidget(groupbox_central)
+
+    #---------------
+
+    def initialize_inputs(self):
+        '''
+        Load initial data in inputs.
+        '''
+
+        # populate data in "combobox_annotation_results"
+        self.combobox_annotation_result_type_populate()
+
+        # load data in "tablewidget"
+        self.load_tablewidget()
+
+        # set initial value in "lineedit_fasta_file"
+        self.lineedit_fasta_file.setText('')
+
+        # initialize "lineedit_species_name"
+        self.lineedit_species_name.setText('')
+
+        # initialize "lineedit_fdr_method"
+        self.lineedit_fdr_method.setText('')
+
+        # initialize "lineedit_min_seqnum_annotations"
+        self.lineedit_min_seqnum_annotations.setText('')
+
+        # initialize "lineedit_min_seqnum_species"
+        self.lineedit_min_seqnum_species.setText('')
+
+    #---------------
+
+    def check_inputs(self):
+        '''
+        Check the content of each input and do the actions linked to its value.
+        '''
+
+        # initialize the control variable
+        OK = True
+
+        # get the list of rows selected
+        row_list = []
+        for idx in self.tablewidget.selectionModel().selectedIndexes():
+            row_list.append(idx.row())
+        row_list = list(set(row_list))
+
+        # check "lineedit_fasta_file" when the editing finished
+        if not self.lineedit_fasta_file_editing_finished():
+            OK = False
+
+        # check "lineedit_species_name" when the editing finished
+        if not self.lineedit_species_name_editing_finished():
+            OK = False
+
+        # check "lineedit_fdr_method" when the editing finished
+        if not self.lineedit_fdr_method_editing_finished():
+            OK = False
+
+        # check "lineedit_min_seqnum_annotations" when the editing finished
+        if not self.lineedit_min_seqnum_annotations_editing_finished():
+            OK = False
+
+        # check "lineedit_min_seqnum_species" when the editing finished
+        if not self.lineedit_min_seqnum_species_editing_finished():
+            OK = False
+
+        # check all inputs are OK
+        if OK:
+            self.parent.statusBar().showMessage('')
+        else:
+            self.parent.statusBar().showMessage('There are one or more inputs without data or with wrong value.')
+
+        # enable "pushbutton_execute"
+        if OK and self.combobox_annotation_result_type.currentText() != '' and len(row_list) == 1 and self.lineedit_fasta_file.text() != '' and self.lineedit_species_name.text() != '' and self.lineedit_fdr_method.text() != '' and self.lineedit_min_seqnum_annotations.text() != '' and self.lineedit_min_seqnum_species.text() != '':
+            self.pushbutton_execute.setEnabled(True)
+        else:
+            self.pushbutton_execute.setEnabled(False)
+            OK = False
+
+        # return the control variable
+        return OK
+
+    #---------------
+
+    def combobox_annotation_result_type_populate(self):
+        '''
+        Populate data in "combobox_annotation_result_type".
+        '''
+
+        # load the annotation result type list in "combobox_annotation_result_type"
+        self.combobox_annotation_result_type.addItems(self.annotation_result_type_text_list)
+
+        # select the annotation result type
+        self.combobox_annotation_result_type.setCurrentIndex(1)
+
+        # simulate the annotation result type has changed
+        self.combobox_annotation_result_type_currentIndexChanged()
+
+    #---------------
+
+    def combobox_annotation_result_type_currentIndexChanged(self):
+        '''
+        Process the event when an item of "combobox_annotation_result_type" has been selected.
+        '''
+
+        # check the content of inputs
+        self.check_inputs()
+
+    #---------------
+
+    def tablewidget_currentCellChanged(self, row, _):
+        '''
+        Perform necessary actions after changing the current "tablewidget" cell.
+        '''
+
+        # check if there is a row selected
+        if row >= 0:
+
+            # get the result directory
+            result_dir = self.app_config_dict['Environment parameters']['result_dir']
+
+            # get the result dataset corresponding to the row clicked
+            result_dataset_id = self.tablewidget.item(row, 1).text()
+
+            # get the parameters file corresponding to the result dataset
+            params_file = f'{result_dir}{os.sep}{genlib.get_result_run_subdir()}{os.sep}{result_dataset_id}{os.sep}{genlib.get_params_file_name()}'
+            if sys.platform.startswith('win32'):
+                params_file = genlib.wsl_path_2_windows_path(params_file)
+
+            # get the dictionary of parameters
+            params_dict = genlib.get_config_dict(params_file)
+
+            # set the FASTA file path in "lineedit_fasta_file"
+            fasta_file = params_dict['Annotation parameters']['fasta_file']
+            if sys.platform.startswith('win32'):
+                fasta_file = genlib.wsl_path_2_windows_path(fasta_file)
+            self.lineedit_fasta_file.setText(fasta_file)
+
+            # set the species in "lineedit_species_name"
+            species_name = params_dict['Enrichment parameters']['species_name']
+            if species_name == genlib.get_all_species_code():
+                species_name = genlib.get_all_species_name()
+            self.lineedit_species_name.setText(species_name)
+
+            # set the FDR method in "lineedit_fdr_method"
+            fdr_method_code = params_dict['Enrichment parameters']['fdr_method']
+            fdr_method_text = self.fdr_method_text_list[self.fdr_method_code_list.index(fdr_method_code)]
+            self.lineedit_fdr_method.setText(fdr_method_text)
+
+            # set the min seq# in annotations
+            min_seqnum_annotations = params_dict['Enrichment parameters']['min_seqnum_annotations']
+            self.lineedit_min_seqnum_annotations.setText(min_seqnum_annotations)
+
+            # set the min seq# in species
+            min_seqnum_species = params_dict['Enrichment parameters']['min_seqnum_species']
+            self.lineedit_min_seqnum_species.setText(min_seqnum_species)
+
+        # check the content of inputs
+        self.check_inputs()
+
+    #---------------
+
+    def tablewidget_cellClicked(self, _, __):
+        '''
+        Perform necessary actions after clicking on a "tablewidget" cell.
+        '''
+
+        # check the content of inputs
+        self.check_inputs()
+
+    #---------------
+
+    def tablewidget_cellDoubleClicked(self, _, __):
+        '''
+        Perform necessary actions after double clicking on "tablewidget" cell.
+        '''
+
+        # check the content of inputs
+        OK = self.check_inputs()
+
+        # if inputs are OK, simulate a click on "pushbutton_execute"
+        if OK:
+            self.pushbutton_execute_clicked()
+
+    #---------------
+
+    def lineedit_fasta_file_editing_finished(self):
+        '''
+        Perform necessary actions after finishing editing "lineedit_fasta_file"
+        '''
+
+        # initialize the control variable
+        OK = True
+
+        # return the control variable
+        return OK
+
+    #---------------
+
+    def lineedit_species_name_editing_finished(self):
+        '''
+        Perform necessary actions after finishing editing "lineedit_species_name"
+        '''
+
+        # initialize the control variable
+        OK = True
+
+        # return the control variable
+        return OK
+
+    #---------------
+
+    def lineedit_fdr_method_editing_finished(self):
+        '''
+        Perform necessary actions after finishing editing "lineedit_fdr_method"
+        '''
+
+        # initialize the control variable
+        OK = True
+
+        # return the control variable
+        return OK
+
+    #---------------
+
+    def lineedit_min_seqnum_annotations_editing_finished(self):
+        '''
+        Perform necessary actions after finishing editing "lineedit_min_seqnum_annotations"
+        '''
+
+        # initialize the control variable
+        OK = True
+
+        # return the control variable
+        return OK
+
+    #---------------
+
+    def lineedit_min_seqnum_species_editing_finished(self):
+        '''
+        Perform necessary actions after finishing editing "lineedit_min_seqnum_species"
+        '''
+
+        # initialize the control variable
+        OK = True
+
+        # return the control variable
+        return OK
+
+    #---------------
+
+    def pushbutton_refresh_clicked(self):
+        '''
+        Refresh "tablewidget" and initialize other inputs.
+        '''
+
+        # check the content of inputs
+        self.initialize_inputs()
+
+        # check the content of inputs
+        self.check_inputs()
+
+    #---------------
+
+    def pushbutton_execute_clicked(self):
+        '''
+        Execute the process.
+        '''
+
+        # initialize the control variable
+        OK = True
+
+        # get the list of rows selected
+        row_list = []
+        for idx in self.tablewidget.selectionModel().selectedIndexes():
+            row_list.append(idx.row())
+        row_list = list(set(row_list))
+
+        # check if there is only a row selected
+        if len(row_list) != 1:
+            title = f'{genlib.get_app_short_name()} - {self.head}'
+            text = 'One row has to be selected.'
+            QMessageBox.critical(self, title, text, buttons=QMessageBox.Ok)
+            OK = False
+
+        # confirm the process is executed
+        if OK:
+            text = 'The result of the enrichment analysis is going to be browsed.\n\nAre you sure to continue?'
+            botton = QMessageBox.question(self, self.title, text, buttons=QMessageBox.Yes|QMessageBox.No, defaultButton=QMessageBox.No)
+            if botton == QMessageBox.No:
+                OK = False
+
+        # execute the process
+        if OK:
+
+            # set the process type
+            process_type = genlib.get_result_run_subdir()
+
+            # get the result directory
+            result_dir = self.app_config_dict['Environment parameters']['result_dir']
+
+            # get the identification of the enrichment analysis dataset
+            result_dataset_id = self.tablewidget.item(row_list[0], 1).text()
+
+            # get the annotation result type
+            annotation_result_type = self.annotation_result_type_code_list[self.annotation_result_type_text_list.index(self.combobox_annotation_result_type.currentText())]
+
+            # get the file path of the enrichment analysis
+            if self.code == genlib.get_goea_code():
+                if annotation_result_type == 'best':
+                    enrichment_analysis_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{genlib.get_besthit_goea_file_name()}'
+                elif annotation_result_type == 'complete':
+                    enrichment_analysis_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{genlib.get_complete_goea_file_name()}'
+            elif self.code == genlib.get_mpea_code():
+                if annotation_result_type == 'best':
+                    enrichment_analysis_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{genlib.get_besthit_mpea_file_name()}'
+                elif annotation_result_type == 'complete':
+                    enrichment_analysis_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{genlib.get_complete_mpea_file_name()}'
             elif self.code == genlib.get_koea_code():
                 if annotation_result_type == 'best':
                     enrichment_analysis_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{genlib.get_besthit_koea_file_name()}'
@@ -2364,76 +2923,12 @@ class FormBrowseEnrichmentAnalysis(QWidget):
         # get the result directory
         result_dir = self.app_config_dict['Environment parameters']['result_dir']
 
-        # set the type, name and code of the enrichment analysis datasets
+        # set the type and name of the enrichment analysis datasets
         process_type = genlib.get_result_run_subdir()
         process_name = genlib.get_process_run_enrichment_analysis_name()
-        process_code = genlib.get_process_id(process_name)
-
-        # get the process dictionary
-        process_dict = genlib.get_process_dict()
 
-        # get the log directory
-        log_dir = f'{result_dir}/{process_type}'
-        if sys.platform.startswith('win32'):
-            log_dir = genlib.wsl_path_2_windows_path(log_dir)
-
-        # set the command to get the result datasets of enrichment analysis in the log directory
-        command = ''
-        if sys.platform.startswith('linux') or sys.platform.startswith('darwin'):
-            if process_name == 'all':
-                command = f'ls -d {log_dir}/*  | xargs -n 1 basename'
-            else:
-                command = f'ls -d {log_dir}/{process_code}-*  | xargs -n 1 basename'
-        elif sys.platform.startswith('win32'):
-            log_dir = log_dir.replace('/', '\\')
-            if process_name == 'all':
-                command = f'dir /a:d /b {log_dir}\\*'
-            else:
-                command = f'dir /a:d /b {log_dir}\\{process_code}-*'
-
-        # run the command to get the result datasets of enrichment analysis in the log directory
-        output = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=False)
-
-        # initialize the result dataset dictionary
-        result_dataset_dict = {}
-
-        # build the result dataset dictionary
-        for line in output.stdout.split('\n'):
-            if line != '':
-
-                # get data
-                result_dataset_id = line.strip()
-                try:
-                    pattern = r'^(.+)\-(.+)\-(.+)$'
-                    mo = re.search(pattern, result_dataset_id)
-                    process_code = mo.group(1).strip()
-                    process_name = process_dict[process_code]['name']
-                    yymmdd = mo.group(2)
-                    hhmmss = mo.group(3)
-                    date = f'20{yymmdd[:2]}-{yymmdd[2:4]}-{yymmdd[4:]}'
-                    time = f'{hhmmss[:2]}:{hhmmss[2:4]}:{hhmmss[4:]}'
-                except:    # pylint: disable=bare-except
-                    process_name = 'unknown process'
-                    date = '0000-00-00'
-                    time = '00:00:00'
-
-                # determine the status
-                status_ok = os.path.isfile(genlib.get_status_ok(os.path.join(log_dir, result_dataset_id)))
-                status_wrong = os.path.isfile(genlib.get_status_wrong(os.path.join(log_dir, result_dataset_id)))
-                status = ''
-                if status_ok and not status_wrong:
-                    status = 'OK'
-                elif not status_ok and status_wrong:
-                    status = 'wrong'
-                elif not status_ok and not status_wrong:
-                    status = 'not finished'
-                elif status_ok and status_wrong:
-                    status = 'undetermined'
-
-                # insert data in the dictionary when the the status is OK
-                if status == 'OK':
-                    key = f'{process_name}-{result_dataset_id}'
-                    result_dataset_dict[key] = {'process': process_name, 'result_dataset_id': result_dataset_id, 'date': date, 'time': time, 'status': status}
+        # get the result datasets ended OK from the run registry
+        result_dataset_dict = registrylib.get_result_dataset_dict(result_dir, process_type, process_name, status_list=['OK'])
 
         # initialize "tablewidget"
         self.tablewidget.clearContents()
@@ -2463,74 +2958,11 @@ class FormBrowseEnrichmentAnalysis(QWidget):
         Get GO term enrichment analysis data.
         '''
 
-        # initialize the enrichment analysis dictionary
-        enrichment_analysis_dict = {}
-
-        # open the enrichment analysis file
-        if enrichment_analysis_file_path.endswith('.gz'):
-            try:
-                enrichment_analysis_file_path_id = gzip.open(enrichment_analysis_file_path, mode='rt', encoding='iso-8859-1', newline='\n')
-            except Exception as e:
-                raise genlib.ProgramException(e, 'F002', enrichment_analysis_file_path)
-        else:
-            try:
-                enrichment_analysis_file_path_id = open(enrichment_analysis_file_path, mode='r', encoding='iso-8859-1', newline='\n')
-            except Exception as e:
-                raise genlib.ProgramException(e, 'F001', enrichment_analysis_file_path)
-
-        # initialize the record counter
-        record_counter = 0
-
-        # initialize the header record control
-        header_record = True
-
-        # read the first record
-        record = enrichment_analysis_file_path_id.readline()
-
-        # while there are records
-        while record != '':
-
-            # add 1 to the record counter
-            record_counter += 1
-
-            # process the header record
-            if header_record:
-                header_record = False
-
-            # process data records
-            else:
-
-                # extract data
-                # record format: "GOterm";"Description";"Namespace";"Sequences# with this GOterm in annotations";"Sequences# with GOterms in annotations";"Sequences# with this GOterm in species";"Sequences# with GOterms in species";"Enrichment";"p-value";"FDR"
-                data_list = []
-                begin = 0
-                for end in [i for i, chr in enumerate(record) if chr == ';']:
-                    data_list.append(record[begin:end].strip('"'))
-                    begin = end + 1
-                data_list.append(record[begin:].strip('\n').strip('"'))
-                try:
-                    goterm = data_list[0]
-                    description = data_list[1]
-                    namespace = data_list[2]
-                    annotation_seqs_count = data_list[3]
-                    annotation_seqs_wgoterms = data_list[4]
-                    species_seqs_count = data_list[5]
-                    species_seqs_wgoterms = data_list[6]
-                    enrichment = data_list[7]
-                    pvalue= data_list[8]
-                    fdr = data_list[9]
-
-                except Exception as e:
-                    raise genlib.ProgramException(e, 'F006', os.path.basename(enrichment_analysis_file_path), record_counter)
-
-                # add data to the dictionary
-                enrichment_analysis_dict[goterm] = {'goterm': goterm, 'description': description, 'namespace': namespace, 'annotation_seqs_count': annotation_seqs_count, 'annotation_seqs_wgoterms': annotation_seqs_wgoterms, 'species_seqs_count': species_seqs_count, 'species_seqs_wgoterms': species_seqs_wgoterms, 'enrichment': enrichment, 'pvalue': pvalue, 'fdr': fdr}
-
-            # read the next record
-            record = enrichment_analysis_file_path_id.readline()
+        # get the table of the enrichment analysis file
+        enrichment_analysis_dict = enrichmentlib.EnrichmentAnalysisTable.load(enrichment_analysis_file_path, genlib.get_goea_code())
 
         # build the data list
-        data_list = ['goterm', 'description', 'namespace', 'annotation_seqs_count', 'annotation_seqs_wgoterms', 'species_seqs_count', 'species_seqs_wgoterms', 'enrichment', 'pvalue', 'fdr']
+        data_list = list(enrichment_analysis_dict.column_list)
 
         # build the data dictionary
         data_dict = {}
@@ -2563,72 +2995,11 @@ class FormBrowseEnrichmentAnalysis(QWidget):
         Get Metacyc pathway enrichment analysis data.
         '''
 
-        # initialize the enrichment analysis dictionary
-        enrichment_analysis_dict = {}
-
-        # open the enrichment analysis file
-        if enrichment_analysis_file_path.endswith('.gz'):
-            try:
-                enrichment_analysis_file_path_id = gzip.open(enrichment_analysis_file_path, mode='rt', encoding='iso-8859-1', newline='\n')
-            except Exception as e:
-                raise genlib.ProgramException(e, 'F002', enrichment_analysis_file_path)
-        else:
-            try:
-                enrichment_analysis_file_path_id = open(enrichment_analysis_file_path, mode='r', encoding='iso-8859-1', newline='\n')
-            except Exception as e:
-                raise genlib.ProgramException(e, 'F001', enrichment_analysis_file_path)
-
-        # initialize the record counter
-        record_counter = 0
-
-        # initialize the header record control
-        header_record = True
-
-        # read the first record
-        record = enrichment_analysis_file_path_id.readline()
-
-        # while there are records
-        while record != '':
-
-            # add 1 to the record counter
-            record_counter += 1
-
-            # process the header record
-            if header_record:
-                header_record = False
-
-            # process data records
-            else:
-
-                # extract data
-                # record format: "Metacyc pathway";"Sequences# with this Metacyc pathway in annotations";"Sequences# with Metacyc pathways in annotations";"Sequences# with this Metacyc pathway in species";"Sequences# with Metacyc pathways in species";"Enrichment";"p-value";"FDR"
-                data_list = []
-                begin = 0
-                for end in [i for i, chr in enumerate(record) if chr == ';']:
-                    data_list.append(record[begin:end].strip('"'))
-                    begin = end + 1
-                data_list.append(record[begin:].strip('\n').strip('"'))
-                try:
-                    metacyc_pathway_id = data_list[0]
-                    annotation_seqs_count = data_list[1]
-                    annotation_seqs_wpathways = data_list[2]
-                    species_seqs_count = data_list[3]
-                    species_seqs_wpathways = data_list[4]
-                    enrichment = data_list[5]
-                    pvalue= data_list[6]
-                    fdr = data_list[7]
-
-                except Exception as e:
-                    raise genlib.ProgramException(e, 'F006', os.path.basename(enrichment_analysis_file_path), record_counter)
-
-                # add data to the dictionary
-                enrichment_analysis_dict[metacyc_pathway_id] = {'metacyc_pathway_id': metacyc_pathway_id, 'annotation_seqs_count': annotation_seqs_count, 'annotation_seqs_wpathways': annotation_seqs_wpathways, 'species_seqs_count': species_seqs_count, 'species_seqs_wpathways': species_seqs_wpathways, 'enrichment': enrichment, 'pvalue': pvalue, 'fdr': fdr}
-
-            # read the next record
-            record = enrichment_analysis_file_path_id.readline()
+        # get the table of the enrichment analysis file
+        enrichment_analysis_dict = enrichmentlib.EnrichmentAnalysisTable.load(enrichment_analysis_file_path, genlib.get_mpea_code())
 
         # build the data list
-        data_list = ['metacyc_pathway_id', 'annotation_seqs_count', 'annotation_seqs_wpathways', 'species_seqs_count', 'species_seqs_wpathways', 'enrichment', 'pvalue', 'fdr']
+        data_list = list(enrichment_analysis_dict.column_list)
 
         # build the data dictionary
         data_dict = {}
@@ -2659,72 +3030,11 @@ class FormBrowseEnrichmentAnalysis(QWidget):
         Get KEGG KO enrichment analysis data.
         '''
 
-        # initialize the enrichment analysis dictionary
-        enrichment_analysis_dict = {}
-
-        # open the enrichment analysis file
-        if enrichment_analysis_file_path.endswith('.gz'):
-            try:
-                enrichment_analysis_file_path_id = gzip.open(enrichment_analysis_file_path, mode='rt', encoding='iso-8859-1', newline='\n')
-            except Exception as e:
-                raise genlib.ProgramException(e, 'F002', enrichment_analysis_file_path)
-        else:
-            try:
-                enrichment_analysis_file_path_id = open(enrichment_analysis_file_path, mode='r', encoding='iso-8859-1', newline='\n')
-            except Exception as e:
-                raise genlib.ProgramException(e, 'F001', enrichment_analysis_file_path)
-
-        # initialize the record counter
-        record_counter = 0
-
-        # initialize the header record control
-        header_record = True
-
-        # read the first record
-        record = enrichment_analysis_file_path_id.readline()
-
-        # while there are records
-        while record != '':
-
-            # add 1 to the record counter
-            record_counter += 1
-
-            # process the header record
-            if header_record:
-                header_record = False
-
-            # process data records
-            else:
-
-                # extract data
-                # record format: "KEGG KO";"Sequences# with this KEGG KO in annotations";"Sequences# with KEGG KOs in annotations";"Sequences# with this KEGG KO in species";"Sequences# with KEGG KOs in species";"Enrichment";"p-value";"FDR"
-                data_list = []
-                begin = 0
-                for end in [i for i, chr in enumerate(record) if chr == ';']:
-                    data_list.append(record[begin:end].strip('"'))
-                    begin = end + 1
-                data_list.append(record[begin:].strip('\n').strip('"'))
-                try:
-                    kegg_ko_id = data_list[0]
-                    annotation_seqs_count = data_list[1]
-                    annotation_seqs_wpathways = data_list[2]
-                    species_seqs_count = data_list[3]
-                    species_seqs_wpathways = data_list[4]
-                    enrichment = data_list[5]
-                    pvalue= data_list[6]
-                    fdr = data_list[7]
-
-                except Exception as e:
-                    raise genlib.ProgramException(e, 'F006', os.path.basename(enrichment_analysis_file_path), record_counter)
-
-                # add data to the dictionary
-                enrichment_analysis_dict[kegg_ko_id] = {'kegg_ko_id': kegg_ko_id, 'annotation_seqs_count': annotation_seqs_count, 'annotation_seqs_wpathways': annotation_seqs_wpathways, 'species_seqs_count': species_seqs_count, 'species_seqs_wpathways': species_seqs_wpathways, 'enrichment': enrichment, 'pvalue': pvalue, 'fdr': fdr}
-
-            # read the next record
-            record = enrichment_analysis_file_path_id.readline()
+        # get the table of the enrichment analysis file
+        enrichment_analysis_dict = enrichmentlib.EnrichmentAnalysisTable.load(enrichment_analysis_file_path, genlib.get_koea_code())
 
         # build the data list
-        data_list = ['kegg_ko_id', 'annotation_seqs_count', 'annotation_seqs_wpathways', 'species_seqs_count', 'species_seqs_wpathways', 'enrichment', 'pvalue', 'fdr']
+        data_list = list(enrichment_analysis_dict.column_list)
 
         # build the data dictionary
         data_dict = {}
@@ -2755,72 +3065,11 @@ class FormBrowseEnrichmentAnalysis(QWidget):
         Get KEGG pathway enrichment analysis data.
         '''
 
-        # initialize the enrichment analysis dictionary
-        enrichment_analysis_dict = {}
-
-        # open the enrichment analysis file
-        if enrichment_analysis_file_path.endswith('.gz'):
-            try:
-                enrichment_analysis_file_path_id = gzip.open(enrichment_analysis_file_path, mode='rt', encoding='iso-8859-1', newline='\n')
-            except Exception as e:
-                raise genlib.ProgramException(e, 'F002', enrichment_analysis_file_path)
-        else:
-            try:
-                enrichment_analysis_file_path_id = open(enrichment_analysis_file_path, mode='r', encoding='iso-8859-1', newline='\n')
-            except Exception as e:
-                raise genlib.ProgramException(e, 'F001', enrichment_analysis_file_path)
-
-        # initialize the record counter
-        record_counter = 0
-
-        # initialize the header record control
-        header_record = True
-
-        # read the first record
-        record = enrichment_analysis_file_path_id.readline()
-
-        # while there are records
-        while record != '':
-
-            # add 1 to the record counter
-            record_counter += 1
-
-            # process the header record
-            if header_record:
-                header_record = False
-
-            # process data records
-            else:
-
-                # extract data
-                # record format: "KEGG pathway";"Sequences# with this KEGG pathway in annotations";"Sequences# with KEGG pathways in annotations";"Sequences# with this KEGG pathway in species";"Sequences# with KEGG pathways in species";"Enrichment";"p-value";"FDR"
-                data_list = []
-                begin = 0
-                for end in [i for i, chr in enumerate(record) if chr == ';']:
-                    data_list.append(record[begin:end].strip('"'))
-                    begin = end + 1
-                data_list.append(record[begin:].strip('\n').strip('"'))
-                try:
-                    kegg_pathway_id = data_list[0]
-                    annotation_seqs_count = data_list[1]
-                    annotation_seqs_wpathways = data_list[2]
-                    species_seqs_count = data_list[3]
-                    species_seqs_wpathways = data_list[4]
-                    enrichment = data_list[5]
-                    pvalue= data_list[6]
-                    fdr = data_list[7]
-
-                except Exception as e:
-                    raise genlib.ProgramException(e, 'F006', os.path.basename(enrichment_analysis_file_path), record_counter)
-
-                # add data to the dictionary
-                enrichment_analysis_dict[kegg_pathway_id] = {'kegg_pathway_id': kegg_pathway_id, 'annotation_seqs_count': annotation_seqs_count, 'annotation_seqs_wpathways': annotation_seqs_wpathways, 'species_seqs_count': species_seqs_count, 'species_seqs_wpathways': species_seqs_wpathways, 'enrichment': enrichment, 'pvalue': pvalue, 'fdr': fdr}
-
-            # read the next record
-            record = enrichment_analysis_file_path_id.readline()
+        # get the table of the enrichment analysis file
+        enrichment_analysis_dict = enrichmentlib.EnrichmentAnalysisTable.load(enrichment_analysis_file_path, genlib.get_kpea_code())
 
         # build the data list
-        data_list = ['kegg_pathway_id', 'annotation_seqs_count', 'annotation_seqs_wpathways', 'species_seqs_count', 'species_seqs_wpathways', 'enrichment', 'pvalue', 'fdr']
+        data_list = list(enrichment_analysis_dict.column_list)
 
         # build the data dictionary
         data_dict = {}
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This source contains functions and classes related to the enrichment analysis result files
+used in gymnoTOA (Gymnosperms Taxonomy-oriented Annotation).
+
+The four enrichment analysis formats (GO terms, Metacyc pathways, KEGG KOs and KEGG pathways)
+are loaded by the same function as typed columns (the counts as integers and the enrichment,
+p-value and FDR as floats, with N/A as NaN), so they can be sorted and filtered numerically.
+The tables loaded are kept while their files are not changed.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import os
+import sys
+
+import numpy as np
+
+import columnlib
+import genlib
+
+#-------------------------------------------------------------------------------
+
+def get_enrichment_analysis_column_list(code):
+    '''
+    Get the column list of the enrichment analysis files of an enrichment analysis code.
+    '''
+
+    # GO term enrichment analysis
+    # record format: "GOterm";"Description";"Namespace";"Sequences# with this GOterm in annotations";"Sequences# with GOterms in annotations";"Sequences# with this GOterm in species";"Sequences# with GOterms in species";"Enrichment";"p-value";"FDR"
+    if code == genlib.get_goea_code():
+        column_list = ['goterm', 'description', 'namespace', 'annotation_seqs_count', 'annotation_seqs_wgoterms', 'species_seqs_count', 'species_seqs_wgoterms', 'enrichment', 'pvalue', 'fdr']
+
+    # Metacyc pathway, KEGG KO and KEGG pathway enrichment analysis
+    # record format: "Id";"Sequences# with this id in annotations";"Sequences# with ids in annotations";"Sequences# with this id in species";"Sequences# with ids in species";"Enrichment";"p-value";"FDR"
+    else:
+        if code == genlib.get_mpea_code():
+            id_column = 'metacyc_pathway_id'
+        elif code == genlib.get_koea_code():
+            id_column = 'kegg_ko_id'
+        elif code == genlib.get_kpea_code():
+            id_column = 'kegg_pathway_id'
+        else:
+            raise genlib.ProgramException('', 'L004', code)
+        column_list = [id_column, 'annotation_seqs_count', 'annotation_seqs_wpathways', 'species_seqs_count', 'species_seqs_wpathways', 'enrichment', 'pvalue', 'fdr']
+
+    # return the column list
+    return column_list
+
+#-------------------------------------------------------------------------------
+
+def get_float_column_list():
+    '''
+    Get the list of the float columns of the enrichment analysis files.
+    '''
+
+    return ['enrichment', 'pvalue', 'fdr']
+
+#-------------------------------------------------------------------------------
+
+def get_column_type(column):
+    '''
+    Get the type of a column of the enrichment analysis files: float, int or text.
+    '''
+
+    if column in get_float_column_list():
+        return 'float'
+    if column.startswith(('annotation_seqs_', 'species_seqs_')):
+        return 'int'
+    return 'text'
+
+#-------------------------------------------------------------------------------
+
+class EnrichmentAnalysisTable():
+    '''
+    This class keeps the typed columns of an enrichment analysis file. An item is got by its row
+    number as a dictionary with the column texts, so the table can be shown in a
+    "dialogs.DialogDataTable" and only the texts of the rows shown are built.
+    '''
+
+    #---------------
+
+    # the tables loaded (key: file path; value: (file signature, table))
+    cache_dict = {}
+
+    #---------------
+
+    @staticmethod
+    def load(enrichment_analysis_file, code):
+        '''
+        Get the table of an enrichment analysis file (the file is only parsed when it is not loaded
+        or it has been changed).
+        '''
+
+        # get the file signature
+        signature = genlib.get_file_signature(enrichment_analysis_file)
+
+        # parse the file when it is not loaded or it has been changed
+        cache_item = EnrichmentAnalysisTable.cache_dict.get(enrichment_analysis_file)
+        if cache_item is None or cache_item[0] != signature or cache_item[1].code != code:
+            genlib.Message.print('trace', f'Parsing the enrichment analysis file {enrichment_analysis_file} ...')
+            table = EnrichmentAnalysisTable(enrichment_analysis_file, code)
+            EnrichmentAnalysisTable.cache_dict[enrichment_analysis_file] = (signature, table)
+        else:
+            table = cache_item[1]
+
+        # return the table
+        return table
+
+    #---------------
+
+    def __init__(self, enrichment_analysis_file, code):
+        '''
+        Create a class instance parsing an enrichment analysis file.
+        '''
+
+        # save parameters in instance variables
+        self.enrichment_analysis_file = enrichment_analysis_file
+        self.code = code
+
+        # get the column list
+        self.column_list = get_enrichment_analysis_column_list(code)
+
+        # read the text columns (the Parquet copy is scanned when it is valid)
+        text_column_list = list(columnlib.read_csv_file_columns(enrichment_analysis_file).values())
+        if len(text_column_list) != len(self.column_list):
+            raise genlib.ProgramException('', 'F005', enrichment_analysis_file)
+
+        # convert the columns to their types
+        self.column_dict = {}
+        for column, text_list in zip(self.column_list, text_column_list):
+            text_array = np.array(text_list, dtype=str)
+            try:
+                if get_column_type(column) == 'float':
+                    self.column_dict[column] = np.where(text_array == genlib.get_na(), 'nan', text_array).astype(np.float64)
+                elif get_column_type(column) == 'int':
+                    self.column_dict[column] = text_array.astype(np.int64)
+                else:
+                    self.column_dict[column] = text_array
+            except ValueError as e:
+                raise genlib.ProgramException(e, 'F005', os.path.basename(enrichment_analysis_file))
+
+        # save the row number
+        self.row_count = len(text_column_list[0]) if text_column_list else 0
+
+    #---------------
+
+    def __len__(self):
+        '''
+        Get the row number.
+        '''
+
+        return self.row_count
+
+    #---------------
+
+    def __getitem__(self, row):
+        '''
+        Get the dictionary with the column texts of a row.
+        '''
+
+        # initialize the row dictionary
+        row_dict = {}
+
+        # build the text of each column
+        for column in self.column_list:
+            value = self.column_dict[column][row]
+            if get_column_type(column) == 'float':
+                row_dict[column] = genlib.get_na() if np.isnan(value) else str(float(value))
+            elif get_column_type(column) == 'int':
+                row_dict[column] = str(int(value))
+            else:
+                row_dict[column] = str(value)
+
+        # return the row dictionary
+        return row_dict
+
+    #---------------
+
+    def keys(self):
+        '''
+        Get the row numbers in the file order.
+        '''
+
+        return range(self.row_count)
+
+    #---------------
+
+    def get_filter_column_list(self):
+        '''
+        Get the columns that can be filtered by a range of values.
+        '''
+
+        return get_float_column_list()
+
+    #---------------
+
+    def filter_key_list(self, column, minimum=None, maximum=None):
+        '''
+        Get the row numbers (in the file order) whose value of a column is in a range (a missing
+        limit is not checked); the rows with N/A are excluded when there is a limit.
+        '''
+
+        # initialize the mask of the rows
+        values = self.column_dict[column]
+        mask = np.ones(self.row_count, dtype=bool)
+
+        # apply the limits
+        if minimum is not None:
+            mask &= values >= minimum
+        if maximum is not None:
+            mask &= values <= maximum
+
+        # return the row numbers
+        return np.flatnonzero(mask).tolist()
+
+    #---------------
+
+    def sort_key_list(self, key_list, column, reverse=False):
+        '''
+        Sort the row numbers of a key list by the values of a column (the rows with N/A are
+        always put at the end).
+        '''
+
+        # get the values of the rows
+        key_array = np.asarray(key_list, dtype=np.int64)
+        values = self.column_dict[column][key_array]
+
+        # sort the rows keeping the order of the rows with equal values
+        if get_column_type(column) == 'text':
+            order = np.argsort(values, kind='stable')
+            if reverse:
+                order = order[::-1]
+        else:
+            order = np.argsort(-values if reverse else values, kind='stable')
+
+        # return the sorted row numbers
+        return key_array[order].tolist()
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    print(f'This source contains functions and classes related to the enrichment analysis result files used in {genlib.get_app_long_name()}.')
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
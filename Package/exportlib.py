@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This source contains functions and classes related to the files built to input in external
+applications such as agriGO or REVIGO used in gymnoTOA (Gymnosperms Taxonomy-oriented Annotation).
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import gzip
+import sys
+
+import genlib
+import statslib
+
+#-------------------------------------------------------------------------------
+
+def open_output_file(output_file):
+    '''
+    Open an output file (compressed with gzip when its name ends with ".gz").
+    '''
+
+    # open the output file (the gzip compression level is the one of the gzip command, which is much faster than the maximum one)
+    if output_file.endswith('.gz'):
+        try:
+            output_file_id = gzip.open(output_file, mode='wt', compresslevel=6, encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F004', output_file)
+    else:
+        try:
+            output_file_id = open(output_file, mode='w', encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F003', output_file)
+
+    # return the output file identification
+    return output_file_id
+
+#-------------------------------------------------------------------------------
+
+class ExternalInputsExporter():
+    '''
+    This class builds the agriGO and REVIGO input files adding the functional annotation records
+    of each sequence. The agriGO records of a sequence are written when it is added, so only the
+    REVIGO counters are kept in memory.
+    '''
+
+    #---------------
+
+    # functional annotation columns used in the input files
+    COLUMN_LIST = ['interpro_goterms', 'panther_goterms', 'eggnog_goterms']
+
+    #---------------
+
+    def __init__(self, output_dir, compress='N'):
+        '''
+        Create a class instance.
+        '''
+
+        # set the input file names
+        extension = '.gz' if compress == 'Y' else ''
+        self.agrigo_input_file = f'{output_dir}/agrigo-input-file.txt{extension}'
+        self.revigo_input_file = f'{output_dir}/revigo-input-file.txt{extension}'
+
+        # initialize the REVIGO counters of sequences per GO term
+        self.revigo_stats = statslib.InternedStatsAccumulator(['seq_num'])
+
+        # open the agriGO input file
+        self.agrigo_input_file_id = open_output_file(self.agrigo_input_file)
+
+    #---------------
+
+    def add_sequence(self, seq_id, annotation_record_list):
+        '''
+        Add the functional annotation records of a sequence.
+        '''
+
+        # extract the GO term identifications of the sequence
+        # goterms format: "goterm_id1|goterm_id2|...|gotermo_idn"
+        goterm_id_set = set()
+        for annotation_record in annotation_record_list:
+            for column in ['interpro_goterms', 'panther_goterms', 'eggnog_goterms']:
+                if annotation_record[column] != '' and annotation_record[column] != '-':
+                    goterm_id_set.update(annotation_record[column].split('|'))
+
+        # if the sequence has GO terms
+        if goterm_id_set:
+
+            # write the agriGO records of the sequence
+            self.agrigo_input_file_id.write(''.join([f'{seq_id} {goterm_id}\n' for goterm_id in sorted(goterm_id_set)]))
+
+            # increase the REVIGO counters of the GO terms
+            self.revigo_stats.add_num_list('seq_num', self.revigo_stats.intern_list(goterm_id_set))
+
+    #---------------
+
+    def close(self):
+        '''
+        Close the agriGO input file and write the REVIGO input file.
+        '''
+
+        # close agriGO input file
+        self.agrigo_input_file_id.close()
+
+        # open the REVIGO input file
+        revigo_input_file_id = open_output_file(self.revigo_input_file)
+
+        # get the GO term list and the counter array
+        self.revigo_stats.flush()
+        goterm_id_list = self.revigo_stats.key_list
+        counter_array = self.revigo_stats.counter_array_dict['seq_num']
+
+        # write data record
+        for goterm_num in sorted(range(len(goterm_id_list)), key=goterm_id_list.__getitem__):
+            revigo_input_file_id.write(f'{goterm_id_list[goterm_num]} {counter_array[goterm_num]}\n')
+
+        # close REVIGO input file
+        revigo_input_file_id.close()
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    print(f'This source contains functions and classes related to the files built to input in external applications used in {genlib.get_app_long_name()}.')
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
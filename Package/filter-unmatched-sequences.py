@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This program builds a FASTA file with the sequences of other FASTA file that do not have hits
+in a list of outfmt6 alignment files, keeping their order. It is used to align only the
+sequences not annotated in the previous alignments of the annotation pipeline.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import argparse
+import os
+import sys
+
+import genlib
+import pipelinelib
+
+#-------------------------------------------------------------------------------
+
+def main():
+    '''
+    Main line of the program.
+    '''
+
+    # check the operating system
+    genlib.check_os()
+
+    # get and check the arguments
+    parser = build_parser()
+    args = parser.parse_args()
+    check_args(args)
+
+    # build the FASTA file with the sequences without hits
+    filter_unmatched_sequences(args.fasta_file, args.alignment_file_list, args.output_file)
+
+#-------------------------------------------------------------------------------
+
+def build_parser():
+    '''
+    Build the parser with the available arguments.
+    '''
+
+    # create the parser and add arguments
+    description = 'Description: This program builds a FASTA file with the sequences of other FASTA file that do not have hits\n' \
+                  'in a list of outfmt6 alignment files, keeping their order. It is used to align only the\n' \
+                  'sequences not annotated in the previous alignments of the annotation pipeline.'
+    text = f'{genlib.get_app_short_name()} v{genlib.get_app_version()} - {os.path.basename(__file__)}\n\n{description}\n'
+    usage = f'\r{text.ljust(len("usage:"))}\nUsage: {os.path.basename(__file__)} arguments'
+    parser = argparse.ArgumentParser(usage=usage)
+    parser._optionals.title = 'Arguments'    #pylint: disable=protected-access
+    parser.add_argument('--fasta', dest='fasta_file', help='Path of the FASTA file (mandatory).')
+    parser.add_argument('--alignments', dest='alignment_file_list', help='Paths of the outfmt6 alignment files separated by comma (mandatory).')
+    parser.add_argument('--out', dest='output_file', help='Path of the FASTA file with the sequences without hits (mandatory).')
+    parser.add_argument('--verbose', dest='verbose', help=f'Additional job status info during the run: {genlib.get_verbose_code_list_text()}; default: {genlib.Const.DEFAULT_VERBOSE}.')
+    parser.add_argument('--trace', dest='trace', help=f'Additional info useful to the developer team: {genlib.get_trace_code_list_text()}; default: {genlib.Const.DEFAULT_TRACE}.')
+
+    # return the paser
+    return parser
+
+#-------------------------------------------------------------------------------
+
+def check_args(args):
+    '''
+    Check the input arguments.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # check "fasta_file"
+    if args.fasta_file is None:
+        genlib.Message.print('error', '*** The FASTA file is not indicated in the input arguments.')
+        OK = False
+    elif not os.path.isfile(args.fasta_file):
+        genlib.Message.print('error', f'*** The file {args.fasta_file} does not exist.')
+        OK = False
+
+    # check "alignment_file_list"
+    if args.alignment_file_list is None:
+        genlib.Message.print('error', '*** The alignment files are not indicated in the input arguments.')
+        OK = False
+    else:
+        args.alignment_file_list = genlib.split_literal_to_text_list(args.alignment_file_list)
+        for alignment_file in args.alignment_file_list:
+            if not os.path.isfile(alignment_file):
+                genlib.Message.print('error', f'*** The file {alignment_file} does not exist.')
+                OK = False
+
+    # check "output_file"
+    if args.output_file is None:
+        genlib.Message.print('error', '*** The FASTA file with the sequences without hits is not indicated in the input arguments.')
+        OK = False
+
+    # check "verbose"
+    if args.verbose is None:
+        args.verbose = genlib.Const.DEFAULT_VERBOSE
+    elif not genlib.check_code(args.verbose, genlib.get_verbose_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** verbose has to be {genlib.get_verbose_code_list_text()}.')
+        OK = False
+    if args.verbose.upper() == 'Y':
+        genlib.Message.set_verbose_status(True)
+
+    # check "trace"
+    if args.trace is None:
+        args.trace = genlib.Const.DEFAULT_TRACE
+    elif not genlib.check_code(args.trace, genlib.get_trace_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** trace has to be {genlib.get_trace_code_list_text()}.')
+        OK = False
+    if args.trace.upper() == 'Y':
+        genlib.Message.set_trace_status(True)
+
+    # if there are errors, exit with exception
+    if not OK:
+        raise genlib.ProgramException('', 'P001')
+
+#-------------------------------------------------------------------------------
+
+def filter_unmatched_sequences(fasta_file, alignment_file_list, output_file):
+    '''
+    Build a FASTA file with the sequences without hits in the alignment files.
+    '''
+
+    # get the sequence identifications with hits
+    qseqid_set = pipelinelib.get_alignment_qseqid_set(alignment_file_list)
+    genlib.Message.print('info', f'{len(qseqid_set)} sequences have hits in {", ".join(alignment_file_list)}.')
+
+    # write the sequences without hits
+    (read_seq_counter, written_seq_counter) = pipelinelib.filter_fasta_file(fasta_file, qseqid_set, output_file)
+    genlib.Message.print('info', f'{written_seq_counter} of {read_seq_counter} sequences of {fasta_file} do not have hits and are written in {output_file}.')
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
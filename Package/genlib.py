@@ -26,9 +26,15 @@ Licence: GNU General Public Licence Version 3.
 
 #-------------------------------------------------------------------------------
 
+import codecs
 import collections
 import configparser
+import copy
 import datetime
+import functools
+import gc
+import gzip
+import importlib.util
 import os
 import re
 import subprocess
@@ -510,6 +516,33 @@ def get_params_file_name():
 
 #-------------------------------------------------------------------------------
 
+def get_run_registry_file_name():
+    '''
+    Get the name of the run registry of the result directory.
+    '''
+
+    return 'run-registry.db'
+
+#-------------------------------------------------------------------------------
+
+def get_job_queue_file_name():
+    '''
+    Get the name of the job queue of the result directory.
+    '''
+
+    return 'job-queue.db'
+
+#-------------------------------------------------------------------------------
+
+def get_plot_cache_dir_name():
+    '''
+    Get the name of the plot cache directory of a run.
+    '''
+
+    return 'plot-cache'
+
+#-------------------------------------------------------------------------------
+
 def get_blastp_clade_alignment_file_name():
     '''
     Get the name of the alignment file yielded by blastp.
@@ -537,6 +570,24 @@ def get_blastn_lncrna_alignment_file_name():
 
 #-------------------------------------------------------------------------------
 
+def get_blastx_query_file_name():
+    '''
+    Get the name of the query file of blastx (transcripts without blastp hits).
+    '''
+
+    return 'blastx-query.fasta'
+
+#-------------------------------------------------------------------------------
+
+def get_blastn_query_file_name():
+    '''
+    Get the name of the query file of blastn (transcripts without blastp hits).
+    '''
+
+    return 'blastn-query.fasta'
+
+#-------------------------------------------------------------------------------
+
 def get_complete_functional_annotation_file_name():
     '''
     Get the name of the functional annotation file with all hits per sequence.
@@ -699,6 +750,133 @@ def get_complete_kpea_file_name():
 
 #-------------------------------------------------------------------------------
 
+def get_functional_annotation_head():
+    '''
+    Get the head record of the functional annotation files.
+    '''
+
+    # -- return 'qseqid;sseqid;pident;length;mismatch;gapopen;qstart;qend;sstart;send;evalue;bitscore;algorithm;ncbi_description;ncbi_species;tair10_ortholog_seq_id;interpro_goterms;panther_goterms;metacyc_pathways;reactome_pathways;eggnog_ortholog_seq_id;eggnog_ortholog_species;eggnog_ogs;cog_category;eggnog_description;eggnog_goterms;ec;kegg_kos;kegg_pathways;kegg_modules;kegg_reactions;kegg_rclasses;brite;kegg_tc;cazy;pfams'
+    return 'qseqid;sseqid;pident;length;mismatch;gapopen;qstart;qend;sstart;send;evalue;bitscore;algorithm;ncbi_description;ncbi_species;tair10_ortholog_seq_id;interpro_goterms;panther_goterms;metacyc_pathways;eggnog_ortholog_seq_id;eggnog_ortholog_species;eggnog_ogs;cog_category;eggnog_description;eggnog_goterms;ec;kegg_kos;kegg_pathways;kegg_modules;kegg_reactions;kegg_rclasses;brite;kegg_tc;cazy;pfams'
+
+#-------------------------------------------------------------------------------
+
+def get_subset_goea_file_name():
+    '''
+    Get the name of the GO enrichment analysis file of a sequence subset.
+    '''
+
+    return 'subset-goterm-enrichment-analysis.csv'
+
+#-------------------------------------------------------------------------------
+
+def get_subset_mpea_file_name():
+    '''
+    Get the name of the Metacyc pathway enrichment analysis file of a sequence subset.
+    '''
+
+    return 'subset-metacyc-pathway-enrichment-analysis.csv'
+
+#-------------------------------------------------------------------------------
+
+def get_subset_koea_file_name():
+    '''
+    Get the name of the KEGG KO enrichment analysis file of a sequence subset.
+    '''
+
+    return 'subset-kegg-ko-enrichment-analysis.csv'
+
+#-------------------------------------------------------------------------------
+
+def get_subset_kpea_file_name():
+    '''
+    Get the name of the KEGG pathway enrichment analysis file of a sequence subset.
+    '''
+
+    return 'subset-kegg-pathway-enrichment-analysis.csv'
+
+#-------------------------------------------------------------------------------
+
+def get_incidence_index_dir(annotation_file):
+    '''
+    Get the path of the sequence-term incidence index directory corresponding to a functional annotation file.
+    '''
+
+    # remove the compression and CSV extensions of the annotation file
+    base_path = annotation_file
+    if base_path.endswith('.gz'):
+        base_path = base_path[:-3]
+    if base_path.endswith('.csv'):
+        base_path = base_path[:-4]
+
+    # return the incidence index directory path
+    return f'{base_path}-incidence'
+
+#-------------------------------------------------------------------------------
+
+def get_functional_annotation_offset_file(functional_annotation_file):
+    '''
+    Get the path of the offset index file corresponding to a functional annotation file.
+    '''
+
+    # remove the compression and CSV extensions of the annotation file
+    base_path = functional_annotation_file
+    if base_path.endswith('.gz'):
+        base_path = base_path[:-3]
+    if base_path.endswith('.csv'):
+        base_path = base_path[:-4]
+
+    # return the offset index file path
+    return f'{base_path}-offsets.npz'
+
+#-------------------------------------------------------------------------------
+
+def get_stats_accumulator_file_name():
+    '''
+    Get the name of the file with the serialized accumulators of the functional annotation statistics.
+    '''
+
+    return 'stats-accumulators.json'
+
+#-------------------------------------------------------------------------------
+
+def get_results_db_file_name():
+    '''
+    Get the name of the SQLite database with the hits and cluster annotations of an annotation pipeline run.
+    '''
+
+    return 'results.db'
+
+#-------------------------------------------------------------------------------
+
+def get_run_comparison_summary_file_name():
+    '''
+    Get the name of the file with the summary of each run of a comparison of annotation runs.
+    '''
+
+    return 'run-comparison-summary.csv'
+
+#-------------------------------------------------------------------------------
+
+def get_run_comparison_overlap_file_name(item):
+    '''
+    Get the name of the file with the pairwise overlaps of the terms of an enrichment analysis
+    code or the best-hit clusters (item "clusters") of a comparison of annotation runs.
+    '''
+
+    return f'run-comparison-{item}-overlaps.csv'
+
+#-------------------------------------------------------------------------------
+
+def get_run_comparison_term_file_name(code):
+    '''
+    Get the name of the file with the sequence count per run of the terms of an enrichment
+    analysis code of a comparison of annotation runs.
+    '''
+
+    return f'run-comparison-{code}-terms.csv'
+
+#-------------------------------------------------------------------------------
+
 def get_status_dir(current_run_dir):
     '''
     Get the status directory of a process.
@@ -1061,6 +1239,15 @@ def join_text_list_to_literal(text_list):
 
 #-------------------------------------------------------------------------------
 
+def split_literal_to_text_list(literal):
+    '''
+    Split a literal with texts separated by comma in a text list (empty texts are discarded).
+    '''
+
+    return [text.strip() for text in literal.split(',') if text.strip() != '']
+
+#-------------------------------------------------------------------------------
+
 def check_parameter_list(parameters, key, not_allowed_parameters_list):
     '''
     Check if a string contains a parameter list.
@@ -1291,6 +1478,69 @@ def get_annotation_result_type_text_list():
 
 #-------------------------------------------------------------------------------
 
+def get_annotation_result_type_code_list_text():
+    '''
+    Get the code list of "annotation_result_type" as text.
+    '''
+
+    return 'complete (all hits per sequence) or best (best hit per sequence)'
+
+#-------------------------------------------------------------------------------
+
+def get_compress_code_list():
+    '''
+    Get the code list of "compress".
+    '''
+
+    return ['Y', 'N']
+
+#-------------------------------------------------------------------------------
+
+def get_compress_code_list_text():
+    '''
+    Get the code list of "compress" as text.
+    '''
+
+    return 'Y (yes) or N (no)'
+
+#-------------------------------------------------------------------------------
+
+def get_eager_code_list():
+    '''
+    Get the code list of "eager".
+    '''
+
+    return ['Y', 'N']
+
+#-------------------------------------------------------------------------------
+
+def get_eager_code_list_text():
+    '''
+    Get the code list of "eager" as text.
+    '''
+
+    return 'Y (yes) or N (no)'
+
+#-------------------------------------------------------------------------------
+
+def get_parquet_code_list():
+    '''
+    Get the code list of "parquet".
+    '''
+
+    return ['Y', 'N']
+
+#-------------------------------------------------------------------------------
+
+def get_parquet_code_list_text():
+    '''
+    Get the code list of "parquet" as text.
+    '''
+
+    return 'Y (yes) or N (no)'
+
+#-------------------------------------------------------------------------------
+
 def get_verbose_code_list():
     '''
     Get the code list of "verbose".
@@ -1367,22 +1617,32 @@ def run_command(command, log, is_script):
         else:
             command = f'wsl bash -c "{command}"'
 
-    # run the command
+    # do not run the command when the process of the log has been cancelled
+    if getattr(log, 'cancelled', False):
+        return -1
+
+    # run the command (the subprocess is saved in the log when it can be cancelled)
     current_subprocess = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, shell=True)
+    if hasattr(log, 'current_subprocess'):
+        log.current_subprocess = current_subprocess
     for line in iter(current_subprocess.stdout.readline, b''):
         line = re.sub(b'[^\x00-\x7F]+', b' ', line) # replace non-ASCII caracters by one blank space
         line = line.decode('iso-8859-1')
         log.write(line)
     rc = current_subprocess.wait()
+    if hasattr(log, 'current_subprocess'):
+        log.current_subprocess = None
 
     # return the return code of the command run
     return rc
 
 #-------------------------------------------------------------------------------
 
-def build_starter(directory, starter_name, script_name, current_run_dir):
+def build_starter(directory, starter_name, script_name, current_run_dir, job_dict=None):
     '''
-    Build the script to start a process script.
+    Build the script to start a process script. When the job dictionary (keys: app_dir,
+    result_dir, threads and memory) is passed, the process script is submitted to the job
+    queue of the result directory and it is run when the job is admitted.
     '''
 
     # initialize the control variable and the error list
@@ -1392,15 +1652,32 @@ def build_starter(directory, starter_name, script_name, current_run_dir):
     # set the starter path
     starter_path = f'{directory}/{starter_name}'
 
+    # set the command that runs the process script
+    command = f'{current_run_dir}/{script_name}'
+    if job_dict is not None:
+        command = f'{job_dict["app_dir"]}/run-queued-job.py --resultdir={job_dict["result_dir"]} --script={current_run_dir}/{script_name} --threads={job_dict["threads"]} --memory={job_dict["memory"]}'
+
+    # get the Miniforge3 bin directory
+    miniforge3_dir = ''
+    if job_dict is not None:
+        if sys.platform.startswith('win32'):
+            miniforge3_dir = get_miniforge3_dir_in_wsl()
+        elif sys.platform.startswith('linux') or sys.platform.startswith('darwin'):
+            miniforge3_dir = get_miniforge3_current_dir()
+    miniforge3_bin_dir = f'{miniforge3_dir}/bin'
+
     # write the starter
     try:
         with open(starter_path, mode='w', encoding='iso-8859-1', newline='\n') as file_id:
             file_id.write( '#!/bin/bash\n')
             file_id.write( '#-------------------------------------------------------------------------------\n')
+            if job_dict is not None:
+                file_id.write(f'export PATH={miniforge3_bin_dir}:/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin:/snap/bin\n')
+                file_id.write(f'source {miniforge3_bin_dir}/activate {get_gymnotoa_env_code()}\n')
             if sys.platform.startswith('linux') or sys.platform.startswith('win32'):
-                file_id.write(f'{current_run_dir}/{script_name} &>>{current_run_dir}/{get_run_log_file()} &\n')
+                file_id.write(f'{command} &>>{current_run_dir}/{get_run_log_file()} &\n')
             elif sys.platform.startswith('darwin'):
-                file_id.write(f'{current_run_dir}/{script_name} &>{current_run_dir}/{get_run_log_file()} &\n')
+                file_id.write(f'{command} &>{current_run_dir}/{get_run_log_file()} &\n')
     except Exception as e:
         error_list.append(f'*** EXCEPTION: "{e}".')
         error_list.append(f'*** ERROR: The file {starter_path} is not created.')
@@ -1466,145 +1743,852 @@ def read_alignment_outfmt6_record(file_name, file_id, record_counter):
 
 #-------------------------------------------------------------------------------
 
-def read_functional_annotation_record(file_name, file_id, record_counter):
+class FunctionalAnnotationRecord(collections.namedtuple('FunctionalAnnotationRecordBase', get_functional_annotation_head().split(';'))):
     '''
-    Read the next record of the functional annotation file.
+    This class keeps the data of a functional annotation record. It is a named tuple without
+    instance dictionary, so its data are accessed by attribute (record.sseqid) or by column
+    name (record['sseqid']) like the data dictionaries of records.
     '''
 
-    # initialize the data dictionary
-    data_dict = {}
+    #---------------
 
-    # initialize the key
-    key = None
+    __slots__ = ()
 
-    # read next record
-    record = file_id.readline()
+    # columns whose values are repeated in many records, so they are interned
+    INTERNED_COLUMN_LIST = ['sseqid', 'algorithm', 'ncbi_species']
 
-    # if there is record
-    if record != '':
+    #---------------
 
-        # extract data
-        # record format (old):  qseqid <field_sep> sseqid <field_sep> pident <field_sep> length <field_sep> mismatch <field_sep> gapopen <field_sep> qstart <field_sep> qend <field_sep> sstart <field_sep> send <field_sep> evalue <field_sep> bitscore <field_sep> algorithm <field_sep> ncbi_description <field_sep> ncbi_species <field_sep> tair10_ortholog_seq_id <field_sep> interpro_goterms <field_sep> panther_goterms <field_sep> metacyc_pathways <field_sep> reactome_pathways <field_sep> eggnog_ortholog_seq_id <field_sep> eggnog_ortholog_species <field_sep> eggnog_ogs <field_sep> cog_category <field_sep> eggnog_description <field_sep> eggnog_goterms <field_sep> ec <field_sep> kegg_kos <field_sep> kegg_pathways <field_sep> kegg_modules <field_sep> kegg_reactions <field_sep> kegg_rclasses <field_sep> brite <field_sep> kegg_tc <field_sep> cazy <field_sep> pfams
-        # record format: qseqid <field_sep> sseqid <field_sep> pident <field_sep> length <field_sep> mismatch <field_sep> gapopen <field_sep> qstart <field_sep> qend <field_sep> sstart <field_sep> send <field_sep> evalue <field_sep> bitscore <field_sep> algorithm <field_sep> ncbi_description <field_sep> ncbi_species <field_sep> tair10_ortholog_seq_id <field_sep> interpro_goterms <field_sep> panther_goterms <field_sep> metacyc_pathways <field_sep> eggnog_ortholog_seq_id <field_sep> eggnog_ortholog_species <field_sep> eggnog_ogs <field_sep> cog_category <field_sep> eggnog_description <field_sep> eggnog_goterms <field_sep> ec <field_sep> kegg_kos <field_sep> kegg_pathways <field_sep> kegg_modules <field_sep> kegg_reactions <field_sep> kegg_rclasses <field_sep> brite <field_sep> kegg_tc <field_sep> cazy <field_sep> pfams
-        field_sep = ';'
-        record_sep = '\n'
-        data_list = re.split(field_sep, record.replace(record_sep,''))
-        try:
-            qseqid = data_list[0].strip()
-            sseqid = data_list[1].strip()
-            pident = data_list[2].strip()
-            length = data_list[3].strip()
-            mismatch = data_list[4].strip()
-            gapopen = data_list[5].strip()
-            qstart = data_list[6].strip()
-            qend = data_list[7].strip()
-            sstart = data_list[8].strip()
-            send = data_list[9].strip()
-            evalue = data_list[10].strip()
-            bitscore = data_list[11].strip()
-            algorithm = data_list[12].strip()
-            ncbi_description = data_list[13].strip()
-            ncbi_species = data_list[14].strip()
-            tair10_ortholog_seq_id = data_list[15].strip()
-            interpro_goterms = data_list[16].strip()
-            panther_goterms = data_list[17].strip()
-            metacyc_pathways = data_list[18].strip()
-            # -- reactome_pathways = data_list[x].strip()
-            eggnog_ortholog_seq_id = data_list[19].strip()
-            eggnog_ortholog_species = data_list[20].strip()
-            eggnog_ogs = data_list[21].strip()
-            cog_category = data_list[22].strip()
-            eggnog_description = data_list[23].strip()
-            eggnog_goterms = data_list[24].strip()
-            ec = data_list[25].strip()
-            kegg_kos = data_list[26].strip()
-            kegg_pathways = data_list[27].strip()
-            kegg_modules = data_list[28].strip()
-            kegg_reactions = data_list[29].strip()
-            kegg_rclasses = data_list[30].strip()
-            brite = data_list[31].strip()
-            kegg_tc = data_list[32].strip()
-            cazy = data_list[33].strip()
-            pfams = data_list[34].strip()
-        except Exception as e:
-            raise ProgramException(e, 'F006', os.path.basename(file_name), record_counter) from e
+    def __getitem__(self, column):
+        '''
+        Get the value of a column by its name (or by its position).
+        '''
 
-        # set the key
-        key = f'{qseqid}-{sseqid}'
+        if isinstance(column, str):
+            return getattr(self, column)
+        return tuple.__getitem__(self, column)
 
-        # get the record data dictionary
-        # -- data_dict = {'qseqid': qseqid, 'sseqid': sseqid, 'pident': pident, 'length': length, 'mismatch': mismatch, 'gapopen': gapopen, 'qstart': qstart, 'qend': qend, 'sstart': sstart, 'send': send, 'evalue': evalue, 'bitscore': bitscore, 'algorithm': algorithm, 'ncbi_description': ncbi_description, 'ncbi_species': ncbi_species, 'tair10_ortholog_seq_id': tair10_ortholog_seq_id, 'interpro_goterms': interpro_goterms, 'panther_goterms': panther_goterms, 'metacyc_pathways': metacyc_pathways, 'reactome_pathways': reactome_pathways, 'eggnog_ortholog_seq_id': eggnog_ortholog_seq_id, 'eggnog_ortholog_species': eggnog_ortholog_species, 'eggnog_ogs': eggnog_ogs, 'cog_category': cog_category, 'eggnog_description': eggnog_description, 'eggnog_goterms': eggnog_goterms, 'ec': ec, 'kegg_kos': kegg_kos, 'kegg_pathways': kegg_pathways, 'kegg_modules': kegg_modules, 'kegg_reactions': kegg_reactions, 'kegg_rclasses': kegg_rclasses, 'brite': brite, 'kegg_tc': kegg_tc, 'cazy': cazy, 'pfams': pfams}
-        data_dict = {'qseqid': qseqid, 'sseqid': sseqid, 'pident': pident, 'length': length, 'mismatch': mismatch, 'gapopen': gapopen, 'qstart': qstart, 'qend': qend, 'sstart': sstart, 'send': send, 'evalue': evalue, 'bitscore': bitscore, 'algorithm': algorithm, 'ncbi_description': ncbi_description, 'ncbi_species': ncbi_species, 'tair10_ortholog_seq_id': tair10_ortholog_seq_id, 'interpro_goterms': interpro_goterms, 'panther_goterms': panther_goterms, 'metacyc_pathways': metacyc_pathways, 'eggnog_ortholog_seq_id': eggnog_ortholog_seq_id, 'eggnog_ortholog_species': eggnog_ortholog_species, 'eggnog_ogs': eggnog_ogs, 'cog_category': cog_category, 'eggnog_description': eggnog_description, 'eggnog_goterms': eggnog_goterms, 'ec': ec, 'kegg_kos': kegg_kos, 'kegg_pathways': kegg_pathways, 'kegg_modules': kegg_modules, 'kegg_reactions': kegg_reactions, 'kegg_rclasses': kegg_rclasses, 'brite': brite, 'kegg_tc': kegg_tc, 'cazy': cazy, 'pfams': pfams}
+    #---------------
 
-    # if there is not record
-    else:
+    def get(self, column, default=None):
+        '''
+        Get the value of a column by its name or the default value when the column does not exist.
+        '''
 
-        # set the key
-        key = bytes.fromhex('7E').decode('utf-8')
+        return getattr(self, column, default)
 
-    # return the record, key and data dictionary
-    return record, key, data_dict
+    #---------------
 
 #-------------------------------------------------------------------------------
 
-class Const():
+def parse_functional_annotation_text(file_name, text, first_record_num=1):
     '''
-    This class has attributes with values will be used as constants.
+    Parse a text with records of the functional annotation file (without the header record)
+    and get the list of their functional annotation records. The first record number is used
+    in the error messages.
     '''
 
-    #---------------
+    # extract data
+    # record format (old):  qseqid <field_sep> sseqid <field_sep> pident <field_sep> length <field_sep> mismatch <field_sep> gapopen <field_sep> qstart <field_sep> qend <field_sep> sstart <field_sep> send <field_sep> evalue <field_sep> bitscore <field_sep> algorithm <field_sep> ncbi_description <field_sep> ncbi_species <field_sep> tair10_ortholog_seq_id <field_sep> interpro_goterms <field_sep> panther_goterms <field_sep> metacyc_pathways <field_sep> reactome_pathways <field_sep> eggnog_ortholog_seq_id <field_sep> eggnog_ortholog_species <field_sep> eggnog_ogs <field_sep> cog_category <field_sep> eggnog_description <field_sep> eggnog_goterms <field_sep> ec <field_sep> kegg_kos <field_sep> kegg_pathways <field_sep> kegg_modules <field_sep> kegg_reactions <field_sep> kegg_rclasses <field_sep> brite <field_sep> kegg_tc <field_sep> cazy <field_sep> pfams
+    # record format: qseqid <field_sep> sseqid <field_sep> pident <field_sep> length <field_sep> mismatch <field_sep> gapopen <field_sep> qstart <field_sep> qend <field_sep> sstart <field_sep> send <field_sep> evalue <field_sep> bitscore <field_sep> algorithm <field_sep> ncbi_description <field_sep> ncbi_species <field_sep> tair10_ortholog_seq_id <field_sep> interpro_goterms <field_sep> panther_goterms <field_sep> metacyc_pathways <field_sep> eggnog_ortholog_seq_id <field_sep> eggnog_ortholog_species <field_sep> eggnog_ogs <field_sep> cog_category <field_sep> eggnog_description <field_sep> eggnog_goterms <field_sep> ec <field_sep> kegg_kos <field_sep> kegg_pathways <field_sep> kegg_modules <field_sep> kegg_reactions <field_sep> kegg_rclasses <field_sep> brite <field_sep> kegg_tc <field_sep> cazy <field_sep> pfams
+    field_sep = ';'
+    record_sep = '\n'
 
-    DEFAULT_FDR_METHOD = 'by'
-    DEFAULT_MIN_SEQNUM_ANNOTATIONS = 5
-    DEFAULT_MIN_SEQNUM_SPECIES = 10
-    DEFAULT_TRACE = 'N'
-    DEFAULT_VERBOSE = 'N'
+    # remove the record separator of the last record
+    if text.endswith(record_sep):
+        text = text[:-1]
+    if text == '':
+        return []
 
-   #---------------
+    # disable the garbage collector while the records are built because many objects are created
+    # without reference cycles and the collections triggered by them are expensive
+    gc_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+
+        # split the records and their fields
+        data_list_list = [record.split(field_sep) for record in text.split(record_sep)]
+
+        # check the field number of the records (the fields after the last column are ignored)
+        column_num = len(FunctionalAnnotationRecord._fields)
+        for i, data_list in enumerate(data_list_list):
+            if len(data_list) != column_num:
+                if len(data_list) < column_num:
+                    raise ProgramException('', 'F006', os.path.basename(file_name), first_record_num + i)
+                data_list_list[i] = data_list[:column_num]
+
+        # strip the fields when there are fields with leading or trailing whitespaces (the check is done
+        # once for all records because they are rare)
+        if text[:1].isspace() or text[-1:].isspace() or Const.FIELD_EDGE_SPACE_PATTERN.search(text) is not None or any(char in text for char in Const.WHITESPACE_CHAR_LIST):
+            data_list_list = [[data.strip() for data in data_list] for data_list in data_list_list]
+
+        # intern the values of the columns repeated in many records
+        intern = sys.intern
+        for index in [FunctionalAnnotationRecord._fields.index(column) for column in FunctionalAnnotationRecord.INTERNED_COLUMN_LIST]:
+            for data_list in data_list_list:
+                data_list[index] = intern(data_list[index])
+
+        # build the functional annotation record list
+        functional_annotation_record_list = list(map(functools.partial(tuple.__new__, FunctionalAnnotationRecord), data_list_list))
+
+    finally:
+
+        # enable the garbage collector
+        if gc_enabled:
+            gc.enable()
+
+    # return the functional annotation record list
+    return functional_annotation_record_list
 
 #-------------------------------------------------------------------------------
 
-class Message():
+def parse_functional_annotation_batches(file_name, record_iterable):
     '''
-    This class controls the informative messages printed on the console.
+    Parse the text records of an iterable of the functional annotation file (the header record
+    has to be skipped by the caller) and get lists of functional annotation records.
     '''
 
-    #---------------
+    # initialize the record number of the first record of the batch and the batch record list
+    first_record_num = 1
+    record_list = []
 
-    verbose_status = False
-    trace_status = False
+    # parse the records in batches
+    for record in record_iterable:
+        record_list.append(record)
+        if len(record_list) >= Const.PARSE_BATCH_RECORD_NUM:
+            yield parse_functional_annotation_text(file_name, ''.join(record_list), first_record_num)
+            first_record_num += len(record_list)
+            record_list = []
 
-    #---------------
+    # parse the records of the last batch
+    if record_list != []:
+        yield parse_functional_annotation_text(file_name, ''.join(record_list), first_record_num)
 
-    @staticmethod
-    def set_verbose_status(status):
-        '''
-        Set the verbose status.
-        '''
+#-------------------------------------------------------------------------------
 
-        Message.verbose_status = status
+def read_functional_annotation_batches(file_name, file_id):
+    '''
+    Read the records of a functional annotation file opened in binary mode (the header record
+    has to be skipped by the caller) in byte buffers and get lists of functional annotation records.
+    '''
 
-    #---------------
+    # initialize the record number of the first record of the buffer and the rest of the previous buffer
+    first_record_num = 1
+    rest = b''
 
-    @staticmethod
-    def set_trace_status(status):
-        '''
-        Set the trace status.
-        '''
+    # read the buffers
+    while True:
 
-        Message.trace_status = status
+        # read the next buffer and join it to the rest of the previous one
+        buffer = file_id.read(Const.READ_BUFFER_SIZE)
+        if buffer == b'':
+            break
+        buffer = rest + buffer
 
-    #---------------
+        # split the buffer at the end of its last complete record
+        end = buffer.rfind(b'\n') + 1
+        rest = buffer[end:]
+        if end == 0:
+            continue
 
-    @staticmethod
-    def print(message_type, message_text):
-        '''
-        Print a message depending to its type.
-        '''
+        # parse the records of the buffer
+        yield parse_functional_annotation_text(file_name, buffer[:end].decode('iso-8859-1'), first_record_num)
+        first_record_num += buffer.count(b'\n', 0, end)
 
-        if message_type == 'info':
-            print(message_text, file=sys.stdout)
-            sys.stdout.flush()
+    # parse the last record when it does not end with a record separator
+    if rest != b'':
+        yield parse_functional_annotation_text(file_name, rest.decode('iso-8859-1'), first_record_num)
+
+#-------------------------------------------------------------------------------
+
+def group_functional_annotation_batches(batch_iterable):
+    '''
+    Get the functional annotation records of lists of records grouped by sequence identification
+    (the records of a sequence have to be consecutive, but they can be in several lists). Each
+    item yielded is (sequence identification, functional annotation record list).
+    '''
+
+    # initialize the old sequence identification and its record list
+    old_qseqid = None
+    group_record_list = []
+
+    # group the records of each list
+    for record_list in batch_iterable:
+        for record in record_list:
+
+            # yield the group of the previous sequence when the sequence identification changes
+            if record.qseqid != old_qseqid:
+                if group_record_list != []:
+                    yield old_qseqid, group_record_list
+                old_qseqid = record.qseqid
+                group_record_list = []
+
+            # add the record to the group of the sequence
+            group_record_list.append(record)
+
+    # yield the group of the last sequence
+    if group_record_list != []:
+        yield old_qseqid, group_record_list
+
+#-------------------------------------------------------------------------------
+
+def read_functional_annotation_groups(file_name, record_iterable):
+    '''
+    Get the functional annotation records of an iterable of text records grouped by sequence
+    identification (the records of a sequence have to be consecutive). Each item yielded is
+    (sequence identification, functional annotation record list). The header record has to
+    be skipped by the caller.
+    '''
+
+    yield from group_functional_annotation_batches(parse_functional_annotation_batches(file_name, record_iterable))
+
+#-------------------------------------------------------------------------------
+
+def read_functional_annotation_file_groups(file_name, file_id):
+    '''
+    Get the functional annotation records of a file opened in binary mode grouped by sequence
+    identification (the records of a sequence have to be consecutive). Each item yielded is
+    (sequence identification, functional annotation record list). The header record has to
+    be skipped by the caller.
+    '''
+
+    yield from group_functional_annotation_batches(read_functional_annotation_batches(file_name, file_id))
+
+#-------------------------------------------------------------------------------
+
+def get_file_signature(file_path):
+    '''
+    Get the signature (modification time and size) of a file used to validate its saved indexes.
+    '''
+
+    # get the modification data of the file
+    try:
+        file_stat = os.stat(file_path)
+    except Exception as e:
+        raise ProgramException(e, 'F001', file_path) from e
+
+    # return the file signature
+    return (file_stat.st_mtime_ns, file_stat.st_size)
+
+#-------------------------------------------------------------------------------
+
+def build_functional_annotation_offset_dict(block_offset_list, row_block_list, row_offset_list, qseqid_list, sseqid_list):
+    '''
+    Build the array dictionary of the offset index of a functional annotation file from the block
+    offsets (offsets in the file where each block starts, and the file size as last item), the block
+    and the offset in the uncompressed block of each data record, and the qseqid and sseqid of each
+    data record.
+    '''
+
+    # import NumPy (it is not imported at module level so as not to slow down the GUI startup)
+    import numpy as np    # pylint: disable=import-outside-toplevel
+
+    # initialize the array dictionary
+    offset_dict = {}
+
+    # save the block and record offsets
+    offset_dict['block_offsets'] = np.array(block_offset_list, dtype=np.int64)
+    offset_dict['row_blocks'] = np.array(row_block_list, dtype=np.int32)
+    offset_dict['row_offsets'] = np.array(row_offset_list, dtype=np.int64)
+
+    # save the sorted identifications and, for each one, the pointers to its rows in a row array
+    # (rows of the identification i: rows[ptr[i]:ptr[i+1]])
+    for name, seq_id_list in [('qseqid', qseqid_list), ('sseqid', sseqid_list)]:
+        (seq_id_array, inverse_array) = np.unique(np.array(seq_id_list, dtype=str), return_inverse=True)
+        offset_dict[f'{name}s'] = seq_id_array
+        offset_dict[f'{name}_ptrs'] = np.concatenate(([0], np.cumsum(np.bincount(inverse_array, minlength=len(seq_id_array))))).astype(np.int64)
+        offset_dict[f'{name}_rows'] = np.argsort(inverse_array, kind='stable').astype(np.int64)
+
+    # return the array dictionary
+    return offset_dict
+
+#-------------------------------------------------------------------------------
+
+def save_functional_annotation_offset_file(functional_annotation_file, offset_dict):
+    '''
+    Save the offset index of a functional annotation file in its sidecar file.
+    '''
+
+    # import NumPy
+    import numpy as np    # pylint: disable=import-outside-toplevel
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # get the offset file
+    offset_file = get_functional_annotation_offset_file(functional_annotation_file)
+
+    # write the index into a temporal file and rename it to avoid partial indexes
+    temp_offset_file = f'{offset_file}.tmp.npz'
+    try:
+        np.savez(temp_offset_file, version=np.array([FunctionalAnnotationFileIndex.VERSION], dtype=np.int64), source_signature=np.array(get_file_signature(functional_annotation_file), dtype=np.int64), **offset_dict)
+        os.replace(temp_offset_file, offset_file)
+    except Exception as e:
+        error_list.append(f'*** EXCEPTION: "{e}".')
+        error_list.append(f'*** ERROR: The file {offset_file} is not created.')
+        OK = False
+
+    # return the control variable and error list
+    return (OK, error_list)
+
+#-------------------------------------------------------------------------------
+
+def scan_functional_annotation_offsets(functional_annotation_file):
+    '''
+    Build the array dictionary of the offset index of a functional annotation file reading it.
+    A compressed file not written by "FunctionalAnnotationFileWriter" is indexed as one block.
+    '''
+
+    # initialize the offset lists
+    row_offset_list = []
+    qseqid_list = []
+    sseqid_list = []
+
+    # open the functional annotation file
+    if functional_annotation_file.endswith('.gz'):
+        try:
+            functional_annotation_file_id = gzip.open(functional_annotation_file, mode='rb')
+        except Exception as e:
+            raise ProgramException(e, 'F002', functional_annotation_file) from e
+    else:
+        try:
+            functional_annotation_file_id = open(functional_annotation_file, mode='rb')
+        except Exception as e:
+            raise ProgramException(e, 'F001', functional_annotation_file) from e
+
+    # skip the header and get the offset, qseqid and sseqid of the data records
+    offset = len(functional_annotation_file_id.readline())
+    for record in functional_annotation_file_id:
+        data_list = record.split(b';', 2)
+        row_offset_list.append(offset)
+        qseqid_list.append(data_list[0].strip().decode('iso-8859-1'))
+        sseqid_list.append(data_list[1].strip().decode('iso-8859-1') if len(data_list) > 1 else '')
+        offset += len(record)
+
+    # close functional annotation file
+    functional_annotation_file_id.close()
+
+    # return the array dictionary
+    return build_functional_annotation_offset_dict([0, os.path.getsize(functional_annotation_file)], [0] * len(row_offset_list), row_offset_list, qseqid_list, sseqid_list)
+
+#-------------------------------------------------------------------------------
+
+class FunctionalAnnotationFileWriter():
+    '''
+    This class writes a functional annotation file (its head and the data records) and its offset
+    index. A compressed file is written as a sequence of gzip members (blocks) with a fixed number
+    of records, so a block can be uncompressed without reading the previous ones; any gzip reader
+    reads the whole file.
+    '''
+
+    #---------------
+
+    # set the number of data records per block in compressed files
+    BLOCK_RECORD_NUM = 10000
+
+    #---------------
+
+    def __init__(self, functional_annotation_file):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.functional_annotation_file = functional_annotation_file
+        self.is_compressed = functional_annotation_file.endswith('.gz')
+
+        # initialize the offset lists, the uncompressed records of the current block and its size
+        self.block_offset_list = [0]
+        self.row_block_list = []
+        self.row_offset_list = []
+        self.qseqid_list = []
+        self.sseqid_list = []
+        self.block_record_list = []
+        self.block_size = 0
+
+        # open the functional annotation file
+        try:
+            self.file_id = open(functional_annotation_file, mode='wb')
+        except Exception as e:
+            raise ProgramException(e, 'F004' if self.is_compressed else 'F003', functional_annotation_file) from e
+
+        # write the head
+        self.write_bytes(f'{get_functional_annotation_head()}\n'.encode('iso-8859-1'))
+
+    #---------------
+
+    def write_bytes(self, data):
+        '''
+        Write data in the current block.
+        '''
+
+        if self.is_compressed:
+            self.block_record_list.append(data)
+        else:
+            self.file_id.write(data)
+        self.block_size += len(data)
+
+    #---------------
+
+    def flush_block(self):
+        '''
+        Write the current block of a compressed file.
+        '''
+
+        if self.block_record_list != []:
+            self.file_id.write(gzip.compress(b''.join(self.block_record_list), compresslevel=6))
+            self.block_offset_list.append(self.file_id.tell())
+            self.block_record_list = []
+            self.block_size = 0
+
+    #---------------
+
+    def write(self, record):
+        '''
+        Write a data record (with its record separator).
+        '''
+
+        # save the qseqid, sseqid, block and offset of the record
+        data_list = record.split(';', 2)
+        self.qseqid_list.append(data_list[0].strip())
+        self.sseqid_list.append(data_list[1].strip() if len(data_list) > 1 else '')
+        self.row_block_list.append(len(self.block_offset_list) - 1)
+        self.row_offset_list.append(self.block_size)
+
+        # write the record
+        self.write_bytes(record.encode('iso-8859-1'))
+
+        # write the block when it is full
+        if self.is_compressed and len(self.block_record_list) >= self.BLOCK_RECORD_NUM:
+            self.flush_block()
+
+    #---------------
+
+    def close(self):
+        '''
+        Close the functional annotation file and save its offset index.
+        '''
+
+        # write the last block and close the file
+        try:
+            if self.is_compressed:
+                self.flush_block()
+            else:
+                self.block_offset_list.append(self.file_id.tell())
+            self.file_id.close()
+        except Exception as e:
+            raise ProgramException(e, 'F004' if self.is_compressed else 'F003', self.functional_annotation_file) from e
+
+        # save the offset index
+        offset_dict = build_functional_annotation_offset_dict(self.block_offset_list, self.row_block_list, self.row_offset_list, self.qseqid_list, self.sseqid_list)
+        (OK, error_list) = save_functional_annotation_offset_file(self.functional_annotation_file, offset_dict)
+        if not OK:
+            for error in error_list:
+                Message.print('error', error)
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class FunctionalAnnotationFileIndex():
+    '''
+    This class gives random access to the data records of a functional annotation file by row
+    number, qseqid or sseqid using its offset index, which is saved in a sidecar file and rebuilt
+    when it does not exist or the annotation file has changed. A record is read and parsed when
+    it is requested, and the last parsed records are cached.
+    '''
+
+    #---------------
+
+    # set the version of the offset index format
+    VERSION = 1
+
+    # set the maximum number of parsed records in the cache
+    CACHE_SIZE = 10000
+
+    #---------------
+
+    def __init__(self, functional_annotation_file, save_index=True):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.functional_annotation_file = functional_annotation_file
+        self.is_compressed = functional_annotation_file.endswith('.gz')
+
+        # initialize the cache of parsed records and the current uncompressed block
+        self.record_cache_dict = {}
+        self.block_num = None
+        self.block_content = None
+
+        # import NumPy
+        import numpy as np    # pylint: disable=import-outside-toplevel
+
+        # load the offset index when it corresponds to the current annotation file
+        source_signature = get_file_signature(functional_annotation_file)
+        offset_file = get_functional_annotation_offset_file(functional_annotation_file)
+        offset_dict = None
+        if os.path.isfile(offset_file):
+            try:
+                with np.load(offset_file, allow_pickle=False) as npz:
+                    if int(npz['version'][0]) == self.VERSION and tuple(npz['source_signature'].tolist()) == tuple(source_signature):
+                        offset_dict = {name: npz[name] for name in npz.files}
+            except Exception as e:
+                Message.print('verbose', f'The offset index {offset_file} can not be loaded: {e}\n')
+                offset_dict = None
+
+        # build the offset index and save it when there is not a valid saved index
+        if offset_dict is None:
+            offset_dict = scan_functional_annotation_offsets(functional_annotation_file)
+            if save_index:
+                (OK, error_list) = save_functional_annotation_offset_file(functional_annotation_file, offset_dict)
+                if not OK:
+                    for error in error_list:
+                        Message.print('verbose', f'{error}\n')
+
+        # save the arrays of the offset index
+        self.block_offset_array = offset_dict['block_offsets']
+        self.row_block_array = offset_dict['row_blocks']
+        self.row_offset_array = offset_dict['row_offsets']
+        self.qseqid_array = offset_dict['qseqids']
+        self.qseqid_ptr_array = offset_dict['qseqid_ptrs']
+        self.qseqid_row_array = offset_dict['qseqid_rows']
+        self.sseqid_array = offset_dict['sseqids']
+        self.sseqid_ptr_array = offset_dict['sseqid_ptrs']
+        self.sseqid_row_array = offset_dict['sseqid_rows']
+
+        # open the functional annotation file
+        try:
+            self.file_id = open(functional_annotation_file, mode='rb')
+        except Exception as e:
+            raise ProgramException(e, 'F001', functional_annotation_file) from e
+
+    #---------------
+
+    def __len__(self):
+        '''
+        Get the number of data records.
+        '''
+
+        return len(self.row_offset_array)
+
+    #---------------
+
+    def __getitem__(self, row):
+        '''
+        Get the functional annotation record of the data record in a row.
+        '''
+
+        # get the functional annotation record from the cache
+        functional_annotation_record = self.record_cache_dict.get(row)
+
+        # if it is not in the cache, read and parse the record
+        if functional_annotation_record is None:
+            record = self.read_record(int(self.row_block_array[row]), int(self.row_offset_array[row]))
+            functional_annotation_record = parse_functional_annotation_text(self.functional_annotation_file, record.decode('iso-8859-1'), row + 1)[0]
+            if len(self.record_cache_dict) >= self.CACHE_SIZE:
+                self.record_cache_dict = {}
+            self.record_cache_dict[row] = functional_annotation_record
+
+        # return the functional annotation record
+        return functional_annotation_record
+
+    #---------------
+
+    def read_record(self, block_num, offset):
+        '''
+        Read the record in an offset of a block.
+        '''
+
+        # read the record from a not compressed file
+        if not self.is_compressed:
+            self.file_id.seek(offset)
+            return self.file_id.readline()
+
+        # uncompress the block when it is not the current one
+        if block_num != self.block_num:
+            start = int(self.block_offset_array[block_num])
+            end = int(self.block_offset_array[block_num + 1])
+            self.file_id.seek(start)
+            try:
+                self.block_content = gzip.decompress(self.file_id.read(end - start))
+            except Exception as e:
+                raise ProgramException(e, 'F002', self.functional_annotation_file) from e
+            self.block_num = block_num
+
+        # get the record from the block
+        end = self.block_content.find(b'\n', offset)
+        return self.block_content[offset:] if end == -1 else self.block_content[offset:end + 1]
+
+    #---------------
+
+    @staticmethod
+    def get_row_list(seq_id_array, ptr_array, row_array, seq_id):
+        '''
+        Get the rows of an identification using the sorted identification array and its row pointers.
+        '''
+
+        i = int(seq_id_array.searchsorted(seq_id))
+        if i < len(seq_id_array) and seq_id_array[i] == seq_id:
+            return row_array[ptr_array[i]:ptr_array[i + 1]].tolist()
+        return []
+
+    #---------------
+
+    def get_qseqid_list(self):
+        '''
+        Get the sorted list of qseqid values.
+        '''
+
+        return self.qseqid_array.tolist()
+
+    #---------------
+
+    def get_qseqid_records(self, qseqid):
+        '''
+        Get the functional annotation record list of the records of a qseqid.
+        '''
+
+        return [self[row] for row in self.get_row_list(self.qseqid_array, self.qseqid_ptr_array, self.qseqid_row_array, qseqid)]
+
+    #---------------
+
+    def get_sseqid_records(self, sseqid):
+        '''
+        Get the functional annotation record list of the records of a sseqid.
+        '''
+
+        return [self[row] for row in self.get_row_list(self.sseqid_array, self.sseqid_ptr_array, self.sseqid_row_array, sseqid)]
+
+    #---------------
+
+    def get_records(self, start_row, end_row):
+        '''
+        Get the functional annotation record list of the records from a start row to an end row (not included).
+        '''
+
+        return [self[row] for row in range(max(start_row, 0), min(end_row, len(self)))]
+
+    #---------------
+
+    def close(self):
+        '''
+        Close the functional annotation file.
+        '''
+
+        if self.file_id is not None:
+            self.file_id.close()
+            self.file_id = None
+        self.block_content = None
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class FileTailReader():
+    '''
+    This class reads incrementally a text file that is being written (e. g. a log file): the first
+    read gets the last bytes of the file, and each next read only gets the bytes appended since
+    the previous read. When the file is truncated or replaced, it is read again from its last bytes.
+    '''
+
+    #---------------
+
+    def __init__(self, file_path, max_initial_size=None, encoding='utf-8'):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.file_path = file_path
+        self.max_initial_size = Const.TAIL_MAX_INITIAL_SIZE if max_initial_size is None else max_initial_size
+        self.encoding = encoding
+
+        # initialize the read state
+        self.reset()
+
+    #---------------
+
+    def reset(self):
+        '''
+        Reset the read state in order to read the file again from its last bytes.
+        '''
+
+        self.offset = None
+        self.file_ino = None
+        self.decoder = codecs.getincrementaldecoder(self.encoding)(errors='replace')
+
+    #---------------
+
+    def read_new_text(self):
+        '''
+        Read the text appended to the file since the previous read. It returns the text and
+        a flag indicating if the file has been read from the beginning of its last bytes (the
+        previous text has to be discarded). It raises OSError when the file can not be read.
+        '''
+
+        # get the size and the identification of the file
+        file_stat = os.stat(self.file_path)
+
+        # set the start offset: the last bytes of the file in the first read or when the file has been truncated or replaced
+        is_reset = False
+        if self.offset is None or file_stat.st_size < self.offset or file_stat.st_ino != self.file_ino:
+            self.reset()
+            self.file_ino = file_stat.st_ino
+            start = max(0, file_stat.st_size - self.max_initial_size)
+            is_reset = True
+        else:
+            start = self.offset
+
+        # return when there are not new bytes
+        if file_stat.st_size == start and not is_reset:
+            return '', False
+
+        # read the new bytes
+        with open(self.file_path, mode='rb') as file_id:
+            file_id.seek(start)
+            data = file_id.read(file_stat.st_size - start)
+        self.offset = start + len(data)
+
+        # discard the first line when it is incomplete
+        if is_reset and start > 0:
+            data = data[data.find(b'\n') + 1:] if b'\n' in data else b''
+
+        # return the decoded text
+        return self.decoder.decode(data), is_reset
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+def check_library(module_name, library_name):
+    '''
+    Check that a library is installed looking for the specification of its module, without
+    importing it.
+    '''
+
+    try:
+        module_spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        module_spec = None
+    if module_spec is None:
+        raise ProgramException('', 'S002', library_name)
+
+#-------------------------------------------------------------------------------
+
+def import_lazily(module_name):
+    '''
+    Import a module lazily: the module is registered, but its code is only executed when one of
+    its attributes is accessed for the first time.
+    '''
+
+    # return the module when it is already imported
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    # create the module with a lazy loader and register it
+    module_spec = importlib.util.find_spec(module_name)
+    if module_spec is None:
+        raise ModuleNotFoundError(f'No module named {module_name!r}', name=module_name)
+    module_spec.loader = importlib.util.LazyLoader(module_spec.loader)
+    module = importlib.util.module_from_spec(module_spec)
+    sys.modules[module_name] = module
+    module_spec.loader.exec_module(module)
+
+    # return the module
+    return module
+
+#-------------------------------------------------------------------------------
+
+#-------------------------------------------------------------------------------
+
+class Const():
+    '''
+    This class has attributes with values will be used as constants.
+    '''
+
+    #---------------
+
+    DEFAULT_ANNOTATION_RESULT_TYPE = 'complete'
+    DEFAULT_COMPRESS = 'N'
+    DEFAULT_EAGER = 'Y'
+    DEFAULT_FDR_METHOD = 'by'
+    DEFAULT_JOB_MEMORY = 4.0
+    DEFAULT_JOB_POLL_INTERVAL = 10
+    DEFAULT_MIN_SEQNUM_ANNOTATIONS = 5
+    DEFAULT_MIN_SEQNUM_SPECIES = 10
+    DEFAULT_MIN_SEQNUM_SUBSET = 2
+    DEFAULT_PARQUET = 'N'
+    DEFAULT_STATS_BENCHMARK_ROWS = 2000000
+    DEFAULT_STARTUP_BENCHMARK_RUNS = 5
+    DEFAULT_STARTUP_MAX_TIME = 2.0
+    DEFAULT_SUMMARY_REPORT_DPI = 600
+    DEFAULT_TRACE = 'N'
+    DEFAULT_VERBOSE = 'N'
+
+    #---------------
+
+    ANNOTATION_RECORD_MEMORY = 2048
+    BLASTPLUS_PROCESS_MEMORY = 1.0
+    BLASTPLUS_SHARD_THREADS = 4
+    DIAMOND_PROCESS_MEMORY = 12.0
+    DIAMOND_SHARD_THREADS = 16
+    ENRICHMENT_JOB_MEMORY = 2.0
+    JOB_BASE_MEMORY = 1.0
+    FIELD_EDGE_SPACE_PATTERN = re.compile(r' (?:(?<=[;\n] )|(?=[;\n]))')
+    WHITESPACE_CHAR_LIST = ['\t', '\r', '\x0b', '\x0c', '\x1c', '\x1d', '\x1e', '\x1f', '\x85', '\xa0']
+    PARSE_BATCH_RECORD_NUM = 10000
+    READ_BUFFER_SIZE = 4 * 1024 * 1024
+    TAIL_MAX_INITIAL_SIZE = 1024 * 1024
+
+   #---------------
+
+#-------------------------------------------------------------------------------
+
+class Message():
+    '''
+    This class controls the informative messages printed on the console.
+    '''
+
+    #---------------
+
+    verbose_status = False
+    trace_status = False
+
+    #---------------
+
+    @staticmethod
+    def set_verbose_status(status):
+        '''
+        Set the verbose status.
+        '''
+
+        Message.verbose_status = status
+
+    #---------------
+
+    @staticmethod
+    def set_trace_status(status):
+        '''
+        Set the trace status.
+        '''
+
+        Message.trace_status = status
+
+    #---------------
+
+    @staticmethod
+    def print(message_type, message_text):
+        '''
+        Print a message depending to its type.
+        '''
+
+        if message_type == 'info':
+            print(message_text, file=sys.stdout)
+            sys.stdout.flush()
         elif message_type == 'verbose' and Message.verbose_status:
             sys.stdout.write(message_text)
             sys.stdout.flush()
@@ -1619,6 +2603,107 @@ class Message():
 
 #-------------------------------------------------------------------------------
 
+class AppState():
+    '''
+    This class keeps the environment state of the application (configuration files, WSL
+    environment variables and directories checked) to avoid parsing and checking it every time a
+    menu item or a form is used. The configuration files are parsed again when their modification
+    time or size change, and all the state is rebuilt after a refresh, which is done when the
+    configuration is recreated and when a process run in a "DialogProcess" window finishes.
+    '''
+
+    #---------------
+
+    config_cache_dict = {}
+    wsl_envvar_dict = {}
+    existing_dir_set = set()
+
+    #---------------
+
+    @staticmethod
+    def get_config_dict(config_file):
+        '''
+        Get a copy of the dictionary with the options of a configuration file (it is only parsed
+        when it has been changed).
+        '''
+
+        # get the file signature
+        try:
+            signature = get_file_signature(config_file) if os.path.isfile(config_file) else None
+        except ProgramException:
+            signature = None
+
+        # parse the configuration file when it is not cached or it has been changed
+        cache_item = AppState.config_cache_dict.get(config_file)
+        if signature is None or cache_item is None or cache_item[0] != signature:
+            config_dict = get_config_dict(config_file)
+            if signature is None:
+                AppState.config_cache_dict.pop(config_file, None)
+            else:
+                AppState.config_cache_dict[config_file] = (signature, config_dict)
+        else:
+            config_dict = cache_item[1]
+
+        # return a copy of the configuration dictionary
+        return copy.deepcopy(config_dict)
+
+    #---------------
+
+    @staticmethod
+    def get_app_config_dict():
+        '''
+        Get a copy of the dictionary of application configuration.
+        '''
+
+        return AppState.get_config_dict(get_app_config_file())
+
+    #---------------
+
+    @staticmethod
+    def get_wsl_envvar(envvar):
+        '''
+        Get the value of a environment variable from WSL (WSL is run again only when the value
+        could not be got).
+        '''
+
+        if envvar not in AppState.wsl_envvar_dict:
+            envvar_value = get_wsl_envvar(envvar)
+            if envvar_value == get_na():
+                return envvar_value
+            AppState.wsl_envvar_dict[envvar] = envvar_value
+
+        return AppState.wsl_envvar_dict[envvar]
+
+    #---------------
+
+    @staticmethod
+    def is_dir(directory):
+        '''
+        Check if a directory exists (only the existing directories are saved, so a missing
+        directory is found when it is created).
+        '''
+
+        if directory not in AppState.existing_dir_set and os.path.isdir(directory):
+            AppState.existing_dir_set.add(directory)
+
+        return directory in AppState.existing_dir_set
+
+    #---------------
+
+    @staticmethod
+    def refresh():
+        '''
+        Clear the environment state in order to rebuild it.
+        '''
+
+        AppState.config_cache_dict = {}
+        AppState.wsl_envvar_dict = {}
+        AppState.existing_dir_set = set()
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
 class ProgramException(Exception):
     '''
     This class controls various exceptions that can occur in the execution of the application.
@@ -1662,6 +2747,12 @@ class ProgramException(Exception):
             Message.print('error', f'*** ERROR {code_exception}: The field {param1} is not found in the variant with identification {param2} and position {param3}.')
         elif code_exception == 'L003':
             Message.print('error', f'*** ERROR {code_exception}: The field {param1} has an invalid value in the variant with identification {param2} and position {param3}.')
+        elif code_exception == 'L004':
+            Message.print('error', f'*** ERROR {code_exception}: The enrichment analysis code {param1} is not valid.')
+        elif code_exception == 'L005':
+            Message.print('error', f'*** ERROR {code_exception}: The pipeline step {param1} depends on the step {param2}, which is not defined.')
+        elif code_exception == 'L006':
+            Message.print('error', f'*** ERROR {code_exception}: The dependencies of the pipeline steps {param1} are circular.')
         elif code_exception == 'S001':
             Message.print('error', f'*** ERROR {code_exception}: The {param1} OS is not supported.')
         elif code_exception == 'S002':
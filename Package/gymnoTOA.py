@@ -49,39 +49,22 @@ try:
 except Exception as e:
     raise genlib.ProgramException('', 'S002', 'PyQt5')
 
-try:
-    import matplotlib    # pylint: disable=unused-import
-except Exception as e:
-    raise genlib.ProgramException('', 'S002', 'Matplotlib')
-
-try:
-    import numpy    # pylint: disable=unused-import
-except Exception as e:
-    raise genlib.ProgramException('', 'S002', 'Numpy')
-
-try:
-    import pandas    # pylint: disable=unused-import
-except Exception as e:
-    raise genlib.ProgramException('', 'S002', 'Pandas')
-
-try:
-    import plotnine    # pylint: disable=unused-import
-except Exception as e:
-    raise genlib.ProgramException('', 'S002', 'Plotnine')
-
-try:
-    import scipy    # pylint: disable=unused-import
-except Exception as e:
-    raise genlib.ProgramException('', 'S002', 'SciPy')
-
-import annotation
-import bioinfosw
-import configuration
-import database
-import dialogs
-import enrichment
-import logs
-import stats
+# check the libraries used by the forms without importing them
+genlib.check_library('matplotlib', 'Matplotlib')
+genlib.check_library('numpy', 'Numpy')
+genlib.check_library('pandas', 'Pandas')
+genlib.check_library('plotnine', 'Plotnine')
+genlib.check_library('scipy', 'SciPy')
+
+# import the form modules lazily (each one is loaded when one of its forms is opened for the first time)
+annotation = genlib.import_lazily('annotation')
+bioinfosw = genlib.import_lazily('bioinfosw')
+configuration = genlib.import_lazily('configuration')
+database = genlib.import_lazily('database')
+dialogs = genlib.import_lazily('dialogs')
+enrichment = genlib.import_lazily('enrichment')
+logs = genlib.import_lazily('logs')
+stats = genlib.import_lazily('stats')
 
 #-------------------------------------------------------------------------------
 
@@ -259,6 +242,11 @@ class MainWindow(QMainWindow):
         action_restart_enrichment_analysis.setStatusTip('Restart an enrichment_analysis.')
         action_restart_enrichment_analysis.triggered.connect(self.action_restart_enrichment_analysis_clicked)
 
+        # create and configure "action_run_subset_enrichment_analysis"
+        action_run_subset_enrichment_analysis = QAction('Run subset analysis', self)
+        action_run_subset_enrichment_analysis.setStatusTip('Run an enrichment analysis of a sequence subset against the sequences of an annotation run.')
+        action_run_subset_enrichment_analysis.triggered.connect(self.action_run_subset_enrichment_analysis_clicked)
+
         # create and configure "action_browse_goea"
         action_browse_goea = QAction('GO enrichment analysis', self)
         action_browse_goea.setStatusTip('Browse GO enrichment analysis results.')
@@ -289,6 +277,16 @@ class MainWindow(QMainWindow):
         action_browse_result_logs.setStatusTip('Browse result logs.')
         action_browse_result_logs.triggered.connect(self.action_browse_result_logs_clicked)
 
+        # create and configure "action_monitor_runs"
+        action_monitor_runs = QAction('Monitor active runs', self)
+        action_monitor_runs.setStatusTip('Monitor the step, progress and throughput of the active runs.')
+        action_monitor_runs.triggered.connect(self.action_monitor_runs_clicked)
+
+        # create and configure "action_browse_job_queue"
+        action_browse_job_queue = QAction('Job queue', self)
+        action_browse_job_queue.setStatusTip('Browse the queued, running and ended jobs of the runs.')
+        action_browse_job_queue.triggered.connect(self.action_browse_job_queue_clicked)
+
         # create and configure "action_manual"
         action_manual = QAction('&Manual', self)
         action_manual.setShortcut('F1')
@@ -365,6 +363,7 @@ class MainWindow(QMainWindow):
         menu_enrichment_analysis.setCursor(QCursor(Qt.PointingHandCursor))
         menu_enrichment_analysis.addAction(action_run_enrichment_analysis)
         menu_enrichment_analysis.addAction(action_restart_enrichment_analysis)
+        menu_enrichment_analysis.addAction(action_run_subset_enrichment_analysis)
         menu_enrichment_analysis.addSeparator()
         submenu_enrichment_analysis_results = menu_enrichment_analysis.addMenu('Browse results')
         submenu_enrichment_analysis_results.addAction(action_browse_goea)
@@ -380,6 +379,10 @@ class MainWindow(QMainWindow):
         menu_logs.addAction(action_browse_submitting_logs)
         menu_logs.addSeparator()
         menu_logs.addAction(action_browse_result_logs)
+        menu_logs.addSeparator()
+        menu_logs.addAction(action_monitor_runs)
+        menu_logs.addSeparator()
+        menu_logs.addAction(action_browse_job_queue)
 
         # create and configure "menu_help"
         menu_help = menubar.addMenu('&Help')
@@ -1119,6 +1122,36 @@ class MainWindow(QMainWindow):
 
     #---------------
 
+    def action_run_subset_enrichment_analysis_clicked(self):
+        '''
+        Run an enrichment analysis of a sequence subset.
+        '''
+
+        # close the existing subwindow
+        if self.current_subwindow is not None:
+            self.current_subwindow.close()
+
+        # if dependencies are OK
+        if self.check_config_file() and self.check_gymnotoa_db():
+
+            # create a new subwindow to perform the action
+            subwindow = enrichment.FormRunSubsetEnrichmentAnalysis(self)
+
+            # create "widget_central"
+            widget_central = QWidget(self)
+
+            # create and configure "v_box_layout"
+            v_box_layout = QVBoxLayout(widget_central)
+            v_box_layout.addWidget(subwindow, alignment=Qt.AlignCenter)
+
+            # set the central widget in "MainWindow"
+            self.setCentralWidget(widget_central)
+
+            # save the current subwindow
+            self.current_subwindow = subwindow
+
+    #---------------
+
     def action_browse_goea_clicked(self):
         '''
         Browse results of a GO enrichment analysis.
@@ -1326,6 +1359,66 @@ class MainWindow(QMainWindow):
 
     #---------------
 
+    def action_monitor_runs_clicked(self):
+        '''
+        Monitor the active runs.
+        '''
+
+        # close the existing subwindow
+        if self.current_subwindow is not None:
+            self.current_subwindow.close()
+
+        # if dependencies are OK
+        if self.check_config_file():
+
+            # create a new subwindow to perform the action
+            subwindow = logs.FormMonitorRuns(self)
+
+            # create "widget_central"
+            widget_central = QWidget(self)
+
+            # create and configure "v_box_layout"
+            v_box_layout = QVBoxLayout(widget_central)
+            v_box_layout.addWidget(subwindow, alignment=Qt.AlignCenter)
+
+            # set the central widget in "MainWindow"
+            self.setCentralWidget(widget_central)
+
+            # save the current subwindow
+            self.current_subwindow = subwindow
+
+    #---------------
+
+    def action_browse_job_queue_clicked(self):
+        '''
+        Browse the job queue.
+        '''
+
+        # close the existing subwindow
+        if self.current_subwindow is not None:
+            self.current_subwindow.close()
+
+        # if dependencies are OK
+        if self.check_config_file():
+
+            # create a new subwindow to perform the action
+            subwindow = logs.FormBrowseJobQueue(self)
+
+            # create "widget_central"
+            widget_central = QWidget(self)
+
+            # create and configure "v_box_layout"
+            v_box_layout = QVBoxLayout(widget_central)
+            v_box_layout.addWidget(subwindow, alignment=Qt.AlignCenter)
+
+            # set the central widget in "MainWindow"
+            self.setCentralWidget(widget_central)
+
+            # save the current subwindow
+            self.current_subwindow = subwindow
+
+    #---------------
+
     def accion_manual_clicked(self):
         '''
         Open the help file.
@@ -1420,8 +1513,8 @@ class MainWindow(QMainWindow):
 
             # get the Miniforge3 bin directory
             miniforge3_bin_dir = ''
-            user = genlib.get_wsl_envvar('USER')
-            wsl_distro_name = genlib.get_wsl_envvar('WSL_DISTRO_NAME')
+            user = genlib.AppState.get_wsl_envvar('USER')
+            wsl_distro_name = genlib.AppState.get_wsl_envvar('WSL_DISTRO_NAME')
             if user == genlib.get_na() or wsl_distro_name == genlib.get_na():
                 OK = False
             else:
@@ -1429,7 +1522,7 @@ class MainWindow(QMainWindow):
 
             # check if the Miniforge3 bin directory exits
             if OK:
-                if not os.path.isdir(miniforge3_bin_dir):
+                if not genlib.AppState.is_dir(miniforge3_bin_dir):
 
                     # set control variable
                     OK = False
@@ -1463,8 +1556,8 @@ class MainWindow(QMainWindow):
 
             # get the gtImputatrion environment directory
             gymnotoa_env_dir = ''
-            user = genlib.get_wsl_envvar('USER')
-            wsl_distro_name = genlib.get_wsl_envvar('WSL_DISTRO_NAME')
+            user = genlib.AppState.get_wsl_envvar('USER')
+            wsl_distro_name = genlib.AppState.get_wsl_envvar('WSL_DISTRO_NAME')
             if user == genlib.get_na() or wsl_distro_name == genlib.get_na():
                 OK = False
             else:
@@ -1472,7 +1565,7 @@ class MainWindow(QMainWindow):
 
             # check if the gymnoTOA environment is installed directory exits
             if OK:
-                if not os.path.isdir(gymnotoa_env_dir):
+                if not genlib.AppState.is_dir(gymnotoa_env_dir):
 
                     # set control variable
                     OK = False
@@ -1502,7 +1595,7 @@ class MainWindow(QMainWindow):
         OK = True
 
         # get the dictionary of application configuration
-        app_config_dict = genlib.get_config_dict(genlib.get_app_config_file())
+        app_config_dict = genlib.AppState.get_app_config_dict()
 
         # get the database directory
         database_dir = app_config_dict['Environment parameters']['database_dir']
@@ -1510,7 +1603,7 @@ class MainWindow(QMainWindow):
             database_dir = genlib.wsl_path_2_windows_path(database_dir)
 
         # check if the gymnoTOA database exists
-        if not os.path.isdir(database_dir):
+        if not genlib.AppState.is_dir(database_dir):
 
             # set control variable
             OK = False
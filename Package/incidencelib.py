@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This source contains functions and classes related to the sequence x term incidence index
+of a functional annotation run used in gymnoTOA (Gymnosperms Taxonomy-oriented Annotation).
+The incidences of each enrichment analysis are kept as a sparse (CSR) term matrix of termlib.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import gzip
+import os
+import sys
+
+import numpy as np
+import scipy.stats as stats
+
+import columnlib
+import genlib
+import termlib
+
+#-------------------------------------------------------------------------------
+
+def build_incidence_index(annotation_file):
+    '''
+    Build the sequence x term incidence index of a functional annotation file.
+    '''
+
+    # initialize the incidence index builder
+    incidence_index_builder = IncidenceIndexBuilder()
+
+    # add the records of each sequence to the index (only the term columns are read when the file has a Parquet copy)
+    column_list = [column for term_column_list in termlib.get_term_column_dict().values() for column in term_column_list]
+    for seq_id, annotation_record_list in columnlib.read_functional_annotation_groups(annotation_file, column_list):
+        incidence_index_builder.add_sequence(seq_id, annotation_record_list)
+        genlib.Message.print('verbose', f'\rProcessed annotations: {incidence_index_builder.annotation_counter}')
+
+    genlib.Message.print('verbose', '\n')
+
+    # print summary
+    genlib.Message.print('info', f'{incidence_index_builder.annotation_counter} records read in annotation file.')
+
+    # return the incidence index
+    return incidence_index_builder.build()
+
+#-------------------------------------------------------------------------------
+
+def get_source_signature(annotation_file):
+    '''
+    Get the signature (modification time and size) of an annotation file used to validate its saved index.
+    '''
+
+    return genlib.get_file_signature(annotation_file)
+
+#-------------------------------------------------------------------------------
+
+def save_incidence_index(incidence_index, annotation_file):
+    '''
+    Save the incidence index of an annotation file and keep it in the cache.
+    '''
+
+    # get the source signature and the index directory
+    source_signature = get_source_signature(annotation_file)
+    index_dir = genlib.get_incidence_index_dir(annotation_file)
+
+    # save the index
+    (OK, error_list) = incidence_index.save(index_dir, source_signature)
+    if OK:
+        genlib.Message.print('info', f'The directory {index_dir} is created.')
+    else:
+        for error in error_list:
+            genlib.Message.print('error', error)
+
+    # save the index in the cache
+    IncidenceIndex.cache_dict[os.path.abspath(annotation_file)] = (source_signature, incidence_index)
+
+#-------------------------------------------------------------------------------
+
+def get_incidence_index(annotation_file, save_index=True):
+    '''
+    Get the sequence x term incidence index of a functional annotation file reusing the cached
+    or saved index while the annotation file does not change.
+    '''
+
+    # get the signature of the annotation file
+    source_signature = get_source_signature(annotation_file)
+
+    # return the index from the cache when the annotation file has not changed
+    cache_key = os.path.abspath(annotation_file)
+    cache_item = IncidenceIndex.cache_dict.get(cache_key)
+    if cache_item is not None and cache_item[0] == source_signature:
+        return cache_item[1]
+
+    # load the saved index when it corresponds to the current annotation file
+    incidence_index = None
+    index_dir = genlib.get_incidence_index_dir(annotation_file)
+    if os.path.isdir(index_dir):
+        incidence_index = IncidenceIndex.load(index_dir, source_signature)
+        if incidence_index is not None:
+            genlib.Message.print('verbose', f'The incidence index {index_dir} is reused.\n')
+
+    # build the index and save it when there is not a valid saved index
+    if incidence_index is None:
+        incidence_index = build_incidence_index(annotation_file)
+        if save_index:
+            save_incidence_index(incidence_index, annotation_file)
+
+    # save the index in the cache
+    IncidenceIndex.cache_dict[cache_key] = (source_signature, incidence_index)
+
+    # return the incidence index
+    return incidence_index
+
+#-------------------------------------------------------------------------------
+
+def read_seq_id_file(seq_id_file):
+    '''
+    Read a file with a sequence identification per line (only the first word of each line is considered).
+    '''
+
+    # initialize the sequence identification list
+    seq_id_list = []
+
+    # open the sequence identification file
+    if seq_id_file.endswith('.gz'):
+        try:
+            seq_id_file_id = gzip.open(seq_id_file, mode='rt', encoding='iso-8859-1')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F002', seq_id_file)
+    else:
+        try:
+            seq_id_file_id = open(seq_id_file, mode='r', encoding='iso-8859-1')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F001', seq_id_file)
+
+    # read the sequence identifications skipping empty and comment lines
+    for record in seq_id_file_id:
+        data_list = record.split()
+        if data_list != [] and not data_list[0].startswith('#'):
+            seq_id_list.append(data_list[0])
+
+    # close the sequence identification file
+    seq_id_file_id.close()
+
+    # return the sequence identification list without duplicates
+    return list(dict.fromkeys(seq_id_list))
+
+#-------------------------------------------------------------------------------
+
+def write_subset_enrichment_file(code, result_list, subset_seqs_wterms, universe_seqs_wterms, go_ontology_dict, min_seqnum_subset, enrichment_file):
+    '''
+    Write a subset enrichment analysis file.
+    '''
+
+    # open the enrichment analysis file
+    if enrichment_file.endswith('.gz'):
+        try:
+            enrichment_file_id = gzip.open(enrichment_file, mode='wt', encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F004', enrichment_file)
+    else:
+        try:
+            enrichment_file_id = open(enrichment_file, mode='w', encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F003', enrichment_file)
+
+    # write the header
+    if code == genlib.get_goea_code():
+        enrichment_file_id.write( '"GOterm";"Description";"Namespace";"Sequences# with this GOterm in subset";"Sequences# with GOterms in subset";"Sequences# with this GOterm in annotations";"Sequences# with GOterms in annotations";"Enrichment";"p-value";"FDR"\n')
+    elif code == genlib.get_mpea_code():
+        enrichment_file_id.write( '"Metacyc pathway";"Sequences# with this Metacyc pathway in subset";"Sequences# with Metacyc pathways in subset";"Sequences# with this Metacyc pathway in annotations";"Sequences# with Metacyc pathways in annotations";"Enrichment";"p-value";"FDR"\n')
+    elif code == genlib.get_koea_code():
+        enrichment_file_id.write( '"KEGG KO";"Sequences# with this KEGG KO in subset";"Sequences# with KEGG KOs in subset";"Sequences# with this KEGG KO in annotations";"Sequences# with KEGG KOs in annotations";"Enrichment";"p-value";"FDR"\n')
+    elif code == genlib.get_kpea_code():
+        enrichment_file_id.write( '"KEGG pathway";"Sequences# with this KEGG pathway in subset";"Sequences# with KEGG pathways in subset";"Sequences# with this KEGG pathway in annotations";"Sequences# with KEGG pathways in annotations";"Enrichment";"p-value";"FDR"\n')
+
+    # write data records
+    for result in result_list:
+        if result['subset_seqs_count'] >= min_seqnum_subset:
+            if code == genlib.get_goea_code():
+                description = go_ontology_dict.get(result['term_id'], {}).get('goterm_name', genlib.get_na())
+                namespace = go_ontology_dict.get(result['term_id'], {}).get('namespace', genlib.get_na())
+                enrichment_file_id.write(f'"{result["term_id"]}";"{description}";"{namespace}";{result["subset_seqs_count"]};{subset_seqs_wterms};{result["universe_seqs_count"]};{universe_seqs_wterms};{result["enrichment"]};{result["pvalue"]};{result["fdr"]}\n')
+            else:
+                enrichment_file_id.write(f'"{result["term_id"]}";{result["subset_seqs_count"]};{subset_seqs_wterms};{result["universe_seqs_count"]};{universe_seqs_wterms};{result["enrichment"]};{result["pvalue"]};{result["fdr"]}\n')
+
+    # close the enrichment analysis file
+    enrichment_file_id.close()
+
+    genlib.Message.print('info', f'The file {enrichment_file} is created.')
+
+#-------------------------------------------------------------------------------
+
+class IncidenceIndexBuilder():
+    '''
+    This class builds an incidence index adding the functional annotation records of each sequence.
+    '''
+
+    #---------------
+
+    def __init__(self):
+        '''
+        Create a class instance.
+        '''
+
+        # get the term column dictionary
+        self.term_column_dict = termlib.get_term_column_dict()
+
+        # initialize the annotation counter
+        self.annotation_counter = 0
+
+        # initialize the sequence identification list
+        self.seq_id_list = []
+
+        # initialize the term matrix builder of each enrichment analysis
+        self.term_matrix_builder_dict = {code: termlib.TermMatrixBuilder() for code in self.term_column_dict}
+
+    #---------------
+
+    def add_sequence(self, seq_id, annotation_record_list):
+        '''
+        Add the functional annotation records of a sequence.
+        '''
+
+        # add the sequence identification (its row number is its position)
+        self.seq_id_list.append(seq_id)
+
+        # add the record number
+        self.annotation_counter += len(annotation_record_list)
+
+        # add the term identifications of the sequence to the matrix of each enrichment analysis
+        # terms format: "term_id1|term_id2|...|term_idn"
+        for code, column_list in self.term_column_dict.items():
+            term_id_list = []
+            for annotation_record in annotation_record_list:
+                for column in column_list:
+                    if annotation_record[column] != '' and annotation_record[column] != '-':
+                        term_id_list.extend(annotation_record[column].split('|'))
+            self.term_matrix_builder_dict[code].add_row(term_id_list)
+
+    #---------------
+
+    def build(self):
+        '''
+        Build the incidence index.
+        '''
+
+        return IncidenceIndex(np.array(self.seq_id_list, dtype=str), {code: term_matrix_builder.build() for code, term_matrix_builder in self.term_matrix_builder_dict.items()})
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class IncidenceIndex():
+    '''
+    This class keeps the sequence x term incidences of a functional annotation file for each
+    enrichment analysis as a sparse term matrix (a row per sequence).
+    '''
+
+    #---------------
+
+    # format version of the saved index
+    VERSION = 2
+
+    # cache of indexes already loaded (absolute annotation file path -> (source signature, index))
+    cache_dict = {}
+
+    #---------------
+
+    def __init__(self, seq_id_array, term_matrix_dict):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.seq_id_array = seq_id_array
+        self.term_matrix_dict = term_matrix_dict
+
+        # build the dictionary to get the row number of a sequence identification
+        self.seq_row_dict = {seq_id: row for row, seq_id in enumerate(self.seq_id_array.tolist())}
+
+        # calculate the sequence count of each term and the count of sequences with terms in the universe
+        self.universe_count_array_dict = {}
+        self.universe_seqs_wterms_dict = {}
+        for code, term_matrix in self.term_matrix_dict.items():
+            (self.universe_count_array_dict[code], self.universe_seqs_wterms_dict[code]) = term_matrix.count_terms()
+
+    #---------------
+
+    def save(self, index_dir, source_signature):
+        '''
+        Save the index in a NumPy array directory.
+        '''
+
+        # build the array dictionary
+        array_dict = {}
+        array_dict['version'] = np.array([self.VERSION], dtype=np.int64)
+        array_dict['source_signature'] = np.array(source_signature, dtype=np.int64)
+        array_dict['seq_ids'] = self.seq_id_array
+        for code, term_matrix in self.term_matrix_dict.items():
+            array_dict.update(term_matrix.get_array_dict(code))
+
+        # save the arrays and return the control variable and error list
+        return termlib.save_array_dir(index_dir, array_dict)
+
+    #---------------
+
+    @staticmethod
+    def load(index_dir, source_signature=None):
+        '''
+        Load an index from a NumPy array directory (memory-mapped); return None when it is not valid for the source signature.
+        '''
+
+        # initialize the incidence index
+        incidence_index = None
+
+        # load the index arrays
+        try:
+            code_list = list(termlib.get_term_column_dict().keys())
+            name_list = ['version', 'source_signature', 'seq_ids'] + [name for code in code_list for name in termlib.TermMatrix.get_array_name_list(code)]
+            array_dict = termlib.load_array_dir(index_dir, name_list)
+            if termlib.is_array_dir_valid(array_dict, IncidenceIndex.VERSION, source_signature):
+                incidence_index = IncidenceIndex(array_dict['seq_ids'], {code: termlib.TermMatrix.from_array_dict(array_dict, code) for code in code_list})
+        except Exception as e:
+            genlib.Message.print('verbose', f'The incidence index {index_dir} can not be loaded: {e}\n')
+            incidence_index = None
+
+        # return the incidence index
+        return incidence_index
+
+    #---------------
+
+    def get_seq_count(self):
+        '''
+        Get the sequence count of the index.
+        '''
+
+        return len(self.seq_id_array)
+
+    #---------------
+
+    def get_annotation_term_dict(self, code):
+        '''
+        Get the dictionary of sequence count per term of an enrichment analysis (term identification -> sequence count)
+        and the count of sequences with terms, as built from the annotation file in calculate-enrichment-analysis.py.
+        '''
+
+        # build the annotation term dictionary
+        count_array = self.universe_count_array_dict[code]
+        term_num_array = np.flatnonzero(count_array)
+        annotation_term_dict = dict(zip(self.term_matrix_dict[code].term_id_array[term_num_array].tolist(), count_array[term_num_array].tolist()))
+
+        # return the annotation term dictionary and the count of sequences with terms
+        return annotation_term_dict, self.universe_seqs_wterms_dict[code]
+
+    #---------------
+
+    def calculate_subset_enrichment(self, code, seq_id_list, fdr_method):
+        '''
+        Calculate the enrichment of the terms of an enrichment analysis in a sequence subset
+        against the universe of the annotation sequences (one-sided hypergeometric test).
+        '''
+
+        # get the term matrix and the universe counts of the enrichment analysis
+        term_matrix = self.term_matrix_dict[code]
+        term_id_array = term_matrix.term_id_array
+        universe_count_array = self.universe_count_array_dict[code]
+        universe_seqs_wterms = self.universe_seqs_wterms_dict[code]
+
+        # get the row numbers of the subset sequences found in the annotations
+        subset_row_list = [self.seq_row_dict[seq_id] for seq_id in seq_id_list if seq_id in self.seq_row_dict]
+
+        # build the mask of subset sequences
+        subset_mask = np.zeros(len(self.seq_id_array), dtype=bool)
+        subset_mask[subset_row_list] = True
+
+        # calculate the sequence count of each term and the count of sequences with terms in the subset
+        (subset_count_array, subset_seqs_wterms) = term_matrix.count_terms(subset_mask)
+
+        # initialize the result list
+        result_list = []
+
+        # get the term numbers with sequences in the subset
+        term_num_array = np.flatnonzero(subset_count_array)
+
+        # perform calculations when there are terms in the subset
+        if term_num_array.size > 0:
+
+            # get the counts of the terms with sequences in the subset
+            k = subset_count_array[term_num_array]
+            K = universe_count_array[term_num_array]
+
+            # calculate the enrichment
+            enrichment_array = (k / subset_seqs_wterms) / (K / universe_seqs_wterms)
+
+            # calculate the p-values
+            pvalue_array = stats.hypergeom.sf(k - 1, universe_seqs_wterms, K, subset_seqs_wterms)
+            pvalue_array = np.clip(pvalue_array, 0.0, 1.0)
+
+            # calculate the FDR values
+            fdr_array = stats.false_discovery_control(pvalue_array, method=fdr_method)
+
+            # sort terms by FDR and p-value
+            order_array = np.lexsort((pvalue_array, fdr_array))
+
+            # build the result list
+            for i in order_array.tolist():
+                result_list.append({'term_id': str(term_id_array[term_num_array[i]]), 'subset_seqs_count': int(k[i]), 'universe_seqs_count': int(K[i]), 'enrichment': float(enrichment_array[i]), 'pvalue': float(pvalue_array[i]), 'fdr': float(fdr_array[i])})
+
+        # return the result list, the subset sequences found in annotations and the count of sequences with terms in the subset and universe
+        return result_list, len(subset_row_list), subset_seqs_wterms, universe_seqs_wterms
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    print(f'This source contains functions and classes related to the sequence x term incidence index used in {genlib.get_app_long_name()}.')
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
@@ -30,8 +30,10 @@ import os
 import re
 import subprocess
 import sys
+import time
 
 from PyQt5.QtCore import Qt                      # pylint: disable=no-name-in-module
+from PyQt5.QtCore import QTimer                  # pylint: disable=no-name-in-module
 from PyQt5.QtGui import QCursor                  # pylint: disable=no-name-in-module
 from PyQt5.QtGui import QFontMetrics             # pylint: disable=no-name-in-module
 from PyQt5.QtGui import QGuiApplication          # pylint: disable=no-name-in-module
@@ -51,6 +53,9 @@ from PyQt5.QtWidgets import QWidget              # pylint: disable=no-name-in-mo
 
 import dialogs
 import genlib
+import monitorlib
+import queuelib
+import registrylib
 
 #-------------------------------------------------------------------------------
 
@@ -460,7 +465,7 @@ class FormBrowseResultLogs(QWidget):
         self.title = f'{genlib.get_app_short_name()} - {self.head}'
 
         # get the dictionary of application configuration
-        self.app_config_dict = genlib.get_config_dict(genlib.get_app_config_file())
+        self.app_config_dict = genlib.AppState.get_app_config_dict()
 
         # build the graphic user interface of the window
         self.build_gui()
@@ -782,75 +787,12 @@ class FormBrowseResultLogs(QWidget):
         # get the result directory
         result_dir = self.app_config_dict['Environment parameters']['result_dir']
 
-        # set the type, name and code of the annotation pipeline datasets
+        # set the type and name of the annotation pipeline datasets
         process_type = self.combobox_process_type.currentText()
         process_name = self.combobox_process.currentText()
-        process_code = genlib.get_process_id(process_name)
 
-        # get the process dictionary
-        process_dict = genlib.get_process_dict()
-
-        # get the log directory
-        log_dir = f'{result_dir}/{process_type}'
-        if sys.platform.startswith('win32'):
-            log_dir = genlib.wsl_path_2_windows_path(log_dir)
-
-        # set the command to get the result datasets of annotation pipeline in the log directory
-        command = ''
-        if sys.platform.startswith('linux') or sys.platform.startswith('darwin'):
-            if process_name == 'all':
-                command = f'ls -d {log_dir}/*  | xargs -n 1 basename'
-            else:
-                command = f'ls -d {log_dir}/{process_code}-*  | xargs -n 1 basename'
-        elif sys.platform.startswith('win32'):
-            log_dir = log_dir.replace('/', '\\')
-            if process_name == 'all':
-                command = f'dir /a:d /b {log_dir}\\*'
-            else:
-                command = f'dir /a:d /b {log_dir}\\{process_code}-*'
-
-        # run the command to get the result datasets of enrichment analysis in the log directory
-        output = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=False)
-
-        # initialize the result dataset dictionary
-        result_dataset_dict = {}
-
-        # build the result dataset dictionary
-        for line in output.stdout.split('\n'):
-            if line != '':
-
-                # get data
-                result_dataset_id = line.strip()
-                try:
-                    pattern = r'^(.+)\-(.+)\-(.+)$'
-                    mo = re.search(pattern, result_dataset_id)
-                    process_code = mo.group(1).strip()
-                    process_name = process_dict[process_code]['name']
-                    yymmdd = mo.group(2)
-                    hhmmss = mo.group(3)
-                    date = f'20{yymmdd[:2]}-{yymmdd[2:4]}-{yymmdd[4:]}'
-                    time = f'{hhmmss[:2]}:{hhmmss[2:4]}:{hhmmss[4:]}'
-                except:    # pylint: disable=bare-except
-                    process_name = 'unknown process'
-                    date = '0000-00-00'
-                    time = '00:00:00'
-
-                # determine the status
-                status_ok = os.path.isfile(genlib.get_status_ok(os.path.join(log_dir, result_dataset_id)))
-                status_wrong = os.path.isfile(genlib.get_status_wrong(os.path.join(log_dir, result_dataset_id)))
-                status = ''
-                if status_ok and not status_wrong:
-                    status = 'OK'
-                elif not status_ok and status_wrong:
-                    status = 'wrong'
-                elif not status_ok and not status_wrong:
-                    status = 'not finished'
-                elif status_ok and status_wrong:
-                    status = 'undetermined'
-
-                # insert data in the dictionary
-                key = f'{process_name}-{result_dataset_id}'
-                result_dataset_dict[key] = {'process': process_name, 'result_dataset_id': result_dataset_id, 'date': date, 'time': time, 'status': status}
+        # get the result datasets from the run registry
+        result_dataset_dict = registrylib.get_result_dataset_dict(result_dir, process_type, process_name)
 
         # initialize "tablewidget"
         self.tablewidget.clearContents()
@@ -887,15 +829,514 @@ class FormBrowseResultLogs(QWidget):
         if sys.platform.startswith('win32'):
             file_path = genlib.wsl_path_2_windows_path(file_path)
 
-        # create and execute "DialogFileBrowser"
+        # create and execute "DialogFileBrowser" following the log content (the run may not be ended)
         head = f'Browse .../{self.combobox_process_type.currentText()}/{result_dataset}/{genlib.get_run_log_file()}'
-        file_browser = dialogs.DialogFileBrowser(self, head, file_path)
+        file_browser = dialogs.DialogFileBrowser(self, head, file_path, follow=True)
         file_browser.exec()
 
     #---------------
 
 #-------------------------------------------------------------------------------
 
+class FormMonitorRuns(QWidget):
+    '''
+    Class used to monitor the active runs.
+    '''
+
+    #---------------
+
+    # set the update intervals (in milliseconds) when there are active runs and when there are not
+    ACTIVE_INTERVAL = 2000
+    IDLE_INTERVAL = 15000
+
+    #---------------
+
+    def __init__(self, parent):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.parent = parent
+
+        # call the init method of the parent class
+        super().__init__()
+
+        # set the dimensions window
+        self.window_height = self.parent.WINDOW_HEIGHT - 100
+        self.window_width = self.parent.WINDOW_WIDTH - 50
+
+        # set the head and title
+        self.head = 'Monitor active runs'
+        self.title = f'{genlib.get_app_short_name()} - {self.head}'
+
+        # get the dictionary of application configuration
+        self.app_config_dict = genlib.AppState.get_app_config_dict()
+
+        # create the monitor of the active runs
+        self.run_monitor_set = monitorlib.RunMonitorSet(self.app_config_dict['Environment parameters']['result_dir'])
+
+        # build the graphic user interface of the window
+        self.build_gui()
+
+        # create the timer that updates the monitor
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.update_monitor)
+
+        # load initial data in inputs
+        self.initialize_inputs()
+
+        # show the window
+        self.show()
+
+    #---------------
+
+    def build_gui(self):
+        '''
+        Build the graphic user interface of the window.
+        '''
+
+        # set the width and height of the window
+        self.setFixedSize(self.window_width, self.window_height)
+
+        # move the window at center
+        rectangle = self.frameGeometry()
+        central_point = QGuiApplication.primaryScreen().availableGeometry().center()
+        rectangle.moveCenter(central_point)
+        self.move(rectangle.topLeft())
+
+        # create and configure "label_head"
+        label_head = QLabel(self.head, alignment=Qt.AlignCenter)
+        label_head.setStyleSheet('font: bold 14px; color: black; background-color: lightGray; max-height: 30px')
+
+        # create and configure "tablewidget"
+        self.tablewidget = QTableWidget()
+        self.tablewidget.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tablewidget.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.column_name_list = ['Result dataset', 'Status', 'Step', 'Progress', 'Throughput', 'ETA']
+        self.tablewidget.setColumnCount(len(self.column_name_list))
+        self.tablewidget.setHorizontalHeaderLabels(self.column_name_list)
+        self.tablewidget.setColumnWidth(0, 260)
+        self.tablewidget.setColumnWidth(1, 90)
+        self.tablewidget.setColumnWidth(2, 330)
+        self.tablewidget.setColumnWidth(3, 220)
+        self.tablewidget.setColumnWidth(4, 130)
+        self.tablewidget.setColumnWidth(5, 80)
+        self.tablewidget.verticalHeader().setVisible(True)
+        self.tablewidget.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.tablewidget.setSelectionBehavior(QAbstractItemView.SelectRows)
+
+        # create and configure "label_monitor"
+        self.label_monitor = QLabel()
+
+        # create and configure "gridlayout_data"
+        gridlayout_data = QGridLayout()
+        gridlayout_data.addWidget(self.tablewidget, 0, 0)
+        gridlayout_data.addWidget(self.label_monitor, 1, 0)
+
+        # create and configure "groupbox_data"
+        groupbox_data = QGroupBox()
+        groupbox_data.setObjectName('groupbox_data')
+        groupbox_data.setStyleSheet('QGroupBox#groupbox_data {border: 0px;}')
+        groupbox_data.setLayout(gridlayout_data)
+
+        # create and configure "pushbutton_refresh"
+        self.pushbutton_refresh = QPushButton('Refresh')
+        self.pushbutton_refresh.setToolTip('Update the monitor now.')
+        self.pushbutton_refresh.setCursor(QCursor(Qt.PointingHandCursor))
+        self.pushbutton_refresh.clicked.connect(self.pushbutton_refresh_clicked)
+
+        # create and configure "pushbutton_close"
+        pushbutton_close = QPushButton('Close')
+        pushbutton_close.setToolTip('Close the window.')
+        pushbutton_close.setCursor(QCursor(Qt.PointingHandCursor))
+        pushbutton_close.clicked.connect(self.pushbutton_close_clicked)
+
+        # create and configure "gridlayout_buttons"
+        gridlayout_buttons = QGridLayout()
+        gridlayout_buttons.setColumnStretch(0, 15)
+        gridlayout_buttons.setColumnStretch(1, 1)
+        gridlayout_buttons.setColumnStretch(2, 1)
+        gridlayout_buttons.addWidget(self.pushbutton_refresh, 0, 1, alignment=Qt.AlignCenter)
+        gridlayout_buttons.addWidget(pushbutton_close, 0, 2, alignment=Qt.AlignCenter)
+
+        # create and configure "groupbox_buttons"
+        groupbox_buttons = QGroupBox()
+        groupbox_buttons.setObjectName('groupbox_buttons')
+        groupbox_buttons.setStyleSheet('QGroupBox#groupbox_buttons {border: 0px;}')
+        groupbox_buttons.setLayout(gridlayout_buttons)
+
+        # create and configure "gridlayout_central"
+        gridlayout_central = QGridLayout()
+        gridlayout_central.setRowStretch(0, 1)
+        gridlayout_central.setRowStretch(1, 1)
+        gridlayout_central.setRowStretch(2, 10)
+        gridlayout_central.setRowStretch(3, 1)
+        gridlayout_central.setColumnStretch(0, 1)
+        gridlayout_central.addWidget(label_head, 0, 0)
+        gridlayout_central.addWidget(QLabel(), 1, 0)
+        gridlayout_central.addWidget(groupbox_data, 2, 0)
+        gridlayout_central.addWidget(groupbox_buttons, 3, 0)
+
+        # create and configure "groupbox_central"
+        groupbox_central = QGroupBox()
+        groupbox_central.setLayout(gridlayout_central)
+
+        # create and configure "vboxlayout"
+        vboxlayout = QVBoxLayout(self)
+        vboxlayout.addWidget(groupbox_central)
+
+    #---------------
+
+    def initialize_inputs(self):
+        '''
+        Load initial data in inputs.
+        '''
+
+        # update the monitor and start the timer
+        self.update_monitor()
+
+    #---------------
+
+    def pushbutton_refresh_clicked(self):
+        '''
+        Update the monitor now.
+        '''
+
+        self.update_monitor()
+
+    #---------------
+
+    def pushbutton_close_clicked(self):
+        '''
+        Close the window.
+        '''
+
+        self.timer.stop()
+        self.parent.current_subwindow = None
+        self.close()
+        self.parent.set_background_image()
+
+    #---------------
+
+    def closeEvent(self, event):
+        '''
+        Stop the timer when the window is closed.
+        '''
+
+        self.timer.stop()
+        event.accept()
+
+    #---------------
+
+    def update_monitor(self):
+        '''
+        Update the monitor of the runs, load its data in "tablewidget" and set the next update
+        (the interval is longer when there are not active runs).
+        '''
+
+        # update the monitor of the runs
+        active_run_counter = self.run_monitor_set.update()
+
+        # load data in "tablewidget"
+        data_list = self.run_monitor_set.get_data_list()
+        self.tablewidget.setRowCount(len(data_list))
+        for row, data_dict in enumerate(data_list):
+            self.tablewidget.setItem(row, 0, QTableWidgetItem(data_dict['result_dataset_id']))
+            self.tablewidget.setItem(row, 1, QTableWidgetItem(data_dict['status']))
+            self.tablewidget.setItem(row, 2, QTableWidgetItem(data_dict['step']))
+            self.tablewidget.setItem(row, 3, QTableWidgetItem(data_dict['progress']))
+            self.tablewidget.setItem(row, 4, QTableWidgetItem(data_dict['rate']))
+            self.tablewidget.setItem(row, 5, QTableWidgetItem(data_dict['eta']))
+
+        # set the monitor message and the next update
+        if active_run_counter > 0:
+            self.label_monitor.setText(f'{active_run_counter} active run(s). Updated every {self.ACTIVE_INTERVAL // 1000} s.')
+            self.timer.start(self.ACTIVE_INTERVAL)
+        else:
+            self.label_monitor.setText(f'There are no active runs. Checked every {self.IDLE_INTERVAL // 1000} s.')
+            self.timer.start(self.IDLE_INTERVAL)
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class FormBrowseJobQueue(QWidget):
+    '''
+    Class used to browse the job queue.
+    '''
+
+    #---------------
+
+    # set the update interval (in milliseconds)
+    UPDATE_INTERVAL = 5000
+
+    #---------------
+
+    def __init__(self, parent):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.parent = parent
+
+        # call the init method of the parent class
+        super().__init__()
+
+        # set the dimensions window
+        self.window_height = self.parent.WINDOW_HEIGHT - 100
+        self.window_width = self.parent.WINDOW_WIDTH - 50
+
+        # set the head and title
+        self.head = 'Browse job queue'
+        self.title = f'{genlib.get_app_short_name()} - {self.head}'
+
+        # get the dictionary of application configuration
+        self.app_config_dict = genlib.AppState.get_app_config_dict()
+
+        # get the result directory
+        self.result_dir = self.app_config_dict['Environment parameters']['result_dir']
+
+        # initialize the job list loaded in "tablewidget"
+        self.job_list = []
+
+        # build the graphic user interface of the window
+        self.build_gui()
+
+        # create the timer that updates the job data
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.update_job_queue)
+
+        # load initial data in inputs
+        self.initialize_inputs()
+
+        # show the window
+        self.show()
+
+    #---------------
+
+    def build_gui(self):
+        '''
+        Build the graphic user interface of the window.
+        '''
+
+        # set the width and height of the window
+        self.setFixedSize(self.window_width, self.window_height)
+
+        # move the window at center
+        rectangle = self.frameGeometry()
+        central_point = QGuiApplication.primaryScreen().availableGeometry().center()
+        rectangle.moveCenter(central_point)
+        self.move(rectangle.topLeft())
+
+        # create and configure "label_head"
+        label_head = QLabel(self.head, alignment=Qt.AlignCenter)
+        label_head.setStyleSheet('font: bold 14px; color: black; background-color: lightGray; max-height: 30px')
+
+        # create and configure "tablewidget"
+        self.tablewidget = QTableWidget()
+        self.tablewidget.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tablewidget.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.column_name_list = ['Job', 'Result dataset', 'Process', 'Threads', 'Memory (GB)', 'Status', 'Submitted', 'Wait time', 'Run time']
+        self.tablewidget.setColumnCount(len(self.column_name_list))
+        self.tablewidget.setHorizontalHeaderLabels(self.column_name_list)
+        self.tablewidget.setColumnWidth(0, 50)
+        self.tablewidget.setColumnWidth(1, 190)
+        self.tablewidget.setColumnWidth(2, 220)
+        self.tablewidget.setColumnWidth(3, 60)
+        self.tablewidget.setColumnWidth(4, 90)
+        self.tablewidget.setColumnWidth(5, 80)
+        self.tablewidget.setColumnWidth(6, 140)
+        self.tablewidget.setColumnWidth(7, 80)
+        self.tablewidget.setColumnWidth(8, 80)
+        self.tablewidget.verticalHeader().setVisible(False)
+        self.tablewidget.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.tablewidget.setSelectionBehavior(QAbstractItemView.SelectRows)
+
+        # create and configure "label_queue"
+        self.label_queue = QLabel()
+
+        # create and configure "gridlayout_data"
+        gridlayout_data = QGridLayout()
+        gridlayout_data.addWidget(self.tablewidget, 0, 0)
+        gridlayout_data.addWidget(self.label_queue, 1, 0)
+
+        # create and configure "groupbox_data"
+        groupbox_data = QGroupBox()
+        groupbox_data.setObjectName('groupbox_data')
+        groupbox_data.setStyleSheet('QGroupBox#groupbox_data {border: 0px;}')
+        groupbox_data.setLayout(gridlayout_data)
+
+        # create and configure "pushbutton_cancel"
+        pushbutton_cancel = QPushButton('Cancel job')
+        pushbutton_cancel.setToolTip('Cancel the selected queued job.')
+        pushbutton_cancel.setCursor(QCursor(Qt.PointingHandCursor))
+        pushbutton_cancel.clicked.connect(self.pushbutton_cancel_clicked)
+
+        # create and configure "pushbutton_refresh"
+        pushbutton_refresh = QPushButton('Refresh')
+        pushbutton_refresh.setToolTip('Update the job data now.')
+        pushbutton_refresh.setCursor(QCursor(Qt.PointingHandCursor))
+        pushbutton_refresh.clicked.connect(self.pushbutton_refresh_clicked)
+
+        # create and configure "pushbutton_close"
+        pushbutton_close = QPushButton('Close')
+        pushbutton_close.setToolTip('Close the window.')
+        pushbutton_close.setCursor(QCursor(Qt.PointingHandCursor))
+        pushbutton_close.clicked.connect(self.pushbutton_close_clicked)
+
+        # create and configure "gridlayout_buttons"
+        gridlayout_buttons = QGridLayout()
+        gridlayout_buttons.setColumnStretch(0, 15)
+        gridlayout_buttons.setColumnStretch(1, 1)
+        gridlayout_buttons.setColumnStretch(2, 1)
+        gridlayout_buttons.setColumnStretch(3, 1)
+        gridlayout_buttons.addWidget(pushbutton_cancel, 0, 1, alignment=Qt.AlignCenter)
+        gridlayout_buttons.addWidget(pushbutton_refresh, 0, 2, alignment=Qt.AlignCenter)
+        gridlayout_buttons.addWidget(pushbutton_close, 0, 3, alignment=Qt.AlignCenter)
+
+        # create and configure "groupbox_buttons"
+        groupbox_buttons = QGroupBox()
+        groupbox_buttons.setObjectName('groupbox_buttons')
+        groupbox_buttons.setStyleSheet('QGroupBox#groupbox_buttons {border: 0px;}')
+        groupbox_buttons.setLayout(gridlayout_buttons)
+
+        # create and configure "gridlayout_central"
+        gridlayout_central = QGridLayout()
+        gridlayout_central.setRowStretch(0, 1)
+        gridlayout_central.setRowStretch(1, 1)
+        gridlayout_central.setRowStretch(2, 10)
+        gridlayout_central.setRowStretch(3, 1)
+        gridlayout_central.setColumnStretch(0, 1)
+        gridlayout_central.addWidget(label_head, 0, 0)
+        gridlayout_central.addWidget(QLabel(), 1, 0)
+        gridlayout_central.addWidget(groupbox_data, 2, 0)
+        gridlayout_central.addWidget(groupbox_buttons, 3, 0)
+
+        # create and configure "groupbox_central"
+        groupbox_central = QGroupBox()
+        groupbox_central.setLayout(gridlayout_central)
+
+        # create and configure "vboxlayout"
+        vboxlayout = QVBoxLayout(self)
+        vboxlayout.addWidget(groupbox_central)
+
+    #---------------
+
+    def initialize_inputs(self):
+        '''
+        Load initial data in inputs.
+        '''
+
+        # update the job data and start the timer
+        self.update_job_queue()
+
+    #---------------
+
+    def pushbutton_cancel_clicked(self):
+        '''
+        Cancel the selected queued job.
+        '''
+
+        # get the selected job
+        row_list = list({idx.row() for idx in self.tablewidget.selectionModel().selectedIndexes()})
+        if len(row_list) != 1 or self.job_list[row_list[0]]['status'] != queuelib.JobQueue.QUEUED_STATUS:
+            text = 'One queued job has to be selected.'
+            QMessageBox.critical(self, self.title, text, buttons=QMessageBox.Ok)
+            return
+        job_dict = self.job_list[row_list[0]]
+
+        # confirm the job is cancelled
+        text = f'The job {job_dict["job_number"]} of the run {job_dict["result_dataset_id"]} is going to be cancelled.\n\nAre you sure to continue?'
+        botton = QMessageBox.question(self, self.title, text, buttons=QMessageBox.Yes|QMessageBox.No, defaultButton=QMessageBox.No)
+        if botton == QMessageBox.No:
+            return
+
+        # cancel the job (its run ends as wrong)
+        job_queue = queuelib.JobQueue(self.result_dir)
+        OK = job_queue.cancel_job(job_dict['job_number'])
+        job_queue.close()
+        if not OK:
+            text = f'The job {job_dict["job_number"]} is not queued any more.'
+            QMessageBox.critical(self, self.title, text, buttons=QMessageBox.Ok)
+
+        # update the job data
+        self.update_job_queue()
+
+    #---------------
+
+    def pushbutton_refresh_clicked(self):
+        '''
+        Update the job data now.
+        '''
+
+        self.update_job_queue()
+
+    #---------------
+
+    def pushbutton_close_clicked(self):
+        '''
+        Close the window.
+        '''
+
+        self.timer.stop()
+        self.parent.current_subwindow = None
+        self.close()
+        self.parent.set_background_image()
+
+    #---------------
+
+    def closeEvent(self, event):
+        '''
+        Stop the timer when the window is closed.
+        '''
+
+        self.timer.stop()
+        event.accept()
+
+    #---------------
+
+    def update_job_queue(self):
+        '''
+        Update the data of the queued, running and ended jobs, load it in "tablewidget" and set
+        the next update.
+        '''
+
+        # get the job data
+        try:
+            job_queue = queuelib.JobQueue(self.result_dir)
+            self.job_list = job_queue.get_job_list()
+            (queued_job_counter, running_job_counter, reserved_threads, reserved_memory) = job_queue.get_queue_data()
+            job_queue.close()
+        except Exception as e:
+            self.job_list = []
+            self.label_queue.setText(f'The job queue can not be read: {e}')
+            self.tablewidget.setRowCount(0)
+            self.timer.start(self.UPDATE_INTERVAL)
+            return
+
+        # load data in "tablewidget"
+        self.tablewidget.setRowCount(len(self.job_list))
+        for row, job_dict in enumerate(self.job_list):
+            self.tablewidget.setItem(row, 0, QTableWidgetItem(str(job_dict['job_number'])))
+            self.tablewidget.setItem(row, 1, QTableWidgetItem(job_dict['result_dataset_id']))
+            self.tablewidget.setItem(row, 2, QTableWidgetItem(job_dict['process_name']))
+            self.tablewidget.setItem(row, 3, QTableWidgetItem(str(job_dict['threads'])))
+            self.tablewidget.setItem(row, 4, QTableWidgetItem(f'{job_dict["memory"]:.1f}'))
+            self.tablewidget.setItem(row, 5, QTableWidgetItem(job_dict['status']))
+            self.tablewidget.setItem(row, 6, QTableWidgetItem(time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(job_dict['submit_time']))))
+            self.tablewidget.setItem(row, 7, QTableWidgetItem(monitorlib.format_duration(job_dict['wait_time'])))
+            self.tablewidget.setItem(row, 8, QTableWidgetItem(monitorlib.format_duration(job_dict['run_time'])))
+
+        # set the queue message and the next update
+        self.label_queue.setText(f'{queued_job_counter} queued job(s) and {running_job_counter} running job(s) using {reserved_threads} thread(s) and {reserved_memory:.1f} GB. Updated every {self.UPDATE_INTERVAL // 1000} s.')
+        self.timer.start(self.UPDATE_INTERVAL)
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
 if __name__ == '__main__':
     print(f'This file contains the classes related to logs used in {genlib.get_app_long_name()}')
     sys.exit(0)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This program merges the functional annotation statistics accumulators calculated from several
+shards or chunks of an annotation run and builds the statistics files.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import argparse
+import os
+import sys
+
+import genlib
+import sqllib
+import statslib
+
+#-------------------------------------------------------------------------------
+
+def main():
+    '''
+    Main line of the program.
+    '''
+
+    # check the operating system
+    genlib.check_os()
+
+    # get and check the arguments
+    parser = build_parser()
+    args = parser.parse_args()
+    check_args(args)
+
+    # connect to the SQLite database
+    conn = sqllib.connect_database(args.sqlite_database)
+
+    # merge functional annotation statistics
+    merge_functional_stats(conn, args.accumulator_files, args.output_dir)
+
+#-------------------------------------------------------------------------------
+
+def build_parser():
+    '''
+    Build the parser with the available arguments.
+    '''
+
+    # create the parser and add arguments
+    description = 'Description: This program merges the functional annotation statistics accumulators calculated from several\n' \
+                  'shards or chunks of an annotation run and builds the statistics files.'
+    text = f'{genlib.get_app_short_name()} v{genlib.get_app_version()} - {os.path.basename(__file__)}\n\n{description}\n'
+    usage = f'\r{text.ljust(len("usage:"))}\nUsage: {os.path.basename(__file__)} arguments'
+    parser = argparse.ArgumentParser(usage=usage)
+    parser._optionals.title = 'Arguments'    #pylint: disable=protected-access
+    parser.add_argument('--db', dest='sqlite_database', help='Path of the SQLite database (mandatory).')
+    parser.add_argument('--accumulators', dest='accumulator_files', help=f'Comma-separated list of paths of the statistics accumulator files ({genlib.get_stats_accumulator_file_name()}) to merge (mandatory).')
+    parser.add_argument('--outdir', dest='output_dir', help='Path of the directory to save statistics files (mandatory).')
+    parser.add_argument('--verbose', dest='verbose', help=f'Additional job status info during the run: {genlib.get_verbose_code_list_text()}; default: {genlib.Const.DEFAULT_VERBOSE}.')
+    parser.add_argument('--trace', dest='trace', help=f'Additional info useful to the developer team: {genlib.get_trace_code_list_text()}; default: {genlib.Const.DEFAULT_TRACE}.')
+
+    # return the paser
+    return parser
+
+#-------------------------------------------------------------------------------
+
+def check_args(args):
+    '''
+    Check the input arguments.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # check "sqlite_database"
+    if args.sqlite_database is None:
+        genlib.Message.print('error', '*** The SQLite database is not indicated in the input arguments.')
+        OK = False
+
+    # check "accumulator_files"
+    if args.accumulator_files is None:
+        genlib.Message.print('error', '*** The statistics accumulator files are not indicated in the input arguments.')
+        OK = False
+    else:
+        args.accumulator_files = genlib.split_literal_to_text_list(args.accumulator_files)
+        for accumulator_file in args.accumulator_files:
+            if not os.path.isfile(accumulator_file):
+                genlib.Message.print('error', f'*** The file {accumulator_file} does not exist.')
+                OK = False
+
+    # check "output_dir"
+    if args.output_dir is None:
+        genlib.Message.print('error', '*** The directory to save statistics files is not indicated in the input arguments.')
+        OK = False
+
+    # check "verbose"
+    if args.verbose is None:
+        args.verbose = genlib.Const.DEFAULT_VERBOSE
+    elif not genlib.check_code(args.verbose, genlib.get_verbose_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** verbose has to be {genlib.get_verbose_code_list_text()}.')
+        OK = False
+    if args.verbose.upper() == 'Y':
+        genlib.Message.set_verbose_status(True)
+
+    # check "trace"
+    if args.trace is None:
+        args.trace = genlib.Const.DEFAULT_TRACE
+    elif not genlib.check_code(args.trace, genlib.get_trace_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** trace has to be {genlib.get_trace_code_list_text()}.')
+        OK = False
+    if args.trace.upper() == 'Y':
+        genlib.Message.set_trace_status(True)
+
+    # if there are errors, exit with exception
+    if not OK:
+        raise genlib.ProgramException('', 'P001')
+
+#-------------------------------------------------------------------------------
+
+def merge_functional_stats(conn, accumulator_file_list, output_dir):
+    '''
+    Merge functional annotation statistics accumulators and build the statistics files.
+    '''
+
+    # initialize the merged functional statistics
+    functional_stats = statslib.FunctionalStats()
+
+    # merge the accumulators of each file
+    for accumulator_file in accumulator_file_list:
+        functional_stats.merge(statslib.FunctionalStats.load(accumulator_file))
+        genlib.Message.print('verbose', f'The accumulators of {accumulator_file} are merged.\n')
+
+    # print summary
+    genlib.Message.print('info', f'{len(accumulator_file_list)} accumulator files merged with {functional_stats.annotation_counter} functional annotation records.')
+
+    # build the statistics files and save the merged accumulators
+    functional_stats.build_stats_files(conn, output_dir)
+
+    # show OK message
+    genlib.Message.print('info', f'The statistics files are save in {output_dir}.')
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    main()
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
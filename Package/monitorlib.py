@@ -0,0 +1,673 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This source contains functions and classes related to the monitoring of the active runs of
+gymnoTOA (Gymnosperms Taxonomy-oriented Annotation): current step from the step status files,
+and progress, throughput and estimated time of the steps whose output files grow while they run
+(queries aligned in the outfmt6 alignment files, or in the ones of their shards, and records
+written by the concatenation of functional annotations). The files are only read from the offset reached in the previous update,
+and the status directories are only listed when they change.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import os
+import sys
+import time
+
+import genlib
+import pipelinelib
+import registrylib
+
+#-------------------------------------------------------------------------------
+
+# set the time window (in seconds) used to calculate the throughput
+RATE_WINDOW = 120
+
+# cache of the query identification dictionaries of the FASTA files: FASTA file -> (file signature, query identification dictionary)
+query_id_dict_cache = {}
+
+#-------------------------------------------------------------------------------
+
+def get_process_step_list(process_code):
+    '''
+    Get the step list of a process: code (the name of its status file without extension), text and
+    progress type (None when the progress of the step can not be measured). The step codes are the
+    ones written in the process scripts.
+    '''
+
+    # annotation pipeline
+    if process_code == genlib.get_process_run_annotation_pipeline_code():
+        step_list = [
+            {'code': 'save-parms', 'text': 'Saving parameters', 'progress': None},
+            {'code': 'predict-orfs', 'text': 'Predicting ORFs', 'progress': None},
+            {'code': 'align-peptides-2-alignment-tool-acrogymnospermae-db', 'text': 'Aligning peptides to the Acrogymnospermae database', 'progress': 'blastp'},
+            {'code': 'align-transcriptome-2-alignment-tool-acrogymnospermae-db', 'text': 'Aligning transcriptome to the Acrogymnospermae database', 'progress': 'blastx'},
+            {'code': 'align-transcriptome-2-blastplus-lncRNA-db', 'text': 'Aligning transcriptome to the lncRNA database', 'progress': 'blastn'},
+            {'code': 'run-post-alignment', 'text': 'Concatenating annotations and post-alignment', 'progress': 'concat'},
+        ]
+
+    # enrichment analysis
+    elif process_code == genlib.get_process_run_enrichment_analysis_code():
+        step_list = [
+            {'code': 'copy-annotation-params', 'text': 'Copying annotation parameters', 'progress': None},
+            {'code': 'append-enrichment-params', 'text': 'Appending enrichment parameters', 'progress': None},
+            {'code': 'calculate_besthit_enrichment_analysis', 'text': 'Calculating the enrichment analysis of best hits', 'progress': None},
+            {'code': 'calculate_complete_enrichment_analysis', 'text': 'Calculating the enrichment analysis of all hits', 'progress': None},
+        ]
+
+    # other processes
+    else:
+        step_list = []
+
+    # return the step list
+    return step_list
+
+#-------------------------------------------------------------------------------
+
+def get_query_id_dict(fasta_file):
+    '''
+    Get the dictionary of the sequence identifications of a FASTA file with their order number
+    (it is cached while the file is not changed).
+    '''
+
+    # get the file signature
+    signature = genlib.get_file_signature(fasta_file)
+
+    # build the dictionary when it is not cached or the file has been changed
+    cache_item = query_id_dict_cache.get(fasta_file)
+    if cache_item is None or cache_item[0] != signature:
+        query_id_dict = {}
+        with open(fasta_file, mode='rb') as fasta_file_id:
+            for line in fasta_file_id:
+                if line.startswith(b'>'):
+                    fields = line[1:].split(None, 1)
+                    query_id = fields[0].decode('iso-8859-1') if fields else ''
+                    query_id_dict.setdefault(query_id, len(query_id_dict))
+        query_id_dict_cache[fasta_file] = (signature, query_id_dict)
+    else:
+        query_id_dict = cache_item[1]
+
+    # return the query identification dictionary
+    return query_id_dict
+
+#-------------------------------------------------------------------------------
+
+def count_file_lines(file_path):
+    '''
+    Count the lines of a file (0 when it does not exist).
+    '''
+
+    # initialize the line counter
+    line_counter = 0
+
+    # count the line ends
+    try:
+        with open(file_path, mode='rb') as file_id:
+            for block in iter(lambda: file_id.read(genlib.Const.READ_BUFFER_SIZE), b''):
+                line_counter += block.count(b'\n')
+    except OSError:
+        pass
+
+    # return the line counter
+    return line_counter
+
+#-------------------------------------------------------------------------------
+
+def format_duration(seconds):
+    '''
+    Format a duration in seconds as hhh:mm:ss ('-' when it is None).
+    '''
+
+    if seconds is None:
+        return '-'
+
+    seconds = int(seconds)
+    return f'{seconds // 3600:03d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}'
+
+#-------------------------------------------------------------------------------
+
+class GrowingFileCounter():
+    '''
+    This class counts the records appended to a text file that is being written, reading only the
+    bytes appended since the previous update. Optionally, it keeps the key (first field) of the last
+    complete record.
+    '''
+
+    #---------------
+
+    def __init__(self, file_path, separator=None):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.file_path = file_path
+        self.separator = separator
+
+        # initialize the counters
+        self.reset()
+
+    #---------------
+
+    def reset(self):
+        '''
+        Reset the counters in order to count the file from its beginning.
+        '''
+
+        self.offset = 0
+        self.file_ino = None
+        self.pending_data = b''
+        self.record_counter = 0
+        self.last_key = None
+
+    #---------------
+
+    def update(self):
+        '''
+        Count the complete records appended since the previous update. It returns False when the
+        file does not exist.
+        '''
+
+        # get the size and the identification of the file
+        try:
+            file_stat = os.stat(self.file_path)
+        except OSError:
+            return False
+
+        # count the file again when it has been truncated or replaced
+        if file_stat.st_size < self.offset or (self.file_ino is not None and file_stat.st_ino != self.file_ino):
+            self.reset()
+        self.file_ino = file_stat.st_ino
+
+        # return when there are not new bytes
+        if file_stat.st_size == self.offset:
+            return True
+
+        # read the new bytes
+        try:
+            with open(self.file_path, mode='rb') as file_id:
+                file_id.seek(self.offset)
+                data = file_id.read(file_stat.st_size - self.offset)
+        except OSError:
+            return False
+        self.offset += len(data)
+
+        # count the complete records and keep the incomplete last one
+        record_list = (self.pending_data + data).split(b'\n')
+        self.pending_data = record_list.pop()
+        self.record_counter += len(record_list)
+
+        # save the key of the last complete record
+        if self.separator is not None and record_list:
+            self.last_key = record_list[-1].split(self.separator, 1)[0].strip().decode('iso-8859-1')
+
+        # return the file is found
+        return True
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class ShardedFileCounter():
+    '''
+    This class counts the queries aligned in the alignment files of the shards of an alignment
+    step, which are written concurrently: the shards with completion marker are fully aligned and
+    the progress of the other ones is the position of their last query aligned.
+    '''
+
+    #---------------
+
+    def __init__(self, shard_dir, shard_list):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.shard_dir = shard_dir
+        self.shard_list = shard_list
+
+        # create the counters of the alignment files of the shards
+        self.counter_list = [GrowingFileCounter(pipelinelib.get_shard_file(shard_dir, shard_dict['shard_code'], 'out'), separator=b'\t') for shard_dict in shard_list]
+
+    #---------------
+
+    def get_done(self, query_id_dict):
+        '''
+        Get the number of queries aligned using the dictionary of the query order numbers (when it
+        is None, only the queries of the shards with completion marker are counted).
+        '''
+
+        # initialize the number of queries aligned
+        done = 0
+
+        # add the queries aligned in each shard
+        for shard_dict, counter in zip(self.shard_list, self.counter_list):
+            if os.path.isfile(pipelinelib.get_shard_file(self.shard_dir, shard_dict['shard_code'], 'ok')):
+                done += shard_dict['seq_num']
+            elif counter.update() and query_id_dict is not None and counter.last_key in query_id_dict:
+                done += min(max(query_id_dict[counter.last_key] - shard_dict['first_seq'] + 1, 0), shard_dict['seq_num'])
+
+        # return the number of queries aligned
+        return done
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class ProgressRate():
+    '''
+    This class calculates the throughput of a progress counter in a time window and the
+    estimated time to complete a total.
+    '''
+
+    #---------------
+
+    def __init__(self, window=RATE_WINDOW):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.window = window
+
+        # initialize the sample list: (time, counter)
+        self.sample_list = []
+
+    #---------------
+
+    def add_sample(self, sample_time, counter):
+        '''
+        Add a sample of the counter and remove the samples out of the time window.
+        '''
+
+        # restart the samples when the counter decreases
+        if self.sample_list and counter < self.sample_list[-1][1]:
+            self.sample_list = []
+
+        # add the sample and remove the old ones (at least two samples are kept)
+        self.sample_list.append((sample_time, counter))
+        while len(self.sample_list) > 2 and sample_time - self.sample_list[0][0] > self.window:
+            self.sample_list.pop(0)
+
+    #---------------
+
+    def get_rate(self):
+        '''
+        Get the throughput in counter units per second (None when it can not be calculated).
+        '''
+
+        if len(self.sample_list) < 2:
+            return None
+
+        (first_time, first_counter) = self.sample_list[0]
+        (last_time, last_counter) = self.sample_list[-1]
+        if last_time <= first_time:
+            return None
+
+        return (last_counter - first_counter) / (last_time - first_time)
+
+    #---------------
+
+    def get_eta(self, total):
+        '''
+        Get the estimated time in seconds to reach a total (None when it can not be calculated).
+        '''
+
+        rate = self.get_rate()
+        if rate is None or rate <= 0 or total is None:
+            return None
+
+        return max(0, total - self.sample_list[-1][1]) / rate
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class RunMonitor():
+    '''
+    This class monitors a run: current step, progress, throughput and estimated time of the step.
+    '''
+
+    #---------------
+
+    def __init__(self, run_dir, result_dataset_id):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.run_dir = run_dir
+        self.result_dataset_id = result_dataset_id
+
+        # get the process and its steps
+        (self.process_code, self.process_name, _, _) = registrylib.parse_result_dataset_id(result_dataset_id, genlib.get_process_dict())
+        self.step_list = get_process_step_list(self.process_code)
+
+        # initialize the state of the status directory
+        self.status_dir = genlib.get_status_dir(run_dir)
+        self.status_dir_mtime = None
+        self.status = 'not finished'
+        self.step_num = 0
+
+        # initialize the state of the progress of the current step
+        self.counter = None
+        self.progress_rate = None
+        self.done = None
+        self.total = None
+        self.unit = ''
+        self.query_id_dict = None
+        self.query_progress = None
+        self.shard_dir = None
+        self.shard_counter = None
+
+        # initialize the parameters of the run
+        self.params_dict = None
+
+    #---------------
+
+    def update(self):
+        '''
+        Update the status, the current step and its progress.
+        '''
+
+        # update the status and the current step when the status directory has changed
+        try:
+            status_dir_mtime = os.stat(self.status_dir).st_mtime_ns
+        except OSError:
+            status_dir_mtime = None
+        if status_dir_mtime != self.status_dir_mtime:
+            self.status_dir_mtime = status_dir_mtime
+            self.update_step()
+
+        # update the progress of the current step
+        if self.status == 'not finished' and self.counter is not None:
+            self.update_progress()
+
+    #---------------
+
+    def update_step(self):
+        '''
+        Update the status and the current step from the status files.
+        '''
+
+        # get the status files
+        try:
+            status_file_set = set(os.listdir(self.status_dir))
+        except OSError:
+            status_file_set = set()
+
+        # get the run status
+        self.status = registrylib.get_run_status(self.run_dir)
+
+        # get the current step (the first one without status file)
+        step_num = len(self.step_list) + 1
+        for i, step_dict in enumerate(self.step_list):
+            if f'{step_dict["code"]}.ok' not in status_file_set:
+                step_num = i + 1
+                break
+
+        # initialize the progress when the step has changed
+        if step_num != self.step_num:
+            self.step_num = step_num
+            self.initialize_progress()
+
+    #---------------
+
+    def initialize_progress(self):
+        '''
+        Initialize the progress counting of the current step.
+        '''
+
+        # initialize the progress state
+        self.counter = None
+        self.progress_rate = None
+        self.done = None
+        self.total = None
+        self.unit = ''
+        self.query_id_dict = None
+        self.query_progress = None
+        self.shard_dir = None
+        self.shard_counter = None
+
+        # get the progress type of the current step
+        if self.step_num > len(self.step_list):
+            return
+        progress = self.step_list[self.step_num - 1]['progress']
+
+        # set the alignment file and the query file of the alignment steps
+        temp_dir = f'{self.run_dir}/temp'
+        if progress in ['blastp', 'blastx', 'blastn']:
+            if progress == 'blastp':
+                alignment_file = f'{temp_dir}/{genlib.get_blastp_clade_alignment_file_name()}'
+            elif progress == 'blastx':
+                alignment_file = f'{temp_dir}/{genlib.get_blastx_clade_alignment_file_name()}'
+            else:
+                alignment_file = f'{temp_dir}/{genlib.get_blastn_lncrna_alignment_file_name()}'
+            self.query_progress = progress
+            self.set_query_id_dict()
+            self.counter = GrowingFileCounter(alignment_file, separator=b'\t')
+            self.shard_dir = pipelinelib.get_shard_dir(alignment_file)
+            self.unit = 'queries'
+
+        # set the functional annotation file written by the concatenation and the number of alignments as total
+        elif progress == 'concat':
+            self.counter = GrowingFileCounter(f'{self.run_dir}/{genlib.get_complete_functional_annotation_file_name()}')
+            self.total = sum(count_file_lines(f'{temp_dir}/{file_name}') for file_name in [genlib.get_blastp_clade_alignment_file_name(), genlib.get_blastx_clade_alignment_file_name(), genlib.get_blastn_lncrna_alignment_file_name()])
+            self.unit = 'records'
+
+        # initialize the throughput calculation
+        if self.counter is not None:
+            self.progress_rate = ProgressRate()
+
+    #---------------
+
+    def set_query_id_dict(self):
+        '''
+        Set the query identifications of the current alignment step and their total (they stay
+        unset while the query file is not available).
+        '''
+
+        query_file = self.get_query_file(self.query_progress)
+        try:
+            self.query_id_dict = get_query_id_dict(query_file) if query_file is not None else None
+        except Exception:
+            self.query_id_dict = None
+        self.total = len(self.query_id_dict) if self.query_id_dict is not None else None
+
+    #---------------
+
+    def get_query_file(self, progress):
+        '''
+        Get the query FASTA file of an alignment step from the run parameters (None when it is
+        not available). The transcriptome alignments use the FASTA file with the transcripts
+        without hits in the previous alignments, which is built when the step starts.
+        '''
+
+        # read the run parameters
+        if self.params_dict is None:
+            params_file = f'{self.run_dir}/{genlib.get_params_file_name()}'
+            if not os.path.isfile(params_file):
+                return None
+            self.params_dict = genlib.get_config_dict(params_file).get('Annotation parameters', {})
+
+        # get the query file
+        fasta_type = self.params_dict.get('fasta_type', '')
+        fasta_file = self.params_dict.get('fasta_file', '')
+        if progress == 'blastp' and fasta_type == genlib.get_fasta_type_transcripts():
+            query_file = f'{self.run_dir}/codan_output/PEP_sequences.fa'
+        elif progress == 'blastx' and fasta_type == genlib.get_fasta_type_transcripts():
+            query_file = f'{self.run_dir}/temp/{genlib.get_blastx_query_file_name()}'
+        elif progress == 'blastn' and fasta_type == genlib.get_fasta_type_transcripts():
+            query_file = f'{self.run_dir}/temp/{genlib.get_blastn_query_file_name()}'
+        elif fasta_file != '':
+            query_file = fasta_file
+            if sys.platform.startswith('win32'):
+                query_file = genlib.wsl_path_2_windows_path(query_file)
+        else:
+            query_file = None
+
+        # return the query file
+        return query_file if query_file is not None and os.path.isfile(query_file) else None
+
+    #---------------
+
+    def update_progress(self):
+        '''
+        Update the progress of the current step.
+        '''
+
+        # get the query identifications when the query file of the alignment step has been built after the step start
+        if self.query_progress is not None and self.query_id_dict is None:
+            self.set_query_id_dict()
+
+        # create the counter of the shards when the query file of the alignment step has been split
+        if self.shard_dir is not None and self.shard_counter is None:
+            shard_list = pipelinelib.read_shard_index(self.shard_dir)
+            if shard_list is not None:
+                self.shard_counter = ShardedFileCounter(self.shard_dir, shard_list)
+
+        # get the progress: queries aligned in the shards
+        if self.shard_counter is not None:
+            self.done = self.shard_counter.get_done(self.query_id_dict)
+
+        # get the progress: position of the last query aligned in the query file or records written
+        else:
+            if not self.counter.update():
+                return
+            if self.query_id_dict is not None:
+                if self.counter.last_key is not None and self.counter.last_key in self.query_id_dict:
+                    self.done = self.query_id_dict[self.counter.last_key] + 1
+                else:
+                    self.done = 0 if self.done is None else self.done
+            else:
+                self.done = self.counter.record_counter
+        if self.total is not None:
+            self.done = min(self.done, self.total)
+
+        # add the sample of the throughput
+        self.progress_rate.add_sample(time.monotonic(), self.done)
+
+    #---------------
+
+    def get_data_dict(self):
+        '''
+        Get the data of the run to be shown.
+        '''
+
+        # get the step data
+        if self.step_num <= len(self.step_list):
+            step_text = f'{self.step_num}/{len(self.step_list)} {self.step_list[self.step_num - 1]["text"]}'
+        elif self.step_list:
+            step_text = f'{len(self.step_list)}/{len(self.step_list)} ended'
+        else:
+            step_text = '-'
+
+        # get the progress data
+        if self.done is None:
+            progress_text = '-'
+        elif self.total:
+            progress_text = f'{self.done}/{self.total} {self.unit} ({100 * self.done / self.total:.1f} %)'
+        else:
+            progress_text = f'{self.done} {self.unit}'
+        rate = self.progress_rate.get_rate() if self.progress_rate is not None else None
+        rate_text = '-' if rate is None else f'{rate:.1f} {self.unit}/s'
+        eta = self.progress_rate.get_eta(self.total) if self.progress_rate is not None else None
+
+        # return the data dictionary
+        return {'process': self.process_name, 'result_dataset_id': self.result_dataset_id, 'status': self.status, 'step': step_text, 'progress': progress_text, 'rate': rate_text, 'eta': format_duration(eta)}
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class RunMonitorSet():
+    '''
+    This class monitors the active runs of a result directory. The runs ended while they are
+    monitored are kept with their final status.
+    '''
+
+    #---------------
+
+    def __init__(self, result_dir):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.result_dir = result_dir
+
+        # initialize the run monitor dictionary: result dataset identification -> run monitor
+        self.run_monitor_dict = {}
+
+    #---------------
+
+    def update(self):
+        '''
+        Update the monitors of the runs. It returns the number of active runs.
+        '''
+
+        # get the active runs from the run registry
+        result_group = genlib.get_result_run_subdir()
+        try:
+            run_registry = registrylib.RunRegistry(self.result_dir)
+            run_list = run_registry.get_run_list(result_group, 'all', ['not finished'])
+            run_registry.close()
+        except Exception:
+            run_list = [run_dict for run_dict in registrylib.RunRegistry.scan_runs(self.result_dir, result_group) if run_dict['status'] == 'not finished']
+
+        # add the monitors of the new active runs
+        for run_dict in run_list:
+            result_dataset_id = run_dict['result_dataset_id']
+            if result_dataset_id not in self.run_monitor_dict:
+                run_dir = registrylib.get_local_path(f'{self.result_dir}/{result_group}/{result_dataset_id}')
+                self.run_monitor_dict[result_dataset_id] = RunMonitor(run_dir, result_dataset_id)
+
+        # update the monitors of the runs not ended
+        active_run_counter = 0
+        for run_monitor in self.run_monitor_dict.values():
+            if run_monitor.status == 'not finished':
+                run_monitor.update()
+                if run_monitor.status == 'not finished':
+                    active_run_counter += 1
+
+        # return the number of active runs
+        return active_run_counter
+
+    #---------------
+
+    def get_data_list(self):
+        '''
+        Get the data of the monitored runs sorted by result dataset identification.
+        '''
+
+        return [self.run_monitor_dict[result_dataset_id].get_data_dict() for result_dataset_id in sorted(self.run_monitor_dict)]
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    print(f'This source contains functions and classes related to the monitoring of the active runs of {genlib.get_app_long_name()}.')
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
@@ -0,0 +1,544 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This source contains functions related to the process scripts of the pipelines used in
+gymnoTOA (Gymnosperms Taxonomy-oriented Annotation). The steps of a pipeline are expressed
+as a dependency graph, which is converted into a sequence of groups of step chains: the chains
+of a group are run concurrently, sharing the thread budget of the run, and the steps of a
+chain are run in order. The query FASTA file of an alignment step can be split into shards
+balanced by residue count, whose alignments are run in concurrent processes and merged in
+query order, and it can be filtered to keep only the sequences without hits in previous
+alignments.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import hashlib
+import os
+import sys
+
+import genlib
+
+#-------------------------------------------------------------------------------
+
+def get_step_group_list(step_dict):
+    '''
+    Convert the dependency graph of the steps of a pipeline (step -> dictionary with the list of
+    steps it depends on in the key "dependency_list") into a list of groups of step chains. A
+    step is appended to the chain of its dependency when it has only one dependency and this
+    dependency has not other dependent steps; then, each chain is placed in the group following
+    the last group of the chains it depends on.
+    '''
+
+    # get the dependent steps of each step
+    dependent_dict = {step: [] for step in step_dict}
+    for step, data_dict in step_dict.items():
+        for dependency in data_dict['dependency_list']:
+            if dependency not in step_dict:
+                raise genlib.ProgramException('', 'L005', step, dependency)
+            dependent_dict[dependency].append(step)
+
+    # build the chains in a topological order of the steps
+    chain_list = []
+    chain_dict = {}
+    pending_list = list(step_dict)
+    while pending_list:
+        ready_list = [step for step in pending_list if all(dependency in chain_dict for dependency in step_dict[step]['dependency_list'])]
+        if not ready_list:
+            raise genlib.ProgramException('', 'L006', ', '.join(pending_list))
+        for step in ready_list:
+            dependency_list = step_dict[step]['dependency_list']
+            if len(dependency_list) == 1 and len(dependent_dict[dependency_list[0]]) == 1:
+                chain_num = chain_dict[dependency_list[0]]
+                chain_list[chain_num].append(step)
+            else:
+                chain_num = len(chain_list)
+                chain_list.append([step])
+            chain_dict[step] = chain_num
+            pending_list.remove(step)
+
+    # get the group of each chain (the chains are built after the chains they depend on)
+    group_num_list = []
+    for chain in chain_list:
+        dependency_chain_set = {chain_dict[dependency] for dependency in step_dict[chain[0]]['dependency_list']}
+        group_num_list.append(max([group_num_list[chain_num] + 1 for chain_num in dependency_chain_set], default=0))
+
+    # build the group list
+    step_group_list = [[] for _ in range(max(group_num_list, default=-1) + 1)]
+    for chain_num, chain in enumerate(chain_list):
+        step_group_list[group_num_list[chain_num]].append(chain)
+
+    # return the group list
+    return step_group_list
+
+#-------------------------------------------------------------------------------
+
+def get_annotation_step_dict(fasta_type):
+    '''
+    Get the dependency graph of the steps of an annotation pipeline and the weight of each step
+    used to split the threads among the steps run concurrently. The transcriptome alignments only
+    get the transcripts without hits in the alignment of the peptides, because their hits would be
+    discarded building the annotations; blastx and blastn are run concurrently because the
+    blastn hits of the transcripts annotated by blastx are also discarded.
+    '''
+
+    is_transcripts = fasta_type == genlib.get_fasta_type_transcripts()
+    return {
+        'save_params': {'dependency_list': [], 'weight': 0},
+        'predict_orfs': {'dependency_list': ['save_params'], 'weight': 1 if is_transcripts else 0},
+        'align_peptides_2_alignment_tool_acrogymnospermae_db': {'dependency_list': ['predict_orfs'], 'weight': 2},
+        'align_transcriptome_2_alignment_tool_acrogymnospermae_db': {'dependency_list': ['align_peptides_2_alignment_tool_acrogymnospermae_db'], 'weight': 3 if is_transcripts else 0},
+        'align_transcriptome_2_blastplus_lncrna_db': {'dependency_list': ['align_peptides_2_alignment_tool_acrogymnospermae_db'], 'weight': 1 if is_transcripts else 0},
+        'run_post_alignment': {'dependency_list': ['align_peptides_2_alignment_tool_acrogymnospermae_db', 'align_transcriptome_2_alignment_tool_acrogymnospermae_db', 'align_transcriptome_2_blastplus_lncrna_db'], 'weight': 0},
+    }
+
+#-------------------------------------------------------------------------------
+
+def get_annotation_step_shard_dict(alignment_tool, step_thread_dict):
+    '''
+    Get the shards of the alignment steps of an annotation pipeline from their threads (BLAST+
+    scales poorly beyond a few threads per process).
+    '''
+
+    shard_threads = genlib.Const.DIAMOND_SHARD_THREADS if alignment_tool == genlib.get_diamond_name() else genlib.Const.BLASTPLUS_SHARD_THREADS
+    return {
+        'align_peptides_2_alignment_tool_acrogymnospermae_db': get_shard_num(step_thread_dict['align_peptides_2_alignment_tool_acrogymnospermae_db'], shard_threads),
+        'align_transcriptome_2_alignment_tool_acrogymnospermae_db': get_shard_num(step_thread_dict['align_transcriptome_2_alignment_tool_acrogymnospermae_db'], shard_threads),
+        'align_transcriptome_2_blastplus_lncrna_db': get_shard_num(step_thread_dict['align_transcriptome_2_blastplus_lncrna_db'], genlib.Const.BLASTPLUS_SHARD_THREADS),
+    }
+
+#-------------------------------------------------------------------------------
+
+def get_step_thread_dict(step_dict, step_group_list, threads):
+    '''
+    Get the threads of each step splitting the thread budget among the chains of each group in
+    proportion to the weight of their steps (key "weight" of the step dictionary; 0 when the step
+    does not use threads). Each step gets at least one thread.
+    '''
+
+    # initialize the dictionary of the threads of each step
+    step_thread_dict = {}
+
+    # split the threads among the chains of each group
+    for chain_list in step_group_list:
+
+        # get the weight of each chain (the one of its heaviest step)
+        weight_list = [max(step_dict[step]['weight'] for step in chain) for chain in chain_list]
+        total_weight = sum(weight_list)
+
+        # get the threads of each chain (the remaining threads are assigned to the heaviest chains)
+        if total_weight == 0:
+            chain_thread_list = [threads] * len(chain_list)
+        else:
+            chain_thread_list = [threads * weight // total_weight for weight in weight_list]
+            remaining_threads = threads - sum(chain_thread_list)
+            for chain_num in sorted(range(len(chain_list)), key=lambda i: weight_list[i], reverse=True)[:remaining_threads]:
+                chain_thread_list[chain_num] += 1
+
+        # set the threads of the steps of each chain
+        for chain_num, chain in enumerate(chain_list):
+            for step in chain:
+                step_thread_dict[step] = max(chain_thread_list[chain_num], 1)
+
+    # return the dictionary of the threads of each step
+    return step_thread_dict
+
+#-------------------------------------------------------------------------------
+
+def write_concurrency_function(file_id):
+    '''
+    Write in a process script the function "run_concurrently", which runs each step chain passed
+    as argument (a string with the step functions separated by spaces) in a subshell, waits for
+    all of them and ends the script with the last error code when a chain ends with errors (the
+    step functions manage their errors, so the status file of the script is already written).
+    '''
+
+    file_id.write( 'function run_concurrently\n')
+    file_id.write( '{\n')
+    file_id.write( '    PID_LIST=""\n')
+    file_id.write( '    for STEP_CHAIN in "$@"; do\n')
+    file_id.write( '        (for STEP in $STEP_CHAIN; do $STEP; done) &\n')
+    file_id.write( '        PID_LIST="$PID_LIST $!"\n')
+    file_id.write( '    done\n')
+    file_id.write( '    CONCURRENT_RC=0\n')
+    file_id.write( '    for PID in $PID_LIST; do\n')
+    file_id.write( '        wait $PID\n')
+    file_id.write( '        RC=$?\n')
+    file_id.write( '        if [ $RC -ne 0 ]; then CONCURRENT_RC=$RC; fi\n')
+    file_id.write( '    done\n')
+    file_id.write( '    if [ $CONCURRENT_RC -ne 0 ]; then exit $CONCURRENT_RC; fi\n')
+    file_id.write( '}\n')
+
+#-------------------------------------------------------------------------------
+
+def write_step_group_calls(file_id, step_group_list):
+    '''
+    Write in a process script the calls to the step functions of a list of groups of step chains:
+    the groups with only one chain are called in the main shell and the other ones are run with
+    the function "run_concurrently".
+    '''
+
+    for chain_list in step_group_list:
+        if len(chain_list) == 1:
+            for step in chain_list[0]:
+                file_id.write(f'{step}\n')
+        else:
+            chain_text = ' '.join([f'"{" ".join(chain)}"' for chain in chain_list])
+            file_id.write(f'run_concurrently {chain_text}\n')
+
+#-------------------------------------------------------------------------------
+
+def write_sharded_alignment_call(file_id, python_path, app_dir, query_file, output_file, shard_num, threads):
+    '''
+    Write in a process script the call to run-sharded-alignment.py (with the Python interpreter
+    of a path, so the environment of the aligner can be active) up to the separator of the
+    aligner command, which has to be written next with the placeholders %QUERY%, %OUTPUT% and
+    %THREADS%.
+    '''
+
+    file_id.write(f'            {python_path} {app_dir}/run-sharded-alignment.py \\\n')
+    file_id.write(f'                --query={query_file} \\\n')
+    file_id.write(f'                --out={output_file} \\\n')
+    file_id.write(f'                --shards={shard_num} \\\n')
+    file_id.write(f'                --threads={threads} \\\n')
+    file_id.write( '                --verbose=N \\\n')
+    file_id.write( '                --trace=N \\\n')
+    file_id.write( '                -- \\\n')
+
+#-------------------------------------------------------------------------------
+
+def write_unmatched_sequence_filter(file_id, python_path, app_dir, fasta_file, alignment_file_list, output_file):
+    '''
+    Write in a process script the call to filter-unmatched-sequences.py (with the Python
+    interpreter of a path) and its error management to build the query file of an alignment
+    with the sequences without hits in previous alignments.
+    '''
+
+    file_id.write( '        /usr/bin/time \\\n')
+    file_id.write(f'            {python_path} {app_dir}/filter-unmatched-sequences.py \\\n')
+    file_id.write(f'                --fasta={fasta_file} \\\n')
+    file_id.write(f'                --alignments={",".join(alignment_file_list)} \\\n')
+    file_id.write(f'                --out={output_file} \\\n')
+    file_id.write( '                --verbose=N \\\n')
+    file_id.write( '                --trace=N\n')
+    file_id.write( '        RC=$?\n')
+    file_id.write( '        if [ $RC -ne 0 ]; then manage_error filter-unmatched-sequences.py $RC; fi\n')
+
+#-------------------------------------------------------------------------------
+
+def get_shard_num(threads, shard_threads):
+    '''
+    Get the number of shards of an alignment step in order to run each aligner process with
+    around shard threads.
+    '''
+
+    return max(threads // shard_threads, 1)
+
+#-------------------------------------------------------------------------------
+
+def get_shard_thread_list(threads, shard_num):
+    '''
+    Get the threads of each shard splitting evenly the threads of the alignment step (each shard
+    gets at least one thread).
+    '''
+
+    return [max(threads // shard_num + (1 if i < threads % shard_num else 0), 1) for i in range(shard_num)]
+
+#-------------------------------------------------------------------------------
+
+def get_shard_dir(output_file):
+    '''
+    Get the directory of the shards of the alignment step that yields an output file.
+    '''
+
+    return f'{output_file}-shards'
+
+#-------------------------------------------------------------------------------
+
+def get_shard_index_file(shard_dir):
+    '''
+    Get the path of the index of the shards of a shard directory.
+    '''
+
+    return f'{shard_dir}/shards.tsv'
+
+#-------------------------------------------------------------------------------
+
+def get_shard_file(shard_dir, shard_code, extension):
+    '''
+    Get the path of a file of a shard: query FASTA file ("fasta"), alignment file ("out") or
+    completion marker ("ok").
+    '''
+
+    return f'{shard_dir}/shard-{shard_code}.{extension}'
+
+#-------------------------------------------------------------------------------
+
+def get_split_signature(fasta_file, shard_num):
+    '''
+    Get the signature of the split of a FASTA file into a shard number: the file size, the hash
+    of its content (the modification time is not used because the filtered query files are
+    rebuilt with the same content when an alignment step is rerun) and the shard number.
+    '''
+
+    # calculate the hash of the FASTA file
+    file_hash = hashlib.sha1()
+    try:
+        with open(fasta_file, mode='rb') as fasta_file_id:
+            while True:
+                data = fasta_file_id.read(genlib.Const.READ_BUFFER_SIZE)
+                if not data:
+                    break
+                file_hash.update(data)
+    except OSError as e:
+        raise genlib.ProgramException(e, 'F001', fasta_file)
+
+    # return the signature
+    return f'{os.path.getsize(fasta_file)}:{file_hash.hexdigest()}:{shard_num}'
+
+#-------------------------------------------------------------------------------
+
+def split_fasta_file(fasta_file, shard_dir, shard_num, signature=''):
+    '''
+    Split a FASTA file into shards of consecutive sequences balanced by residue count (there are
+    not more shards than sequences), write the shard index with the split signature and get the
+    shard list. Each shard dictionary has the shard code, the order number of its first sequence
+    in the FASTA file, its sequence number and its residue number.
+    '''
+
+    # get the residue number of each sequence
+    residue_list = []
+    try:
+        with open(fasta_file, mode='rb') as fasta_file_id:
+            for line in fasta_file_id:
+                if line.startswith(b'>'):
+                    residue_list.append(0)
+                elif residue_list:
+                    residue_list[-1] += len(line.strip())
+    except OSError as e:
+        raise genlib.ProgramException(e, 'F001', fasta_file)
+
+    # get the shard of each sequence: the next shard is begun when the residues of the previous shards reach its
+    # target or when the remaining sequences are needed to avoid empty shards
+    shard_num = max(min(shard_num, len(residue_list)), 1)
+    total_residues = sum(residue_list)
+    shard_list = [{'shard_code': f'{i + 1:03d}', 'first_seq': 0, 'seq_num': 0, 'residue_num': 0} for i in range(shard_num)]
+    seq_shard_list = []
+    shard_i = 0
+    cumulative_residues = 0
+    for seq_i, residue_num in enumerate(residue_list):
+        if shard_i < shard_num - 1 and shard_list[shard_i]['seq_num'] > 0:
+            if cumulative_residues >= total_residues * (shard_i + 1) / shard_num or len(residue_list) - seq_i <= shard_num - shard_i - 1:
+                shard_i += 1
+                shard_list[shard_i]['first_seq'] = seq_i
+        shard_list[shard_i]['seq_num'] += 1
+        shard_list[shard_i]['residue_num'] += residue_num
+        cumulative_residues += residue_num
+        seq_shard_list.append(shard_i)
+
+    # write the shard FASTA files
+    os.makedirs(shard_dir, exist_ok=True)
+    shard_file_id_list = []
+    try:
+        for shard_dict in shard_list:
+            shard_file_id_list.append(open(get_shard_file(shard_dir, shard_dict['shard_code'], 'fasta'), mode='wb'))    # pylint: disable=consider-using-with
+        with open(fasta_file, mode='rb') as fasta_file_id:
+            seq_i = -1
+            for line in fasta_file_id:
+                if line.startswith(b'>'):
+                    seq_i += 1
+                if seq_i >= 0:
+                    shard_file_id_list[seq_shard_list[seq_i]].write(line)
+    except OSError as e:
+        raise genlib.ProgramException(e, 'F003', shard_dir)
+    finally:
+        for shard_file_id in shard_file_id_list:
+            shard_file_id.close()
+
+    # write the shard index (it is renamed at the end, so it only exists when the split has ended)
+    index_file = get_shard_index_file(shard_dir)
+    try:
+        with open(f'{index_file}.tmp', mode='w', encoding='iso-8859-1', newline='\n') as index_file_id:
+            index_file_id.write(f'#signature\t{signature}\n')
+            index_file_id.write('shard_code\tfirst_seq\tseq_num\tresidue_num\n')
+            for shard_dict in shard_list:
+                index_file_id.write(f'{shard_dict["shard_code"]}\t{shard_dict["first_seq"]}\t{shard_dict["seq_num"]}\t{shard_dict["residue_num"]}\n')
+        os.replace(f'{index_file}.tmp', index_file)
+    except OSError as e:
+        raise genlib.ProgramException(e, 'F003', index_file)
+
+    # return the shard list
+    return shard_list
+
+#-------------------------------------------------------------------------------
+
+def read_shard_index(shard_dir, signature=None):
+    '''
+    Read the index of the shards of a shard directory and get the shard list (None when it does
+    not exist or when its split signature is not the signature, if this one is passed).
+    '''
+
+    # initialize the shard list
+    shard_list = []
+
+    # read the shard index
+    try:
+        with open(get_shard_index_file(shard_dir), mode='r', encoding='iso-8859-1') as index_file_id:
+            (_, index_signature) = next(index_file_id).rstrip('\n').split('\t')
+            if signature is not None and index_signature != signature:
+                return None
+            next(index_file_id, None)
+            for record in index_file_id:
+                (shard_code, first_seq, seq_num, residue_num) = record.rstrip('\n').split('\t')
+                shard_list.append({'shard_code': shard_code, 'first_seq': int(first_seq), 'seq_num': int(seq_num), 'residue_num': int(residue_num)})
+    except (OSError, ValueError, StopIteration):
+        shard_list = None
+
+    # return the shard list
+    return shard_list
+
+#-------------------------------------------------------------------------------
+
+def merge_shard_files(shard_dir, shard_list, output_file):
+    '''
+    Merge the alignment files of the shards in shard order, which is the query order because the
+    shards have consecutive sequences and the aligners write the alignments in query order.
+    '''
+
+    try:
+        with open(f'{output_file}.tmp', mode='wb') as output_file_id:
+            for shard_dict in shard_list:
+                with open(get_shard_file(shard_dir, shard_dict['shard_code'], 'out'), mode='rb') as shard_file_id:
+                    while True:
+                        data = shard_file_id.read(genlib.Const.READ_BUFFER_SIZE)
+                        if not data:
+                            break
+                        output_file_id.write(data)
+        os.replace(f'{output_file}.tmp', output_file)
+    except OSError as e:
+        raise genlib.ProgramException(e, 'F003', output_file)
+
+#-------------------------------------------------------------------------------
+
+def has_sequences(fasta_file):
+    '''
+    Check if a FASTA file has any sequence.
+    '''
+
+    try:
+        with open(fasta_file, mode='rb') as fasta_file_id:
+            for line in fasta_file_id:
+                if line.startswith(b'>'):
+                    return True
+    except OSError as e:
+        raise genlib.ProgramException(e, 'F001', fasta_file)
+
+    return False
+
+#-------------------------------------------------------------------------------
+
+def count_fasta_sequences(fasta_file):
+    '''
+    Count the sequences of a FASTA file (the headers are the only lines with ">").
+    '''
+
+    # initialize the sequence counter
+    seq_counter = 0
+
+    # count the characters ">" of the file
+    try:
+        with open(fasta_file, mode='rb') as fasta_file_id:
+            while True:
+                data = fasta_file_id.read(genlib.Const.READ_BUFFER_SIZE)
+                if not data:
+                    break
+                seq_counter += data.count(b'>')
+    except OSError as e:
+        raise genlib.ProgramException(e, 'F001', fasta_file)
+
+    # return the sequence counter
+    return seq_counter
+
+#-------------------------------------------------------------------------------
+
+def get_alignment_qseqid_set(alignment_file_list):
+    '''
+    Get the set of the query sequence identifications (first field) of a list of outfmt6
+    alignment files.
+    '''
+
+    # initialize the set of query sequence identifications
+    qseqid_set = set()
+
+    # add the query sequence identifications of each alignment file
+    for alignment_file in alignment_file_list:
+        try:
+            with open(alignment_file, mode='rb') as alignment_file_id:
+                for line in alignment_file_id:
+                    qseqid = line.split(b'\t', 1)[0].strip()
+                    if qseqid != b'':
+                        qseqid_set.add(qseqid)
+        except OSError as e:
+            raise genlib.ProgramException(e, 'F001', alignment_file)
+
+    # return the set of query sequence identifications
+    return qseqid_set
+
+#-------------------------------------------------------------------------------
+
+def filter_fasta_file(fasta_file, excluded_seqid_set, output_file):
+    '''
+    Write the sequences of a FASTA file whose identification (first word of the header) is not
+    in the excluded set, keeping their order, and get the number of sequences read and written.
+    '''
+
+    # initialize the counters
+    read_seq_counter = 0
+    written_seq_counter = 0
+
+    # copy the sequences not excluded
+    try:
+        with open(fasta_file, mode='rb') as fasta_file_id, open(f'{output_file}.tmp', mode='wb') as output_file_id:
+            is_written = False
+            for line in fasta_file_id:
+                if line.startswith(b'>'):
+                    read_seq_counter += 1
+                    fields = line[1:].split(None, 1)
+                    is_written = (fields[0] if fields else b'') not in excluded_seqid_set
+                    if is_written:
+                        written_seq_counter += 1
+                if is_written:
+                    output_file_id.write(line)
+        os.replace(f'{output_file}.tmp', output_file)
+    except OSError as e:
+        raise genlib.ProgramException(e, 'F003', output_file)
+
+    # return the counters
+    return read_seq_counter, written_seq_counter
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    print(f'This source contains functions related to the process scripts of the pipelines used in {genlib.get_app_long_name()}.')
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
@@ -0,0 +1,734 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This source contains functions and classes related to the plots of the functional annotation
+statistics used in gymnoTOA (Gymnosperms Taxonomy-oriented Annotation).
+
+The plots are saved in a cache directory of the run with a key built from the content of the
+statistics file and the plot parameters, so a plot is only rendered again when its data change.
+The plots that are not in the cache, and the summary report built with them, are rendered in a
+pool of processes with the non-interactive backend of Matplotlib.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import concurrent.futures
+import gzip
+import hashlib
+import multiprocessing
+import os
+import shutil
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt    # pylint: disable=wrong-import-position
+import pandas                      # pylint: disable=wrong-import-position
+import plotnine                    # pylint: disable=wrong-import-position
+
+import genlib                      # pylint: disable=wrong-import-position
+
+#-------------------------------------------------------------------------------
+
+# set the version of the plots (change it when the plot functions change to discard the plots of the cache)
+PLOT_VERSION = 1
+
+# set the size of the blocks read to hash the statistics files
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# set the name shown in the titles of the summary report plots
+SUMMARY_REPORT_NAME = 'Statistics - Summary report'
+
+# set the statistics codes and file names of the summary report plots
+SUMMARY_REPORT_STATS_LIST = [
+    ('species', 'stats-species.csv', 'figure-species'),
+    ('go', 'stats-goterms.csv', 'figure-goterms'),
+    ('namespace', 'stats-namespaces.csv', 'figure-namespaces'),
+    ('seq_per_goterm', 'stats-seq-per-goterm.csv', 'figure-seq-per-goterm'),
+]
+
+# set the layout of the summary report page (A4 size in inches; the plots are drawn with their pixels
+# at the PDF resolution, centered in the PDF width and separated by the PDF spacing)
+PDF_PAGE_WIDTH = 8.27
+PDF_PAGE_HEIGHT = 11.69
+PDF_RESOLUTION = 1200
+PDF_WIDTH = 9000
+PDF_SPACING = 100
+
+#-------------------------------------------------------------------------------
+
+def get_plot_cache_dir(run_dir):
+    '''
+    Get the path of the plot cache directory of a run.
+    '''
+
+    return f'{run_dir}{os.sep}{genlib.get_plot_cache_dir_name()}'
+
+#-------------------------------------------------------------------------------
+
+def get_summary_report_plot_list(run_dir, dpi):
+    '''
+    Get the plot list of the summary report of a run.
+    '''
+
+    # initialize the plot list
+    plot_list = []
+
+    # add the plot of each statistics file
+    for (stats_code, stats_file_name, image_file_name) in SUMMARY_REPORT_STATS_LIST:
+        plot_list.append({'stats_code': stats_code, 'annotation_result_type': 'best', 'stats_file_path': f'{run_dir}{os.sep}{stats_file_name}', 'image_file_path': f'{run_dir}{os.sep}{image_file_name}.png', 'dpi': dpi, 'name': SUMMARY_REPORT_NAME})
+
+    # return the plot list
+    return plot_list
+
+#-------------------------------------------------------------------------------
+
+def get_summary_report_file_path(run_dir):
+    '''
+    Get the path of the summary report file of a run.
+    '''
+
+    return f'{run_dir}{os.sep}summary_report.pdf'
+
+#-------------------------------------------------------------------------------
+
+def get_file_hash(file_path):
+    '''
+    Get the SHA-256 hash of the content of a file.
+    '''
+
+    # initialize the hash
+    file_hash = hashlib.sha256()
+
+    # update the hash with the file content
+    try:
+        with open(file_path, mode='rb') as file_id:
+            for block in iter(lambda: file_id.read(HASH_BLOCK_SIZE), b''):
+                file_hash.update(block)
+    except Exception as e:
+        raise genlib.ProgramException(e, 'F001', file_path)
+
+    # return the hash
+    return file_hash.hexdigest()
+
+#-------------------------------------------------------------------------------
+
+def get_plot_key(stats_code, annotation_result_type, stats_file_path, dpi, name):
+    '''
+    Get the key of a plot in the cache from the content of the statistics file and the plot parameters.
+    '''
+
+    # build the key text
+    key_text = f'{PLOT_VERSION}|{get_file_hash(stats_file_path)}|{stats_code}|{annotation_result_type}|{dpi}|{name}'
+
+    # return the key
+    return hashlib.sha256(key_text.encode('utf-8')).hexdigest()
+
+#-------------------------------------------------------------------------------
+
+def get_report_key(plot_key_list):
+    '''
+    Get the key of a report in the cache from the keys of its plots.
+    '''
+
+    return hashlib.sha256('|'.join(plot_key_list).encode('utf-8')).hexdigest()
+
+#-------------------------------------------------------------------------------
+
+def copy_cached_file(cached_file_path, file_path):
+    '''
+    Copy a file of the cache to its path in the run directory.
+    '''
+
+    try:
+        shutil.copyfile(cached_file_path, file_path)
+    except Exception as e:
+        raise genlib.ProgramException(e, 'F003', file_path)
+
+#-------------------------------------------------------------------------------
+
+def render_plot(stats_code, annotation_result_type, stats_file_path, image_file_path, dpi, name):
+    '''
+    Render a plot in a temporal file and rename it to the image file path, so the cache never
+    contains a partial plot. It is run in the processes of the pool, so it returns a control
+    variable and the error text instead of raising exceptions.
+    '''
+
+    # set the temporal file path (it keeps the extension because it sets the image format)
+    (root, extension) = os.path.splitext(image_file_path)
+    temporal_file_path = f'{root}-{os.getpid()}.tmp{extension}'
+
+    # render the plot
+    try:
+        if stats_code == 'seq_per_goterm':
+            plot_x_per_y_data(stats_code, stats_file_path, temporal_file_path, dpi, name)
+        else:
+            plot_frecuency_data(stats_code, annotation_result_type, stats_file_path, temporal_file_path, dpi, name)
+        os.replace(temporal_file_path, image_file_path)
+    except SystemExit:
+        # the program exceptions print their messages and exit
+        if os.path.isfile(temporal_file_path):
+            os.remove(temporal_file_path)
+        return False, f'The plot of {os.path.basename(stats_file_path)} can not be rendered (the file has a wrong format).'
+    except Exception as e:
+        if os.path.isfile(temporal_file_path):
+            os.remove(temporal_file_path)
+        return False, f'The plot of {os.path.basename(stats_file_path)} can not be rendered: {e}'
+
+    # return the control variable and the error text
+    return True, ''
+
+#-------------------------------------------------------------------------------
+
+def render_summary_report(image_file_list, report_file_path):
+    '''
+    Render a summary report in a temporal file and rename it to the report file path, so the
+    cache never contains a partial report. It is run in the processes of the pool, so it returns
+    a control variable and the error text instead of raising exceptions.
+    '''
+
+    # set the temporal file path
+    temporal_file_path = f'{report_file_path}-{os.getpid()}.tmp'
+
+    # render the summary report
+    try:
+        plot_summary_report(image_file_list, temporal_file_path)
+        os.replace(temporal_file_path, report_file_path)
+    except Exception as e:
+        if os.path.isfile(temporal_file_path):
+            os.remove(temporal_file_path)
+        return False, f'The summary report can not be rendered: {e}'
+
+    # return the control variable and the error text
+    return True, ''
+
+#-------------------------------------------------------------------------------
+
+def plot_frecuency_data(stats_code, annotation_result_type, stats_file_path, image_file_path, dpi, name):
+    '''
+    Plot a bar plot when x is a interger number and y is a literal.
+    '''
+
+    # initialize the data dictionary
+    data_dict = {}
+
+    # open the statistics file
+    if stats_file_path.endswith('.gz'):
+        try:
+            stats_file_path_id = gzip.open(stats_file_path, mode='rt', encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F002', stats_file_path)
+    else:
+        try:
+            stats_file_path_id = open(stats_file_path, mode='r', encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F001', stats_file_path)
+
+    # initialize the record counter
+    record_counter = 0
+
+    # initialize the header record control
+    header_record = True
+
+    # read the first record
+    record = stats_file_path_id.readline()
+
+    # while there are records
+    while record != '':
+
+        # add 1 to the record counter
+        record_counter += 1
+
+        # process the header record
+        if header_record:
+            header_record = False
+
+        # process data records
+        else:
+
+            # extract data
+            data_list = []
+            begin = 0
+            for end in [i for i, chr in enumerate(record) if chr == ';']:
+                data_list.append(record[begin:end].strip('"'))
+                begin = end + 1
+            data_list.append(record[begin:].strip('\n').strip('"'))
+            try:
+                # record format: "stats_code_id";"best_hit";"all_hits"
+                if stats_code in ['species', 'namespace']:
+                    # format: "id";"best_hit";"all_hits"
+                    key = data_list[0]
+                    value = 0
+                    if annotation_result_type == 'best':
+                        value = int(data_list[1])
+                    elif annotation_result_type == 'complete':
+                        value = int(data_list[2])
+                    if value > 0:
+                        data_dict[key] = value
+                # record format: "go_id";"description";"namespace";"best_hit";"all_hits"
+                elif stats_code == 'go':
+                    key = f'{data_list[0]} ({data_list[1]})'
+                    if annotation_result_type == 'best':
+                        value = int(data_list[3])
+                    elif annotation_result_type == 'complete':
+                        value = int(data_list[4])
+                    if value > 0:
+                        data_dict[key] = value
+            except Exception as e:
+                raise genlib.ProgramException(e, 'F006', os.path.basename(stats_file_path), record_counter)
+
+        # read the next record
+        record = stats_file_path_id.readline()
+
+    # close the statistics file
+    stats_file_path_id.close()
+
+    # initialize the lists associated to the distribution dictionary
+    text_list = []
+    value_list = []
+
+    # initialize the item counter
+    item_counter = 0
+
+    # initialize the value sum of remainder items
+    remainder_sum = 0
+
+    # sort the data dictionary by value
+    for (key, value) in sorted(data_dict.items(), reverse=True, key=lambda x: x[1]):
+
+        # check if item counter is less than the maximum of items to show
+        if item_counter < 10:
+            text_list.append(key)
+            value_list.append(value)
+
+        # if it not is less
+        else:
+            remainder_sum += value
+
+        # add 1 to the item counter
+        item_counter += 1
+
+    # build distribution dictionary
+    text_list = list(reversed(text_list))
+    value_list = list(reversed(value_list))
+    distribution_dict = {'text_list': text_list, 'value_list': value_list}
+
+    # load data in a Pandas DataFrame
+    distribution_df = pandas.DataFrame(distribution_dict)
+    distribution_df['text_list'] = pandas.Categorical(distribution_df['text_list'], categories=text_list, ordered=False)
+
+    # build the "plot"
+    if stats_code == 'namespace':
+        # pie chart
+        title = ''
+        if annotation_result_type == 'best':
+            title = f'{name}\n(best hit per sequence)'
+        elif annotation_result_type == 'complete':
+            title = f'{name}\n(all hits per sequence)'
+        explode = [0.01] * len(value_list)
+        (_, ax1) = plt.subplots()
+        (_, texts, _) = ax1.pie(value_list, explode=explode, labels=text_list, autopct='%1.1f%%', shadow=False, startangle=270)
+        ax1.axis('equal')
+        for text in texts:
+            text.set_color('grey')
+        plt.title(title, color='blue')
+        plt.savefig(image_file_path, dpi=dpi)
+        plt.close()
+    else:
+        # bar plot
+        title = name
+        caption = ''
+        if annotation_result_type == 'best':
+            caption = 'Best hit per sequence'
+        elif annotation_result_type == 'complete':
+            caption = 'All hits per sequence'
+        label_y = 'Alignments #'
+        plot = (plotnine.ggplot(data=distribution_df) +
+                    plotnine.aes(x='text_list', y='value_list') +
+                    plotnine.geom_bar(stat='identity', size=0.1, color='green', fill='green') +
+                    plotnine.geom_text(plotnine.aes(label='value_list'), va='center') +
+                    plotnine.coord_flip() +
+                    plotnine.labs(title=title, caption=caption, x='', y=label_y) +
+                    plotnine.theme_grey() +
+                    plotnine.theme(plot_title=plotnine.element_text(color='blue', margin={'b':15})) +
+                    plotnine.theme(axis_title_x=plotnine.element_text(color='black')) +
+                    plotnine.theme(axis_title_y=plotnine.element_text(color='black'))
+        )
+        plot.save(filename=image_file_path, height=6, width=10, dpi=dpi, verbose=False)
+
+#-------------------------------------------------------------------------------
+
+def plot_x_per_y_data(stats_code, stats_file_path, image_file_path, dpi, name):
+    '''
+    Plot x # per y #.
+    '''
+
+    # initialize the lists associated to the distribution dictionary
+    x_count_list = []
+    y_count_list = []
+
+    # open the statistics file
+    if stats_file_path.endswith('.gz'):
+        try:
+            stats_file_path_id = gzip.open(stats_file_path, mode='rt', encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F002', stats_file_path)
+    else:
+        try:
+            stats_file_path_id = open(stats_file_path, mode='r', encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F001', stats_file_path)
+
+    # initialize the record counter
+    record_counter = 0
+
+    # initialize the header record control
+    header_record = True
+
+    # read the first record
+    record = stats_file_path_id.readline()
+
+    # while there are records
+    while record != '':
+
+        # add 1 to the record counter
+        record_counter += 1
+
+        # process the header record
+        if header_record:
+            header_record = False
+
+        # process data records
+        else:
+
+            # extract data
+            # record format: "x_count";"y_count"
+            data_list = []
+            begin = 0
+            for end in [i for i, chr in enumerate(record) if chr == ';']:
+                data_list.append(record[begin:end].strip('"'))
+                begin = end + 1
+            data_list.append(record[begin:].strip('\n').strip('"'))
+            try:
+                x_count_list.append(int(data_list[0]))
+                y_count_list.append(int(data_list[1]))
+            except Exception as e:
+                raise genlib.ProgramException(e, 'F006', os.path.basename(stats_file_path), record_counter)
+
+        # read the next record
+        record = stats_file_path_id.readline()
+
+    # close the statistics file
+    stats_file_path_id.close()
+
+    # build distribution dictionary
+    distribution_dict = {'x_count': x_count_list, 'y_count': y_count_list}
+
+    # load data in a Pandas DataFrame
+    distribution_df = pandas.DataFrame(distribution_dict)
+
+    # set the title, caption and labels
+    title = name
+    caption = ''
+    label_x = ''
+    label_y = ''
+    if stats_code == 'seq_per_goterm':
+        label_x = 'GO terms #'
+        label_y = 'Sequences #'
+
+    # build the plot
+    plot = (plotnine.ggplot(data=distribution_df) +
+                plotnine.aes(x='x_count', y='y_count') +
+                plotnine.geom_bar(stat='identity', color='red', fill='red') +
+                plotnine.labs(title=title, caption=caption, x=label_x, y=label_y) +
+                plotnine.theme_grey() +
+                plotnine.theme(plot_title=plotnine.element_text(color='blue', margin={'b':15})) +
+                plotnine.theme(axis_title_x=plotnine.element_text(color='black')) +
+                plotnine.theme(axis_title_y=plotnine.element_text(color='black'))
+    )
+    plot.save(filename=image_file_path, height=4.8, width=6.4, dpi=dpi, verbose=False)
+
+#-------------------------------------------------------------------------------
+
+def plot_summary_report(image_file_list, report_file_path):
+    '''
+    Build the PDF file of a summary report with one page where the plots are drawn one below another.
+    '''
+
+    # create the page
+    figure = plt.figure(figsize=(PDF_PAGE_WIDTH, PDF_PAGE_HEIGHT))
+
+    # initialize the y position (in inches from the top of the page)
+    y = 0
+
+    # draw every plot
+    for image_file in image_file_list:
+
+        # load the plot
+        image = plt.imread(image_file)
+
+        # get the plot size and the current x position in inches
+        (height, width) = (image.shape[0] / PDF_RESOLUTION, image.shape[1] / PDF_RESOLUTION)
+        x = (PDF_WIDTH / PDF_RESOLUTION - width) / 2
+
+        # draw the plot in the page without resampling it
+        axes = figure.add_axes([x / PDF_PAGE_WIDTH, 1 - (y + height) / PDF_PAGE_HEIGHT, width / PDF_PAGE_WIDTH, height / PDF_PAGE_HEIGHT])
+        axes.imshow(image, interpolation='none')
+        axes.axis('off')
+
+        # update the next y position
+        y += height + PDF_SPACING / PDF_RESOLUTION
+
+    # save the page
+    figure.savefig(report_file_path, format='pdf')
+    plt.close(figure)
+
+#-------------------------------------------------------------------------------
+
+class PlotRenderer():
+    '''
+    Class used to render a list of plots, and optionally the summary report built with them, in a
+    pool of processes reusing the files of the cache. Each plot is a dictionary with the keys
+    stats_code, annotation_result_type, stats_file_path, image_file_path, dpi and name; the image
+    files and the report file are copied from the cache when they are rendered. The pool can be
+    shared by several renderers; otherwise, the renderer creates its own pool.
+    '''
+
+    #---------------
+
+    def __init__(self, plot_list, cache_dir, report_file_path='', executor=None):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.plot_list = plot_list
+        self.cache_dir = cache_dir
+        self.report_file_path = report_file_path
+        self.executor = executor
+        self.is_executor_shared = executor is not None
+
+        # initialize the list of cache keys of the plots
+        self.plot_key_list = []
+
+        # initialize the dictionary of plot futures (key: plot index) and the report future
+        self.future_dict = {}
+        self.report_future = None
+
+    #---------------
+
+    def get_cached_file_path(self, key, extension):
+        '''
+        Get the path of a file of the cache.
+        '''
+
+        return f'{self.cache_dir}{os.sep}{key}{extension}'
+
+    #---------------
+
+    def get_cached_plot_file_path(self, i):
+        '''
+        Get the path of a plot of the cache.
+        '''
+
+        return self.get_cached_file_path(self.plot_key_list[i], os.path.splitext(self.plot_list[i]['image_file_path'])[1])
+
+    #---------------
+
+    def get_cached_report_file_path(self):
+        '''
+        Get the path of the summary report of the cache built with the plots.
+        '''
+
+        return self.get_cached_file_path(get_report_key(self.plot_key_list), '.pdf')
+
+    #---------------
+
+    def load_plot_keys(self):
+        '''
+        Get the cache keys of the plots.
+        '''
+
+        if not self.plot_key_list:
+            self.plot_key_list = [get_plot_key(plot['stats_code'], plot['annotation_result_type'], plot['stats_file_path'], plot['dpi'], plot['name']) for plot in self.plot_list]
+
+    #---------------
+
+    def is_report_updated(self):
+        '''
+        Check if the summary report exists and it was built from the current statistics files.
+        '''
+
+        self.load_plot_keys()
+        return os.path.isfile(self.report_file_path) and os.path.isfile(self.get_cached_report_file_path())
+
+    #---------------
+
+    def get_executor(self):
+        '''
+        Get the pool of processes, creating it when the renderer does not share one.
+        '''
+
+        if self.executor is None:
+            # the processes are spawned (not forked) because the parent process can be the GUI
+            max_workers = min(len(self.plot_list), os.cpu_count() or 1)
+            self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+        return self.executor
+
+    #---------------
+
+    def start(self):
+        '''
+        Submit to the pool the plots that are not in the cache.
+        '''
+
+        # get the cache keys of the plots
+        self.load_plot_keys()
+
+        # create the cache directory
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+        # submit the plots that are not in the cache
+        self.future_dict = {}
+        self.report_future = None
+        for i, plot in enumerate(self.plot_list):
+            cached_file_path = self.get_cached_plot_file_path(i)
+            if os.path.isfile(cached_file_path):
+                genlib.Message.print('trace', f'Plot {os.path.basename(plot["image_file_path"])} got from the cache.')
+            else:
+                self.future_dict[i] = self.get_executor().submit(render_plot, plot['stats_code'], plot['annotation_result_type'], plot['stats_file_path'], cached_file_path, plot['dpi'], plot['name'])
+
+    #---------------
+
+    def is_done(self):
+        '''
+        Check if all the plots and the summary report are rendered (the summary report is
+        submitted to the pool when the plots end OK and it is not in the cache).
+        '''
+
+        # check the plots
+        if not all(future.done() for future in self.future_dict.values()):
+            return False
+
+        # submit the summary report
+        if self.report_file_path != '' and self.report_future is None:
+            cached_report_file_path = self.get_cached_report_file_path()
+            plots_OK = all(future.exception() is None and future.result()[0] for future in self.future_dict.values())
+            if plots_OK and not os.path.isfile(cached_report_file_path):
+                image_file_list = [self.get_cached_plot_file_path(i) for i in range(len(self.plot_list))]
+                self.report_future = self.get_executor().submit(render_summary_report, image_file_list, cached_report_file_path)
+
+        # check the summary report
+        return self.report_future is None or self.report_future.done()
+
+    #---------------
+
+    def get_pending_future_list(self):
+        '''
+        Get the futures of the plots and the summary report that are not done.
+        '''
+
+        return [future for future in [*self.future_dict.values(), self.report_future] if future is not None and not future.done()]
+
+    #---------------
+
+    def wait(self):
+        '''
+        Wait until all the plots and the summary report are rendered.
+        '''
+
+        while not self.is_done():
+            concurrent.futures.wait(self.get_pending_future_list())
+
+    #---------------
+
+    def get_result(self):
+        '''
+        Wait for the plots and the summary report, copy them from the cache and get the control
+        variable and the error list.
+        '''
+
+        # initialize the control variable and the error list
+        OK = True
+        error_list = []
+
+        # wait for the plots and the summary report
+        self.wait()
+
+        # check the files rendered in the pool
+        future_list = [(future, os.path.basename(self.plot_list[i]['stats_file_path'])) for (i, future) in sorted(self.future_dict.items())]
+        if self.report_future is not None:
+            future_list.append((self.report_future, os.path.basename(self.report_file_path)))
+        for (future, file_name) in future_list:
+            try:
+                (file_OK, error) = future.result()
+            except Exception as e:
+                (file_OK, error) = (False, f'The file {file_name} can not be rendered: {e}')
+            if not file_OK:
+                OK = False
+                error_list.append(error)
+
+        # release the pool of processes
+        self.shutdown()
+
+        # copy the plots and the summary report from the cache
+        if OK:
+            for i, plot in enumerate(self.plot_list):
+                copy_cached_file(self.get_cached_plot_file_path(i), plot['image_file_path'])
+            if self.report_file_path != '':
+                copy_cached_file(self.get_cached_report_file_path(), self.report_file_path)
+
+        # return the control variable and the error list
+        return OK, error_list
+
+    #---------------
+
+    def render(self):
+        '''
+        Render the plots and the summary report waiting for the pool and get the control variable
+        and the error list.
+        '''
+
+        self.start()
+        return self.get_result()
+
+    #---------------
+
+    def shutdown(self):
+        '''
+        Release the pool of processes cancelling the files not started (a shared pool is not released).
+        '''
+
+        if self.executor is not None and not self.is_executor_shared:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    print(f'This source contains functions and classes related to the plots of the functional annotation statistics used in {genlib.get_app_long_name()}.')
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
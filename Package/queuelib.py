@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This source contains functions and classes related to the job queue used in gymnoTOA
+(Gymnosperms Taxonomy-oriented Annotation). The queue is a SQLite database in the result
+directory with a row per submitted job. Each job is run by the program run-queued-job.py,
+which waits until the job is admitted: the jobs are admitted in submission order when the
+threads and memory reserved by the running jobs leave enough resources free.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import math
+import os
+import socket
+import sqlite3
+import sys
+import time
+
+import genlib
+import pipelinelib
+import registrylib
+
+#-------------------------------------------------------------------------------
+
+def get_job_queue_file(result_dir):
+    '''
+    Get the path of the job queue of a result directory.
+    '''
+
+    return f'{registrylib.get_local_path(result_dir)}/{genlib.get_job_queue_file_name()}'
+
+#-------------------------------------------------------------------------------
+
+def get_total_threads():
+    '''
+    Get the number of threads (logical cores) of the computer.
+    '''
+
+    return os.cpu_count() or 1
+
+#-------------------------------------------------------------------------------
+
+def get_total_memory():
+    '''
+    Get the total memory of the computer in GB (None when it can not be determined).
+    '''
+
+    try:
+        total_memory = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / 1024**3
+    except (AttributeError, ValueError, OSError):
+        total_memory = None
+
+    return total_memory
+
+#-------------------------------------------------------------------------------
+
+def get_available_memory():
+    '''
+    Get the memory available for new processes in GB (None when it can not be determined).
+    '''
+
+    # initialize the available memory
+    available_memory = None
+
+    # get the available memory from /proc/meminfo (its values are in kB)
+    try:
+        with open('/proc/meminfo', mode='r', encoding='iso-8859-1') as file_id:
+            for record in file_id:
+                if record.startswith('MemAvailable:'):
+                    available_memory = int(record.split()[1]) / 1024**2
+                    break
+    except OSError:
+        pass
+
+    # return the available memory
+    return available_memory
+
+#-------------------------------------------------------------------------------
+
+def estimate_annotation_job_memory(fasta_file, fasta_type, alignment_tool, threads):
+    '''
+    Estimate the memory in GB of an annotation pipeline run: the base memory plus the largest of
+    the memory of the aligner processes run at the same time (the shards of the alignment steps
+    of each group of step chains; BLAST+ maps its database and DIAMOND uses about 6 times its
+    default block size) and the memory of the post-alignment, which sorts the functional
+    annotation files externally and keeps in memory the records with the best hit per sequence
+    (all the sequences are supposed to get hits).
+    '''
+
+    # get the shards of the alignment steps as they are got building the pipeline script
+    step_dict = pipelinelib.get_annotation_step_dict(fasta_type)
+    step_group_list = pipelinelib.get_step_group_list(step_dict)
+    step_thread_dict = pipelinelib.get_step_thread_dict(step_dict, step_group_list, int(threads))
+    step_shard_dict = pipelinelib.get_annotation_step_shard_dict(alignment_tool, step_thread_dict)
+
+    # get the memory of the aligner processes of each step
+    alignment_tool_memory = genlib.Const.DIAMOND_PROCESS_MEMORY if alignment_tool == genlib.get_diamond_name() else genlib.Const.BLASTPLUS_PROCESS_MEMORY
+    step_memory_dict = {
+        'align_peptides_2_alignment_tool_acrogymnospermae_db': step_shard_dict['align_peptides_2_alignment_tool_acrogymnospermae_db'] * alignment_tool_memory,
+        'align_transcriptome_2_alignment_tool_acrogymnospermae_db': step_shard_dict['align_transcriptome_2_alignment_tool_acrogymnospermae_db'] * alignment_tool_memory if fasta_type == genlib.get_fasta_type_transcripts() else 0,
+        'align_transcriptome_2_blastplus_lncrna_db': step_shard_dict['align_transcriptome_2_blastplus_lncrna_db'] * genlib.Const.BLASTPLUS_PROCESS_MEMORY if fasta_type == genlib.get_fasta_type_transcripts() else 0,
+    }
+
+    # get the memory of the aligner processes run at the same time (the chains of a group are run concurrently)
+    alignment_memory = max([sum(max([step_memory_dict.get(step, 0) for step in chain]) for chain in chain_list) for chain_list in step_group_list])
+
+    # get the memory of the post-alignment
+    local_fasta_file = registrylib.get_local_path(fasta_file)
+    seq_num = pipelinelib.count_fasta_sequences(local_fasta_file) if os.path.isfile(local_fasta_file) else 0
+    post_alignment_memory = seq_num * genlib.Const.ANNOTATION_RECORD_MEMORY / 1024**3
+
+    # return the memory rounded up to tenths of GB
+    return math.ceil((genlib.Const.JOB_BASE_MEMORY + max(alignment_memory, post_alignment_memory)) * 10) / 10
+
+#-------------------------------------------------------------------------------
+
+def is_process_alive(pid):
+    '''
+    Check if a process of the computer is alive.
+    '''
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+    return True
+
+#-------------------------------------------------------------------------------
+
+class JobQueue():
+    '''
+    This class manages the job queue of a result directory.
+    '''
+
+    #---------------
+
+    # format version of the queue
+    VERSION = 1
+
+    # column list of the table "jobs"
+    COLUMN_LIST = ['job_number', 'result_dataset_id', 'process_name', 'script', 'threads', 'memory', 'status', 'host', 'pid', 'submit_time', 'start_time', 'end_time']
+
+    # status of the jobs
+    QUEUED_STATUS = 'queued'
+    RUNNING_STATUS = 'running'
+    OK_STATUS = 'OK'
+    WRONG_STATUS = 'wrong'
+    CANCELLED_STATUS = 'cancelled'
+    LOST_STATUS = 'lost'
+
+    #---------------
+
+    def __init__(self, result_dir):
+        '''
+        Create a class instance opening the queue (it is created when it does not exist).
+        '''
+
+        # save parameters in instance variables
+        self.result_dir = result_dir
+
+        # open the queue (the transactions are managed explicitly) and create its table when it does not exist
+        self.conn = sqlite3.connect(get_job_queue_file(result_dir), timeout=10, isolation_level=None)
+        if self.conn.execute('PRAGMA user_version;').fetchone()[0] != self.VERSION:
+            self.conn.execute('DROP TABLE IF EXISTS jobs;')
+            self.conn.execute(f'PRAGMA user_version = {self.VERSION};')
+        self.conn.execute('''
+                          CREATE TABLE IF NOT EXISTS jobs (
+                              job_number INTEGER PRIMARY KEY AUTOINCREMENT,
+                              result_dataset_id TEXT NOT NULL,
+                              process_name TEXT,
+                              script TEXT,
+                              threads INTEGER,
+                              memory REAL,
+                              status TEXT,
+                              host TEXT,
+                              pid INTEGER,
+                              submit_time REAL,
+                              start_time REAL,
+                              end_time REAL
+                          );
+                          ''')
+
+    #---------------
+
+    def close(self):
+        '''
+        Close the queue.
+        '''
+
+        self.conn.close()
+
+    #---------------
+
+    def submit_job(self, script, threads, memory):
+        '''
+        Submit the job of a run script, which is queued, and get its job number.
+        '''
+
+        # get the run data (the run directory name is the result dataset identification)
+        result_dataset_id = os.path.basename(os.path.dirname(script))
+        (_, process_name, _, _) = registrylib.parse_result_dataset_id(result_dataset_id, genlib.get_process_dict())
+
+        # insert the job
+        cursor = self.conn.execute('INSERT INTO jobs (result_dataset_id, process_name, script, threads, memory, status, host, pid, submit_time) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);', (result_dataset_id, process_name, script, threads, memory, self.QUEUED_STATUS, socket.gethostname(), os.getpid(), time.time()))
+
+        # return the job number
+        return cursor.lastrowid
+
+    #---------------
+
+    def admit_job(self, job_number, total_threads, total_memory, available_memory):
+        '''
+        Admit a queued job when it is the oldest queued job and the resources reserved by the
+        running jobs leave enough threads and memory free (a job is always admitted when there
+        are not running jobs). Get the job status after the admission attempt.
+        '''
+
+        # lock the queue until the admission is decided
+        self.conn.execute('BEGIN IMMEDIATE;')
+
+        try:
+
+            # mark the lost jobs
+            self.mark_lost_jobs()
+
+            # get the job status
+            row = self.conn.execute('SELECT status, threads, memory FROM jobs WHERE job_number = ?;', (job_number,)).fetchone()
+            if row is None:
+                status = self.CANCELLED_STATUS
+            else:
+                (status, threads, memory) = row
+
+            # check if the job can be admitted
+            if status == self.QUEUED_STATUS:
+
+                # get the oldest queued job
+                first_job_number = self.conn.execute('SELECT MIN(job_number) FROM jobs WHERE status = ?;', (self.QUEUED_STATUS,)).fetchone()[0]
+
+                # get the resources reserved by the running jobs
+                (running_job_counter, reserved_threads, reserved_memory) = self.conn.execute('SELECT COUNT(*), COALESCE(SUM(threads), 0), COALESCE(SUM(memory), 0) FROM jobs WHERE status = ?;', (self.RUNNING_STATUS,)).fetchone()
+
+                # check the resources (the job requirements are limited to the computer resources)
+                if running_job_counter == 0:
+                    is_admitted = True
+                else:
+                    is_admitted = reserved_threads + min(threads, total_threads) <= total_threads
+                    if total_memory is not None:
+                        is_admitted = is_admitted and reserved_memory + min(memory, total_memory) <= total_memory
+                    if available_memory is not None:
+                        is_admitted = is_admitted and available_memory >= memory
+                is_admitted = is_admitted and job_number == first_job_number
+
+                # start the job
+                if is_admitted:
+                    self.conn.execute('UPDATE jobs SET status = ?, host = ?, pid = ?, start_time = ? WHERE job_number = ?;', (self.RUNNING_STATUS, socket.gethostname(), os.getpid(), time.time(), job_number))
+                    status = self.RUNNING_STATUS
+
+            # save the changes
+            self.conn.execute('COMMIT;')
+
+        except Exception:
+            self.conn.execute('ROLLBACK;')
+            raise
+
+        # return the job status
+        return status
+
+    #---------------
+
+    def end_job(self, job_number, rc):
+        '''
+        Record the end of a running job with the return code of its script.
+        '''
+
+        status = self.OK_STATUS if rc == 0 else self.WRONG_STATUS
+        self.conn.execute('UPDATE jobs SET status = ?, end_time = ? WHERE job_number = ? AND status = ?;', (status, time.time(), job_number, self.RUNNING_STATUS))
+
+    #---------------
+
+    def cancel_job(self, job_number):
+        '''
+        Cancel a queued job (the running jobs can not be cancelled). Get True when it is cancelled.
+        '''
+
+        cursor = self.conn.execute('UPDATE jobs SET status = ?, end_time = ? WHERE job_number = ? AND status = ?;', (self.CANCELLED_STATUS, time.time(), job_number, self.QUEUED_STATUS))
+
+        return cursor.rowcount == 1
+
+    #---------------
+
+    def mark_lost_jobs(self):
+        '''
+        Mark as lost the queued and running jobs of this computer whose process has ended without
+        recording it (the processes can not be checked from Windows because they run in WSL).
+        '''
+
+        if not sys.platform.startswith('win32'):
+            rows = self.conn.execute('SELECT job_number, pid FROM jobs WHERE status IN (?, ?) AND host = ?;', (self.QUEUED_STATUS, self.RUNNING_STATUS, socket.gethostname())).fetchall()
+            lost_job_number_list = [job_number for (job_number, pid) in rows if not is_process_alive(pid)]
+            self.conn.executemany('UPDATE jobs SET status = ?, end_time = ? WHERE job_number = ?;', [(self.LOST_STATUS, time.time(), job_number) for job_number in lost_job_number_list])
+
+    #---------------
+
+    def get_job_list(self, max_ended_job_number=100):
+        '''
+        Get the queued and running jobs and the latest ended jobs (up to max ended job number),
+        with their wait time and run time in seconds.
+        '''
+
+        # mark the lost jobs
+        self.mark_lost_jobs()
+
+        # get the jobs
+        rows = self.conn.execute(f'SELECT {", ".join(self.COLUMN_LIST)} FROM jobs WHERE status IN (?, ?) UNION ALL SELECT * FROM (SELECT {", ".join(self.COLUMN_LIST)} FROM jobs WHERE status NOT IN (?, ?) ORDER BY job_number DESC LIMIT ?) ORDER BY job_number DESC;', (self.QUEUED_STATUS, self.RUNNING_STATUS, self.QUEUED_STATUS, self.RUNNING_STATUS, max_ended_job_number))
+        job_list = [dict(zip(self.COLUMN_LIST, row)) for row in rows]
+
+        # calculate the wait time (until the start or the cancellation) and the run time
+        now = time.time()
+        for job_dict in job_list:
+            if job_dict['start_time'] is not None:
+                job_dict['wait_time'] = job_dict['start_time'] - job_dict['submit_time']
+                job_dict['run_time'] = (job_dict['end_time'] or now) - job_dict['start_time']
+            else:
+                job_dict['wait_time'] = (job_dict['end_time'] or now) - job_dict['submit_time']
+                job_dict['run_time'] = None
+
+        # return the job list
+        return job_list
+
+    #---------------
+
+    def get_queue_data(self):
+        '''
+        Get the number of queued and running jobs and the threads and memory reserved by the
+        running jobs.
+        '''
+
+        (queued_job_counter,) = self.conn.execute('SELECT COUNT(*) FROM jobs WHERE status = ?;', (self.QUEUED_STATUS,)).fetchone()
+        (running_job_counter, reserved_threads, reserved_memory) = self.conn.execute('SELECT COUNT(*), COALESCE(SUM(threads), 0), COALESCE(SUM(memory), 0) FROM jobs WHERE status = ?;', (self.RUNNING_STATUS,)).fetchone()
+
+        return queued_job_counter, running_job_counter, reserved_threads, reserved_memory
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    print(f'This source contains functions and classes related to the job queue used in {genlib.get_app_long_name()}.')
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
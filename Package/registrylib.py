@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This source contains functions and classes related to the run registry used in gymnoTOA
+(Gymnosperms Taxonomy-oriented Annotation). The registry is a SQLite database in the result
+directory with a row per run (identification, type, parameters, status, duration and size).
+The runs are registered when they are submitted and the registry is reconciled with the result
+directories with a os.scandir pass, so the status files are only checked for the runs not
+ended yet and the runs created out of the application are also registered.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import datetime
+import os
+import re
+import sqlite3
+import sys
+
+import genlib
+
+#-------------------------------------------------------------------------------
+
+def get_local_path(path):
+    '''
+    Get a path of the result directory as it is seen from the application (the paths are
+    converted to Windows paths when the application runs in Windows).
+    '''
+
+    return genlib.wsl_path_2_windows_path(path) if sys.platform.startswith('win32') else path
+
+#-------------------------------------------------------------------------------
+
+def get_run_registry_file(result_dir):
+    '''
+    Get the path of the run registry of a result directory.
+    '''
+
+    return f'{get_local_path(result_dir)}/{genlib.get_run_registry_file_name()}'
+
+#-------------------------------------------------------------------------------
+
+def parse_result_dataset_id(result_dataset_id, process_dict):
+    '''
+    Get the process code, process name, date and time of a result dataset identification
+    (format: process_code-yymmdd-hhmmss).
+    '''
+
+    # get data
+    try:
+        pattern = r'^(.+)\-(.+)\-(.+)$'
+        mo = re.search(pattern, result_dataset_id)
+        process_code = mo.group(1).strip()
+        process_name = process_dict[process_code]['name']
+        yymmdd = mo.group(2)
+        hhmmss = mo.group(3)
+        date = f'20{yymmdd[:2]}-{yymmdd[2:4]}-{yymmdd[4:]}'
+        time = f'{hhmmss[:2]}:{hhmmss[2:4]}:{hhmmss[4:]}'
+    except:    # pylint: disable=bare-except
+        process_code = ''
+        process_name = 'unknown process'
+        date = '0000-00-00'
+        time = '00:00:00'
+
+    # return the result dataset data
+    return process_code, process_name, date, time
+
+#-------------------------------------------------------------------------------
+
+def get_run_status(run_dir):
+    '''
+    Get the status of a run from its status files.
+    '''
+
+    # determine the status
+    status_ok = os.path.isfile(genlib.get_status_ok(run_dir))
+    status_wrong = os.path.isfile(genlib.get_status_wrong(run_dir))
+    status = ''
+    if status_ok and not status_wrong:
+        status = 'OK'
+    elif not status_ok and status_wrong:
+        status = 'wrong'
+    elif not status_ok and not status_wrong:
+        status = 'not finished'
+    elif status_ok and status_wrong:
+        status = 'undetermined'
+
+    # return the status
+    return status
+
+#-------------------------------------------------------------------------------
+
+def remove_run_status_files(run_dir):
+    '''
+    Remove the status files of an ended run before restarting it, so the run is not read as
+    ended while its script waits in the job queue.
+    '''
+
+    for status_file in [genlib.get_status_ok(run_dir), genlib.get_status_wrong(run_dir)]:
+        try:
+            os.remove(get_local_path(status_file))
+        except FileNotFoundError:
+            pass
+
+#-------------------------------------------------------------------------------
+
+def get_dir_size(directory):
+    '''
+    Get the total size in bytes of the files of a directory and its subdirectories.
+    '''
+
+    # initialize the size
+    size = 0
+
+    # add the size of the files of the directory and its subdirectories
+    try:
+        for entry in os.scandir(directory):
+            if entry.is_dir(follow_symlinks=False):
+                size += get_dir_size(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                size += entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        pass
+
+    # return the size
+    return size
+
+#-------------------------------------------------------------------------------
+
+def register_run(result_dir, result_group, result_dataset_id):
+    '''
+    Register a submitted run (a restarted run is registered again as not finished). The errors
+    are only printed because the registry is rebuilt from the result directories.
+    '''
+
+    try:
+        run_registry = RunRegistry(result_dir)
+        run_registry.register_run(result_group, result_dataset_id)
+        run_registry.close()
+    except Exception as e:
+        genlib.Message.print('verbose', f'The run {result_dataset_id} can not be registered: {e}\n')
+
+#-------------------------------------------------------------------------------
+
+def get_result_dataset_dict(result_dir, result_group, process_name, status_list=None):
+    '''
+    Get the dictionary of the result datasets of a result group corresponding to a process
+    ("all" for all processes) with a status of status list (all status when it is None), as it
+    is loaded in the table widgets. The run registry is read when it is available; otherwise,
+    the result group directory is scanned.
+    '''
+
+    # get the runs from the run registry
+    try:
+        run_registry = RunRegistry(result_dir)
+        run_list = run_registry.get_run_list(result_group, process_name, status_list)
+        run_registry.close()
+
+    # get the runs scanning the result group directory when the registry is not available
+    except Exception as e:
+        genlib.Message.print('verbose', f'The run registry can not be read ({e}); the result directory is scanned.\n')
+        run_list = [run_dict for run_dict in RunRegistry.scan_runs(result_dir, result_group, refresh_all=True) if is_run_selected(run_dict, process_name, status_list)]
+
+    # build the result dataset dictionary
+    result_dataset_dict = {}
+    for run_dict in run_list:
+        key = f'{run_dict["process_name"]}-{run_dict["result_dataset_id"]}'
+        result_dataset_dict[key] = {'process': run_dict['process_name'], 'result_dataset_id': run_dict['result_dataset_id'], 'date': run_dict['date'], 'time': run_dict['time'], 'status': run_dict['status']}
+
+    # return the result dataset dictionary
+    return result_dataset_dict
+
+#-------------------------------------------------------------------------------
+
+def is_run_selected(run_dict, process_name, status_list):
+    '''
+    Check if a run corresponds to a process ("all" for all processes) and a status of status
+    list (all status when it is None).
+    '''
+
+    # check the process (the identification begins with the process code)
+    if process_name != 'all' and not run_dict['result_dataset_id'].startswith(f'{genlib.get_process_id(process_name)}-'):
+        return False
+
+    # check the status
+    if status_list is not None and run_dict['status'] not in status_list:
+        return False
+
+    # the run is selected
+    return True
+
+#-------------------------------------------------------------------------------
+
+class RunRegistry():
+    '''
+    This class manages the run registry of a result directory.
+    '''
+
+    #---------------
+
+    # format version of the registry
+    VERSION = 1
+
+    # column list of the table "runs"
+    COLUMN_LIST = ['result_group', 'result_dataset_id', 'process_code', 'process_name', 'date', 'time', 'status', 'params', 'duration', 'size']
+
+    # status of the ended runs, which are not checked again
+    ENDED_STATUS_LIST = ['OK', 'wrong']
+
+    #---------------
+
+    def __init__(self, result_dir):
+        '''
+        Create a class instance opening the registry (it is created when it does not exist).
+        '''
+
+        # save parameters in instance variables
+        self.result_dir = result_dir
+
+        # open the registry and create its table when it does not exist
+        self.conn = sqlite3.connect(get_run_registry_file(result_dir), timeout=10)
+        if self.conn.execute('PRAGMA user_version;').fetchone()[0] != self.VERSION:
+            self.conn.execute('DROP TABLE IF EXISTS runs;')
+            self.conn.execute(f'PRAGMA user_version = {self.VERSION};')
+        self.conn.execute('''
+                          CREATE TABLE IF NOT EXISTS runs (
+                              result_group TEXT NOT NULL,
+                              result_dataset_id TEXT NOT NULL,
+                              process_code TEXT,
+                              process_name TEXT,
+                              date TEXT,
+                              time TEXT,
+                              status TEXT,
+                              params TEXT,
+                              duration INTEGER,
+                              size INTEGER,
+                              PRIMARY KEY (result_group, result_dataset_id)
+                          );
+                          ''')
+        self.conn.commit()
+
+    #---------------
+
+    def close(self):
+        '''
+        Close the registry.
+        '''
+
+        self.conn.close()
+
+    #---------------
+
+    def register_run(self, result_group, result_dataset_id):
+        '''
+        Register a submitted run as not finished.
+        '''
+
+        # get the run data
+        (process_code, process_name, date, time) = parse_result_dataset_id(result_dataset_id, genlib.get_process_dict())
+
+        # insert or replace the run
+        self.conn.execute('INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?);', (result_group, result_dataset_id, process_code, process_name, date, time, 'not finished', '', None, None))
+        self.conn.commit()
+
+    #---------------
+
+    def reconcile(self, result_group):
+        '''
+        Reconcile the registry with the directories of a result group: the new directories are
+        registered, the removed ones are deleted, and the status of the runs not ended is checked.
+        '''
+
+        # get the runs of the registry
+        registered_dict = {row[0]: row[1] for row in self.conn.execute('SELECT result_dataset_id, status FROM runs WHERE result_group = ?;', (result_group,))}
+
+        # get the result dataset identifications of the result group directory
+        group_dir = get_local_path(f'{self.result_dir}/{result_group}')
+        try:
+            result_dataset_id_set = {entry.name for entry in os.scandir(group_dir) if entry.is_dir()}
+        except OSError:
+            result_dataset_id_set = set()
+
+        # delete the runs whose directories have been removed
+        removed_id_list = [result_dataset_id for result_dataset_id in registered_dict if result_dataset_id not in result_dataset_id_set]
+        self.conn.executemany('DELETE FROM runs WHERE result_group = ? AND result_dataset_id = ?;', [(result_group, result_dataset_id) for result_dataset_id in removed_id_list])
+
+        # register the new runs and update the runs not ended
+        pending_id_list = [result_dataset_id for result_dataset_id in sorted(result_dataset_id_set) if registered_dict.get(result_dataset_id) not in self.ENDED_STATUS_LIST]
+        self.conn.executemany('INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?);', [tuple(run_dict[column] for column in self.COLUMN_LIST) for run_dict in RunRegistry.scan_runs(self.result_dir, result_group, pending_id_list)])
+
+        # save the changes
+        self.conn.commit()
+
+    #---------------
+
+    def get_run_list(self, result_group, process_name='all', status_list=None):
+        '''
+        Get the runs of a result group corresponding to a process ("all" for all processes) with
+        a status of status list (all status when it is None) after reconciling the registry.
+        '''
+
+        # reconcile the registry with the result group directory
+        self.reconcile(result_group)
+
+        # get the runs of the result group
+        rows = self.conn.execute(f'SELECT {", ".join(self.COLUMN_LIST)} FROM runs WHERE result_group = ? ORDER BY result_dataset_id;', (result_group,))
+        run_list = [dict(zip(self.COLUMN_LIST, row)) for row in rows]
+
+        # return the selected runs
+        return [run_dict for run_dict in run_list if is_run_selected(run_dict, process_name, status_list)]
+
+    #---------------
+
+    @staticmethod
+    def scan_runs(result_dir, result_group, result_dataset_id_list=None, refresh_all=False):
+        '''
+        Get the run data of the result dataset identifications of a result group (all the
+        directories of the result group when the list is None) from the run directories.
+        The parameters, duration and size are only calculated for the runs ended (or all runs
+        when refresh all is True).
+        '''
+
+        # get the result group directory and the process dictionary
+        group_dir = get_local_path(f'{result_dir}/{result_group}')
+        process_dict = genlib.get_process_dict()
+
+        # get the result dataset identifications of the result group directory
+        if result_dataset_id_list is None:
+            try:
+                result_dataset_id_list = sorted(entry.name for entry in os.scandir(group_dir) if entry.is_dir())
+            except OSError:
+                result_dataset_id_list = []
+
+        # initialize the run list
+        run_list = []
+
+        # get the data of each run
+        for result_dataset_id in result_dataset_id_list:
+            run_dir = os.path.join(group_dir, result_dataset_id)
+            (process_code, process_name, date, time) = parse_result_dataset_id(result_dataset_id, process_dict)
+            status = get_run_status(run_dir)
+            params = ''
+            duration = None
+            size = None
+            if status in RunRegistry.ENDED_STATUS_LIST or refresh_all:
+                params = RunRegistry.read_params(run_dir)
+                duration = RunRegistry.get_duration(run_dir, status, date, time)
+                size = get_dir_size(run_dir)
+            run_list.append({'result_group': result_group, 'result_dataset_id': result_dataset_id, 'process_code': process_code, 'process_name': process_name, 'date': date, 'time': time, 'status': status, 'params': params, 'duration': duration, 'size': size})
+
+        # return the run list
+        return run_list
+
+    #---------------
+
+    @staticmethod
+    def read_params(run_dir):
+        '''
+        Read the parameter file of a run ('' when it does not exist).
+        '''
+
+        try:
+            with open(os.path.join(run_dir, genlib.get_params_file_name()), mode='r', encoding='iso-8859-1') as params_file_id:
+                params = params_file_id.read()
+        except OSError:
+            params = ''
+
+        return params
+
+    #---------------
+
+    @staticmethod
+    def get_duration(run_dir, status, date, time):
+        '''
+        Get the duration in seconds of an ended run from its start (date and time of its
+        identification) to the modification time of its status file.
+        '''
+
+        # get the status file
+        if status == 'OK':
+            status_file = genlib.get_status_ok(run_dir)
+        elif status == 'wrong':
+            status_file = genlib.get_status_wrong(run_dir)
+        else:
+            return None
+
+        # calculate the duration
+        try:
+            start = datetime.datetime.strptime(f'{date} {time}', '%Y-%m-%d %H:%M:%S')
+            end = datetime.datetime.fromtimestamp(os.path.getmtime(status_file))
+            duration = max(0, int((end - start).total_seconds()))
+        except (OSError, ValueError):
+            duration = None
+
+        # return the duration
+        return duration
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    print(f'This source contains functions and classes related to the run registry used in {genlib.get_app_long_name()}.')
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This source contains functions and classes related to the SQLite database with the hits and
+cluster annotations of an annotation pipeline run used in gymnoTOA (Gymnosperms Taxonomy-oriented
+Annotation). The records of the functional annotation files of the run are read from the database
+while it has been built from the current files.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import collections
+import operator
+import os
+import sys
+
+import genlib
+import sqllib
+
+#-------------------------------------------------------------------------------
+
+def get_results_db_file(functional_annotation_file):
+    '''
+    Get the path of the results database of the run of a functional annotation file.
+    '''
+
+    return os.path.join(os.path.dirname(functional_annotation_file), genlib.get_results_db_file_name())
+
+#-------------------------------------------------------------------------------
+
+def get_results_annotation_file_dict(functional_annotation_file):
+    '''
+    Get the data dictionary of a functional annotation file loaded in the results database of its
+    run when the database has been built from the current file (when the functional annotation
+    file has been removed, its data in the database are valid); otherwise, get None.
+    '''
+
+    # check the results database
+    results_db_file = get_results_db_file(functional_annotation_file)
+    if not os.path.isfile(results_db_file):
+        return None
+
+    # get the data of the functional annotation file saved in the results database
+    conn = sqllib.connect_database(results_db_file)
+    annotation_file_dict = sqllib.get_results_annotation_file_dict(conn, os.path.basename(functional_annotation_file))
+    conn.close()
+
+    # check the signature of the functional annotation file
+    if annotation_file_dict is not None and os.path.isfile(functional_annotation_file) and annotation_file_dict['signature'] != genlib.get_file_signature(functional_annotation_file):
+        annotation_file_dict = None
+
+    # return the data dictionary
+    return annotation_file_dict
+
+#-------------------------------------------------------------------------------
+
+def is_results_db_valid(functional_annotation_file):
+    '''
+    Check if the records of a functional annotation file can be read from the results database of
+    its run.
+    '''
+
+    return get_results_annotation_file_dict(functional_annotation_file) is not None
+
+#-------------------------------------------------------------------------------
+
+def read_results_functional_annotation_batches(functional_annotation_file, column_list):
+    '''
+    Get lists of functional annotation records of a functional annotation file from the results
+    database of its run reading only the columns of column list (the other columns are empty).
+    The records are got in the order of the file.
+    '''
+
+    # get the data of the functional annotation file saved in the results database
+    annotation_file_dict = get_results_annotation_file_dict(functional_annotation_file)
+
+    # get the hit columns to read (the sequence and cluster identifications are always read), the
+    # cluster annotation columns to read and the position of the value of each record column in a
+    # row with the hit values, the cluster annotation values and an empty value at the end
+    hit_column_list = [column for column in sqllib.get_results_hit_column_list() if column in column_list or column in ['qseqid', 'sseqid']]
+    cluster_column_list = [column for column in sqllib.get_results_cluster_column_list() if column in column_list]
+    row_column_list = hit_column_list + cluster_column_list
+    get_record_value_list = operator.itemgetter(*[row_column_list.index(column) if column in row_column_list else len(row_column_list) for column in genlib.FunctionalAnnotationRecord._fields])    # pylint: disable=no-member
+    interned_position_list = [hit_column_list.index(column) for column in genlib.FunctionalAnnotationRecord.INTERNED_COLUMN_LIST if column in hit_column_list]
+    sseqid_position = hit_column_list.index('sseqid')
+
+    # connect to the results database
+    conn = sqllib.connect_database(get_results_db_file(functional_annotation_file))
+
+    # get the cluster annotations (a hit without cluster annotation has "-" values)
+    cluster_annotation_dict = sqllib.get_results_cluster_annotation_dict(conn, cluster_column_list)
+    missing_cluster_annotation = ('-',) * len(cluster_column_list) + ('',)
+    cluster_annotation_dict = {sys.intern(sseqid): tuple(sys.intern(value) for value in value_tuple) + ('',) for sseqid, value_tuple in cluster_annotation_dict.items()}
+
+    # build the functional annotation records of each batch (the columns not read are empty and
+    # the values of the columns repeated in many records are interned)
+    make_record = genlib.FunctionalAnnotationRecord._make    # pylint: disable=protected-access
+    cursor = sqllib.get_results_hit_rows(conn, hit_column_list, annotation_file_dict['besthit'])
+    while True:
+        row_list = cursor.fetchmany(genlib.Const.PARSE_BATCH_RECORD_NUM)
+        if not row_list:
+            break
+        record_list = []
+        for row in row_list:
+            if interned_position_list:
+                row = list(row)
+                for position in interned_position_list:
+                    row[position] = sys.intern(row[position])
+                row = tuple(row)
+            record_list.append(make_record(get_record_value_list(row + cluster_annotation_dict.get(row[sseqid_position], missing_cluster_annotation))))
+        yield record_list
+
+    # close the connection to the results database
+    conn.close()
+
+#-------------------------------------------------------------------------------
+
+class ResultsDatabaseBuilder():
+    '''
+    This class builds the results database of a run adding the functional annotation records with
+    all hits of each sequence. The hits are numbered in the order they are added, and the hits of
+    the functional annotation file with the best hit per sequence are also numbered as best hits
+    in the order of that file. The cluster annotations are saved once per cluster.
+    '''
+
+    #---------------
+
+    # set the number of hits inserted at a time
+    BATCH_SIZE = 10000
+
+    #---------------
+
+    def __init__(self, results_db_file, complete_functional_annotation_file, besthit_functional_annotation_file, besthit_annotation_record_list):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.results_db_file = results_db_file
+        self.complete_functional_annotation_file = complete_functional_annotation_file
+        self.besthit_functional_annotation_file = besthit_functional_annotation_file
+
+        # get the positions of the hits of the functional annotation file with the best hit per sequence
+        self.besthit_num_dict = collections.defaultdict(collections.deque)
+        for besthit_num, annotation_record in enumerate(besthit_annotation_record_list, start=1):
+            self.besthit_num_dict[self.get_hit_key(annotation_record)].append(besthit_num)
+
+        # initialize the hit number, the set of clusters saved and the pending rows
+        self.hit_num = 0
+        self.sseqid_set = set()
+        self.hit_row_list = []
+        self.cluster_row_list = []
+
+        # create the database
+        if os.path.isfile(results_db_file):
+            try:
+                os.remove(results_db_file)
+            except Exception as e:
+                raise genlib.ProgramException(e, 'F003', results_db_file)
+        self.conn = sqllib.connect_database(results_db_file)
+        sqllib.create_results_tables(self.conn)
+
+    #---------------
+
+    @staticmethod
+    def get_hit_key(annotation_record):
+        '''
+        Get the values of the hit columns of a functional annotation record.
+        '''
+
+        return tuple(annotation_record[column] for column in sqllib.get_results_hit_column_list())
+
+    #---------------
+
+    def add_sequence(self, _, annotation_record_list):
+        '''
+        Add the functional annotation records of a sequence.
+        '''
+
+        for annotation_record in annotation_record_list:
+
+            # number the hit and, when it is a best hit, number it with its position in the functional annotation file with the best hit per sequence
+            self.hit_num += 1
+            hit_key = self.get_hit_key(annotation_record)
+            besthit_num_deque = self.besthit_num_dict.get(hit_key)
+            besthit_num = besthit_num_deque.popleft() if besthit_num_deque else None
+            self.hit_row_list.append((self.hit_num, besthit_num) + hit_key)
+
+            # add the cluster annotations when the cluster is not saved
+            sseqid = annotation_record.sseqid
+            if sseqid not in self.sseqid_set:
+                self.sseqid_set.add(sseqid)
+                self.cluster_row_list.append((sseqid,) + tuple(annotation_record[column] for column in sqllib.get_results_cluster_column_list()))
+
+        # insert the pending rows when there are enough
+        if len(self.hit_row_list) >= self.BATCH_SIZE:
+            self.flush()
+
+    #---------------
+
+    def flush(self):
+        '''
+        Insert the pending rows.
+        '''
+
+        sqllib.insert_results_rows(self.conn, self.hit_row_list, self.cluster_row_list)
+        self.hit_row_list = []
+        self.cluster_row_list = []
+
+    #---------------
+
+    def close(self):
+        '''
+        Insert the pending rows, create the indexes, save the signatures of the functional annotation
+        files and close the database.
+        '''
+
+        self.flush()
+        sqllib.create_results_indexes(self.conn)
+        sqllib.insert_results_annotation_file(self.conn, os.path.basename(self.complete_functional_annotation_file), False, genlib.get_file_signature(self.complete_functional_annotation_file))
+        sqllib.insert_results_annotation_file(self.conn, os.path.basename(self.besthit_functional_annotation_file), True, genlib.get_file_signature(self.besthit_functional_annotation_file))
+        self.conn.commit()
+        self.conn.close()
+        genlib.Message.print('info', f'The file {self.results_db_file} is created.')
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class ResultsHitRows():
+    '''
+    This class gives access by row number to the hits of a functional annotation file saved in the
+    results database of its run, with the same data dictionaries as the functional annotation
+    files. The hits are got from the database by pages when they are requested.
+    '''
+
+    #---------------
+
+    # set the number of hits of a page
+    PAGE_SIZE = 500
+
+    #---------------
+
+    def __init__(self, functional_annotation_file):
+        '''
+        Create a class instance.
+        '''
+
+        # get if the functional annotation file has the best hits
+        self.besthit = get_results_annotation_file_dict(functional_annotation_file)['besthit']
+
+        # connect to the results database and get the hit count
+        self.conn = sqllib.connect_database(get_results_db_file(functional_annotation_file))
+        self.hit_count = sqllib.get_results_hit_count(self.conn, self.besthit)
+
+        # initialize the current page
+        self.page_num = None
+        self.page_data_dict_list = []
+
+    #---------------
+
+    def __len__(self):
+        '''
+        Get the number of hits.
+        '''
+
+        return self.hit_count
+
+    #---------------
+
+    def __getitem__(self, row):
+        '''
+        Get the data dictionary of the hit in a row.
+        '''
+
+        # check the row
+        if row < 0 or row >= self.hit_count:
+            raise IndexError(row)
+
+        # get the page of the row when it is not the current one (hit numbers start in 1)
+        page_num = row // self.PAGE_SIZE
+        if page_num != self.page_num:
+            first_num = page_num * self.PAGE_SIZE + 1
+            self.page_data_dict_list = sqllib.get_results_hit_range_dict_list(self.conn, first_num, first_num + self.PAGE_SIZE - 1, self.besthit)
+            self.page_num = page_num
+
+        # return the data dictionary
+        return self.page_data_dict_list[row % self.PAGE_SIZE]
+
+    #---------------
+
+    @staticmethod
+    def get_filter_column_list():
+        '''
+        Get the columns that can be filtered by a range of values.
+        '''
+
+        return ['pident', 'evalue']
+
+    #---------------
+
+    def filter_key_list(self, column, minimum=None, maximum=None):
+        '''
+        Get the row numbers (in the file order) whose value of a column is in a range (a missing
+        limit is not checked); the rows without value are excluded when there is a limit.
+        '''
+
+        return [num - 1 for num in sqllib.get_results_hit_num_list(self.conn, column, minimum, maximum, self.besthit)]
+
+    #---------------
+
+    def close(self):
+        '''
+        Close the connection to the results database.
+        '''
+
+        self.conn.close()
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    print(f'This source contains functions and classes related to the results database of a run used in {genlib.get_app_long_name()}.')
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
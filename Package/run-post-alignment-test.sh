@@ -0,0 +1,69 @@
+#!/bin/bash
+
+#-------------------------------------------------------------------------------
+
+# This script performs a test of the program run-post-alignment.py
+# in a Linux environment.
+#
+# This software has been developed by:
+#
+#    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+#    Dpto. Sistemas y Recursos Naturales
+#    ETSI Montes, Forestal y del Medio Natural
+#    Universidad Politecnica de Madrid
+#    https://github.com/ggfhf/
+#
+# Licence: GNU General Public Licence Version 3.
+
+#-------------------------------------------------------------------------------
+
+# Control parameters
+
+if [ -n "$*" ]; then echo 'This script does not have parameters'; exit 1; fi
+
+#-------------------------------------------------------------------------------
+
+# Set environment
+
+APP_DIR=$GYMNOTOA
+DATA_DIR=$APP_DIR/data
+OUTPUT_DIR=$APP_DIR/output
+
+if [ ! -d "$OUTPUT_DIR" ]; then mkdir --parents $OUTPUT_DIR; fi
+
+INITIAL_DIR=$(pwd)
+cd $APP_DIR
+
+#-------------------------------------------------------------------------------
+
+# Execute the program run-post-alignment.py
+
+/usr/bin/time \
+    ./run-post-alignment.py \
+        --db=$DATA_DIR/gymnoTOA.db \
+        --blastp-alignments=$DATA_DIR/blastp-Acrogymnospermae-alignments.csv \
+        --blastx-alignments=$DATA_DIR/blastx-Acrogymnospermae-alignments.csv \
+        --blastn-alignments=$DATA_DIR/blast-lncRNA-alignments.csv \
+        --complete_annotations=$OUTPUT_DIR/complete_functional-annotations.csv \
+        --besthit_annotations=$OUTPUT_DIR/besthit_functional-annotations.csv \
+        --outdir=$OUTPUT_DIR \
+        --species=all_species \
+        --method=by \
+        --msqannot=5 \
+        --msqspec=10 \
+        --parquet=N \
+        --verbose=Y  \
+        --trace=N
+if [ $? -ne 0 ]; then echo 'Script ended with errors.'; exit 1; fi
+
+#-------------------------------------------------------------------------------
+
+# End
+
+cd $INITIAL_DIR
+
+echo
+echo '**************************************************'
+exit 0
+
+#-------------------------------------------------------------------------------
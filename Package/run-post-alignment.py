@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This program runs in a single process the steps of an annotation pipeline after the alignments:
+concatenation of functional annotations, sort and head of annotation files, functional annotation
+statistics, inputs to external applications, incidence indexes, results database and, optionally,
+the enrichment analysis. All steps share the connection to the database and the annotation
+records of each file are parsed once. Optionally, the annotation and enrichment analysis files
+are also written in Parquet format.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import argparse
+import gzip
+import importlib
+import os
+import shutil
+import subprocess
+import sys
+
+import columnlib
+import exportlib
+import genlib
+import incidencelib
+import resultslib
+import sqllib
+import statslib
+
+#-------------------------------------------------------------------------------
+
+def main():
+    '''
+    Main line of the program.
+    '''
+
+    # check the operating system
+    genlib.check_os()
+
+    # get and check the arguments
+    parser = build_parser()
+    args = parser.parse_args()
+    check_args(args)
+
+    # connect to the gymnoTOA database
+    conn = sqllib.connect_database(args.gymnotoa_database)
+
+    # run the steps after the alignments
+    run_post_alignment(conn, args.blastp_clade_alignment_file, args.blastx_clade_alignment_file, args.blastn_lncrna_alignment_file, args.complete_functional_annotation_file, args.besthit_functional_annotation_file, args.output_dir, args.species_name, args.fdr_method, args.min_seqnum_annotations, args.min_seqnum_species, args.parquet)
+
+    # close connection to gymnoTOA database
+    conn.close()
+
+#-------------------------------------------------------------------------------
+
+def build_parser():
+    '''
+    Build the parser with the available arguments.
+    '''
+
+    # create the parser and add arguments
+    description = 'Description: This program runs in a single process the steps of an annotation pipeline after the alignments:\n' \
+                  'concatenation of functional annotations, statistics, inputs to external applications, incidence indexes,\n' \
+                  'results database and, optionally, the enrichment analysis.'
+    text = f'{genlib.get_app_short_name()} v{genlib.get_app_version()} - {os.path.basename(__file__)}\n\n{description}\n'
+    usage = f'\r{text.ljust(len("usage:"))}\nUsage: {os.path.basename(__file__)} arguments'
+    parser = argparse.ArgumentParser(usage=usage)
+    parser._optionals.title = 'Arguments'    #pylint: disable=protected-access
+    parser.add_argument('--db', dest='gymnotoa_database', help=f'Path of the {genlib.get_app_short_name()} database (mandatory).')
+    parser.add_argument('--blastp-alignments', dest='blastp_clade_alignment_file', help='Path of the clade alignment file yielded by blastp (mandatory).')
+    parser.add_argument('--blastx-alignments', dest='blastx_clade_alignment_file', help='Path of the clade alignment file yielded by blastx (mandatory).')
+    parser.add_argument('--blastn-alignments', dest='blastn_lncrna_alignment_file', help='Path of the lncRNA alignment file yielded by blastn (mandatory).')
+    parser.add_argument('--complete_annotations', dest='complete_functional_annotation_file', help='Path of the functional annotation file with all hits per sequence (mandatory).')
+    parser.add_argument('--besthit_annotations', dest='besthit_functional_annotation_file', help='Path of the functional annotation file with the best hit per sequence (mandatory).')
+    parser.add_argument('--outdir', dest='output_dir', help='Path of the directory to save statistics, inputs to external applications and enrichment analysis files (mandatory).')
+    parser.add_argument('--species', dest='species_name', help=f'The species name or "{genlib.get_all_species_code()}" of the enrichment analysis; default: no enrichment analysis.')
+    parser.add_argument('--method', dest='fdr_method', help=f'Method used in FDR calcutation: {genlib.get_fdr_method_code_list_text()}; default: {genlib.Const.DEFAULT_FDR_METHOD}.')
+    parser.add_argument('--msqannot', dest='min_seqnum_annotations', help=f'Minimum sequence number in annotation; default: {genlib.Const.DEFAULT_MIN_SEQNUM_ANNOTATIONS}.')
+    parser.add_argument('--msqspec', dest='min_seqnum_species', help=f'Minimum sequence number in species; default: {genlib.Const.DEFAULT_MIN_SEQNUM_SPECIES}.')
+    parser.add_argument('--parquet', dest='parquet', help=f'Write also the annotation and enrichment analysis files in Parquet format (they are not written when pyarrow is not installed): {genlib.get_parquet_code_list_text()}; default: {genlib.Const.DEFAULT_PARQUET}.')
+    parser.add_argument('--verbose', dest='verbose', help=f'Additional job status info during the run: {genlib.get_verbose_code_list_text()}; default: {genlib.Const.DEFAULT_VERBOSE}.')
+    parser.add_argument('--trace', dest='trace', help=f'Additional info useful to the developer team: {genlib.get_trace_code_list_text()}; default: {genlib.Const.DEFAULT_TRACE}.')
+
+    # return the paser
+    return parser
+
+#-------------------------------------------------------------------------------
+
+def check_args(args):
+    '''
+    Check the input arguments.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # check "gymnotoa_database"
+    if args.gymnotoa_database is None:
+        genlib.Message.print('error', f'*** The {genlib.get_app_short_name()} database is not indicated in the input arguments.')
+        OK = False
+    elif not os.path.isfile(args.gymnotoa_database):
+        genlib.Message.print('error', f'*** The file {args.gymnotoa_database} does not exist.')
+        OK = False
+
+    # check "blastp_clade_alignment_file"
+    if args.blastp_clade_alignment_file is None:
+        genlib.Message.print('error', '*** The clade alignment file yielded by blastp is not indicated in the input arguments.')
+        OK = False
+    elif not os.path.isfile(args.blastp_clade_alignment_file):
+        genlib.Message.print('error', f'*** The file {args.blastp_clade_alignment_file} does not exist.')
+        OK = False
+
+    # check "blastx_clade_alignment_file"
+    if args.blastx_clade_alignment_file is None:
+        genlib.Message.print('error', '*** The clade alignment file yielded by blastx is not indicated in the input arguments.')
+        OK = False
+    elif not os.path.isfile(args.blastx_clade_alignment_file):
+        genlib.Message.print('error', f'*** The file {args.blastx_clade_alignment_file} does not exist.')
+        OK = False
+
+    # check "blastn_lncrna_alignment_file"
+    if args.blastn_lncrna_alignment_file is None:
+        genlib.Message.print('error', '*** The lncRNA alignment file yielded by blastn is not indicated in the input arguments.')
+        OK = False
+    elif not os.path.isfile(args.blastn_lncrna_alignment_file):
+        genlib.Message.print('error', f'*** The file {args.blastn_lncrna_alignment_file} does not exist.')
+        OK = False
+
+    # check "complete_functional_annotation_file"
+    if args.complete_functional_annotation_file is None:
+        genlib.Message.print('error', '*** The functional annotation file with all hits per sequence is not indicated in the input arguments.')
+        OK = False
+
+    # check "besthit_functional_annotation_file"
+    if args.besthit_functional_annotation_file is None:
+        genlib.Message.print('error', '*** The functional annotation file with the best hit per sequence is not indicated in the input arguments.')
+        OK = False
+
+    # check "output_dir"
+    if args.output_dir is None:
+        genlib.Message.print('error', '*** The output directory is not indicated in the input arguments.')
+        OK = False
+
+    # check "fdr_method"
+    if args.fdr_method is None:
+        args.fdr_method = genlib.Const.DEFAULT_FDR_METHOD
+    elif not genlib.check_code(args.fdr_method, genlib.get_fdr_method_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** FDR method has to be {genlib.get_fdr_method_code_list_text()}.')
+        OK = False
+    else:
+        args.fdr_method = args.fdr_method.lower()
+
+    # check "min_seqnum_annotations"
+    if args.min_seqnum_annotations is None:
+        args.min_seqnum_annotations = genlib.Const.DEFAULT_MIN_SEQNUM_ANNOTATIONS
+    elif not genlib.check_int(args.min_seqnum_annotations, minimum=1):
+        genlib.Message.print('error', 'The minimum sequence number in annotations has to be an integer number greater than or equal to 1.')
+        OK = False
+    else:
+        args.min_seqnum_annotations = int(args.min_seqnum_annotations)
+
+    # check "min_seqnum_species"
+    if args.min_seqnum_species is None:
+        args.min_seqnum_species = genlib.Const.DEFAULT_MIN_SEQNUM_SPECIES
+    elif not genlib.check_int(args.min_seqnum_species, minimum=1):
+        genlib.Message.print('error', 'The minimum sequence number in species has to be an integer number greater than or equal to 1.')
+        OK = False
+    else:
+        args.min_seqnum_species = int(args.min_seqnum_species)
+
+    # check "parquet"
+    if args.parquet is None:
+        args.parquet = genlib.Const.DEFAULT_PARQUET
+    elif not genlib.check_code(args.parquet, genlib.get_parquet_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** parquet has to be {genlib.get_parquet_code_list_text()}.')
+        OK = False
+    else:
+        args.parquet = args.parquet.upper()
+    if args.parquet == 'Y' and not columnlib.is_parquet_available():
+        genlib.Message.print('info', 'WARNING: The Parquet files are not written because the library pyarrow is not installed in this environment.')
+        args.parquet = 'N'
+
+    # check "verbose"
+    if args.verbose is None:
+        args.verbose = genlib.Const.DEFAULT_VERBOSE
+    elif not genlib.check_code(args.verbose, genlib.get_verbose_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** verbose has to be {genlib.get_verbose_code_list_text()}.')
+        OK = False
+    if args.verbose.upper() == 'Y':
+        genlib.Message.set_verbose_status(True)
+
+    # check "trace"
+    if args.trace is None:
+        args.trace = genlib.Const.DEFAULT_TRACE
+    elif not genlib.check_code(args.trace, genlib.get_trace_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** trace has to be {genlib.get_trace_code_list_text()}.')
+        OK = False
+    if args.trace.upper() == 'Y':
+        genlib.Message.set_trace_status(True)
+
+    # if there are errors, exit with exception
+    if not OK:
+        raise genlib.ProgramException('', 'P001')
+
+#-------------------------------------------------------------------------------
+
+def run_post_alignment(conn, blastp_clade_alignment_file, blastx_clade_alignment_file, blastn_lncrna_alignment_file, complete_functional_annotation_file, besthit_functional_annotation_file, output_dir, species_name, fdr_method, min_seqnum_annotations, min_seqnum_species, parquet='N'):
+    '''
+    Run the steps of an annotation pipeline after the alignments.
+    '''
+
+    # concat functional annotations corresponding to the BLAST+ alignments
+    # (the programs have hyphens in their names, so they are imported with importlib)
+    genlib.Message.print('info', 'Concatenating functional annotation to alignment file ...')
+    concat_module = importlib.import_module('concat-functional-annotations')
+    concat_module.concat_functional_annotations(conn, blastp_clade_alignment_file, blastx_clade_alignment_file, blastn_lncrna_alignment_file, complete_functional_annotation_file, besthit_functional_annotation_file)
+
+    # sort the functional annotation files and add their heads
+    genlib.Message.print('info', 'Sorting functional annotations files and adding their heads ...')
+    sort_functional_annotation_file(besthit_functional_annotation_file)
+    sort_functional_annotation_file(complete_functional_annotation_file)
+
+    # write the Parquet copies of the functional annotation files
+    if parquet == 'Y':
+        genlib.Message.print('info', 'Writing the Parquet copies of functional annotations files ...')
+        columnlib.write_functional_annotation_parquet(besthit_functional_annotation_file)
+        columnlib.write_functional_annotation_parquet(complete_functional_annotation_file)
+
+    # build the incidence index of the functional annotation file with the best hit per sequence
+    # and keep its data to number the best hits in the results database
+    besthit_annotation_record_list = []
+    incidence_index_builder = incidencelib.IncidenceIndexBuilder()
+    for seq_id, annotation_record_list in columnlib.read_csv_functional_annotation_groups(besthit_functional_annotation_file):
+        incidence_index_builder.add_sequence(seq_id, annotation_record_list)
+        besthit_annotation_record_list.extend(annotation_record_list)
+    besthit_incidence_index = incidence_index_builder.build()
+    incidencelib.save_incidence_index(besthit_incidence_index, besthit_functional_annotation_file)
+
+    # calculate the functional annotation statistics, build the inputs to external applications, the incidence index
+    # and the results database from the records with all hits per sequence
+    genlib.Message.print('info', 'Calculating functional annotation statistics and building inputs to external applications, incidence indexes and results database ...')
+    functional_stats = statslib.FunctionalStats()
+    external_inputs_exporter = exportlib.ExternalInputsExporter(output_dir)
+    incidence_index_builder = incidencelib.IncidenceIndexBuilder()
+    results_database_builder = resultslib.ResultsDatabaseBuilder(f'{output_dir}/{genlib.get_results_db_file_name()}', complete_functional_annotation_file, besthit_functional_annotation_file, besthit_annotation_record_list)
+    del besthit_annotation_record_list
+    for seq_id, annotation_record_list in columnlib.read_csv_functional_annotation_groups(complete_functional_annotation_file):
+        functional_stats.add_sequence(annotation_record_list)
+        external_inputs_exporter.add_sequence(seq_id, annotation_record_list)
+        incidence_index_builder.add_sequence(seq_id, annotation_record_list)
+        results_database_builder.add_sequence(seq_id, annotation_record_list)
+        genlib.Message.print('verbose', f'\rProcessed annotations: {incidence_index_builder.annotation_counter}')
+    genlib.Message.print('verbose', '\n')
+    genlib.Message.print('info', f'{incidence_index_builder.annotation_counter} records processed.')
+    functional_stats.build_stats_files(conn, output_dir)
+    external_inputs_exporter.close()
+    complete_incidence_index = incidence_index_builder.build()
+    incidencelib.save_incidence_index(complete_incidence_index, complete_functional_annotation_file)
+    results_database_builder.close()
+
+    # calculate the enrichment analysis from the incidence indexes when a species is indicated
+    if species_name is not None:
+        genlib.Message.print('info', 'Calculating enrichment analysis ...')
+        enrichment_module = importlib.import_module('calculate-enrichment-analysis')
+        for (annotation_file, incidence_index, goea_file_name, mpea_file_name, koea_file_name, kpea_file_name) in [
+                (besthit_functional_annotation_file, besthit_incidence_index, genlib.get_besthit_goea_file_name(), genlib.get_besthit_mpea_file_name(), genlib.get_besthit_koea_file_name(), genlib.get_besthit_kpea_file_name()),
+                (complete_functional_annotation_file, complete_incidence_index, genlib.get_complete_goea_file_name(), genlib.get_complete_mpea_file_name(), genlib.get_complete_koea_file_name(), genlib.get_complete_kpea_file_name())]:
+            enrichment_module.calculate_goterm_enrichment_analysis(conn, annotation_file, species_name, fdr_method, min_seqnum_annotations, min_seqnum_species, f'{output_dir}/{goea_file_name}', incidence_index.get_annotation_term_dict(genlib.get_goea_code()))
+            enrichment_module.calculate_metacyc_pathway_enrichment_analysis(conn, annotation_file, species_name, fdr_method, min_seqnum_annotations, min_seqnum_species, f'{output_dir}/{mpea_file_name}', incidence_index.get_annotation_term_dict(genlib.get_mpea_code()))
+            enrichment_module.calculate_kegg_ko_enrichment_analysis(conn, annotation_file, species_name, fdr_method, min_seqnum_annotations, min_seqnum_species, f'{output_dir}/{koea_file_name}', incidence_index.get_annotation_term_dict(genlib.get_koea_code()))
+            enrichment_module.calculate_kegg_pathway_enrichment_analysis(conn, annotation_file, species_name, fdr_method, min_seqnum_annotations, min_seqnum_species, f'{output_dir}/{kpea_file_name}', incidence_index.get_annotation_term_dict(genlib.get_kpea_code()))
+            if parquet == 'Y':
+                for enrichment_file_name in [goea_file_name, mpea_file_name, koea_file_name, kpea_file_name]:
+                    columnlib.write_csv_file_parquet(f'{output_dir}/{enrichment_file_name}')
+
+    # show OK message
+    genlib.Message.print('info', f'The files are save in {output_dir}.')
+
+#-------------------------------------------------------------------------------
+
+def sort_functional_annotation_file(functional_annotation_file):
+    '''
+    Sort the records of a functional annotation file without head with the external merge sort
+    of the operating system (as the previous sort step of the pipeline script, so the records have
+    the collation order of the locale of the environment and they are not loaded into memory),
+    and write the file with its head and its offset index.
+    '''
+
+    # set the path of the temporal file with the sorted records
+    sorted_file = f'{functional_annotation_file}.sorted'
+
+    # open the functional annotation file in binary mode
+    if functional_annotation_file.endswith('.gz'):
+        try:
+            functional_annotation_file_id = gzip.open(functional_annotation_file, mode='rb')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F002', functional_annotation_file) from e
+    else:
+        try:
+            functional_annotation_file_id = open(functional_annotation_file, mode='rb')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F001', functional_annotation_file) from e
+
+    # sort the records in the temporal file
+    # (the locale of the environment is inherited by the sort process)
+    try:
+        with subprocess.Popen(['sort', f'--output={sorted_file}'], stdin=subprocess.PIPE) as process:
+            shutil.copyfileobj(functional_annotation_file_id, process.stdin)
+            process.stdin.close()
+            rc = process.wait()
+    except Exception as e:
+        raise genlib.ProgramException(e, 'F003', sorted_file) from e
+    functional_annotation_file_id.close()
+    if rc != 0:
+        raise genlib.ProgramException(f'sort has ended with return code {rc}', 'F003', sorted_file)
+
+    # write the head and the sorted records, and save the offset index of the file
+    functional_annotation_writer = genlib.FunctionalAnnotationFileWriter(functional_annotation_file)
+    try:
+        with open(sorted_file, mode='r', encoding='iso-8859-1', newline='') as sorted_file_id:
+            for record in sorted_file_id:
+                functional_annotation_writer.write(record)
+    except Exception as e:
+        raise genlib.ProgramException(e, 'F001', sorted_file) from e
+    functional_annotation_writer.close()
+
+    # remove the temporal file
+    os.remove(sorted_file)
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    main()
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
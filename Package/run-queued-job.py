@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This program submits the process script of a run to the job queue of the result directory,
+waits until the job is admitted, when the threads and memory reserved by the running jobs
+leave enough resources free, and runs the script recording its queue and run times.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import genlib
+import monitorlib
+import queuelib
+
+#-------------------------------------------------------------------------------
+
+def main():
+    '''
+    Main line of the program.
+    '''
+
+    # check the operating system
+    genlib.check_os()
+
+    # get and check the arguments
+    parser = build_parser()
+    args = parser.parse_args()
+    check_args(args)
+
+    # run the job
+    rc = run_queued_job(args.result_dir, args.script, args.threads, args.memory)
+
+    # exit with the return code of the job
+    if rc != 0:
+        sys.exit(1)
+
+#-------------------------------------------------------------------------------
+
+def build_parser():
+    '''
+    Build the parser with the available arguments.
+    '''
+
+    # create the parser and add arguments
+    description = 'Description: This program submits the process script of a run to the job queue of the result directory,\n' \
+                  'waits until the job is admitted, when the threads and memory reserved by the running jobs\n' \
+                  'leave enough resources free, and runs the script recording its queue and run times.'
+    text = f'{genlib.get_app_short_name()} v{genlib.get_app_version()} - {os.path.basename(__file__)}\n\n{description}\n'
+    usage = f'\r{text.ljust(len("usage:"))}\nUsage: {os.path.basename(__file__)} arguments'
+    parser = argparse.ArgumentParser(usage=usage)
+    parser._optionals.title = 'Arguments'    #pylint: disable=protected-access
+    parser.add_argument('--resultdir', dest='result_dir', help='Path of the result directory with the job queue (mandatory).')
+    parser.add_argument('--script', dest='script', help='Path of the process script of the run (mandatory).')
+    parser.add_argument('--threads', dest='threads', help='Number of threads used by the script; default: 1.')
+    parser.add_argument('--memory', dest='memory', help=f'Memory in GB used by the script; default: {genlib.Const.DEFAULT_JOB_MEMORY}.')
+    parser.add_argument('--verbose', dest='verbose', help=f'Additional job status info during the run: {genlib.get_verbose_code_list_text()}; default: {genlib.Const.DEFAULT_VERBOSE}.')
+    parser.add_argument('--trace', dest='trace', help=f'Additional info useful to the developer team: {genlib.get_trace_code_list_text()}; default: {genlib.Const.DEFAULT_TRACE}.')
+
+    # return the paser
+    return parser
+
+#-------------------------------------------------------------------------------
+
+def check_args(args):
+    '''
+    Check the input arguments.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # check "result_dir"
+    if args.result_dir is None:
+        genlib.Message.print('error', '*** The result directory is not indicated in the input arguments.')
+        OK = False
+    elif not os.path.isdir(args.result_dir):
+        genlib.Message.print('error', f'*** The directory {args.result_dir} does not exist.')
+        OK = False
+
+    # check "script"
+    if args.script is None:
+        genlib.Message.print('error', '*** The process script is not indicated in the input arguments.')
+        OK = False
+    elif not os.path.isfile(args.script):
+        genlib.Message.print('error', f'*** The file {args.script} does not exist.')
+        OK = False
+
+    # check "threads"
+    if args.threads is None:
+        args.threads = 1
+    elif not genlib.check_int(args.threads, minimum=1):
+        genlib.Message.print('error', '*** threads has to be an integer number greater than or equal to 1.')
+        OK = False
+    else:
+        args.threads = int(args.threads)
+
+    # check "memory"
+    if args.memory is None:
+        args.memory = genlib.Const.DEFAULT_JOB_MEMORY
+    elif not genlib.check_float(args.memory, minimum=0.):
+        genlib.Message.print('error', '*** memory has to be a float number greater than or equal to 0.')
+        OK = False
+    else:
+        args.memory = float(args.memory)
+
+    # check "verbose"
+    if args.verbose is None:
+        args.verbose = genlib.Const.DEFAULT_VERBOSE
+    elif not genlib.check_code(args.verbose, genlib.get_verbose_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** verbose has to be {genlib.get_verbose_code_list_text()}.')
+        OK = False
+    if args.verbose.upper() == 'Y':
+        genlib.Message.set_verbose_status(True)
+
+    # check "trace"
+    if args.trace is None:
+        args.trace = genlib.Const.DEFAULT_TRACE
+    elif not genlib.check_code(args.trace, genlib.get_trace_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** trace has to be {genlib.get_trace_code_list_text()}.')
+        OK = False
+    if args.trace.upper() == 'Y':
+        genlib.Message.set_trace_status(True)
+
+    # if there are errors, exit with exception
+    if not OK:
+        raise genlib.ProgramException('', 'P001')
+
+#-------------------------------------------------------------------------------
+
+def run_queued_job(result_dir, script, threads, memory):
+    '''
+    Submit the process script of a run to the job queue, wait until it is admitted and run it.
+    Get the return code of the script (1 when the job is not run).
+    '''
+
+    # get the run directory
+    run_dir = os.path.dirname(os.path.abspath(script))
+
+    # submit the job
+    job_queue = queuelib.JobQueue(result_dir)
+    job_number = job_queue.submit_job(script, threads, memory)
+    genlib.Message.print('info', f'The job {job_number} of the run {os.path.basename(run_dir)} is queued (threads: {threads}; memory: {memory} GB).')
+
+    # wait until the job is admitted
+    submit_time = time.time()
+    while True:
+        status = job_queue.admit_job(job_number, queuelib.get_total_threads(), queuelib.get_total_memory(), queuelib.get_available_memory())
+        if status != queuelib.JobQueue.QUEUED_STATUS:
+            break
+        genlib.Message.print('trace', f'The job {job_number} is waiting for resources.')
+        time.sleep(genlib.Const.DEFAULT_JOB_POLL_INTERVAL)
+    wait_time = monitorlib.format_duration(time.time() - submit_time)
+
+    # end the run as wrong when the job is not admitted (it has been cancelled)
+    if status != queuelib.JobQueue.RUNNING_STATUS:
+        genlib.Message.print('info', f'The job {job_number} has not been run (status: {status}; wait time: {wait_time}).')
+        os.makedirs(genlib.get_status_dir(run_dir), exist_ok=True)
+        with open(genlib.get_status_wrong(run_dir), mode='w', encoding='iso-8859-1'):
+            pass
+        job_queue.close()
+        return 1
+
+    # run the script
+    genlib.Message.print('info', f'The job {job_number} is started (wait time: {wait_time}).')
+    start_time = time.time()
+    try:
+        rc = subprocess.run([script], cwd=run_dir, check=False).returncode
+    except OSError as e:
+        genlib.Message.print('error', f'*** The script {script} can not be run: {e}')
+        rc = 1
+
+    # record the end of the job
+    job_queue.end_job(job_number, rc)
+    job_queue.close()
+    genlib.Message.print('info', f'The job {job_number} is ended with return code {rc} (run time: {monitorlib.format_duration(time.time() - start_time)}).')
+
+    # return the return code of the script
+    return rc
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
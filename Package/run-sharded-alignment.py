@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This program runs an alignment splitting the query FASTA file into shards balanced by residue
+count. The aligner command is run for each shard in concurrent processes sharing the threads,
+a completion marker is written for each shard ended OK and the alignment files of the shards
+are merged in query order. When the alignment is rerun, only the shards without completion
+marker are aligned.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+
+import genlib
+import pipelinelib
+
+#-------------------------------------------------------------------------------
+
+# set the placeholders of the aligner command replaced with the data of each shard
+QUERY_PLACEHOLDER = '%QUERY%'
+OUTPUT_PLACEHOLDER = '%OUTPUT%'
+THREADS_PLACEHOLDER = '%THREADS%'
+
+#-------------------------------------------------------------------------------
+
+def main():
+    '''
+    Main line of the program.
+    '''
+
+    # check the operating system
+    genlib.check_os()
+
+    # separate the aligner command (the arguments after "--")
+    if '--' in sys.argv:
+        separator_pos = sys.argv.index('--')
+        (argument_list, command_list) = (sys.argv[1:separator_pos], sys.argv[separator_pos + 1:])
+    else:
+        (argument_list, command_list) = (sys.argv[1:], [])
+
+    # get and check the arguments
+    parser = build_parser()
+    args = parser.parse_args(argument_list)
+    check_args(args, command_list)
+
+    # run the alignment
+    rc = run_sharded_alignment(args.query_file, args.output_file, args.shards, args.threads, command_list)
+
+    # exit with error when the alignment fails
+    if rc != 0:
+        sys.exit(1)
+
+#-------------------------------------------------------------------------------
+
+def build_parser():
+    '''
+    Build the parser with the available arguments.
+    '''
+
+    # create the parser and add arguments
+    description = 'Description: This program runs an alignment splitting the query FASTA file into shards balanced by residue\n' \
+                  'count. The aligner command is run for each shard in concurrent processes sharing the threads,\n' \
+                  'a completion marker is written for each shard ended OK and the alignment files of the shards\n' \
+                  'are merged in query order. When the alignment is rerun, only the shards without completion\n' \
+                  'marker are aligned.'
+    text = f'{genlib.get_app_short_name()} v{genlib.get_app_version()} - {os.path.basename(__file__)}\n\n{description}\n'
+    usage = f'\r{text.ljust(len("usage:"))}\nUsage: {os.path.basename(__file__)} arguments -- aligner command with {QUERY_PLACEHOLDER}, {OUTPUT_PLACEHOLDER} and {THREADS_PLACEHOLDER}'
+    parser = argparse.ArgumentParser(usage=usage)
+    parser._optionals.title = 'Arguments'    #pylint: disable=protected-access
+    parser.add_argument('--query', dest='query_file', help='Path of the query FASTA file (mandatory).')
+    parser.add_argument('--out', dest='output_file', help='Path of the alignment file (mandatory).')
+    parser.add_argument('--shards', dest='shards', help='Number of shards (it is reduced to the sequence number when there are less sequences); default: 1.')
+    parser.add_argument('--threads', dest='threads', help='Number of threads shared by the aligner processes; default: 1.')
+    parser.add_argument('--verbose', dest='verbose', help=f'Additional job status info during the run: {genlib.get_verbose_code_list_text()}; default: {genlib.Const.DEFAULT_VERBOSE}.')
+    parser.add_argument('--trace', dest='trace', help=f'Additional info useful to the developer team: {genlib.get_trace_code_list_text()}; default: {genlib.Const.DEFAULT_TRACE}.')
+
+    # return the paser
+    return parser
+
+#-------------------------------------------------------------------------------
+
+def check_args(args, command_list):
+    '''
+    Check the input arguments and the aligner command.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # check "query_file"
+    if args.query_file is None:
+        genlib.Message.print('error', '*** The query FASTA file is not indicated in the input arguments.')
+        OK = False
+    elif not os.path.isfile(args.query_file):
+        genlib.Message.print('error', f'*** The file {args.query_file} does not exist.')
+        OK = False
+
+    # check "output_file"
+    if args.output_file is None:
+        genlib.Message.print('error', '*** The alignment file is not indicated in the input arguments.')
+        OK = False
+
+    # check "shards"
+    if args.shards is None:
+        args.shards = 1
+    elif not genlib.check_int(args.shards, minimum=1):
+        genlib.Message.print('error', '*** shards has to be an integer number greater than or equal to 1.')
+        OK = False
+    else:
+        args.shards = int(args.shards)
+
+    # check "threads"
+    if args.threads is None:
+        args.threads = 1
+    elif not genlib.check_int(args.threads, minimum=1):
+        genlib.Message.print('error', '*** threads has to be an integer number greater than or equal to 1.')
+        OK = False
+    else:
+        args.threads = int(args.threads)
+
+    # check "verbose"
+    if args.verbose is None:
+        args.verbose = genlib.Const.DEFAULT_VERBOSE
+    elif not genlib.check_code(args.verbose, genlib.get_verbose_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** verbose has to be {genlib.get_verbose_code_list_text()}.')
+        OK = False
+    if args.verbose.upper() == 'Y':
+        genlib.Message.set_verbose_status(True)
+
+    # check "trace"
+    if args.trace is None:
+        args.trace = genlib.Const.DEFAULT_TRACE
+    elif not genlib.check_code(args.trace, genlib.get_trace_code_list(), case_sensitive=False):
+        genlib.Message.print('error', f'*** trace has to be {genlib.get_trace_code_list_text()}.')
+        OK = False
+    if args.trace.upper() == 'Y':
+        genlib.Message.set_trace_status(True)
+
+    # check the aligner command
+    if not command_list:
+        genlib.Message.print('error', '*** The aligner command is not indicated after "--".')
+        OK = False
+    else:
+        for placeholder in [QUERY_PLACEHOLDER, OUTPUT_PLACEHOLDER]:
+            if placeholder not in command_list:
+                genlib.Message.print('error', f'*** The aligner command does not have the placeholder {placeholder}.')
+                OK = False
+
+    # if there are errors, exit with exception
+    if not OK:
+        raise genlib.ProgramException('', 'P001')
+
+#-------------------------------------------------------------------------------
+
+def get_command(command_list, query_file, output_file, threads):
+    '''
+    Get the aligner command of a shard replacing the placeholders.
+    '''
+
+    replacement_dict = {QUERY_PLACEHOLDER: query_file, OUTPUT_PLACEHOLDER: output_file, THREADS_PLACEHOLDER: str(threads)}
+
+    return [replacement_dict.get(argument, argument) for argument in command_list]
+
+#-------------------------------------------------------------------------------
+
+def run_sharded_alignment(query_file, output_file, shard_num, threads, command_list):
+    '''
+    Run the alignment of the shards of a query FASTA file and merge their alignment files.
+    Get the return code (the last one of the aligner processes ended with errors).
+    '''
+
+    # write an empty alignment file when the query file does not have sequences (e.g. all of them have been filtered)
+    if not pipelinelib.has_sequences(query_file):
+        genlib.Message.print('info', f'The query file {query_file} does not have sequences; the alignment file is empty.')
+        open(output_file, mode='wb').close()    # pylint: disable=consider-using-with
+        return 0
+
+    # run the aligner with the query file when there is only one shard
+    if shard_num == 1:
+        genlib.Message.print('info', f'Running the alignment without shards ({threads} threads) ...')
+        return subprocess.run(get_command(command_list, query_file, output_file, threads), check=False).returncode
+
+    # split the query file when the split has not ended or it was done with other query file or shard number
+    # (the shards of a previous split are removed)
+    shard_dir = pipelinelib.get_shard_dir(output_file)
+    signature = pipelinelib.get_split_signature(query_file, shard_num)
+    shard_list = pipelinelib.read_shard_index(shard_dir, signature)
+    if shard_list is None:
+        shutil.rmtree(shard_dir, ignore_errors=True)
+        genlib.Message.print('info', f'Splitting the query file {query_file} into {shard_num} shards ...')
+        shard_list = pipelinelib.split_fasta_file(query_file, shard_dir, shard_num, signature)
+    else:
+        genlib.Message.print('info', f'The query file was previously split into {len(shard_list)} shards.')
+
+    # get the shards without completion marker
+    pending_shard_list = [shard_dict for shard_dict in shard_list if not os.path.isfile(pipelinelib.get_shard_file(shard_dir, shard_dict['shard_code'], 'ok'))]
+    genlib.Message.print('info', f'{len(shard_list) - len(pending_shard_list)} shards were previously aligned; {len(pending_shard_list)} shards are pending.')
+
+    # start an aligner process for each pending shard
+    process_list = []
+    shard_thread_list = pipelinelib.get_shard_thread_list(threads, len(pending_shard_list)) if pending_shard_list else []
+    for shard_dict, shard_threads in zip(pending_shard_list, shard_thread_list):
+        shard_query_file = pipelinelib.get_shard_file(shard_dir, shard_dict['shard_code'], 'fasta')
+        shard_output_file = pipelinelib.get_shard_file(shard_dir, shard_dict['shard_code'], 'out')
+        genlib.Message.print('info', f'Aligning the shard {shard_dict["shard_code"]} ({shard_dict["seq_num"]} sequences; {shard_dict["residue_num"]} residues; {shard_threads} threads) ...')
+        if shard_dict['seq_num'] == 0:
+            open(shard_output_file, mode='wb').close()    # pylint: disable=consider-using-with
+            process_list.append((shard_dict, None))
+        else:
+            process_list.append((shard_dict, subprocess.Popen(get_command(command_list, shard_query_file, shard_output_file, shard_threads))))    # pylint: disable=consider-using-with
+
+    # wait for the aligner processes and write the completion marker of the shards ended OK
+    rc = 0
+    for shard_dict, process in process_list:
+        shard_rc = process.wait() if process is not None else 0
+        if shard_rc == 0:
+            open(pipelinelib.get_shard_file(shard_dir, shard_dict['shard_code'], 'ok'), mode='wb').close()    # pylint: disable=consider-using-with
+            genlib.Message.print('info', f'The shard {shard_dict["shard_code"]} is aligned.')
+        else:
+            genlib.Message.print('error', f'*** The alignment of the shard {shard_dict["shard_code"]} has ended with return code {shard_rc}.')
+            rc = shard_rc
+
+    # merge the alignment files of the shards
+    if rc == 0:
+        genlib.Message.print('info', f'Merging the alignment files of the shards into {output_file} ...')
+        pipelinelib.merge_shard_files(shard_dir, shard_list, output_file)
+        genlib.Message.print('info', 'The alignment files are merged.')
+
+    # return the return code
+    return rc
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
@@ -336,6 +336,34 @@ def get_mmseqs2_species_list(conn):
 
 #-------------------------------------------------------------------------------
 
+def get_species_cluster_id_list(conn, species_name):
+    '''
+    Get the distinct cluster identifications of a species in the table "mmseqs2_protein_clusters".
+    '''
+
+    # initialize the cluster identification list
+    cluster_id_list = []
+
+    # select rows from the table "mmseqs2_protein_clusters"
+    sentence = f'''
+                SELECT DISTINCT cluster_id
+                    FROM mmseqs2_protein_clusters
+                    WHERE species LIKE '%{species_name}%';
+                '''
+    try:
+        rows = conn.execute(sentence)
+    except Exception as e:
+        raise genlib.ProgramException(e, 'B002', sentence, conn)
+
+    # add the cluster identifications to the list
+    for row in rows:
+        cluster_id_list.append(row[0])
+
+    # return the cluster identification list
+    return cluster_id_list
+
+#-------------------------------------------------------------------------------
+
 def get_goterms_per_cluster_dict(conn, species_name):
     '''
     Get the dictionary of the GO terms of each cluster corresponding to the species.
@@ -449,6 +477,302 @@ def get_go_ontology_dict(conn, goterm_id_list):
     # return the ontology dictionary
     return go_onlology_dict
 
+#-------------------------------------------------------------------------------
+# results database of a run: tables "hits", "cluster_annotations" and "annotation_files"
+#-------------------------------------------------------------------------------
+
+def get_results_hit_column_list():
+    '''
+    Get the list of the hit columns of a functional annotation record.
+    '''
+
+    return ['qseqid', 'sseqid', 'pident', 'length', 'mismatch', 'gapopen', 'qstart', 'qend', 'sstart', 'send', 'evalue', 'bitscore', 'algorithm']
+
+#-------------------------------------------------------------------------------
+
+def get_results_cluster_column_list():
+    '''
+    Get the list of the cluster annotation columns of a functional annotation record.
+    '''
+
+    return ['ncbi_description', 'ncbi_species', 'tair10_ortholog_seq_id', 'interpro_goterms', 'panther_goterms', 'metacyc_pathways', 'eggnog_ortholog_seq_id', 'eggnog_ortholog_species', 'eggnog_ogs', 'cog_category', 'eggnog_description', 'eggnog_goterms', 'ec', 'kegg_kos', 'kegg_pathways', 'kegg_modules', 'kegg_reactions', 'kegg_rclasses', 'brite', 'kegg_tc', 'cazy', 'pfams']
+
+#-------------------------------------------------------------------------------
+
+def create_results_tables(conn):
+    '''
+    Create the tables of the results database of a run (it is prepared for a bulk load). The
+    decimal columns are saved as text to keep the format of the functional annotation files, and
+    the table "annotation_files" keeps the signature of the functional annotation files loaded.
+    '''
+
+    # set the sentence list
+    cluster_column_text = ', '.join([f'{column} TEXT' for column in get_results_cluster_column_list()])
+    sentence_list = [
+        'PRAGMA journal_mode = OFF;',
+        'PRAGMA synchronous = OFF;',
+        'DROP TABLE IF EXISTS hits;',
+        'DROP TABLE IF EXISTS cluster_annotations;',
+        'DROP TABLE IF EXISTS annotation_files;',
+        '''
+        CREATE TABLE hits (
+            hit_num INTEGER PRIMARY KEY,
+            besthit_num INTEGER,
+            qseqid TEXT NOT NULL,
+            sseqid TEXT NOT NULL,
+            pident TEXT,
+            length INTEGER,
+            mismatch INTEGER,
+            gapopen INTEGER,
+            qstart INTEGER,
+            qend INTEGER,
+            sstart INTEGER,
+            send INTEGER,
+            evalue TEXT,
+            bitscore TEXT,
+            algorithm TEXT);
+        ''',
+        f'''
+        CREATE TABLE cluster_annotations (
+            sseqid TEXT PRIMARY KEY,
+            {cluster_column_text});
+        ''',
+        '''
+        CREATE TABLE annotation_files (
+            file_name TEXT PRIMARY KEY,
+            besthit INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            size INTEGER NOT NULL);
+        ''',
+        ]
+
+    # create the tables
+    for sentence in sentence_list:
+        try:
+            conn.execute(sentence)
+        except Exception as e:
+            raise genlib.ProgramException(e, 'B002', sentence, conn)
+
+#-------------------------------------------------------------------------------
+
+def insert_results_rows(conn, hit_row_list, cluster_row_list):
+    '''
+    Insert rows in the tables "hits" and "cluster_annotations" of the results database of a run.
+    '''
+
+    # set the sentence and row list of each table
+    hit_column_list = ['hit_num', 'besthit_num'] + get_results_hit_column_list()
+    cluster_column_list = ['sseqid'] + get_results_cluster_column_list()
+    sentence_row_list = [
+        (f'INSERT INTO hits ({", ".join(hit_column_list)}) VALUES ({", ".join(["?"] * len(hit_column_list))});', hit_row_list),
+        (f'INSERT INTO cluster_annotations ({", ".join(cluster_column_list)}) VALUES ({", ".join(["?"] * len(cluster_column_list))});', cluster_row_list),
+        ]
+
+    # insert the rows
+    for sentence, row_list in sentence_row_list:
+        try:
+            conn.executemany(sentence, row_list)
+        except Exception as e:
+            raise genlib.ProgramException(e, 'B002', sentence, conn)
+
+#-------------------------------------------------------------------------------
+
+def create_results_indexes(conn):
+    '''
+    Create the indexes of the results database of a run (the best hits are read in the order of
+    their numbers).
+    '''
+
+    # set the sentence list
+    sentence_list = [
+        'CREATE INDEX hits_besthit_num ON hits (besthit_num);',
+        ]
+
+    # create the indexes
+    for sentence in sentence_list:
+        try:
+            conn.execute(sentence)
+        except Exception as e:
+            raise genlib.ProgramException(e, 'B002', sentence, conn)
+
+#-------------------------------------------------------------------------------
+
+def insert_results_annotation_file(conn, file_name, besthit, signature):
+    '''
+    Insert the signature (modification time and size) of a functional annotation file loaded in
+    the results database of a run.
+    '''
+
+    sentence = 'INSERT OR REPLACE INTO annotation_files (file_name, besthit, mtime_ns, size) VALUES (?, ?, ?, ?);'
+    try:
+        conn.execute(sentence, [file_name, int(besthit), signature[0], signature[1]])
+    except Exception as e:
+        raise genlib.ProgramException(e, 'B002', sentence, conn)
+
+#-------------------------------------------------------------------------------
+
+def get_results_annotation_file_dict(conn, file_name):
+    '''
+    Get the data dictionary of a functional annotation file loaded in the results database of a
+    run (None when the file is not loaded or the database does not have the table).
+    '''
+
+    # select the row from the table "annotation_files"
+    sentence = 'SELECT besthit, mtime_ns, size FROM annotation_files WHERE file_name = ?;'
+    try:
+        row = conn.execute(sentence, [file_name]).fetchone()
+    except Exception:
+        row = None
+
+    # return the data dictionary
+    return None if row is None else {'besthit': bool(row[0]), 'signature': (row[1], row[2])}
+
+#-------------------------------------------------------------------------------
+
+def get_results_hit_dict_list(conn, where_text, parameter_list, order_column='hit_num'):
+    '''
+    Get the data dictionary list of the hits (joined to their cluster annotations) of the results
+    database of a run which satisfy a condition.
+    '''
+
+    # initialize the data dictionary list
+    data_dict_list = []
+
+    # select rows from the tables "hits" and "cluster_annotations"
+    column_list = get_results_hit_column_list() + get_results_cluster_column_list()
+    sentence = f'''
+                SELECT {", ".join([f"a.{column}" for column in get_results_hit_column_list()])}, {", ".join([f"b.{column}" for column in get_results_cluster_column_list()])}
+                    FROM hits a
+                    LEFT JOIN cluster_annotations b USING (sseqid)
+                    WHERE {where_text}
+                    ORDER BY a.{order_column};
+                '''
+    try:
+        rows = conn.execute(sentence, parameter_list)
+    except Exception as e:
+        raise genlib.ProgramException(e, 'B002', sentence, conn)
+
+    # add row data to the data dictionary list
+    for row in rows:
+        data_dict_list.append({column: ('-' if value is None else str(value)) for column, value in zip(column_list, row)})
+
+    # return the data dictionary list
+    return data_dict_list
+
+#-------------------------------------------------------------------------------
+
+def get_results_hit_count(conn, besthit=False):
+    '''
+    Get the number of hits (or best hits) of the results database of a run.
+    '''
+
+    # select the count from the table "hits"
+    sentence = 'SELECT COUNT(*) FROM hits WHERE besthit_num IS NOT NULL;' if besthit else 'SELECT COUNT(*) FROM hits;'
+    try:
+        row = conn.execute(sentence).fetchone()
+    except Exception as e:
+        raise genlib.ProgramException(e, 'B002', sentence, conn)
+
+    # return the count
+    return row[0]
+
+#-------------------------------------------------------------------------------
+
+def get_results_hit_range_dict_list(conn, first_num, last_num, besthit=False):
+    '''
+    Get the data dictionary list of the hits (or best hits) numbered from first_num to last_num of the results database of a run.
+    '''
+
+    if besthit:
+        return get_results_hit_dict_list(conn, 'a.besthit_num BETWEEN ? AND ?', [first_num, last_num], 'besthit_num')
+    return get_results_hit_dict_list(conn, 'a.hit_num BETWEEN ? AND ?', [first_num, last_num])
+
+#-------------------------------------------------------------------------------
+
+def get_results_hit_num_list(conn, column, minimum=None, maximum=None, besthit=False):
+    '''
+    Get the numbers (or best hit numbers) of the hits of the results database of a run whose
+    decimal value of a hit column is in a range (a missing limit is not checked); the hits
+    without value are excluded when there is a limit.
+    '''
+
+    # set the condition
+    num_column = 'besthit_num' if besthit else 'hit_num'
+    condition_list = [f'{num_column} IS NOT NULL']
+    parameter_list = []
+    if minimum is not None or maximum is not None:
+        condition_list.append(f"{column} NOT IN ('', '-')")
+    if minimum is not None:
+        condition_list.append(f'CAST({column} AS REAL) >= ?')
+        parameter_list.append(minimum)
+    if maximum is not None:
+        condition_list.append(f'CAST({column} AS REAL) <= ?')
+        parameter_list.append(maximum)
+
+    # select the numbers from the table "hits"
+    sentence = f'SELECT {num_column} FROM hits WHERE {" AND ".join(condition_list)} ORDER BY {num_column};'
+    try:
+        rows = conn.execute(sentence, parameter_list)
+    except Exception as e:
+        raise genlib.ProgramException(e, 'B002', sentence, conn)
+
+    # return the number list
+    return [row[0] for row in rows]
+
+#-------------------------------------------------------------------------------
+
+def get_results_hit_rows(conn, column_list, besthit=False):
+    '''
+    Get a cursor with the text values of some hit columns of the hits (or best hits) of the
+    results database of a run in the order of their numbers.
+    '''
+
+    # select rows from the table "hits"
+    select_text = ', '.join([f'CAST({column} AS TEXT)' for column in column_list])
+    num_column = 'besthit_num' if besthit else 'hit_num'
+    sentence = f'''
+                SELECT {select_text}
+                    FROM hits
+                    WHERE {num_column} IS NOT NULL
+                    ORDER BY {num_column};
+                '''
+    try:
+        cursor = conn.execute(sentence)
+    except Exception as e:
+        raise genlib.ProgramException(e, 'B002', sentence, conn)
+
+    # return the cursor
+    return cursor
+
+#-------------------------------------------------------------------------------
+
+def get_results_cluster_annotation_dict(conn, column_list):
+    '''
+    Get a dictionary with the values of some cluster annotation columns of each cluster of the
+    results database of a run (a missing value is "-").
+    '''
+
+    # initialize the dictionary
+    cluster_annotation_dict = {}
+
+    # select rows from the table "cluster_annotations"
+    select_text = ''.join([f", IFNULL({column}, '-')" for column in column_list])
+    sentence = f'''
+                SELECT sseqid{select_text}
+                    FROM cluster_annotations;
+                '''
+    try:
+        rows = conn.execute(sentence)
+    except Exception as e:
+        raise genlib.ProgramException(e, 'B002', sentence, conn)
+
+    # add row data to the dictionary
+    for row in rows:
+        cluster_annotation_dict[row[0]] = row[1:]
+
+    # return the dictionary
+    return cluster_annotation_dict
+
 #-------------------------------------------------------------------------------
 
 if __name__ == '__main__':
@@ -28,21 +28,14 @@ Licence: GNU General Public Licence Version 3.
 
 import gzip
 import os
-import re
-import subprocess
 import sys
 import webbrowser
-import matplotlib.pyplot as plt
-import plotnine
-import pandas
 
 from PyQt5.QtCore import Qt                      # pylint: disable=no-name-in-module
+from PyQt5.QtCore import QTimer                  # pylint: disable=no-name-in-module
 from PyQt5.QtGui import QCursor                  # pylint: disable=no-name-in-module
 from PyQt5.QtGui import QFontMetrics             # pylint: disable=no-name-in-module
 from PyQt5.QtGui import QGuiApplication          # pylint: disable=no-name-in-module
-from PyQt5.QtGui import QPainter                 # pylint: disable=no-name-in-module
-from PyQt5.QtGui import QPdfWriter               # pylint: disable=no-name-in-module
-from PyQt5.QtGui import QPixmap                  # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QAbstractItemView    # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QApplication         # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import QComboBox            # pylint: disable=no-name-in-module
@@ -60,6 +53,8 @@ from PyQt5.QtWidgets import QWidget              # pylint: disable=no-name-in-mo
 
 import dialogs
 import genlib
+import plotlib
+import registrylib
 
 #-------------------------------------------------------------------------------
 
@@ -101,7 +96,7 @@ class FormBrowseStats(QWidget):
         self.title = f'{genlib.get_app_short_name()} - {self.head}'
 
         # get the dictionary of application configuration
-        self.app_config_dict = genlib.get_config_dict(genlib.get_app_config_file())
+        self.app_config_dict = genlib.AppState.get_app_config_dict()
 
         # build the graphic user interface of the window
         self.build_gui()
@@ -404,76 +399,12 @@ class FormBrowseStats(QWidget):
         # get the result directory
         result_dir = self.app_config_dict['Environment parameters']['result_dir']
 
-        # set the type, name and code of the annotation pipeline datasets
+        # set the type and name of the annotation pipeline datasets
         process_type = genlib.get_result_run_subdir()
         process_name = genlib.get_process_run_annotation_pipeline_name()
-        process_code = genlib.get_process_id(process_name)
 
-        # get the process dictionary
-        process_dict = genlib.get_process_dict()
-
-        # get the log directory
-        log_dir = f'{result_dir}{os.sep}{process_type}'
-        if sys.platform.startswith('win32'):
-            log_dir = genlib.wsl_path_2_windows_path(log_dir)
-
-        # set the command to get the result datasets of annotation pipeline in the log directory
-        command = ''
-        if sys.platform.startswith('linux') or sys.platform.startswith('darwin'):
-            if process_name == 'all':
-                command = f'ls -d {log_dir}/*  | xargs -n 1 basename'
-            else:
-                command = f'ls -d {log_dir}{os.sep}{process_code}-*  | xargs -n 1 basename'
-        elif sys.platform.startswith('win32'):
-            log_dir = log_dir.replace('/', '\\')
-            if process_name == 'all':
-                command = f'dir /a:d /b {log_dir}\\*'
-            else:
-                command = f'dir /a:d /b {log_dir}\\{process_code}-*'
-
-        # run the command to get the result datasets of annotation pipeline in the log directory
-        output = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=False)
-
-        # initialize the result dataset dictionary
-        result_dataset_dict = {}
-
-        # build the result dataset dictionary
-        for line in output.stdout.split('\n'):
-            if line != '':
-
-                # get data
-                result_dataset_id = line.strip()
-                try:
-                    pattern = r'^(.+)\-(.+)\-(.+)$'
-                    mo = re.search(pattern, result_dataset_id)
-                    process_code = mo.group(1).strip()
-                    process_name = process_dict[process_code]['name']
-                    yymmdd = mo.group(2)
-                    hhmmss = mo.group(3)
-                    date = f'20{yymmdd[:2]}-{yymmdd[2:4]}-{yymmdd[4:]}'
-                    time = f'{hhmmss[:2]}:{hhmmss[2:4]}:{hhmmss[4:]}'
-                except:    # pylint: disable=bare-except
-                    process_name = 'unknown process'
-                    date = '0000-00-00'
-                    time = '00:00:00'
-
-                # determine the status
-                status_ok = os.path.isfile(genlib.get_status_ok(os.path.join(log_dir, result_dataset_id)))
-                status_wrong = os.path.isfile(genlib.get_status_wrong(os.path.join(log_dir, result_dataset_id)))
-                status = ''
-                if status_ok and not status_wrong:
-                    status = 'OK'
-                elif not status_ok and status_wrong:
-                    status = 'wrong'
-                elif not status_ok and not status_wrong:
-                    status = 'not finished'
-                elif status_ok and status_wrong:
-                    status = 'undetermined'
-
-                # insert data in the dictionary when the the status is OK
-                if status == 'OK':
-                    key = f'{process_name}-{result_dataset_id}'
-                    result_dataset_dict[key] = {'process': process_name, 'result_dataset_id': result_dataset_id, 'date': date, 'time': time, 'status': status}
+        # get the result datasets ended OK from the run registry
+        result_dataset_dict = registrylib.get_result_dataset_dict(result_dir, process_type, process_name, status_list=['OK'])
 
         # initialize "tablewidget"
         self.tablewidget.clearContents()
@@ -790,7 +721,7 @@ class FormPlotStats(QWidget):
         self.title = f'{genlib.get_app_short_name()} - {self.head}'
 
         # get the dictionary of application configuration
-        self.app_config_dict = genlib.get_config_dict(genlib.get_app_config_file())
+        self.app_config_dict = genlib.AppState.get_app_config_dict()
 
         # get the the code list and text list of annotation result types
         self.annotation_result_type_code_list = genlib.get_annotation_result_type_code_list()
@@ -1251,13 +1182,13 @@ class FormPlotStats(QWidget):
             # build the plot
             QApplication.setOverrideCursor(Qt.WaitCursor)
             if self.stats_code == 'species':
-                self.plot_frecuency_data(self.stats_code, annotation_result_type, stats_file_path, image_file_path, dpi, self.name)
+                plotlib.plot_frecuency_data(self.stats_code, annotation_result_type, stats_file_path, image_file_path, dpi, self.name)
             elif self.stats_code == 'go':
-                self.plot_frecuency_data(self.stats_code, annotation_result_type, stats_file_path, image_file_path, dpi, self.name)
+                plotlib.plot_frecuency_data(self.stats_code, annotation_result_type, stats_file_path, image_file_path, dpi, self.name)
             elif self.stats_code == 'namespace':
-                self.plot_frecuency_data(self.stats_code, annotation_result_type, stats_file_path, image_file_path, dpi, self.name)
+                plotlib.plot_frecuency_data(self.stats_code, annotation_result_type, stats_file_path, image_file_path, dpi, self.name)
             elif self.stats_code == 'seq_per_goterm':
-                self.plot_x_per_y_data(self.stats_code, stats_file_path, image_file_path, dpi, self.name)
+                plotlib.plot_x_per_y_data(self.stats_code, stats_file_path, image_file_path, dpi, self.name)
             QApplication.restoreOverrideCursor()
 
             # show the plot
@@ -1286,76 +1217,12 @@ class FormPlotStats(QWidget):
         # get the result directory
         result_dir = self.app_config_dict['Environment parameters']['result_dir']
 
-        # set the type, name and code of the annotation pipeline datasets
+        # set the type and name of the annotation pipeline datasets
         process_type = genlib.get_result_run_subdir()
         process_name = genlib.get_process_run_annotation_pipeline_name()
-        process_code = genlib.get_process_id(process_name)
-
-        # get the process dictionary
-        process_dict = genlib.get_process_dict()
-
-        # get the log directory
-        log_dir = f'{result_dir}{os.sep}{process_type}'
-        if sys.platform.startswith('win32'):
-            log_dir = genlib.wsl_path_2_windows_path(log_dir)
-
-        # set the command to get the result datasets of annotation pipeline in the log directory
-        command = ''
-        if sys.platform.startswith('linux') or sys.platform.startswith('darwin'):
-            if process_name == 'all':
-                command = f'ls -d {log_dir}/*  | xargs -n 1 basename'
-            else:
-                command = f'ls -d {log_dir}{os.sep}{process_code}-*  | xargs -n 1 basename'
-        elif sys.platform.startswith('win32'):
-            log_dir = log_dir.replace('/', '\\')
-            if process_name == 'all':
-                command = f'dir /a:d /b {log_dir}\\*'
-            else:
-                command = f'dir /a:d /b {log_dir}\\{process_code}-*'
-
-        # run the command to get the result datasets of annotation pipeline in the log directory
-        output = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=False)
 
-        # initialize the result dataset dictionary
-        result_dataset_dict = {}
-
-        # build the result dataset dictionary
-        for line in output.stdout.split('\n'):
-            if line != '':
-
-                # get data
-                result_dataset_id = line.strip()
-                try:
-                    pattern = r'^(.+)\-(.+)\-(.+)$'
-                    mo = re.search(pattern, result_dataset_id)
-                    process_code = mo.group(1).strip()
-                    process_name = process_dict[process_code]['name']
-                    yymmdd = mo.group(2)
-                    hhmmss = mo.group(3)
-                    date = f'20{yymmdd[:2]}-{yymmdd[2:4]}-{yymmdd[4:]}'
-                    time = f'{hhmmss[:2]}:{hhmmss[2:4]}:{hhmmss[4:]}'
-                except:    # pylint: disable=bare-except
-                    process_name = 'unknown process'
-                    date = '0000-00-00'
-                    time = '00:00:00'
-
-                # determine the status
-                status_ok = os.path.isfile(genlib.get_status_ok(os.path.join(log_dir, result_dataset_id)))
-                status_wrong = os.path.isfile(genlib.get_status_wrong(os.path.join(log_dir, result_dataset_id)))
-                status = ''
-                if status_ok and not status_wrong:
-                    status = 'OK'
-                elif not status_ok and status_wrong:
-                    status = 'wrong'
-                elif not status_ok and not status_wrong:
-                    status = 'not finished'
-                elif status_ok and status_wrong:
-                    status = 'undetermined'
-
-                # insert data in the dictionary when the the status is OK
-                if status == 'OK':
-                    key = f'{process_name}-{result_dataset_id}'
-                    result_dataset_dict[key] = {'process': process_name, 'result_dataset_id': result_dataset_id, 'date': date, 'time': time, 'status': status}
+        # get the result datasets ended OK from the run registry
+        result_dataset_dict = registrylib.get_result_dataset_dict(result_dir, process_type, process_name, status_list=['OK'])
 
         # initialize "tablewidget"
         self.tablewidget.clearContents()
@@ -1379,247 +1246,6 @@ class FormPlotStats(QWidget):
 
     #---------------
 
-    @staticmethod
-    def plot_frecuency_data(stats_code, annotation_result_type, stats_file_path, image_file_path, dpi, name):
-        '''
-        Plot a bar plot when x is a interger number and y is a literal.
-        '''
-
-        # initialize the data dictionary
-        data_dict = {}
-
-        # open the statistics file
-        if stats_file_path.endswith('.gz'):
-            try:
-                stats_file_path_id = gzip.open(stats_file_path, mode='rt', encoding='iso-8859-1', newline='\n')
-            except Exception as e:
-                raise genlib.ProgramException(e, 'F002', stats_file_path)
-        else:
-            try:
-                stats_file_path_id = open(stats_file_path, mode='r', encoding='iso-8859-1', newline='\n')
-            except Exception as e:
-                raise genlib.ProgramException(e, 'F001', stats_file_path)
-
-        # initialize the record counter
-        record_counter = 0
-
-        # initialize the header record control
-        header_record = True
-
-        # read the first record
-        record = stats_file_path_id.readline()
-
-        # while there are records
-        while record != '':
-
-            # add 1 to the record counter
-            record_counter += 1
-
-            # process the header record
-            if header_record:
-                header_record = False
-
-            # process data records
-            else:
-
-                # extract data
-                data_list = []
-                begin = 0
-                for end in [i for i, chr in enumerate(record) if chr == ';']:
-                    data_list.append(record[begin:end].strip('"'))
-                    begin = end + 1
-                data_list.append(record[begin:].strip('\n').strip('"'))
-                try:
-                    # record format: "stats_code_id";"best_hit";"all_hits"
-                    if stats_code in ['species', 'namespace']:
-                        # format: "id";"best_hit";"all_hits"
-                        key = data_list[0]
-                        value = 0
-                        if annotation_result_type == 'best':
-                            value = int(data_list[1])
-                        elif annotation_result_type == 'complete':
-                            value = int(data_list[2])
-                        if value > 0:
-                            data_dict[key] = value
-                    # record format: "go_id";"description";"namespace";"best_hit";"all_hits"
-                    elif stats_code == 'go':
-                        key = f'{data_list[0]} ({data_list[1]})'
-                        if annotation_result_type == 'best':
-                            value = int(data_list[3])
-                        elif annotation_result_type == 'complete':
-                            value = int(data_list[4])
-                        if value > 0:
-                            data_dict[key] = value
-                except Exception as e:
-                    raise genlib.ProgramException(e, 'F006', os.path.basename(stats_file_path), record_counter)
-
-            # read the next record
-            record = stats_file_path_id.readline()
-
-        # initialize the lists associated to the distribution dictionary
-        text_list = []
-        value_list = []
-
-        # initialize the item counter
-        item_counter = 0
-
-        # initialize the value sum of remainder items
-        remainder_sum = 0
-
-        # sort the data dictionary by value
-        for (key, value) in sorted(data_dict.items(), reverse=True, key=lambda x: x[1]):
-
-            # check if item counter is less than the maximum of items to show
-            if item_counter < 10:
-                text_list.append(key)
-                value_list.append(value)
-
-            # if it not is less
-            else:
-                remainder_sum += value
-
-            # add 1 to the item counter
-            item_counter += 1
-
-        # build distribution dictionary
-        text_list = list(reversed(text_list))
-        value_list = list(reversed(value_list))
-        distribution_dict = {'text_list': text_list, 'value_list': value_list}
-
-        # load data in a Pandas DataFrame
-        distribution_df = pandas.DataFrame(distribution_dict)
-        distribution_df['text_list'] = pandas.Categorical(distribution_df['text_list'], categories=text_list, ordered=False)
-
-        # build the "plot"
-        if stats_code == 'namespace':
-            # pie chart
-            title = ''
-            if annotation_result_type == 'best':
-                title = f'{name}\n(best hit per sequence)'
-            elif annotation_result_type == 'complete':
-                title = f'{name}\n(all hits per sequence)'
-            explode = [0.01] * len(value_list)
-            (_, ax1) = plt.subplots()
-            (_, texts, _) = ax1.pie(value_list, explode=explode, labels=text_list, autopct='%1.1f%%', shadow=False, startangle=270)
-            ax1.axis('equal')
-            for text in texts:
-                text.set_color('grey')
-            plt.title(title, color='blue')
-            plt.savefig(image_file_path, dpi=dpi)
-        else:
-            # bar plot
-            title = name
-            caption = ''
-            if annotation_result_type == 'best':
-                caption = 'Best hit per sequence'
-            elif annotation_result_type == 'complete':
-                caption = 'All hits per sequence'
-            label_y = 'Alignments #'
-            plot = (plotnine.ggplot(data=distribution_df) +
-                        plotnine.aes(x='text_list', y='value_list') +
-                        plotnine.geom_bar(stat='identity', size=0.1, color='green', fill='green') +
-                        plotnine.geom_text(plotnine.aes(label='value_list'), va='center') +
-                        plotnine.coord_flip() +
-                        plotnine.labs(title=title, caption=caption, x='', y=label_y) +
-                        plotnine.theme_grey() +
-                        plotnine.theme(plot_title=plotnine.element_text(color='blue', margin={'b':15})) +
-                        plotnine.theme(axis_title_x=plotnine.element_text(color='black')) +
-                        plotnine.theme(axis_title_y=plotnine.element_text(color='black'))
-            )
-            plot.save(filename=image_file_path, height=6, width=10, dpi=dpi, verbose=False)
-
-    #---------------
-
-    @staticmethod
-    def plot_x_per_y_data(stats_code, stats_file_path, image_file_path, dpi, name):
-        '''
-        Plot x # per y #.
-        '''
-
-        # initialize the lists associated to the distribution dictionary
-        x_count_list = []
-        y_count_list = []
-
-        # open the statistics file
-        if stats_file_path.endswith('.gz'):
-            try:
-                stats_file_path_id = gzip.open(stats_file_path, mode='rt', encoding='iso-8859-1', newline='\n')
-            except Exception as e:
-                raise genlib.ProgramException(e, 'F002', stats_file_path)
-        else:
-            try:
-                stats_file_path_id = open(stats_file_path, mode='r', encoding='iso-8859-1', newline='\n')
-            except Exception as e:
-                raise genlib.ProgramException(e, 'F001', stats_file_path)
-
-        # initialize the record counter
-        record_counter = 0
-
-        # initialize the header record control
-        header_record = True
-
-        # read the first record
-        record = stats_file_path_id.readline()
-
-        # while there are records
-        while record != '':
-
-            # add 1 to the record counter
-            record_counter += 1
-
-            # process the header record
-            if header_record:
-                header_record = False
-
-            # process data records
-            else:
-
-                # extract data
-                # record format: "x_count";"y_count"
-                data_list = []
-                begin = 0
-                for end in [i for i, chr in enumerate(record) if chr == ';']:
-                    data_list.append(record[begin:end].strip('"'))
-                    begin = end + 1
-                data_list.append(record[begin:].strip('\n').strip('"'))
-                try:
-                    x_count_list.append(int(data_list[0]))
-                    y_count_list.append(int(data_list[1]))
-                except Exception as e:
-                    raise genlib.ProgramException(e, 'F006', os.path.basename(stats_file_path), record_counter)
-
-            # read the next record
-            record = stats_file_path_id.readline()
-
-        # build distribution dictionary
-        distribution_dict = {'x_count': x_count_list, 'y_count': y_count_list}
-
-        # load data in a Pandas DataFrame
-        distribution_df = pandas.DataFrame(distribution_dict)
-
-        # set the title, caption and labels
-        title = name
-        caption = ''
-        label_x = ''
-        label_y = ''
-        if stats_code == 'seq_per_goterm':
-            label_x = 'GO terms #'
-            label_y = 'Sequences #'
-
-        # build the plot
-        plot = (plotnine.ggplot(data=distribution_df) +
-                    plotnine.aes(x='x_count', y='y_count') +
-                    plotnine.geom_bar(stat='identity', color='red', fill='red') +
-                    plotnine.labs(title=title, caption=caption, x=label_x, y=label_y) +
-                    plotnine.theme_grey() +
-                    plotnine.theme(plot_title=plotnine.element_text(color='blue', margin={'b':15})) +
-                    plotnine.theme(axis_title_x=plotnine.element_text(color='black')) +
-                    plotnine.theme(axis_title_y=plotnine.element_text(color='black'))
-        )
-        plot.save(filename=image_file_path, height=4.8, width=6.4, dpi=dpi, verbose=False)
-
-    #---------------
-
 #-------------------------------------------------------------------------------
 
 class FormViewSummaryReport(QWidget):
@@ -1627,6 +1253,9 @@ class FormViewSummaryReport(QWidget):
     Class used to view a summary report of statistics.
     '''
 
+    # set the interval (in milliseconds) to check the rendering of the plots
+    RENDERING_CHECK_INTERVAL = 200
+
     #---------------
 
     def __init__(self, parent):
@@ -1638,7 +1267,7 @@ class FormViewSummaryReport(QWidget):
         self.parent = parent
 
         # assign the text of the "name"
-        self.name = 'Statistics - Summary report'
+        self.name = plotlib.SUMMARY_REPORT_NAME
 
         # call the init method of the parent class
         super().__init__()
@@ -1652,7 +1281,15 @@ class FormViewSummaryReport(QWidget):
         self.title = f'{genlib.get_app_short_name()} - {self.head}'
 
         # get the dictionary of application configuration
-        self.app_config_dict = genlib.get_config_dict(genlib.get_app_config_file())
+        self.app_config_dict = genlib.AppState.get_app_config_dict()
+
+        # initialize the renderer of the plots and the summary report path
+        self.plot_renderer = None
+        self.summary_report_path = ''
+
+        # create the timer that checks the rendering of the plots
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.check_plot_rendering)
 
         # build the graphic user interface of the window
         self.build_gui()
@@ -1879,102 +1516,53 @@ class FormViewSummaryReport(QWidget):
             # get the result dataset
             result_dataset_id = self.tablewidget.item(row_list[0], 1).text()
 
-            # set file name, file path, image name and image path corresponding to species frequency distribution
-            species_stats_file_name = 'stats-species.csv'
-            species_stats_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{species_stats_file_name}'
-            if sys.platform.startswith('win32'):
-                species_stats_file_path = genlib.wsl_path_2_windows_path(species_stats_file_path)
-            species_image_file_name = 'figure-species'
-            species_image_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{species_image_file_name}.png'
-            if sys.platform.startswith('win32'):
-                species_image_file_path = genlib.wsl_path_2_windows_path(species_image_file_path)
-
-            # set file name, file path, image name and image path corresponding to GO terms frequency distribution
-            go_stats_file_name = 'stats-goterms.csv'
-            go_stats_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{go_stats_file_name}'
-            if sys.platform.startswith('win32'):
-                go_stats_file_path = genlib.wsl_path_2_windows_path(go_stats_file_path)
-            go_image_file_name = 'figure-goterms'
-            go_image_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{go_image_file_name}.png'
-            if sys.platform.startswith('win32'):
-                go_image_file_path = genlib.wsl_path_2_windows_path(go_image_file_path)
-
-            # set file name, file path, image name and image path corresponding to namespaces frequency distribution
-            namespace_stats_file_name = 'stats-namespaces.csv'
-            namespace_stats_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{namespace_stats_file_name}'
-            if sys.platform.startswith('win32'):
-                namespace_stats_file_path = genlib.wsl_path_2_windows_path(namespace_stats_file_path)
-            namespace_image_file_name = 'figure-namespaces'
-            namespace_image_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{namespace_image_file_name}.png'
+            # get the run directory
+            run_dir = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}'
             if sys.platform.startswith('win32'):
-                namespace_image_file_path = genlib.wsl_path_2_windows_path(namespace_image_file_path)
-
-            # set file name, file path, image name and image path corresponding to sequences number per GO terms umber
-            seq_per_goterm_stats_file_name = 'stats-seq-per-goterm.csv'
-            seq_per_goterm_stats_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{seq_per_goterm_stats_file_name}'
-            if sys.platform.startswith('win32'):
-                seq_per_goterm_stats_file_path = genlib.wsl_path_2_windows_path(seq_per_goterm_stats_file_path)
-            seq_per_goterm_image_file_name = 'figure-seq-per-goterm'
-            seq_per_goterm_image_file_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}{seq_per_goterm_image_file_name}.png'
-            if sys.platform.startswith('win32'):
-                seq_per_goterm_image_file_path = genlib.wsl_path_2_windows_path(seq_per_goterm_image_file_path)
-
-            # get the DPI
-            dpi = 600
-
-            # build plots
-            QApplication.setOverrideCursor(Qt.WaitCursor)
-            FormPlotStats.plot_frecuency_data('species', 'best', species_stats_file_path, species_image_file_path, dpi, self.name)
-            FormPlotStats.plot_frecuency_data('go', 'best', go_stats_file_path, go_image_file_path, dpi, self.name)
-            FormPlotStats.plot_frecuency_data('namespace', 'best', namespace_stats_file_path, namespace_image_file_path, dpi, self.name)
-            FormPlotStats.plot_x_per_y_data('seq_per_goterm', seq_per_goterm_stats_file_path, seq_per_goterm_image_file_path, dpi, self.name)
-            QApplication.restoreOverrideCursor()
+                run_dir = genlib.wsl_path_2_windows_path(run_dir)
 
             # set the plot list
-            images_path_list = [species_image_file_path, go_image_file_path, namespace_image_file_path, seq_per_goterm_image_file_path]
+            plot_list = plotlib.get_summary_report_plot_list(run_dir, genlib.Const.DEFAULT_SUMMARY_REPORT_DPI)
 
             # set the summary report path
-            summary_report_path = f'{result_dir}{os.sep}{process_type}{os.sep}{result_dataset_id}{os.sep}summary_report.pdf'
-            if sys.platform.startswith('win32'):
-                summary_report_path = genlib.wsl_path_2_windows_path(summary_report_path)
-
-            # create a QPdfWriter object
-            pdf_writer = QPdfWriter(summary_report_path)
-
-            # create a QPainter object
-            painter = QPainter()
+            self.summary_report_path = plotlib.get_summary_report_file_path(run_dir)
 
-            # begin to paint in QPainter object
-            painter.begin(pdf_writer)
+            # start the rendering of the plots and the summary report that are not in the cache of the run
+            self.plot_renderer = plotlib.PlotRenderer(plot_list, plotlib.get_plot_cache_dir(run_dir), report_file_path=self.summary_report_path)
+            self.plot_renderer.start()
 
-            # set the PDF width
-            pdf_width = 9000
-
-            # initialize the y position
-            y = 0
-
-            # paint every plot
-            for _, image_path in enumerate(images_path_list):
+            # wait for the rendering without blocking the window
+            self.pushbutton_execute.setEnabled(False)
+            QApplication.setOverrideCursor(Qt.BusyCursor)
+            self.timer.start(self.RENDERING_CHECK_INTERVAL)
 
-                # load the plot
-                pixmap = QPixmap(image_path)
+    #---------------
 
-                # set the current x position
-                x = int((pdf_width - pixmap.width()) / 2)
+    def check_plot_rendering(self):
+        '''
+        Check the rendering of the plots and the summary report and, when it ends, view the summary report.
+        '''
 
-                # draw the plot in the PDF
-                painter.drawPixmap(x, y, pixmap)
+        # check if the rendering has ended
+        if not self.plot_renderer.is_done():
+            return
 
-                # update the next y position
-                y += pixmap.height() + 100
+        # stop the timer
+        self.timer.stop()
+        QApplication.restoreOverrideCursor()
+        self.pushbutton_execute.setEnabled(True)
 
-            # end to paint in QPainter object
-            painter.end()
+        # get the result of the rendering
+        (OK, error_list) = self.plot_renderer.get_result()
+        if not OK:
+            text = '\n'.join(error_list)
+            QMessageBox.critical(self, self.title, text, buttons=QMessageBox.Ok)
+            return
 
-            # show the summary report
-            QApplication.setOverrideCursor(Qt.WaitCursor)
-            webbrowser.open_new(f'file://{summary_report_path}')
-            QApplication.restoreOverrideCursor()
+        # show the summary report
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        webbrowser.open_new(f'file://{self.summary_report_path}')
+        QApplication.restoreOverrideCursor()
 
     #---------------
 
@@ -1989,6 +1577,20 @@ class FormViewSummaryReport(QWidget):
 
     #---------------
 
+    def closeEvent(self, event):
+        '''
+        Stop the timer and release the pool of processes when the window is closed.
+        '''
+
+        if self.timer.isActive():
+            self.timer.stop()
+            QApplication.restoreOverrideCursor()
+        if self.plot_renderer is not None:
+            self.plot_renderer.shutdown()
+        event.accept()
+
+    #---------------
+
     def load_tablewidget(self):
         '''
         Load data in "tablewidget".
@@ -1997,72 +1599,12 @@ class FormViewSummaryReport(QWidget):
         # get the result directory
         result_dir = self.app_config_dict['Environment parameters']['result_dir']
 
-        # set the type, name and code of the annotation pipeline datasets
+        # set the type and name of the annotation pipeline datasets
         process_type = genlib.get_result_run_subdir()
         process_name = genlib.get_process_run_annotation_pipeline_name()
-        process_code = genlib.get_process_id(process_name)
-
-        # get the process dictionary
-        process_dict = genlib.get_process_dict()
-
-        # get the log directory
-        log_dir = f'{result_dir}{os.sep}{process_type}'
-        if sys.platform.startswith('win32'):
-            log_dir = genlib.wsl_path_2_windows_path(log_dir)
 
-        # set the command to get the result datasets of annotation pipeline in the log directory
-        command = ''
-        if sys.platform.startswith('linux') or sys.platform.startswith('darwin'):
-            if process_name == 'all':
-                command = f'ls -d {log_dir}/*  | xargs -n 1 basename'
-            else:
-                command = f'ls -d {log_dir}{os.sep}{process_code}-*  | xargs -n 1 basename'
-        elif sys.platform.startswith('win32'):
-            log_dir = log_dir.replace('/', '\\')
-            if process_name == 'all':
-                command = f'dir /a:d /b {log_dir}\\*'
-            else:
-                command = f'dir /a:d /b {log_dir}\\{process_code}-*'
-
-        # run the command to get the result datasets of annotation pipeline in the log directory
-        output = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=False)
-        result_dataset_dict = {}
-        for line in output.stdout.split('\n'):
-            if line != '':
-
-                # get data
-                result_dataset_id = line.strip()
-                try:
-                    pattern = r'^(.+)\-(.+)\-(.+)$'
-                    mo = re.search(pattern, result_dataset_id)
-                    process_code = mo.group(1).strip()
-                    process_name = process_dict[process_code]['name']
-                    yymmdd = mo.group(2)
-                    hhmmss = mo.group(3)
-                    date = f'20{yymmdd[:2]}-{yymmdd[2:4]}-{yymmdd[4:]}'
-                    time = f'{hhmmss[:2]}:{hhmmss[2:4]}:{hhmmss[4:]}'
-                except:    # pylint: disable=bare-except
-                    process_name = 'unknown process'
-                    date = '0000-00-00'
-                    time = '00:00:00'
-
-                # determine the status
-                status_ok = os.path.isfile(genlib.get_status_ok(os.path.join(log_dir, result_dataset_id)))
-                status_wrong = os.path.isfile(genlib.get_status_wrong(os.path.join(log_dir, result_dataset_id)))
-                status = ''
-                if status_ok and not status_wrong:
-                    status = 'OK'
-                elif not status_ok and status_wrong:
-                    status = 'wrong'
-                elif not status_ok and not status_wrong:
-                    status = 'not finished'
-                elif status_ok and status_wrong:
-                    status = 'undetermined'
-
-                # insert data in the dictionary when the the status is OK
-                if status == 'OK':
-                    key = f'{process_name}-{result_dataset_id}'
-                    result_dataset_dict[key] = {'process': process_name, 'result_dataset_id': result_dataset_id, 'date': date, 'time': time, 'status': status}
+        # get the result datasets ended OK from the run registry
+        result_dataset_dict = registrylib.get_result_dataset_dict(result_dir, process_type, process_name, status_list=['OK'])
 
         # initialize "tablewidget"
         self.tablewidget.clearContents()
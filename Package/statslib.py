@@ -0,0 +1,685 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This source contains functions and classes related to the functional annotation statistics
+used in gymnoTOA (Gymnosperms Taxonomy-oriented Annotation).
+
+The statistics are kept in accumulators that can be serialized and merged, so they can be
+calculated per shard or chunk of an annotation run and combined afterwards without a second
+pass over the whole functional annotation file. The records of a sequence must not be split
+between two shards.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import gzip
+import json
+import os
+import sys
+
+import numpy as np
+
+import columnlib
+import genlib
+import sqllib
+
+#-------------------------------------------------------------------------------
+
+def accumulate_functional_stats(functional_annotation_file):
+    '''
+    Accumulate the statistics of a functional annotation file.
+    '''
+
+    # initialize the functional statistics
+    functional_stats = FunctionalStats()
+
+    # accumulate the statistics of each sequence (only the columns used are read when the file has a Parquet copy)
+    for _, annotation_record_list in columnlib.read_functional_annotation_groups(functional_annotation_file, FunctionalStats.COLUMN_LIST):
+        functional_stats.add_sequence(annotation_record_list)
+        genlib.Message.print('verbose', f'\rProcessed functional annotations: {functional_stats.annotation_counter}')
+
+    genlib.Message.print('verbose', '\n')
+
+    # return the functional statistics
+    return functional_stats
+
+#-------------------------------------------------------------------------------
+
+def build_x_per_y_stats(stats_dict, output_dir, stats_code):
+    '''
+   Build a data per other data statistics file
+    '''
+
+    # get the stats file name
+    stats_file = f'{output_dir}/stats-{stats_code}.csv'
+
+    # open the statistics file
+    if stats_file.endswith('.gz'):
+        try:
+            stats_file_id = gzip.open(stats_file, mode='wt', encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F004', stats_file)
+    else:
+        try:
+            stats_file_id = open(stats_file, mode='w', encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F003', stats_file)
+
+    # write the header
+    if stats_code == 'seq-per-goterm':
+        stats_file_id.write( '"goterm_num";"seq_num"\n')
+
+    # write data record
+    for key in sorted(stats_dict.keys()):
+        stats_file_id.write(f'"{key}";"{stats_dict[key]}"\n')
+
+    # close statistics file
+    stats_file_id.close()
+
+#-------------------------------------------------------------------------------
+
+def build_phylogenic_data_frecuency(stats_dict, output_dir, stats_code):
+    '''
+    Build a phylogenic data frecuency file.
+    '''
+
+    # get the stats file name
+    stats_file = f'{output_dir}/stats-{stats_code}.csv'
+
+    # open the statistics file
+    if stats_file.endswith('.gz'):
+        try:
+            stats_file_id = gzip.open(stats_file, mode='wt', encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F004', stats_file)
+    else:
+        try:
+            stats_file_id = open(stats_file, mode='w', encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F003', stats_file)
+
+    # write the header
+    if stats_code == 'species':
+        stats_file_id.write( '"species";"best_hit";"all_hits"\n')
+
+    # write data record
+    for key in sorted(stats_dict.keys()):
+        if stats_code == 'species':
+            if len(key.split()) == 2 and key[0].isalpha() and key[0].isupper() and not key.endswith('sp.') and key.find('AltName') == -1:
+                stats_file_id.write(f'''"{key}";{stats_dict[key]['best']};{stats_dict[key]['complete']}\n''')
+
+    # close statistics file
+    stats_file_id.close()
+
+#-------------------------------------------------------------------------------
+
+def build_goterm_data_frecuency(conn, goterm_id_stats_dict, output_dir):
+    '''
+    Build a GO term data frencuency file.
+    '''
+
+    # iitialize namespace statistics dictionary
+    namespace_stats_dict = {}
+
+    # get the GO ontology dictionary
+    go_ontology_dictionary = sqllib.get_go_ontology_dict(conn, goterm_id_list=[])
+
+    # get the stats file names
+    goterm_id_stats_file = f'{output_dir}/stats-goterms.csv'
+    namespace_stats_file = f'{output_dir}/stats-namespaces.csv'
+
+    # open the file of statistics by GO identifier
+    if goterm_id_stats_file.endswith('.gz'):
+        try:
+            goterm_id_stats_file_id = gzip.open(goterm_id_stats_file, mode='wt', encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F004', goterm_id_stats_file)
+    else:
+        try:
+            goterm_id_stats_file_id = open(goterm_id_stats_file, mode='w', encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F003', goterm_id_stats_file)
+
+    # write the header in the file of statistics by GO term identifier
+    goterm_id_stats_file_id.write( '"goterm_id";"goterm_name";"namespace";"best_hit";"all_hits"\n')
+
+    # write data in the file of statistics by GO identifier and accumulate data in the namespace statistics dictionary
+    for key in sorted(goterm_id_stats_dict.keys()):
+        try:
+            goterm_id_stats_file_id.write(f'''"{key}";"{go_ontology_dictionary[key]['goterm_name']}";"{go_ontology_dictionary[key]['namespace']}";{goterm_id_stats_dict[key]['best']};{goterm_id_stats_dict[key]['complete']}\n''')
+            namespace_data = namespace_stats_dict.get(go_ontology_dictionary[key]['namespace'], {'best': 0, 'complete': 0})
+            namespace_data['best'] = namespace_data['best'] + goterm_id_stats_dict[key]['best']
+            namespace_data['complete'] = namespace_data['complete'] + goterm_id_stats_dict[key]['complete']
+            namespace_stats_dict[go_ontology_dictionary[key]['namespace']] = namespace_data
+        except Exception:
+            goterm_id_stats_file_id.write(f'''"{key}";"N/A";"N/A";{goterm_id_stats_dict[key]['best']};{goterm_id_stats_dict[key]['complete']}\n''')
+            namespace_data = namespace_stats_dict.get('N/A', {'best': 0, 'complete': 0})
+            namespace_data['best'] = namespace_data['best'] + goterm_id_stats_dict[key]['best']
+            namespace_data['complete'] = namespace_data['complete'] + goterm_id_stats_dict[key]['complete']
+            namespace_stats_dict['N/A'] = namespace_data
+
+    # close the file of statistics by GO term identifier
+    goterm_id_stats_file_id.close()
+
+    # open the file of statistics by namespace
+    if namespace_stats_file.endswith('.gz'):
+        try:
+            namespace_stats_file_id = gzip.open(namespace_stats_file, mode='wt', encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F004', namespace_stats_file)
+    else:
+        try:
+            namespace_stats_file_id = open(namespace_stats_file, mode='w', encoding='iso-8859-1', newline='\n')
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F003', namespace_stats_file)
+
+    # write the header in the file of statistics by namespace
+    namespace_stats_file_id.write( '"namespace";"best_hit";"all_hits"\n')
+
+    # write data in the file of statistics by namespace
+    for key in sorted(namespace_stats_dict.keys()):
+
+        # write data record
+        namespace_stats_file_id.write(f'''"{key}";{namespace_stats_dict[key]['best']};{namespace_stats_dict[key]['complete']}\n''')
+
+    # close the file of statistics by namespace
+    namespace_stats_file_id.close()
+
+#-------------------------------------------------------------------------------
+
+class StatsAccumulator():
+    '''
+    This class accumulates counters per key and field (for example, best and complete counters per species).
+    '''
+
+    #---------------
+
+    def __init__(self, field_list):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.field_list = field_list
+
+        # initialize the data dictionary (key -> field -> counter)
+        self.data_dict = {}
+
+    #---------------
+
+    def add(self, key, field, increment=1):
+        '''
+        Increase the counter of a field of a key.
+        '''
+
+        # get the counters of the key
+        key_data = self.data_dict.get(key)
+        if key_data is None:
+            key_data = {field: 0 for field in self.field_list}
+            self.data_dict[key] = key_data
+
+        # increase the counter
+        key_data[field] += increment
+
+    #---------------
+
+    def merge(self, other):
+        '''
+        Add the counters of other accumulator with the same fields.
+        '''
+
+        # check the fields
+        if other.field_list != self.field_list:
+            raise ValueError(f'The fields {other.field_list} do not match the fields {self.field_list}.')
+
+        # add the counters of each key
+        for key, other_key_data in other.data_dict.items():
+            for field in self.field_list:
+                self.add(key, field, other_key_data[field])
+
+    #---------------
+
+    def to_list(self):
+        '''
+        Get a serializable list of the counters ([key, [counter1, counter2, ...]] per key).
+        '''
+
+        return [[key, [key_data[field] for field in self.field_list]] for key, key_data in self.data_dict.items()]
+
+    #---------------
+
+    @staticmethod
+    def from_list(field_list, item_list):
+        '''
+        Build an accumulator from a serialized list of counters.
+        '''
+
+        # initialize the accumulator
+        accumulator = StatsAccumulator(field_list)
+
+        # add the counters of each key
+        for key, counter_list in item_list:
+            accumulator.data_dict[key] = dict(zip(field_list, counter_list))
+
+        # return the accumulator
+        return accumulator
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class InternedStatsAccumulator():
+    '''
+    This class accumulates counters per key and field like StatsAccumulator, but the keys are
+    interned to integer numbers and the counters are kept in NumPy arrays updated by bincount.
+    It is used when there are many additions per key (for example, GO terms).
+    '''
+
+    #---------------
+
+    # number of pending key numbers of a field that forces the update of its counters
+    FLUSH_SIZE = 1000000
+
+    #---------------
+
+    def __init__(self, field_list):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.field_list = field_list
+
+        # initialize the key list (key number -> key) and the key number dictionary (key -> key number)
+        self.key_list = []
+        self.key_num_dict = {}
+
+        # initialize the pending key numbers and the counter array of each field
+        self.pending_num_list_dict = {field: [] for field in field_list}
+        self.counter_array_dict = {field: np.zeros(0, dtype=np.int64) for field in field_list}
+
+    #---------------
+
+    def intern(self, key):
+        '''
+        Get the number of a key (a new number is assigned when the key is not known).
+        '''
+
+        # get the key number
+        key_num = self.key_num_dict.get(key)
+        if key_num is None:
+            key_num = len(self.key_list)
+            self.key_num_dict[key] = key_num
+            self.key_list.append(key)
+
+        # return the key number
+        return key_num
+
+    #---------------
+
+    def intern_list(self, key_list):
+        '''
+        Get the numbers of a key list.
+        '''
+
+        # intern the unknown keys
+        key_num_dict = self.key_num_dict
+        for key in set(key_list).difference(key_num_dict):
+            self.intern(key)
+
+        # return the key number list
+        return list(map(key_num_dict.__getitem__, key_list))
+
+    #---------------
+
+    def add_num_list(self, field, key_num_list):
+        '''
+        Increase by 1 the counter of a field of each key number of a list.
+        '''
+
+        # append the key numbers to the pending ones
+        pending_num_list = self.pending_num_list_dict[field]
+        pending_num_list.extend(key_num_list)
+
+        # update the counters when there are too many pending key numbers
+        if len(pending_num_list) >= InternedStatsAccumulator.FLUSH_SIZE:
+            self.flush()
+
+    #---------------
+
+    def add(self, key, field, increment=1):
+        '''
+        Increase the counter of a field of a key.
+        '''
+
+        # get the key number
+        key_num = self.intern(key)
+
+        # increase the counter
+        if increment == 1:
+            self.pending_num_list_dict[field].append(key_num)
+        else:
+            self.flush()
+            self.counter_array_dict[field][key_num] += increment
+
+    #---------------
+
+    def flush(self):
+        '''
+        Update the counter arrays with the pending key numbers.
+        '''
+
+        # get the number of keys
+        key_count = len(self.key_list)
+
+        # update the counter array of each field
+        for field in self.field_list:
+            counter_array = self.counter_array_dict[field]
+            if len(counter_array) < key_count:
+                counter_array = np.concatenate((counter_array, np.zeros(key_count - len(counter_array), dtype=np.int64)))
+            pending_num_list = self.pending_num_list_dict[field]
+            if pending_num_list != []:
+                counter_array += np.bincount(np.array(pending_num_list, dtype=np.int64), minlength=key_count)
+                pending_num_list.clear()
+            self.counter_array_dict[field] = counter_array
+
+    #---------------
+
+    def merge(self, other):
+        '''
+        Add the counters of other accumulator with the same fields.
+        '''
+
+        # check the fields
+        if other.field_list != self.field_list:
+            raise ValueError(f'The fields {other.field_list} do not match the fields {self.field_list}.')
+
+        # update the pending counters of both accumulators
+        other.flush()
+
+        # get the numbers in this accumulator of the keys of other accumulator
+        key_num_array = np.array(self.intern_list(other.key_list), dtype=np.int64)
+        self.flush()
+
+        # add the counters (the key numbers are not repeated)
+        for field in self.field_list:
+            self.counter_array_dict[field][key_num_array] += other.counter_array_dict[field]
+
+    #---------------
+
+    @property
+    def data_dict(self):
+        '''
+        Get the data dictionary (key -> field -> counter).
+        '''
+
+        # update the pending counters
+        self.flush()
+
+        # get the counter lists of each field
+        counter_list_dict = {field: self.counter_array_dict[field].tolist() for field in self.field_list}
+
+        # return the data dictionary
+        return {key: {field: counter_list_dict[field][key_num] for field in self.field_list} for key_num, key in enumerate(self.key_list)}
+
+    #---------------
+
+    def to_list(self):
+        '''
+        Get a serializable list of the counters ([key, [counter1, counter2, ...]] per key).
+        '''
+
+        return [[key, [key_data[field] for field in self.field_list]] for key, key_data in self.data_dict.items()]
+
+    #---------------
+
+    @staticmethod
+    def from_list(field_list, item_list):
+        '''
+        Build an accumulator from a serialized list of counters.
+        '''
+
+        # initialize the accumulator
+        accumulator = InternedStatsAccumulator(field_list)
+
+        # intern the keys and set their counters
+        for key, _ in item_list:
+            accumulator.intern(key)
+        for i, field in enumerate(field_list):
+            accumulator.counter_array_dict[field] = np.array([counter_list[i] for _, counter_list in item_list], dtype=np.int64)
+
+        # return the accumulator
+        return accumulator
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class FunctionalStats():
+    '''
+    This class keeps the accumulators of the functional annotation statistics.
+    '''
+
+    #---------------
+
+    # format version of the serialized accumulators
+    VERSION = 1
+
+    # functional annotation columns used in the statistics
+    COLUMN_LIST = ['sseqid', 'ncbi_species', 'interpro_goterms', 'panther_goterms', 'eggnog_goterms', 'evalue', 'pident']
+
+    #---------------
+
+    def __init__(self):
+        '''
+        Create a class instance.
+        '''
+
+        # initialize the annotation counter
+        self.annotation_counter = 0
+
+        # initialize the accumulators
+        self.species_stats = StatsAccumulator(['best', 'complete'])
+        self.go_stats = InternedStatsAccumulator(['best', 'complete'])
+        self.seq_num_per_goterm_id_num_stats = StatsAccumulator(['seq_num'])
+
+    #---------------
+
+    def add_sequence(self, annotation_record_list):
+        '''
+        Accumulate the statistics of the functional annotation records of a sequence.
+        '''
+
+        # initialize the best evalue and pident
+        best_evalue = 1.
+        best_pident = 0.
+
+        # initialize the species and GO term numbers with the best evalue and pident
+        best_species = ''
+        best_goterm_num_set = set()
+
+        # initialize the set of GO term numbers of the sequence
+        goterm_nums_per_seq_set = set()
+
+        # accumulate data of each record
+        for annotation_record in annotation_record_list:
+
+            # if the sequence matched is a potential lncRNA, skip the record
+            if annotation_record.sseqid == genlib.get_potential_lncrn():
+                continue
+
+            # add 1 to the annotation counter
+            self.annotation_counter += 1
+
+            # increase the species counter
+            self.species_stats.add(annotation_record.ncbi_species, 'complete')
+
+            # extract the GO term identifications and get their numbers
+            # goterms format: "goterm_id1|goterm_id2|...|gotermo_idn"
+            goterm_id_set = set()
+            for column in ['interpro_goterms', 'panther_goterms', 'eggnog_goterms']:
+                if annotation_record[column] != '' and annotation_record[column] != '-':
+                    goterm_id_set.update(annotation_record[column].split('|'))
+            goterm_num_set = set(self.go_stats.intern_list(goterm_id_set))
+
+            # increase the GO term counters
+            self.go_stats.add_num_list('complete', goterm_num_set)
+
+            # add the GO term numbers to the set of GO term numbers of the sequence
+            goterm_nums_per_seq_set |= goterm_num_set
+
+            # save the species with best evalue and pident
+            evalue = float(annotation_record.evalue)
+            if evalue < best_evalue or evalue == best_evalue and float(annotation_record.pident) > best_pident:
+                best_evalue = evalue
+                best_pident = float(annotation_record.pident)
+                best_species = annotation_record.ncbi_species
+                best_goterm_num_set = goterm_num_set
+
+        # if the first sequence matched is not a potential lncRNA
+        if annotation_record_list != [] and annotation_record_list[0].sseqid != genlib.get_potential_lncrn():
+
+            # increase the species counter (best evalue and pident case)
+            self.species_stats.add(best_species, 'best')
+
+            # increase the GO term counters (best evalue and pident case)
+            self.go_stats.add_num_list('best', best_goterm_num_set)
+
+            # increase the sequence number per Gene Ontology identification number
+            self.seq_num_per_goterm_id_num_stats.add(len(goterm_nums_per_seq_set), 'seq_num')
+
+    #---------------
+
+    def merge(self, other):
+        '''
+        Add the statistics of other functional statistics (of a different set of sequences).
+        '''
+
+        self.annotation_counter += other.annotation_counter
+        self.species_stats.merge(other.species_stats)
+        self.go_stats.merge(other.go_stats)
+        self.seq_num_per_goterm_id_num_stats.merge(other.seq_num_per_goterm_id_num_stats)
+
+    #---------------
+
+    def save(self, accumulator_file):
+        '''
+        Save the accumulators in a JSON file.
+        '''
+
+        # build the serializable dictionary
+        accumulator_dict = {
+            'version': FunctionalStats.VERSION,
+            'annotation_counter': self.annotation_counter,
+            'species_stats': self.species_stats.to_list(),
+            'go_stats': self.go_stats.to_list(),
+            'seq_num_per_goterm_id_num_stats': self.seq_num_per_goterm_id_num_stats.to_list(),
+        }
+
+        # open the accumulator file
+        if accumulator_file.endswith('.gz'):
+            try:
+                accumulator_file_id = gzip.open(accumulator_file, mode='wt', encoding='iso-8859-1', newline='\n')
+            except Exception as e:
+                raise genlib.ProgramException(e, 'F004', accumulator_file)
+        else:
+            try:
+                accumulator_file_id = open(accumulator_file, mode='w', encoding='iso-8859-1', newline='\n')
+            except Exception as e:
+                raise genlib.ProgramException(e, 'F003', accumulator_file)
+
+        # write the accumulators
+        json.dump(accumulator_dict, accumulator_file_id)
+
+        # close the accumulator file
+        accumulator_file_id.close()
+
+    #---------------
+
+    @staticmethod
+    def load(accumulator_file):
+        '''
+        Load the accumulators from a JSON file.
+        '''
+
+        # open the accumulator file
+        if accumulator_file.endswith('.gz'):
+            try:
+                accumulator_file_id = gzip.open(accumulator_file, mode='rt', encoding='iso-8859-1')
+            except Exception as e:
+                raise genlib.ProgramException(e, 'F002', accumulator_file)
+        else:
+            try:
+                accumulator_file_id = open(accumulator_file, mode='r', encoding='iso-8859-1')
+            except Exception as e:
+                raise genlib.ProgramException(e, 'F001', accumulator_file)
+
+        # read the accumulators
+        try:
+            accumulator_dict = json.load(accumulator_file_id)
+        except Exception as e:
+            raise genlib.ProgramException(e, 'F005', accumulator_file)
+
+        # close the accumulator file
+        accumulator_file_id.close()
+
+        # check the format version
+        if accumulator_dict.get('version') != FunctionalStats.VERSION:
+            raise genlib.ProgramException('', 'F005', accumulator_file)
+
+        # build the functional statistics
+        functional_stats = FunctionalStats()
+        functional_stats.annotation_counter = accumulator_dict['annotation_counter']
+        functional_stats.species_stats = StatsAccumulator.from_list(['best', 'complete'], accumulator_dict['species_stats'])
+        functional_stats.go_stats = InternedStatsAccumulator.from_list(['best', 'complete'], accumulator_dict['go_stats'])
+        functional_stats.seq_num_per_goterm_id_num_stats = StatsAccumulator.from_list(['seq_num'], accumulator_dict['seq_num_per_goterm_id_num_stats'])
+
+        # return the functional statistics
+        return functional_stats
+
+    #---------------
+
+    def build_stats_files(self, conn, output_dir):
+        '''
+        Build the statistics files.
+        '''
+
+        # build phylogenic statistics files
+        build_phylogenic_data_frecuency(self.species_stats.data_dict, output_dir, stats_code='species')
+
+        # build ontology statistics files
+        build_goterm_data_frecuency(conn, self.go_stats.data_dict, output_dir)
+        seq_num_per_goterm_id_num_stats_dict = {key: key_data['seq_num'] for key, key_data in self.seq_num_per_goterm_id_num_stats.data_dict.items()}
+        build_x_per_y_stats(seq_num_per_goterm_id_num_stats_dict, output_dir, stats_code='seq-per-goterm')
+
+        # save the accumulators to allow later merges
+        self.save(os.path.join(output_dir, genlib.get_stats_accumulator_file_name()))
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    print(f'This source contains functions and classes related to the functional annotation statistics used in {genlib.get_app_long_name()}.')
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
@@ -0,0 +1,620 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=broad-except
+# pylint: disable=invalid-name
+# pylint: disable=line-too-long
+# pylint: disable=multiple-statements
+# pylint: disable=too-many-lines
+# pylint: disable=unnecessary-pass
+
+#-------------------------------------------------------------------------------
+
+'''
+This source contains functions and classes related to the integer-encoded term vocabularies
+and the sparse (CSR) row x term matrices used in gymnoTOA (Gymnosperms Taxonomy-oriented
+Annotation): the sequence x term matrices of a functional annotation run and the cluster x term
+matrices of the gymnoTOA database. The matrices are saved as NumPy array directories, which are
+loaded memory-mapped.
+
+This software has been developed by:
+
+    GI en Desarrollo de Especies y Comunidades Leñosas (WooSp)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+import os
+import shutil
+import sys
+
+import numpy as np
+import scipy.sparse as sparse
+
+import genlib
+import sqllib
+
+#-------------------------------------------------------------------------------
+
+def get_term_column_dict():
+    '''
+    Get the dictionary of annotation columns with the terms of each enrichment analysis.
+    '''
+
+    # build the term column dictionary
+    term_column_dict = {}
+    term_column_dict[genlib.get_goea_code()] = ['interpro_goterms', 'panther_goterms', 'eggnog_goterms']
+    term_column_dict[genlib.get_mpea_code()] = ['metacyc_pathways']
+    term_column_dict[genlib.get_koea_code()] = ['kegg_kos']
+    term_column_dict[genlib.get_kpea_code()] = ['kegg_pathways']
+
+    # return the term column dictionary
+    return term_column_dict
+
+#-------------------------------------------------------------------------------
+
+def get_database_cluster_term_dict(conn, code):
+    '''
+    Get the dictionary of the terms of an enrichment analysis of each cluster of the gymnoTOA
+    database (all species), as read in calculate-enrichment-analysis.py.
+    '''
+
+    # get the dictionary of the terms of each cluster
+    if code == genlib.get_goea_code():
+        cluster_term_dict = sqllib.get_goterms_per_cluster_dict(conn, genlib.get_all_species_code())
+    elif code == genlib.get_mpea_code():
+        cluster_term_dict = sqllib.get_metacyc_pathways_per_cluster_dict(conn, genlib.get_all_species_code())
+    elif code == genlib.get_koea_code():
+        cluster_term_dict = sqllib.get_kegg_kos_per_cluster_dict(conn, genlib.get_all_species_code())
+    elif code == genlib.get_kpea_code():
+        cluster_term_dict = sqllib.get_kegg_pathways_per_cluster_dict(conn, genlib.get_all_species_code())
+
+    # return the cluster term dictionary
+    return cluster_term_dict
+
+#-------------------------------------------------------------------------------
+
+def get_database_file(conn):
+    '''
+    Get the path of the file of a SQLite database connection ('' when it is a memory database).
+    '''
+
+    # get the file of the main database
+    database_file = ''
+    try:
+        for row in conn.execute('PRAGMA database_list;'):
+            if row[1] == 'main':
+                database_file = row[2] or ''
+    except Exception:
+        database_file = ''
+
+    # return the database file path
+    return database_file
+
+#-------------------------------------------------------------------------------
+
+def get_database_term_index_dir(database_file):
+    '''
+    Get the path of the directory of the cluster x term matrices of the gymnoTOA database.
+    '''
+
+    return f'{os.path.splitext(database_file)[0]}-terms'
+
+#-------------------------------------------------------------------------------
+
+def get_database_term_index(conn, save_index=True):
+    '''
+    Get the cluster x term matrices of the gymnoTOA database reusing the cached or saved
+    matrices while the database file does not change.
+    '''
+
+    # get the database file and its signature
+    database_file = get_database_file(conn)
+    source_signature = genlib.get_file_signature(database_file) if database_file != '' else None
+
+    # return the index from the cache when the database has not changed
+    cache_key = os.path.abspath(database_file) if database_file != '' else id(conn)
+    cache_item = DatabaseTermIndex.cache_dict.get(cache_key)
+    if cache_item is not None and cache_item[0] == source_signature:
+        return cache_item[1]
+
+    # load the saved index when it corresponds to the current database file
+    database_term_index = None
+    index_dir = get_database_term_index_dir(database_file) if database_file != '' else ''
+    if index_dir != '' and os.path.isdir(index_dir):
+        database_term_index = DatabaseTermIndex.load(index_dir, source_signature)
+        if database_term_index is not None:
+            genlib.Message.print('verbose', f'The term matrices {index_dir} are reused.\n')
+
+    # build the index and save it when there is not a valid saved index
+    if database_term_index is None:
+        database_term_index = DatabaseTermIndex.build(conn)
+        if save_index and index_dir != '':
+            (OK, error_list) = database_term_index.save(index_dir, source_signature)
+            if OK:
+                genlib.Message.print('verbose', f'The term matrices {index_dir} are created.\n')
+            else:
+                for error in error_list:
+                    genlib.Message.print('verbose', f'{error}\n')
+
+    # save the index in the cache
+    DatabaseTermIndex.cache_dict[cache_key] = (source_signature, database_term_index)
+
+    # return the database term index
+    return database_term_index
+
+#-------------------------------------------------------------------------------
+
+def save_array_dir(array_dir, array_dict):
+    '''
+    Save the arrays of a dictionary (array name -> array) as NumPy files of a directory, which is
+    written into a temporal directory and renamed to avoid partial directories.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # write the arrays into the temporal directory and replace the directory
+    temp_array_dir = f'{array_dir}.tmp'
+    try:
+        shutil.rmtree(temp_array_dir, ignore_errors=True)
+        os.makedirs(temp_array_dir)
+        for name, array in array_dict.items():
+            np.save(f'{temp_array_dir}/{name}.npy', array, allow_pickle=False)
+        shutil.rmtree(array_dir, ignore_errors=True)
+        os.replace(temp_array_dir, array_dir)
+    except Exception as e:
+        error_list.append(f'*** EXCEPTION: "{e}".')
+        error_list.append(f'*** ERROR: The directory {array_dir} is not created.')
+        OK = False
+
+    # return the control variable and error list
+    return (OK, error_list)
+
+#-------------------------------------------------------------------------------
+
+def load_array_dir(array_dir, name_list):
+    '''
+    Load the arrays of a directory memory-mapped as a dictionary (array name -> array).
+    '''
+
+    return {name: np.load(f'{array_dir}/{name}.npy', mmap_mode='r', allow_pickle=False) for name in name_list}
+
+#-------------------------------------------------------------------------------
+
+def is_array_dir_valid(array_dict, version, source_signature):
+    '''
+    Check the version and the source signature saved with the arrays of a directory.
+    '''
+
+    return int(array_dict['version'][0]) == version and (source_signature is None or tuple(array_dict['source_signature'].tolist()) == tuple(source_signature))
+
+#-------------------------------------------------------------------------------
+
+class TermVocabulary():
+    '''
+    This class keeps the term identifications of an enrichment analysis sorted, so the term number
+    of a term identification is its position.
+    '''
+
+    #---------------
+
+    def __init__(self, term_id_array):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.term_id_array = term_id_array
+
+    #---------------
+
+    def __len__(self):
+        '''
+        Get the term count of the vocabulary.
+        '''
+
+        return len(self.term_id_array)
+
+    #---------------
+
+    def get_term_num_array(self, term_id_list):
+        '''
+        Get the array of term numbers of a term identification list (-1 when a term is not in the vocabulary).
+        '''
+
+        # search the term identifications in the sorted term identification array
+        term_id_array = np.asarray(term_id_list, dtype=str)
+        if len(self.term_id_array) == 0 or term_id_array.size == 0:
+            return np.full(term_id_array.size, -1, dtype=np.int64)
+        term_num_array = np.searchsorted(self.term_id_array, term_id_array)
+        term_num_array = np.minimum(term_num_array, len(self.term_id_array) - 1)
+
+        # set -1 to the terms not found
+        term_num_array[self.term_id_array[term_num_array] != term_id_array] = -1
+
+        # return the term number array
+        return term_num_array
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class TermMatrixBuilder():
+    '''
+    This class builds a row x term matrix adding the term identifications of each row. The term
+    identifications are numbered as they are added unless a vocabulary is indicated.
+    '''
+
+    #---------------
+
+    def __init__(self, vocabulary=None):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.vocabulary = vocabulary
+
+        # initialize the term identification dictionary (term identification -> term number)
+        self.term_num_dict = {} if vocabulary is None else {term_id: term_num for term_num, term_id in enumerate(vocabulary.term_id_array.tolist())}
+
+        # initialize the row pointer and term number lists
+        self.indptr_list = [0]
+        self.indices_list = []
+
+    #---------------
+
+    def add_row(self, term_id_iterable):
+        '''
+        Add the term identifications of a row.
+        '''
+
+        # intern the term identifications and add the incidences of the row
+        term_num_dict = self.term_num_dict
+        term_num_set = {term_num_dict.setdefault(term_id, len(term_num_dict)) for term_id in term_id_iterable}
+        self.indices_list.extend(sorted(term_num_set))
+        self.indptr_list.append(len(self.indices_list))
+
+    #---------------
+
+    def build(self):
+        '''
+        Build the row x term matrix.
+        '''
+
+        # build the term identification array sorted by term number
+        if self.vocabulary is not None:
+            term_id_array = self.vocabulary.term_id_array
+        else:
+            term_id_list = [''] * len(self.term_num_dict)
+            for term_id, term_num in self.term_num_dict.items():
+                term_id_list[term_num] = term_id
+            term_id_array = np.array(term_id_list, dtype=str)
+
+        # build and return the matrix
+        return TermMatrix(term_id_array, np.array(self.indptr_list, dtype=np.int64), np.array(self.indices_list, dtype=np.int32))
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class TermMatrix():
+    '''
+    This class keeps a row x term incidence matrix in CSR format: the term numbers of row i are
+    indices[indptr[i]:indptr[i+1]] and the term identification of a term number is its position
+    in the term identification array.
+    '''
+
+    #---------------
+
+    def __init__(self, term_id_array, indptr_array, indices_array):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.term_id_array = term_id_array
+        self.indptr_array = indptr_array
+        self.indices_array = indices_array
+
+        # initialize the SciPy sparse matrix (it is built when it is used)
+        self.csr_matrix = None
+
+    #---------------
+
+    def get_row_count(self):
+        '''
+        Get the row count of the matrix.
+        '''
+
+        return len(self.indptr_array) - 1
+
+    #---------------
+
+    def get_csr_matrix(self):
+        '''
+        Get the matrix as a SciPy sparse matrix (the data values are 1).
+        '''
+
+        # build the sparse matrix sharing the index arrays
+        if self.csr_matrix is None:
+            self.csr_matrix = sparse.csr_matrix((np.ones(len(self.indices_array), dtype=np.int32), self.indices_array, self.indptr_array), shape=(self.get_row_count(), len(self.term_id_array)))
+
+        # return the sparse matrix
+        return self.csr_matrix
+
+    #---------------
+
+    def get_row_term_num_array(self, row):
+        '''
+        Get the term number array of a row.
+        '''
+
+        return self.indices_array[self.indptr_array[row]:self.indptr_array[row + 1]]
+
+    #---------------
+
+    def count_terms(self, row_mask=None):
+        '''
+        Get the row count of each term and the count of rows with terms in the rows of a boolean
+        mask (all rows when it is None).
+        '''
+
+        # get the term count of each row
+        row_term_count_array = np.diff(self.indptr_array)
+
+        # count the terms of all rows
+        if row_mask is None:
+            count_array = np.bincount(self.indices_array, minlength=len(self.term_id_array))
+            rows_wterms = int(np.count_nonzero(row_term_count_array))
+
+        # count the terms of the masked rows (the transposed matrix by the mask vector)
+        else:
+            count_array = np.asarray(self.get_csr_matrix().T @ row_mask.astype(np.int32), dtype=np.int64)
+            rows_wterms = int(np.count_nonzero(row_term_count_array[row_mask]))
+
+        # return the count array and the count of rows with terms
+        return count_array, rows_wterms
+
+    #---------------
+
+    def get_term_count_dict(self, row_mask=None, term_id_list=None):
+        '''
+        Get the dictionary of row count per term (term identification -> row count) with the terms
+        with rows of term identification list (all terms when it is None), and the count of rows
+        with terms, in the rows of a boolean mask (all rows when it is None).
+        '''
+
+        # count the terms
+        (count_array, rows_wterms) = self.count_terms(row_mask)
+
+        # build the term count dictionary with all terms with rows
+        if term_id_list is None:
+            term_num_array = np.flatnonzero(count_array)
+            term_count_dict = dict(zip(self.term_id_array[term_num_array].tolist(), count_array[term_num_array].tolist()))
+
+        # build the term count dictionary with the terms of the list
+        else:
+            term_num_dict = dict(zip(self.term_id_array.tolist(), range(len(self.term_id_array))))
+            term_count_dict = {}
+            for term_id in term_id_list:
+                term_num = term_num_dict.get(term_id)
+                if term_num is not None and count_array[term_num] > 0:
+                    term_count_dict[term_id] = int(count_array[term_num])
+
+        # return the term count dictionary and the count of rows with terms
+        return term_count_dict, rows_wterms
+
+    #---------------
+
+    def get_array_dict(self, prefix):
+        '''
+        Get the array dictionary to save the matrix.
+        '''
+
+        return {f'{prefix}_term_ids': self.term_id_array, f'{prefix}_indptr': self.indptr_array, f'{prefix}_indices': self.indices_array}
+
+    #---------------
+
+    @staticmethod
+    def get_array_name_list(prefix):
+        '''
+        Get the array names of a saved matrix.
+        '''
+
+        return [f'{prefix}_term_ids', f'{prefix}_indptr', f'{prefix}_indices']
+
+    #---------------
+
+    @staticmethod
+    def from_array_dict(array_dict, prefix):
+        '''
+        Create the matrix from the arrays of a saved matrix.
+        '''
+
+        return TermMatrix(array_dict[f'{prefix}_term_ids'], array_dict[f'{prefix}_indptr'], array_dict[f'{prefix}_indices'])
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class DatabaseTermIndex():
+    '''
+    This class keeps the cluster x term matrix of the gymnoTOA database for each enrichment
+    analysis; the term numbers are the ones of the sorted vocabulary of the database terms.
+    '''
+
+    #---------------
+
+    # format version of the saved index
+    VERSION = 1
+
+    # cache of indexes already loaded (absolute database file path -> (source signature, index))
+    cache_dict = {}
+
+    #---------------
+
+    def __init__(self, cluster_id_array_dict, term_matrix_dict):
+        '''
+        Create a class instance.
+        '''
+
+        # save parameters in instance variables
+        self.cluster_id_array_dict = cluster_id_array_dict
+        self.term_matrix_dict = term_matrix_dict
+
+        # initialize the cache of species cluster masks ((code, species name) -> mask)
+        self.species_mask_dict = {}
+
+    #---------------
+
+    @staticmethod
+    def build(conn):
+        '''
+        Build the index from the gymnoTOA database.
+        '''
+
+        # initialize the dictionaries of cluster identification arrays and matrices
+        cluster_id_array_dict = {}
+        term_matrix_dict = {}
+
+        for code, column_list in get_term_column_dict().items():
+
+            # get the term identification lists of each cluster
+            # terms format: "term_id1|term_id2|...|term_idn"
+            cluster_term_dict = get_database_cluster_term_dict(conn, code)
+            cluster_id_list = []
+            term_id_list_list = []
+            for cluster_id, data_dict in cluster_term_dict.items():
+                cluster_id_list.append(cluster_id)
+                term_id_list = []
+                for column in column_list:
+                    if data_dict[column] != '' and data_dict[column] != '-':
+                        term_id_list.extend(data_dict[column].split('|'))
+                term_id_list_list.append(term_id_list)
+
+            # build the vocabulary of the database terms
+            vocabulary = TermVocabulary(np.array(sorted({term_id for term_id_list in term_id_list_list for term_id in term_id_list}), dtype=str))
+
+            # build the cluster x term matrix
+            term_matrix_builder = TermMatrixBuilder(vocabulary)
+            for term_id_list in term_id_list_list:
+                term_matrix_builder.add_row(term_id_list)
+            cluster_id_array_dict[code] = np.array(cluster_id_list, dtype=str)
+            term_matrix_dict[code] = term_matrix_builder.build()
+
+        # return the index
+        return DatabaseTermIndex(cluster_id_array_dict, term_matrix_dict)
+
+    #---------------
+
+    def save(self, index_dir, source_signature):
+        '''
+        Save the index in a NumPy array directory.
+        '''
+
+        # build the array dictionary
+        array_dict = {}
+        array_dict['version'] = np.array([self.VERSION], dtype=np.int64)
+        array_dict['source_signature'] = np.array(source_signature, dtype=np.int64)
+        for code, term_matrix in self.term_matrix_dict.items():
+            array_dict[f'{code}_cluster_ids'] = self.cluster_id_array_dict[code]
+            array_dict.update(term_matrix.get_array_dict(code))
+
+        # save the arrays and return the control variable and error list
+        return save_array_dir(index_dir, array_dict)
+
+    #---------------
+
+    @staticmethod
+    def load(index_dir, source_signature=None):
+        '''
+        Load an index from a NumPy array directory; return None when it is not valid for the source signature.
+        '''
+
+        # initialize the database term index
+        database_term_index = None
+
+        # load the index arrays memory-mapped
+        try:
+            code_list = list(get_term_column_dict().keys())
+            name_list = ['version', 'source_signature'] + [f'{code}_cluster_ids' for code in code_list] + [name for code in code_list for name in TermMatrix.get_array_name_list(code)]
+            array_dict = load_array_dir(index_dir, name_list)
+            if is_array_dir_valid(array_dict, DatabaseTermIndex.VERSION, source_signature):
+                database_term_index = DatabaseTermIndex({code: array_dict[f'{code}_cluster_ids'] for code in code_list}, {code: TermMatrix.from_array_dict(array_dict, code) for code in code_list})
+        except Exception as e:
+            genlib.Message.print('verbose', f'The term matrices {index_dir} can not be loaded: {e}\n')
+            database_term_index = None
+
+        # return the database term index
+        return database_term_index
+
+    #---------------
+
+    def get_vocabulary(self, code):
+        '''
+        Get the term vocabulary of an enrichment analysis.
+        '''
+
+        return TermVocabulary(self.term_matrix_dict[code].term_id_array)
+
+    #---------------
+
+    def get_species_mask(self, conn, code, species_name):
+        '''
+        Get the boolean mask of the clusters of a species (all clusters when the species is all species).
+        '''
+
+        # return the mask from the cache
+        species_mask = self.species_mask_dict.get((code, species_name))
+        if species_mask is not None:
+            return species_mask
+
+        # build the mask
+        cluster_id_array = self.cluster_id_array_dict[code]
+        if species_name == genlib.get_all_species_code():
+            species_mask = np.ones(len(cluster_id_array), dtype=bool)
+        else:
+            species_cluster_id_set = set(sqllib.get_species_cluster_id_list(conn, species_name))
+            species_mask = np.fromiter((cluster_id in species_cluster_id_set for cluster_id in cluster_id_array.tolist()), dtype=bool, count=len(cluster_id_array))
+
+        # save the mask in the cache
+        self.species_mask_dict[(code, species_name)] = species_mask
+
+        # return the mask
+        return species_mask
+
+    #---------------
+
+    def get_species_term_count_dict(self, conn, code, species_name, term_id_list=None):
+        '''
+        Get the dictionary of cluster count per term (term identification -> cluster count) of the
+        terms of term identification list (all terms when it is None), the count of clusters with
+        terms and the count of clusters of a species.
+        '''
+
+        # get the species mask
+        species_mask = self.get_species_mask(conn, code, species_name)
+
+        # count the terms of the species clusters
+        (term_count_dict, clusters_wterms) = self.term_matrix_dict[code].get_term_count_dict(species_mask, term_id_list)
+
+        # return the term count dictionary, the count of clusters with terms and the species cluster count
+        return term_count_dict, clusters_wterms, int(np.count_nonzero(species_mask))
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    print(f'This source contains functions and classes related to the term vocabularies and the row x term matrices used in {genlib.get_app_long_name()}.')
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------